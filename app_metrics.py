@@ -13,6 +13,8 @@ from byceps.metrics.application import create_app
 
 
 ENV_VAR_NAME_DATABASE_URI = 'DATABASE_URI'
+ENV_VAR_NAME_DATABASE_REPLICA_URI = 'DATABASE_REPLICA_URI'
+ENV_VAR_NAME_REDIS_URL = 'REDIS_URL'
 
 
 database_uri = os.environ.get(ENV_VAR_NAME_DATABASE_URI)
@@ -22,4 +24,8 @@ if not database_uri:
         "environment variable.",
     )
 
-app = create_app(database_uri)
+database_replica_uri = os.environ.get(ENV_VAR_NAME_DATABASE_REPLICA_URI)
+
+redis_url = os.environ.get(ENV_VAR_NAME_REDIS_URL)
+
+app = create_app(database_uri, redis_url, database_replica_uri)
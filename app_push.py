@@ -0,0 +1,44 @@
+"""
+push application instance
+~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Run with an ASGI server, e.g. Uvicorn::
+
+    $ REDIS_URL=redis://127.0.0.1:6379/0 uvicorn app_push:app
+
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import os
+
+from byceps.config import ConfigurationError
+from byceps.push.application import create_app, PushConfig
+
+
+ENV_VAR_NAME_REDIS_URL = 'REDIS_URL'
+ENV_VAR_NAME_MAX_CONNECTIONS = 'PUSH_MAX_CONNECTIONS'
+ENV_VAR_NAME_ALLOWED_ORIGINS = 'PUSH_ALLOWED_ORIGINS'
+
+
+redis_url = os.environ.get(ENV_VAR_NAME_REDIS_URL)
+if not redis_url:
+    raise ConfigurationError(
+        f"No Redis URL was specified via the '{ENV_VAR_NAME_REDIS_URL}' "
+        "environment variable.",
+    )
+
+config_kwargs = {}
+
+max_connections = os.environ.get(ENV_VAR_NAME_MAX_CONNECTIONS)
+if max_connections:
+    config_kwargs['max_connections'] = int(max_connections)
+
+# comma-separated, e.g. 'https://www.example.com,https://example.com'
+allowed_origins = os.environ.get(ENV_VAR_NAME_ALLOWED_ORIGINS)
+if allowed_origins:
+    config_kwargs['allowed_origins'] = frozenset(
+        origin.strip() for origin in allowed_origins.split(',')
+    )
+
+app = create_app(redis_url, PushConfig(**config_kwargs))
@@ -8,8 +8,12 @@ Connect event signals to announcement handlers.
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from __future__ import annotations
+from datetime import timedelta
 from typing import Optional
 
+from flask import current_app
+
 from ..events.auth import UserLoggedIn
 from ..events.base import _BaseEvent
 from ..events.board import (
@@ -57,6 +61,7 @@ from ..events.user import (
     UserScreenNameChanged,
 )
 from ..events.user_badge import UserBadgeAwarded
+from ..services.webhooks.transfer.models import OutgoingWebhook, WebhookID
 from ..signals import auth as auth_signals
 from ..signals import board as board_signals
 from ..signals import guest_server as guest_server_signals
@@ -68,8 +73,9 @@ from ..signals import ticketing as ticketing_signals
 from ..signals import tourney as tourney_signals
 from ..signals import user as user_signals
 from ..signals import user_badge as user_badge_signals
-from ..util.jobqueue import enqueue
+from ..util.jobqueue import enqueue, enqueue_coalesced, QUEUE_ANNOUNCE
 
+from .events import get_name_for_event
 from .handlers import (
     auth as auth_handlers,
     board as board_handlers,
@@ -96,7 +102,6 @@ EVENT_TYPES_TO_HANDLERS = {
     BoardTopicPinned: board_handlers.announce_board_topic_pinned,
     BoardTopicUnpinned: board_handlers.announce_board_topic_unpinned,
     BoardTopicMoved: board_handlers.announce_board_topic_moved,
-    BoardPostingCreated: board_handlers.announce_board_posting_created,
     BoardPostingHidden: board_handlers.announce_board_posting_hidden,
     BoardPostingUnhidden: board_handlers.announce_board_posting_unhidden,
     GuestServerRegistered: guest_server_handlers.announce_guest_server_registered,
@@ -137,19 +142,89 @@ EVENT_TYPES_TO_HANDLERS = {
 }
 
 
+# Events of these types are announced right away, but further events
+# for the same webhook and value of the given event attribute are
+# collected and announced together once the window has passed. This
+# avoids flooding channels (and the job queue) during bursts of events.
+EVENT_TYPES_TO_COALESCING_HANDLERS = {
+    BoardPostingCreated: (
+        board_handlers.announce_board_postings_created,
+        'topic_id',
+    ),
+}
+
+COALESCING_WINDOW = timedelta(seconds=30)
+
+
 def receive_signal(sender, *, event: Optional[_BaseEvent] = None) -> None:
     if event is None:
         return None
 
+    if current_app.config['OUTBOX_ENABLED']:
+        # The event is recorded in the outbox and announced by the
+        # outbox relay.
+        return None
+
+    announce_event(event)
+
+
+def announce_event(
+    event: _BaseEvent, *, webhook_ids: Optional[set[WebhookID]] = None
+) -> None:
+    """Enqueue jobs to announce the event via the webhooks configured
+    for its type.
+
+    If webhook IDs are given, only those webhooks are considered.
+    """
     event_type = type(event)
 
+    coalescing_handler = EVENT_TYPES_TO_COALESCING_HANDLERS.get(event_type)
+    if coalescing_handler is not None:
+        _announce_coalesced(event, *coalescing_handler, webhook_ids)
+        return None
+
     handler = EVENT_TYPES_TO_HANDLERS.get(event_type)
     if handler is None:
         return None
 
-    webhooks = get_webhooks(event)
+    webhooks = _get_webhooks(event, webhook_ids)
+    for webhook in webhooks:
+        enqueue(handler, event, webhook, queue_name=QUEUE_ANNOUNCE)
+
+
+def _announce_coalesced(
+    event: _BaseEvent,
+    handler,
+    scope_attribute_name: str,
+    webhook_ids: Optional[set[WebhookID]],
+) -> None:
+    event_name = get_name_for_event(event)
+    scope = getattr(event, scope_attribute_name)
+
+    webhooks = _get_webhooks(event, webhook_ids)
     for webhook in webhooks:
-        enqueue(handler, event, webhook)
+        dedupe_key = f'announce:{event_name}:{webhook.id}:{scope}'
+        enqueue_coalesced(
+            dedupe_key,
+            COALESCING_WINDOW,
+            handler,
+            event,
+            webhook,
+            queue_name=QUEUE_ANNOUNCE,
+        )
+
+
+def _get_webhooks(
+    event: _BaseEvent, webhook_ids: Optional[set[WebhookID]]
+) -> list[OutgoingWebhook]:
+    webhooks = get_webhooks(event)
+
+    if webhook_ids is not None:
+        webhooks = [
+            webhook for webhook in webhooks if webhook.id in webhook_ids
+        ]
+
+    return webhooks
 
 
 SIGNALS = [
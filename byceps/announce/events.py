@@ -14,6 +14,7 @@ from ..events.board import (
     BoardPostingCreated,
     BoardPostingHidden,
     BoardPostingUnhidden,
+    BoardPostingUpdated,
     BoardTopicCreated,
     BoardTopicHidden,
     BoardTopicLocked,
@@ -22,13 +23,19 @@ from ..events.board import (
     BoardTopicUnhidden,
     BoardTopicUnlocked,
     BoardTopicUnpinned,
+    BoardTopicUpdated,
 )
 from ..events.guest_server import GuestServerRegistered
 from ..events.news import NewsItemPublished
 from ..events.page import PageCreated, PageDeleted, PageUpdated
 from ..events.shop import ShopOrderCanceled, ShopOrderPaid, ShopOrderPlaced
 from ..events.snippet import SnippetCreated, SnippetDeleted, SnippetUpdated
-from ..events.ticketing import TicketCheckedIn, TicketsSold
+from ..events.ticketing import (
+    TicketCheckedIn,
+    TicketSeatOccupied,
+    TicketSeatReleased,
+    TicketsSold,
+)
 from ..events.tourney import (
     TourneyStarted,
     TourneyPaused,
@@ -67,9 +74,11 @@ EVENT_TYPES_TO_NAMES = {
     BoardTopicUnhidden:             'board-topic-unhidden',
     BoardTopicUnlocked:             'board-topic-unlocked',
     BoardTopicUnpinned:             'board-topic-unpinned',
+    BoardTopicUpdated:              'board-topic-updated',
     BoardPostingCreated:            'board-posting-created',
     BoardPostingHidden:             'board-posting-hidden',
     BoardPostingUnhidden:           'board-posting-unhidden',
+    BoardPostingUpdated:            'board-posting-updated',
     GuestServerRegistered:          'guest-server-registered',
     NewsItemPublished:              'news-item-published',
     PageCreated:                    'page-created',
@@ -82,6 +91,8 @@ EVENT_TYPES_TO_NAMES = {
     SnippetDeleted:                 'snippet-deleted',
     SnippetUpdated:                 'snippet-updated',
     TicketCheckedIn:                'ticket-checked-in',
+    TicketSeatOccupied:             'ticket-seat-occupied',
+    TicketSeatReleased:             'ticket-seat-released',
     TicketsSold:                    'tickets-sold',
     TourneyStarted:                 'tourney-started',
     TourneyPaused:                  'tourney-paused',
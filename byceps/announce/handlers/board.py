@@ -8,6 +8,7 @@ Announce board events.
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from __future__ import annotations
 from functools import wraps
 
 from ...events.board import (
@@ -122,15 +123,30 @@ def announce_board_topic_moved(
     call_webhook(webhook, text)
 
 
-@apply_selectors
-def announce_board_posting_created(
-    event: BoardPostingCreated, webhook: OutgoingWebhook
+def announce_board_postings_created(
+    events: list[BoardPostingCreated], webhook: OutgoingWebhook
 ) -> None:
-    """Announce that someone has created a board posting."""
-    if event.topic_muted:
+    """Announce that board postings have been created in a topic, with
+    a single message.
+    """
+    events = [
+        event
+        for event in events
+        if not event.topic_muted
+        and matches_selectors(event, webhook, 'board_id', str(event.board_id))
+    ]
+
+    if not events:
         return
 
-    text = board.assemble_text_for_board_posting_created(event, webhook.format)
+    if len(events) == 1:
+        text = board.assemble_text_for_board_posting_created(
+            events[0], webhook.format
+        )
+    else:
+        text = board.assemble_text_for_board_postings_created(
+            events, webhook.format
+        )
 
     call_webhook(webhook, text)
 
@@ -12,7 +12,7 @@ from functools import wraps
 
 from ...events.news import NewsItemPublished
 from ...services.webhooks.transfer.models import OutgoingWebhook
-from ...util.jobqueue import enqueue_at
+from ...util.jobqueue import enqueue_at, QUEUE_ANNOUNCE
 
 from ..helpers import call_webhook, matches_selectors
 from ..text_assembly import news
@@ -39,7 +39,13 @@ def announce_news_item_published(
 
     if event.published_at > event.occurred_at:
         # Schedule job to announce later.
-        enqueue_at(event.published_at, call_webhook, webhook, text)
+        enqueue_at(
+            event.published_at,
+            call_webhook,
+            webhook,
+            text,
+            queue_name=QUEUE_ANNOUNCE,
+        )
     else:
         # Announce now.
         call_webhook(webhook, text)
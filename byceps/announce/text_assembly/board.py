@@ -8,6 +8,8 @@ Announce board events.
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from __future__ import annotations
+
 from flask_babel import gettext
 
 from ...events.board import (
@@ -258,6 +260,38 @@ def assemble_text_for_board_posting_created(
     )
 
 
+@with_locale
+def assemble_text_for_board_postings_created(
+    events: list[BoardPostingCreated],
+    webhook_format: str,
+) -> str:
+    """Assemble a single text for multiple postings in the same topic.
+
+    The URL points to the first of the postings.
+    """
+    first_event = events[0]
+
+    posting_creator_screen_names = list(
+        dict.fromkeys(
+            get_screen_name_or_fallback(event.posting_creator_screen_name)
+            for event in events
+        )
+    )
+    board_label_segment = _get_board_label_segment(
+        first_event.topic_id, webhook_format
+    )
+    url = _format_url(first_event.url, webhook_format)
+
+    return gettext(
+        '%(posting_count)s new replies by %(posting_creator_screen_names)s in topic "%(topic_title)s"%(board_label_segment)s: %(url)s',
+        posting_count=len(events),
+        posting_creator_screen_names=', '.join(posting_creator_screen_names),
+        board_label_segment=board_label_segment,
+        topic_title=first_event.topic_title,
+        url=url,
+    )
+
+
 @with_locale
 def assemble_text_for_board_posting_hidden(
     event: BoardPostingHidden,
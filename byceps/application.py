@@ -7,10 +7,15 @@ byceps.application
 """
 
 from __future__ import annotations
+from contextlib import contextmanager
+from dataclasses import dataclass
+import gc
 from importlib import import_module
 import os
 from pathlib import Path
-from typing import Any, Callable, Optional, Union
+import sys
+from time import perf_counter
+from typing import Any, Callable, Iterator, Optional, Union
 
 from flask import abort, current_app, Flask, g
 from flask_babel import Babel
@@ -19,19 +24,95 @@ from redis import StrictRedis
 
 from .blueprints.blueprints import register_blueprints
 from . import config, config_defaults
-from .database import db
+from .database import (
+    configure_engines as configure_database_engines,
+    db,
+    dispose_engines as dispose_database_engines,
+)
 from .util.authorization import has_current_user_permission, load_permissions
 from .util.l10n import get_current_user_locale
 from .util import templatefilters, templatefunctions
 from .util.templating import SiteTemplateOverridesLoader
 
 
+# Modules that are only imported on first use (to keep startup fast)
+# but should be shared between forked processes if preloaded.
+PRELOAD_MODULE_NAMES = [
+    'PIL.Image',
+    'qrcode',
+    'qrcode.image.svg',
+]
+
+
+@dataclass(frozen=True)
+class StartupPhase:
+    name: str
+    duration_seconds: float
+    imported_module_count: int
+
+
 def create_app(
     *,
     config_filename: Optional[Union[Path, str]] = None,
     config_overrides: Optional[dict[str, Any]] = None,
 ) -> Flask:
-    """Create the actual Flask application."""
+    """Create the actual Flask application.
+
+    Only what the configured app mode requires is loaded. How long the
+    individual startup phases took is available as `startup_phases`
+    attribute of the application.
+    """
+    phases: list[StartupPhase] = []
+
+    with _measure(phases, 'configuration'):
+        app = _create_configured_app(config_filename, config_overrides)
+
+    with _measure(phases, 'extensions'):
+        _init_extensions(app)
+
+    app_mode = config.get_app_mode(app)
+
+    if app_mode.is_admin() or app_mode.is_site():
+        with _measure(phases, 'permissions'):
+            load_permissions()
+
+    if not app_mode.is_worker():
+        with _measure(phases, 'blueprints'):
+            register_blueprints(app, app_mode)
+
+    with _measure(phases, 'templating'):
+        templatefilters.register(app)
+        templatefunctions.register(app)
+
+    _add_static_file_url_rules(app)
+
+    if app_mode.is_admin():
+        with _measure(phases, 'admin'):
+            _init_admin_app(app)
+    elif app_mode.is_site():
+        with _measure(phases, 'site'):
+            _init_site_app(app)
+
+    with _measure(phases, 'announcements'):
+        _load_announce_signal_handlers()
+
+    if app.config['OUTBOX_ENABLED']:
+        with _measure(phases, 'outbox'):
+            _load_outbox_signal_handlers()
+
+    if app.config['PUSH_ENABLED']:
+        with _measure(phases, 'push'):
+            _load_push_signal_handlers()
+
+    app.startup_phases = phases
+
+    return app
+
+
+def _create_configured_app(
+    config_filename: Optional[Union[Path, str]],
+    config_overrides: Optional[dict[str, Any]],
+) -> Flask:
     app = Flask('byceps')
 
     app.config.from_object(config_defaults)
@@ -47,6 +128,14 @@ def create_app(
     if sqlalchemy_database_uri:
         app.config['SQLALCHEMY_DATABASE_URI'] = sqlalchemy_database_uri
 
+    # Allow read replica database URI to be overriden via environment
+    # variable.
+    database_replica_uri = os.environ.get('DATABASE_REPLICA_URI')
+    if database_replica_uri:
+        app.config['DATABASE_REPLICA_URI'] = database_replica_uri
+
+    configure_database_engines(app.config)
+
     config.init_app(app)
 
     # Throw an exception when an undefined name is referenced in a template.
@@ -55,6 +144,10 @@ def create_app(
     #      environment too early.
     app.jinja_options['undefined'] = jinja2.StrictUndefined
 
+    return app
+
+
+def _init_extensions(app: Flask) -> None:
     babel = Babel(app)
     babel.locale_selector_func = get_current_user_locale
 
@@ -64,25 +157,46 @@ def create_app(
     # Initialize Redis client.
     app.redis_client = StrictRedis.from_url(app.config['REDIS_URL'])
 
-    app_mode = config.get_app_mode(app)
 
-    load_permissions()
+@contextmanager
+def _measure(phases: list[StartupPhase], name: str) -> Iterator[None]:
+    """Record duration of, and number of modules imported during, the
+    startup phase.
+    """
+    module_count_before = len(sys.modules)
+    start = perf_counter()
 
-    register_blueprints(app, app_mode)
+    yield
 
-    templatefilters.register(app)
-    templatefunctions.register(app)
+    duration_seconds = perf_counter() - start
+    imported_module_count = len(sys.modules) - module_count_before
+    phases.append(
+        StartupPhase(name, duration_seconds, imported_module_count)
+    )
 
-    _add_static_file_url_rules(app)
 
-    if app_mode.is_admin():
-        _init_admin_app(app)
-    elif app_mode.is_site():
-        _init_site_app(app)
+def preload(app: Flask) -> None:
+    """Prepare the application to be shared by forked processes (e.g.
+    Gunicorn workers with `--preload`, or job queue workers).
 
-    _load_announce_signal_handlers()
+    Modules that are otherwise imported on first use are imported now so
+    that forked processes share them (copy-on-write) instead of each
+    loading them on its own.
 
-    return app
+    Database connections must not be shared between processes, so the
+    connection pools are emptied.
+
+    Finally, all objects created so far are excluded from garbage
+    collection as inspecting them would write to (and thus copy) their
+    memory pages in every process.
+    """
+    for module_name in PRELOAD_MODULE_NAMES:
+        import_module(module_name)
+
+    with app.app_context():
+        dispose_database_engines(app)
+
+    gc.freeze()
 
 
 def _add_static_file_url_rules(app: Flask) -> None:
@@ -181,3 +295,17 @@ def _load_announce_signal_handlers() -> None:
     corresponding signals.
     """
     from .announce import connections
+
+
+def _load_outbox_signal_handlers() -> None:
+    """Import module containing handlers so they connect to the
+    corresponding signals.
+    """
+    from .outbox import connections
+
+
+def _load_push_signal_handlers() -> None:
+    """Import module containing handlers so they connect to the
+    corresponding signals.
+    """
+    from .push import connections
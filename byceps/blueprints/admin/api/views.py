@@ -9,7 +9,10 @@ byceps.blueprints.admin.api.views
 from flask import current_app, g, request
 from flask_babel import gettext
 
-from ....services.authentication.api import service as api_service
+from ....services.authentication.api import (
+    service as api_service,
+    usage_service as api_usage_service,
+)
 from ....services.user import service as user_service
 from ....util.framework.blueprint import create_blueprint
 from ....util.framework.flash import flash_success
@@ -35,10 +38,15 @@ def index():
     users = user_service.get_users(user_ids, include_avatars=True)
     users_by_id = user_service.index_users_by_id(users)
 
+    request_counts_by_api_token_id = api_usage_service.get_request_counts(
+        current_app.redis_client
+    )
+
     return {
         'api_enabled': api_enabled,
         'api_tokens': api_tokens,
         'users_by_id': users_by_id,
+        'request_counts_by_api_token_id': request_counts_by_api_token_id,
     }
 
 
@@ -76,6 +84,26 @@ def create_api_token():
     return redirect_to('.index')
 
 
+@blueprint.post('/api_tokens/<uuid:api_token_id>/suspend')
+@permission_required('api.administrate')
+@respond_no_content
+def suspend_api_token(api_token_id):
+    """Suspend an API token."""
+    api_service.suspend_api_token(api_token_id)
+
+    flash_success(gettext('API token has been suspended.'))
+
+
+@blueprint.post('/api_tokens/<uuid:api_token_id>/unsuspend')
+@permission_required('api.administrate')
+@respond_no_content
+def unsuspend_api_token(api_token_id):
+    """Unsuspend an API token."""
+    api_service.unsuspend_api_token(api_token_id)
+
+    flash_success(gettext('API token has been unsuspended.'))
+
+
 @blueprint.delete('/api_tokens/<uuid:api_token_id>')
 @permission_required('api.administrate')
 @respond_no_content
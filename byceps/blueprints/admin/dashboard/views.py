@@ -10,6 +10,7 @@ from datetime import date, timedelta
 
 from flask import abort
 
+from ....database import use_read_replica
 from ....services.board import board_service
 from ....services.brand import (
     service as brand_service,
@@ -46,6 +47,7 @@ blueprint = create_blueprint('admin_dashboard', __name__)
 @blueprint.get('')
 @permission_required('admin.access')
 @templated
+@use_read_replica()
 def view_global():
     """View dashboard for global entities."""
     active_brands = brand_service.get_active_brands()
@@ -102,6 +104,7 @@ def view_global():
 @blueprint.get('/brands/<brand_id>')
 @permission_required('brand.view')
 @templated
+@use_read_replica()
 def view_brand(brand_id):
     """View dashboard for that brand."""
     brand = brand_service.find_brand(brand_id)
@@ -169,6 +172,7 @@ def view_brand(brand_id):
 @blueprint.get('/parties/<party_id>')
 @permission_required('party.view')
 @templated
+@use_read_replica()
 def view_party(party_id):
     """View dashboard for that party."""
     party = party_service.find_party(party_id)
@@ -212,6 +216,7 @@ def view_party(party_id):
 @blueprint.get('/sites/<site_id>')
 @permission_required('site.view')
 @templated
+@use_read_replica()
 def view_site(site_id):
     """View dashboard for that site."""
     site = site_service.find_site(site_id)
@@ -13,6 +13,7 @@ from typing import Iterable, Optional
 from flask import abort, g, request, url_for
 from flask_babel import gettext
 
+from ....database import use_read_replica
 from ....services.guest_server import service as guest_server_service
 from ....services.guest_server.transfer.models import (
     Address,
@@ -241,6 +242,7 @@ def address_index(party_id):
 @blueprint.get('/for_party/<party_id>/addresses/export/netbox')
 @permission_required('guest_server.view')
 @textified
+@use_read_replica()
 def address_export_netbox(party_id):
     """Export addresses for a party as NetBox-compatible CSV.
 
@@ -11,6 +11,7 @@ from operator import attrgetter
 
 from flask import abort
 
+from ....database import use_read_replica
 from ....services.newsletter import service as newsletter_service
 from ....services.newsletter.transfer.models import List
 from ....services.user import stats_service as user_stats_service
@@ -33,20 +34,18 @@ class ListWithStats(List):
 def index():
     """List all lists."""
     lists = newsletter_service.get_all_lists()
+    subscriber_counts = newsletter_service.get_subscriber_counts()
 
-    lists_with_stats = list(map(_add_subscriber_count, lists))
+    lists_with_stats = [
+        ListWithStats(list_.id, list_.title, subscriber_counts[list_.id])
+        for list_ in lists
+    ]
 
     return {
         'lists': lists_with_stats,
     }
 
 
-def _add_subscriber_count(list_):
-    subscriber_count = newsletter_service.count_subscribers_for_list(list_.id)
-
-    return ListWithStats(list_.id, list_.title, subscriber_count)
-
-
 @blueprint.get('/lists/<list_id>/subscriptions')
 @permission_required('newsletter.view_subscriptions')
 @templated
@@ -67,6 +66,7 @@ def view_subscriptions(list_id):
 @blueprint.get('/lists/<list_id>/subscriptions/export')
 @permission_required('newsletter.export_subscribers')
 @jsonified
+@use_read_replica()
 def export_subscribers(list_id):
     """Export the screen names and email addresses of enabled users
     which are currently subscribed to that list as JSON.
@@ -90,6 +90,7 @@ def assemble_subscriber_export(subscriber):
 @blueprint.get('/lists/<list_id>/subscriptions/email_addresses/export')
 @permission_required('newsletter.export_subscribers')
 @textified
+@use_read_replica()
 def export_subscriber_email_addresses(list_id):
     """Export the email addresses of enabled users which are currently
     subscribed to that list as plaintext, with one address per row.
@@ -11,6 +11,7 @@ from typing import Optional
 from flask import abort, g, request
 from flask_babel import gettext
 
+from ....database import use_read_replica
 from ....services.brand import service as brand_service
 from ....services.orga import birthday_service as orga_birthday_service
 from ....services.orga import service as orga_service
@@ -130,6 +131,7 @@ def remove_orgaflag(brand_id, user_id):
 @blueprint.get('/persons/<brand_id>/export')
 @permission_required('orga_detail.view')
 @textified
+@use_read_replica()
 def export_persons(brand_id):
     """Export the list of organizers for the brand as a CSV document in
     Microsoft Excel dialect.
@@ -35,6 +35,9 @@ class OrderWithOrderer(Order):
     placed_by: DbUser
 
 
+_ORDER_FIELDS = dataclasses.fields(Order)
+
+
 def extend_order_tuples_with_orderer(
     orders: Sequence[Order],
 ) -> Iterator[OrderWithOrderer]:
@@ -44,8 +47,10 @@ def extend_order_tuples_with_orderer(
 
     for order in orders:
         orderer = orderers_by_id[order.placed_by_id]
-        values = dataclasses.astuple(order) + (orderer,)
-        yield OrderWithOrderer(*values)
+        # Copy field values shallowly. Unlike `dataclasses.astuple`,
+        # this does not recursively copy addresses and line items.
+        values = [getattr(order, field.name) for field in _ORDER_FIELDS]
+        yield OrderWithOrderer(*values, orderer)
 
 
 def get_articles_by_item_number(order: Order) -> dict[ArticleNumber, Article]:
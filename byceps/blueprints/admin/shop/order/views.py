@@ -41,6 +41,10 @@ from . import service
 blueprint = create_blueprint('shop_order_admin', __name__)
 
 
+# Bookkeeping staff go through orders in large pages.
+MAX_ORDERS_PER_PAGE = 500
+
+
 @blueprint.get('/for_shop/<shop_id>', defaults={'page': 1})
 @blueprint.get('/for_shop/<shop_id>/pages/<int:page>')
 @permission_required('shop_order.view')
@@ -52,6 +56,7 @@ def index_for_shop(shop_id, page):
     brand = brand_service.get_brand(shop.brand_id)
 
     per_page = request.args.get('per_page', type=int, default=15)
+    per_page = min(max(per_page, 1), MAX_ORDERS_PER_PAGE)
 
     search_term = request.args.get('search_term', default='').strip()
 
@@ -111,7 +111,7 @@ def view(user_id):
 
     orga_activities = orga_team_service.get_orga_activities_for_user(user.id)
 
-    newsletter_subscription_states = list(
+    newsletter_subscription_states = (
         service.get_newsletter_subscription_states(user.id)
     )
     newsletter_subscription_count = sum(
@@ -830,20 +830,21 @@ def view_events(user_id):
     """Show user's events."""
     user = _get_user_for_admin_or_404(user_id)
 
-    log_entries = list(service.get_log_entries(user.id))
-
     include_logins = request.args.get('include_logins', default='yes') == 'yes'
-    if not include_logins:
-        log_entries = [
-            entry
-            for entry in log_entries
-            if entry['event_type'] != 'user-logged-in'
-        ]
+    cursor = request.args.get('cursor')
+
+    try:
+        log_entries, next_cursor = service.get_log_entries(
+            user.id, cursor=cursor, include_logins=include_logins
+        )
+    except ValueError:
+        abort(400, 'Invalid cursor')
 
     return {
         'profile_user': user,
         'user': user,
         'log_entries': log_entries,
+        'next_cursor': next_cursor,
         'logins_included': include_logins,
     }
 
@@ -12,7 +12,10 @@ from typing import Optional
 from flask import abort, request
 from werkzeug.datastructures import WWWAuthenticate
 
-from ...services.authentication.api import service as api_service
+from ...services.authentication.api import (
+    service as api_service,
+    usage_service as api_usage_service,
+)
 from ...services.authentication.api.transfer.models import ApiToken
 
 
@@ -32,6 +35,8 @@ def api_token_required(func):
             www_authenticate['error'] = 'invalid_token'
             abort(401, www_authenticate=www_authenticate)
 
+        api_usage_service.record_request(api_token.id)
+
         return func(*args, **kwargs)
 
     return wrapper
@@ -42,7 +47,7 @@ def _find_valid_api_token() -> Optional[ApiToken]:
     if request_token is None:
         return None
 
-    return api_service.find_api_token_by_token(request_token)
+    return api_service.find_api_token_by_token_cached(request_token)
 
 
 def _extract_token_from_request() -> Optional[str]:
@@ -0,0 +1,21 @@
+"""
+byceps.blueprints.api.v1.tourney.bracket.models
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from typing import List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class CreateBracketRequest(BaseModel):
+    type: str
+    seeding: Optional[List[UUID]] = None
+
+
+class ConfirmMatchResultRequest(BaseModel):
+    winner_id: UUID
@@ -0,0 +1,120 @@
+"""
+byceps.blueprints.api.v1.tourney.bracket.views
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+from typing import Type
+
+from flask import abort, request, Response, url_for
+from pydantic import BaseModel, ValidationError
+
+from ......events.tourney import (
+    TourneyMatchReady,
+    TourneyMatchScoreConfirmed,
+    TourneyParticipantEliminated,
+)
+from ......services.tourney.bracket import service as bracket_service
+from ......services.tourney import tourney_service
+from ......services.tourney.transfer.models import (
+    BracketType,
+    ParticipantID,
+)
+from ......signals import tourney as tourney_signals
+from ......util.framework.blueprint import create_blueprint
+from ......util.views import respond_created, respond_no_content
+
+from ....decorators import api_token_required
+
+from .models import ConfirmMatchResultRequest, CreateBracketRequest
+
+
+blueprint = create_blueprint('tourney_bracket_api', __name__)
+
+
+SIGNALS_BY_EVENT_TYPE = {
+    TourneyMatchReady: tourney_signals.match_ready,
+    TourneyMatchScoreConfirmed: tourney_signals.match_score_confirmed,
+    TourneyParticipantEliminated: tourney_signals.participant_eliminated,
+}
+
+
+@blueprint.get('/tourneys/<uuid:tourney_id>/bracket')
+@api_token_required
+def view(tourney_id):
+    """Return the tourney's bracket.
+
+    Answer conditional requests with `304 Not Modified` if the bracket
+    has not changed.
+    """
+    bracket_json = bracket_service.get_bracket_json(tourney_id)
+    if bracket_json is None:
+        abort(404)
+
+    response = Response(bracket_json, mimetype='application/json')
+    response.add_etag()
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+
+@blueprint.post('/tourneys/<uuid:tourney_id>/bracket')
+@api_token_required
+@respond_created
+def create(tourney_id):
+    """Create a bracket for the tourney's participants.
+
+    Respond with `409 Conflict` if the tourney already has a bracket.
+    """
+    tourney = tourney_service.find_tourney(tourney_id)
+    if tourney is None:
+        abort(404)
+
+    req = _parse_request(CreateBracketRequest)
+
+    bracket_type = BracketType.__members__.get(req.type)
+    if bracket_type is None:
+        abort(400, 'Unknown bracket type')
+
+    seeding = None
+    if req.seeding is not None:
+        seeding = [ParticipantID(p_id) for p_id in req.seeding]
+
+    try:
+        bracket_service.create_bracket(
+            tourney.id, bracket_type, seeding=seeding
+        )
+    except bracket_service.BracketExists as e:
+        abort(409, str(e))
+    except ValueError as e:
+        abort(400, str(e))
+
+    return url_for('.view', tourney_id=tourney.id)
+
+
+@blueprint.post('/matches/<uuid:match_id>/result')
+@api_token_required
+@respond_no_content
+def confirm_result(match_id):
+    """Confirm the match's result, and let the participants advance."""
+    req = _parse_request(ConfirmMatchResultRequest)
+
+    try:
+        events = bracket_service.confirm_match_result(
+            match_id, ParticipantID(req.winner_id)
+        )
+    except ValueError as e:
+        abort(400, str(e))
+
+    for event in events:
+        signal = SIGNALS_BY_EVENT_TYPE[type(event)]
+        signal.send(None, event=event)
+
+
+def _parse_request(model_class: Type[BaseModel]) -> BaseModel:
+    try:
+        return model_class.parse_obj(request.get_json())
+    except ValidationError as e:
+        abort(400, e.json())
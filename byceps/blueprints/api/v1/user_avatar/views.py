@@ -6,6 +6,8 @@ byceps.blueprints.api.v1.user_avatar.views
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from typing import Optional
+
 from flask import redirect
 
 from .....services.user_avatar import service as user_avatar_service
@@ -16,13 +18,20 @@ from .....util.framework.blueprint import create_blueprint
 blueprint = create_blueprint('user_avatar_api', __name__)
 
 
-@blueprint.get('/by_email_hash/<md5_hash>')
-def get_avatar_url_by_email_address_hash(md5_hash):
+# Let clients and intermediate caches reuse redirects for a while, but
+# not so long that a changed avatar takes ages to show up.
+CACHE_MAX_AGE = 300  # seconds
+
+
+@blueprint.get('/by_email_hash/<email_address_hash>')
+def get_avatar_url_by_email_address_hash(email_address_hash):
     """Redirect to the avatar of the user with that hashed email address.
 
     This endpoint provides a Gravatar.com-like interface to obtain an
     avatar image for a email address. However, no parameters (size,
     etc.) are supported.
+
+    Both MD5 and SHA-256 hashes (as hex digests) are accepted.
     """
     # No extra checks are done regarding user account states because:
     # - uninitialized accounts shouldn't have been able to upload
@@ -33,11 +42,26 @@ def get_avatar_url_by_email_address_hash(md5_hash):
     # - deleted accounts should have their avatar removed by the
     #   deletion process.
 
-    avatar_url = user_avatar_service.get_avatar_url_for_md5_email_address_hash(
-        md5_hash
-    )
+    avatar_url = _find_avatar_url(email_address_hash)
 
     if avatar_url is None:
         avatar_url = FALLBACK_AVATAR_URL_PATH
 
-    return redirect(avatar_url)
+    response = redirect(avatar_url)
+    response.cache_control.public = True
+    response.cache_control.max_age = CACHE_MAX_AGE
+    return response
+
+
+def _find_avatar_url(email_address_hash: str) -> Optional[str]:
+    if len(email_address_hash) == 32:
+        return user_avatar_service.get_avatar_url_for_md5_email_address_hash(
+            email_address_hash
+        )
+
+    if len(email_address_hash) == 64:
+        return user_avatar_service.get_avatar_url_for_sha256_email_address_hash(
+            email_address_hash
+        )
+
+    return None
@@ -144,6 +144,7 @@ def register_api_blueprints(app: Flask) -> None:
         ('attendance',              '/attendances'          ),
         ('snippet',                 '/snippets'             ),
         ('tourney.avatar',          '/tourney/avatars'      ),
+        ('tourney.bracket',         '/tourney'              ),
         ('tourney.match.comments',  '/tourney'              ),
         ('ticketing',               '/ticketing'            ),
         ('user',                    '/users'                ),
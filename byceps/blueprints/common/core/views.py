@@ -13,6 +13,9 @@ from typing import Any
 from flask import g, render_template
 
 from .... import config
+from ....services.authentication.password.hashing_pool import (
+    PasswordHashingOverloaded,
+)
 from ....util.authorization import (
     has_current_user_any_permission,
     has_current_user_permission,
@@ -34,6 +37,13 @@ def not_found(error) -> tuple[str, int]:
     return render_template('error/not_found.html'), 404
 
 
+@blueprint.app_errorhandler(PasswordHashingOverloaded)
+def password_hashing_overloaded(error) -> tuple[str, int, dict[str, str]]:
+    return 'Service temporarily overloaded, please retry.', 503, {
+        'Retry-After': '5',
+    }
+
+
 @blueprint.app_context_processor
 def inject_template_variables() -> dict[str, Any]:
     return {
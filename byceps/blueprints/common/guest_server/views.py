@@ -10,8 +10,6 @@ from __future__ import annotations
 from typing import Iterable
 
 from flask import abort, g
-import qrcode
-from qrcode.image.svg import SvgPathImage
 
 from ....services.guest_server import service as guest_server_service
 from ....services.guest_server.transfer.models import Address, Server
@@ -26,7 +24,8 @@ from ....typing import PartyID
 from ....util.authorization import has_current_user_permission
 from ....util.framework.blueprint import create_blueprint
 from ....util.framework.templating import templated
-from ....util.views import login_required
+from ....util import qrcode_svg
+from ....util.views import create_cacheable_svg_response, login_required
 
 
 blueprint = create_blueprint('guest_server_common', __name__)
@@ -46,22 +45,28 @@ def view_printable_card(server_id):
     addresses = _sort_addresses(server.addresses)
     setting = guest_server_service.get_setting_for_party(party.id)
 
-    site_server_name = _get_site_server_name(party.id)
-    qrcode_data = (
-        f'https://{site_server_name}/guest_servers/servers/{server.id}/admin'
-    )
-    qrcode_svg = _generate_qrcode_svg(qrcode_data)
-    qrcode_svg_inline = _inline_svg(qrcode_svg)
-
     return {
+        'server_id': server.id,
         'party_title': party.title,
         'owner': owner,
         'addresses': addresses,
         'domain': setting.domain,
-        'qrcode': qrcode_svg_inline,
     }
 
 
+@blueprint.get('/guest_servers/<uuid:server_id>/qrcode.svg')
+@login_required
+def view_qrcode(server_id):
+    """Return the QR code that links to the server's admin page."""
+    server = _get_server_or_404(server_id)
+
+    _ensure_user_allowed_to_view_printable_card(server)
+
+    qrcode_svg = _generate_qrcode_svg(server)
+
+    return create_cacheable_svg_response(qrcode_svg, max_age=86400)
+
+
 def _get_server_or_404(server_id) -> Server:
     server = guest_server_service.find_server(server_id)
 
@@ -111,27 +116,8 @@ def _get_site_server_name(party_id: PartyID) -> str:
     return site.server_name
 
 
-def _generate_qrcode_svg(data: str) -> str:
-    """Generate QR code as SVG."""
-    image = qrcode.make(data, border=0, box_size=10, image_factory=SvgPathImage)
-    return image.to_string().decode('utf-8')
-
-
-def _inline_svg(svg: str) -> str:
-    """Encode SVG to be used inline as part of a data URI.
-
-    Replacements are not complete, but sufficient for this case.
-
-    See https://codepen.io/tigt/post/optimizing-svgs-in-data-uris
-    for details.
-    """
-    replaced = (
-        svg
-        .replace('\n', '%0A')
-        .replace('#', '%23')
-        .replace('<', '%3C')
-        .replace('>', '%3E')
-        .replace('"', '\'')
-    )
-
-    return 'data:image/svg+xml,' + replaced
+def _generate_qrcode_svg(server: Server) -> str:
+    """Generate QR code, linking to the server's admin page, as SVG."""
+    site_server_name = _get_site_server_name(server.party_id)
+    data = f'https://{site_server_name}/guest_servers/servers/{server.id}/admin'
+    return qrcode_svg.render_svg(data, box_size=10, border=0)
@@ -10,6 +10,7 @@ Metrics export for `Prometheus <https://prometheus.io/>`_
 
 from flask import Response
 
+from ....database import use_read_replica
 from ....services.metrics import service as metrics_service
 from ....util.framework.blueprint import create_blueprint
 
@@ -18,6 +19,7 @@ blueprint = create_blueprint('metrics', __name__)
 
 
 @blueprint.get('')
+@use_read_replica()
 def metrics():
     """Return metrics."""
     metrics = metrics_service.collect_metrics()
@@ -20,13 +20,12 @@ from ....services.board import (
     posting_query_service as board_posting_query_service,
 )
 from ....services.board.transfer.models import CategoryWithLastUpdate
-from ....services.orga_team import service as orga_team_service
 from ....services.party import service as party_service
 from ....services.party.transfer.models import Party
 from ....services.site import settings_service as site_settings_service
 from ....services.ticketing import ticket_service
-from ....services.user import service as user_service
-from ....services.user_badge import awarding_service as badge_awarding_service
+from ....services.user import loader_service as user_loader_service
+from ....services.user.loader_service import UserLoader
 from ....services.user_badge.transfer.models import Badge
 from ....util.authorization import has_current_user_permission
 from ....typing import BrandID, PartyID, UserID
@@ -37,6 +36,10 @@ from .models import CategoryWithLastUpdateAndUnseenFlag, Creator, Ticket
 DEFAULT_POSTINGS_PER_PAGE = 10
 DEFAULT_TOPICS_PER_PAGE = 10
 
+# Topic lists show the creator's avatar at only 16 pixels, so the
+# smallest available version is sufficient.
+TOPIC_AVATAR_SIZE = 48
+
 
 def add_unseen_postings_flag_to_categories(
     categories: Sequence[CategoryWithLastUpdate], user: CurrentUser
@@ -68,8 +71,9 @@ def add_unseen_postings_flag_to_categories(
 def add_topic_creators(topics: Sequence[DbTopic]) -> None:
     """Add each topic's creator as topic attribute."""
     creator_ids = {t.creator_id for t in topics}
-    creators = user_service.get_users(creator_ids, include_avatars=True)
-    creators_by_id = user_service.index_users_by_id(creators)
+    creators_by_id = user_loader_service.get_loader().get_users(
+        creator_ids, avatar_size=TOPIC_AVATAR_SIZE
+    )
 
     for topic in topics:
         topic.creator = creators_by_id[topic.creator_id]
@@ -117,14 +121,16 @@ def enrich_creators(
     """Enrich creators with their orga status and badges."""
     creator_ids = {posting.creator_id for posting in postings}
 
-    badges_by_user_id = _get_badges_for_users(creator_ids, brand_id)
+    user_loader = user_loader_service.get_loader()
+
+    badges_by_user_id = _get_badges_for_users(
+        user_loader, creator_ids, brand_id
+    )
 
     party: Optional[Party]
     if party_id is not None:
         party = party_service.get_party(party_id)
-        orga_ids = orga_team_service.select_orgas_for_party(
-            creator_ids, party_id
-        )
+        orga_ids = user_loader.get_orga_ids(creator_ids, party_id)
         ticket_users = ticket_service.select_ticket_users_for_party(
             creator_ids, party.id
         )
@@ -150,12 +156,10 @@ def enrich_creators(
 
 
 def _get_badges_for_users(
-    user_ids: set[UserID], brand_id: BrandID
+    user_loader: UserLoader, user_ids: set[UserID], brand_id: BrandID
 ) -> dict[UserID, set[Badge]]:
     """Fetch users' badges that are either global or belong to the brand."""
-    badges_by_user_id = badge_awarding_service.get_badges_awarded_to_users(
-        user_ids, featured_only=True
-    )
+    badges_by_user_id = user_loader.get_badges(user_ids, featured_only=True)
 
     def generate_items():
         for user_id, badges in badges_by_user_id.items():
@@ -8,14 +8,17 @@ byceps.blueprints.site.seating.service
 
 from __future__ import annotations
 from dataclasses import dataclass
-from itertools import chain
-from typing import Iterable, Iterator, Optional
+from typing import Any, Iterable, Iterator, Optional
 
 from ....services.seating.dbmodels.seat import Seat as DbSeat
 from ....services.seating.transfer.models import Seat
 from ....services.ticketing.dbmodels.ticket import Ticket as DbTicket
-from ....services.ticketing.transfer.models import TicketCode, TicketID
-from ....services.user import service as user_service
+from ....services.ticketing.transfer.models import (
+    RelatedTicket,
+    TicketCode,
+    TicketID,
+)
+from ....services.user import loader_service as user_loader_service
 from ....services.user.transfer.models import User
 from ....typing import UserID
 
@@ -30,12 +33,10 @@ class SeatTicket:
 
 def get_users(
     seats_with_tickets: Iterable[tuple[Seat, DbTicket]],
-    managed_tickets: Iterable[DbTicket],
 ) -> dict[UserID, User]:
     seat_tickets = _get_seat_tickets(seats_with_tickets)
-    tickets = chain(seat_tickets, managed_tickets)
 
-    return _get_ticket_users_by_id(tickets)
+    return _get_ticket_users_by_id(seat_tickets)
 
 
 def _get_seat_tickets(
@@ -48,8 +49,7 @@ def _get_seat_tickets(
 
 def _get_ticket_users_by_id(tickets: Iterable[DbTicket]) -> dict[UserID, User]:
     user_ids = set(_get_ticket_user_ids(tickets))
-    users = user_service.get_users(user_ids, include_avatars=True)
-    return user_service.index_users_by_id(users)
+    return user_loader_service.get_loader().get_users(user_ids)
 
 
 def _get_ticket_user_ids(tickets: Iterable[DbTicket]) -> Iterator[UserID]:
@@ -73,16 +73,46 @@ def get_seats_and_tickets(
 
 
 def get_managed_tickets(
-    tickets: Iterable[DbTicket], users_by_id: dict[UserID, User]
+    tickets: Iterable[RelatedTicket],
 ) -> Iterator[tuple[SeatTicket, bool, Optional[str]]]:
     for ticket in tickets:
-        managed_ticket = _build_seat_ticket(ticket, users_by_id)
-        occupies_seat = ticket.occupied_seat_id is not None
+        managed_ticket = SeatTicket(
+            id=ticket.id,
+            code=ticket.code,
+            category_label=ticket.category.title,
+            user=ticket.used_by,
+        )
+        occupies_seat = ticket.occupied_seat is not None
         seat_label = ticket.occupied_seat.label if occupies_seat else None
 
         yield managed_ticket, occupies_seat, seat_label
 
 
+def seat_to_json(
+    seat: Seat, seat_ticket: Optional[SeatTicket]
+) -> dict[str, Any]:
+    user = seat_ticket.user if (seat_ticket is not None) else None
+
+    return {
+        'id': str(seat.id),
+        'label': seat.label,
+        'x': seat.coord_x,
+        'y': seat.coord_y,
+        'rotation': seat.rotation,
+        'type': seat.type_,
+        'occupied': seat_ticket is not None,
+        'user': _user_to_json(user) if (user is not None) else None,
+    }
+
+
+def _user_to_json(user: User) -> dict[str, Any]:
+    return {
+        'id': str(user.id),
+        'screen_name': user.screen_name,
+        'avatar_url': user.avatar_url,
+    }
+
+
 def _build_seat_ticket(
     ticket: DbTicket, users_by_id: dict[UserID, User]
 ) -> SeatTicket:
@@ -6,20 +6,28 @@ byceps.blueprints.site.seating.views
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from flask import abort, g, request
-from flask_babel import gettext
+from flask import abort, g, jsonify, request
+from flask_babel import gettext, ngettext
 
 from ....services.party import service as party_service
 from ....services.seating import area_service as seating_area_service
 from ....services.seating import seat_service
-from ....services.seating.transfer.models import Seat, SeatID
+from ....services.seating.seat_placement import PlacementPreferences
+from ....services.seating.transfer.models import (
+    Area,
+    MAX_COORDINATE,
+    Seat,
+    SeatID,
+)
 from ....services.ticketing.dbmodels.ticket import Ticket as DbTicket
 from ....services.ticketing import (
     exceptions as ticket_exceptions,
+    related_ticket_service,
     ticket_seat_management_service,
     ticket_service,
 )
 from ....services.ticketing.transfer.models import TicketID
+from ....signals import ticketing as ticketing_signals
 from ....util.authorization import has_current_user_permission
 from ....util.framework.blueprint import create_blueprint
 from ....util.framework.flash import flash_error, flash_success
@@ -71,7 +79,7 @@ def view_area(slug):
 
     seats_with_tickets = seat_service.get_seats_with_tickets_for_area(area.id)
 
-    users_by_id = service.get_users(seats_with_tickets, [])
+    users_by_id = service.get_users(seats_with_tickets)
 
     seats_and_tickets = service.get_seats_and_tickets(
         seats_with_tickets, users_by_id
@@ -88,6 +96,56 @@ def view_area(slug):
     }
 
 
+@blueprint.get('/areas/<slug>/seats.json')
+def view_area_seats_as_json(slug):
+    """Return the seats within a region of the area as JSON, so that
+    large areas can be loaded piecewise.
+    """
+    area = _get_area_or_404(slug)
+
+    min_x = _get_coordinate_arg_or_400('min_x')
+    min_y = _get_coordinate_arg_or_400('min_y')
+    max_x = _get_coordinate_arg_or_400('max_x')
+    max_y = _get_coordinate_arg_or_400('max_y')
+
+    seats_with_tickets = seat_service.get_seats_with_tickets_in_region(
+        area.id, min_x, min_y, max_x, max_y
+    )
+
+    users_by_id = service.get_users(seats_with_tickets)
+
+    seats_and_tickets = service.get_seats_and_tickets(
+        seats_with_tickets, users_by_id
+    )
+
+    return jsonify(
+        {
+            'seats': [
+                service.seat_to_json(seat, seat_ticket)
+                for seat, seat_ticket in seats_and_tickets
+            ],
+        }
+    )
+
+
+@blueprint.get('/areas/<slug>/free_seats.json')
+def view_nearest_free_seats_as_json(slug):
+    """Return the free seats of the area nearest to a point as JSON."""
+    area = _get_area_or_404(slug)
+
+    x = _get_coordinate_arg_or_400('x')
+    y = _get_coordinate_arg_or_400('y')
+    limit = min(max(request.args.get('limit', 1, type=int), 1), 100)
+
+    seats = seat_service.find_nearest_free_seats(area.id, x, y, limit)
+
+    return jsonify(
+        {
+            'seats': [service.seat_to_json(seat, None) for seat in seats],
+        }
+    )
+
+
 @blueprint.get('/areas/<slug>/manage_seats')
 @login_required
 @templated('site/seating/view_area')
@@ -123,22 +181,20 @@ def manage_seats_in_area(slug):
     seats_with_tickets = seat_service.get_seats_with_tickets_for_area(area.id)
 
     if seat_manager_id is not None:
-        tickets = ticket_service.find_tickets_for_seat_manager(
+        tickets = related_ticket_service.get_tickets_for_seat_manager(
             seat_manager_id, g.party_id
         )
     else:
         tickets = []
 
-    users_by_id = service.get_users(seats_with_tickets, tickets)
+    users_by_id = service.get_users(seats_with_tickets)
 
     seats_and_tickets = service.get_seats_and_tickets(
         seats_with_tickets, users_by_id
     )
 
     if seat_management_enabled:
-        managed_tickets = list(
-            service.get_managed_tickets(tickets, users_by_id)
-        )
+        managed_tickets = list(service.get_managed_tickets(tickets))
     else:
         managed_tickets = []
 
@@ -219,7 +275,7 @@ def occupy_seat(ticket_id, seat_id):
         return
 
     try:
-        ticket_seat_management_service.occupy_seat(
+        event = ticket_seat_management_service.occupy_seat(
             ticket.id, seat.id, manager.id
         )
     except ticket_exceptions.SeatChangeDeniedForBundledTicket:
@@ -242,6 +298,8 @@ def occupy_seat(ticket_id, seat_id):
     except ValueError:
         abort(404)
 
+    ticketing_signals.ticket_seat_occupied.send(None, event=event)
+
     flash_success(
         gettext(
             '%(seat_label)s has been occupied with ticket %(ticket_code)s.',
@@ -251,6 +309,74 @@ def occupy_seat(ticket_id, seat_id):
     )
 
 
+@blueprint.post('/areas/<slug>/assign_seats')
+@login_required
+def assign_seats_in_area(slug):
+    """Occupy seats close to each other in the area with the tickets
+    whose seats the current user manages.
+    """
+    if not _is_seat_management_enabled():
+        flash_error(
+            gettext('Seat reservations cannot be changed at this time.')
+        )
+        return redirect_to('.view_area', slug=slug)
+
+    area = _get_area_or_404(slug)
+
+    # Bundled tickets occupy seat groups instead.
+    tickets = [
+        ticket
+        for ticket in related_ticket_service.get_tickets_for_seat_manager(
+            g.user.id, g.party_id
+        )
+        if ticket.bundle_id is None
+    ]
+    if not tickets:
+        flash_error(gettext('You do not manage any seats.'))
+        return redirect_to('.manage_seats_in_area', slug=area.slug)
+
+    preferences = PlacementPreferences(
+        adjacent='scattered' not in request.form,
+        same_row='same_row' in request.form,
+    )
+
+    ticket_ids = {ticket.id for ticket in tickets}
+    seat_ids_by_ticket_id = (
+        ticket_seat_management_service.find_seats_for_tickets(
+            ticket_ids, preferences, area_id=area.id
+        )
+    )
+    if seat_ids_by_ticket_id is None:
+        flash_error(gettext('Not enough suitable seats are available.'))
+        return redirect_to('.manage_seats_in_area', slug=area.slug)
+
+    try:
+        events = ticket_seat_management_service.occupy_seats(
+            seat_ids_by_ticket_id, g.user.id
+        )
+    except ticket_exceptions.SeatAlreadyOccupied:
+        flash_error(
+            gettext(
+                'Some of the seats have been occupied in the meantime. '
+                'Please try again.'
+            )
+        )
+        return redirect_to('.manage_seats_in_area', slug=area.slug)
+
+    for event in events:
+        ticketing_signals.ticket_seat_occupied.send(None, event=event)
+
+    flash_success(
+        ngettext(
+            '%(num)d seat has been occupied.',
+            '%(num)d seats have been occupied.',
+            len(events),
+        )
+    )
+
+    return redirect_to('.manage_seats_in_area', slug=area.slug)
+
+
 @blueprint.delete('/ticket/<uuid:ticket_id>/seat')
 @login_required
 @respond_no_content
@@ -290,7 +416,9 @@ def release_seat(ticket_id):
     seat = ticket.occupied_seat
 
     try:
-        ticket_seat_management_service.release_seat(ticket.id, manager.id)
+        event = ticket_seat_management_service.release_seat(
+            ticket.id, manager.id
+        )
     except ticket_exceptions.SeatChangeDeniedForBundledTicket:
         flash_error(
             gettext(
@@ -300,6 +428,8 @@ def release_seat(ticket_id):
         )
         return
 
+    ticketing_signals.ticket_seat_released.send(None, event=event)
+
     flash_success(
         gettext('%(seat_label)s has been released.', seat_label=seat.label)
     )
@@ -323,6 +453,30 @@ def _is_current_user_seating_admin() -> bool:
     return has_current_user_permission('seating.administrate')
 
 
+def _get_area_or_404(slug: str) -> Area:
+    if g.party_id is None:
+        # No party is configured for the current site.
+        abort(404)
+
+    area = seating_area_service.find_area_for_party_by_slug(g.party_id, slug)
+    if area is None:
+        abort(404)
+
+    return area
+
+
+def _get_coordinate_arg_or_400(name: str) -> int:
+    value = request.args.get(name, type=int)
+
+    if value is None:
+        abort(400, f'Integer argument "{name}" is required.')
+
+    if abs(value) > MAX_COORDINATE:
+        abort(400, f'Argument "{name}" is out of range.')
+
+    return value
+
+
 def _get_ticket_or_404(ticket_id: TicketID) -> DbTicket:
     ticket = ticket_service.find_ticket(ticket_id)
 
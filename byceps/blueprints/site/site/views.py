@@ -11,10 +11,11 @@ from flask import g, url_for
 
 from ..page.templating import url_for_site_page
 
-from ....services.site_navigation.service import get_items_for_menu
+from ....services.site_navigation.service import get_item_tree_for_menu
 from ....services.site_navigation.transfer.models import (
     ItemForRendering,
     ItemTargetType,
+    ItemTreeNode,
 )
 from ....util.framework.blueprint import create_blueprint
 from ....util.l10n import get_locale_str
@@ -30,18 +31,24 @@ def get_nav_menu_items(menu_name: str) -> list[ItemForRendering]:
     if locale_str is None:  # outside of request
         return []
 
-    items = get_items_for_menu(g.site_id, menu_name, locale_str)
-    return [_to_item_for_rendering(g.site_id, item) for item in items]
+    nodes = get_item_tree_for_menu(g.site_id, menu_name, locale_str)
+    return [_to_item_for_rendering(g.site_id, node) for node in nodes]
 
 
-def _to_item_for_rendering(site_id: str, item) -> ItemForRendering:
+def _to_item_for_rendering(
+    site_id: str, node: ItemTreeNode
+) -> ItemForRendering:
+    item = node.item
     target = _assemble_target(site_id, item.target_type, item.target)
+    children = [
+        _to_item_for_rendering(site_id, child) for child in node.children
+    ]
 
     return ItemForRendering(
         target=target,
         label=item.label,
         current_page_id=item.current_page_id,
-        children=[],
+        children=children,
     )
 
 
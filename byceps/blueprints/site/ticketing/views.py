@@ -15,6 +15,7 @@ from ....services.shop.order import service as order_service
 from ....services.ticketing import (
     barcode_service,
     category_service as ticket_category_service,
+    related_ticket_service,
     ticket_service,
     ticket_seat_management_service,
     ticket_user_management_service,
@@ -23,7 +24,12 @@ from ....util.framework.blueprint import create_blueprint
 from ....util.framework.flash import flash_error, flash_success
 from ....util.iterables import find
 from ....util.framework.templating import templated
-from ....util.views import login_required, redirect_to, respond_no_content
+from ....util.views import (
+    create_cacheable_svg_response,
+    login_required,
+    redirect_to,
+    respond_no_content,
+)
 
 from .forms import SpecifyUserForm
 from . import notification_service
@@ -45,7 +51,7 @@ def index_mine():
 
     user = g.user
 
-    tickets = ticket_service.find_tickets_related_to_user_for_party(
+    tickets = related_ticket_service.get_tickets_related_to_user_for_party(
         user.id, party.id
     )
 
@@ -94,31 +100,32 @@ def view_printable_html(ticket_id):
     ticket_category = ticket_category_service.get_category(ticket.category_id)
     party = party_service.get_party(ticket_category.party_id)
 
-    barcode_svg = barcode_service.render_svg(ticket.code)
-
-    # Encode SVG to be used inline as part of a data URI.
-    # Replacements are not complete, but sufficient for this case.
-    #
-    # See https://codepen.io/tigt/post/optimizing-svgs-in-data-uris
-    # for details.
-    barcode_svg_inline = barcode_svg \
-            .replace('\n', '%0A') \
-            .replace('#', '%23') \
-            .replace('<', '%3C') \
-            .replace('>', '%3E') \
-            .replace('"', '\'')
-
     return {
+        'ticket_id': ticket.id,
         'party_title': party.title,
         'ticket_code': ticket.code,
         'ticket_category_title': ticket_category.title,
         'ticket_owner': ticket.owned_by,
         'ticket_user': ticket.used_by,
         'occupied_seat': ticket.occupied_seat,
-        'barcode_svg_inline': barcode_svg_inline,
     }
 
 
+@blueprint.get('/tickets/<uuid:ticket_id>/barcode.svg')
+@login_required
+def view_barcode(ticket_id):
+    """Return the ticket code as barcode image."""
+    ticket = _get_ticket_or_404(ticket_id)
+
+    if not _is_user_allowed_to_print_ticket(ticket, g.user.id):
+        # Hide ticket ID validity rather than openly denying access.
+        abort(404)
+
+    barcode_svg = barcode_service.render_svg(ticket.code)
+
+    return create_cacheable_svg_response(barcode_svg, max_age=86400)
+
+
 # -------------------------------------------------------------------- #
 # user
 
@@ -54,8 +54,9 @@ def view():
     newsletter_list_id = _find_newsletter_list_for_brand()
     newsletter_offered = newsletter_list_id is not None
 
-    subscribed_to_newsletter = newsletter_service.is_subscribed(
-        user.id, newsletter_list_id
+    subscribed_to_newsletter = (
+        newsletter_offered
+        and newsletter_service.is_subscribed(user.id, newsletter_list_id)
     )
 
     return {
@@ -4,18 +4,49 @@
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from pathlib import Path
+
 import click
 from flask.cli import with_appcontext
 
-from ...services.user import import_service
+from ...services.user import bulk_import_service, import_service
 
 
 @click.command()
+@click.option(
+    '--bulk',
+    is_flag=True,
+    help='Import in batches (parallel validation and password hashing).',
+)
+@click.option(
+    '--batch-size',
+    type=click.IntRange(min=1),
+    default=bulk_import_service.DEFAULT_BATCH_SIZE,
+    show_default=True,
+    help='Number of lines per transaction (bulk mode only).',
+)
+@click.option(
+    '--checkpoint-file',
+    type=click.Path(dir_okay=False, path_type=Path),
+    help='File to record progress in, to resume from (bulk mode only).',
+)
+@click.option(
+    '--workers',
+    type=click.IntRange(min=1),
+    help='Number of worker processes (bulk mode only).',
+)
 @click.argument('data_file', type=click.File())
 @with_appcontext
-def import_users(data_file) -> None:
+def import_users(
+    bulk, batch_size, checkpoint_file, workers, data_file
+) -> None:
     """Import user accounts."""
     lines = import_service.parse_lines(data_file)
+
+    if bulk:
+        _import_users_in_bulk(lines, batch_size, checkpoint_file, workers)
+        return
+
     for line_number, line in enumerate(lines, start=1):
         try:
             user_to_import = import_service.parse_user_json(line)
@@ -28,3 +59,36 @@ def import_users(data_file) -> None:
             click.secho(
                 f'[line {line_number}] Could not import user: {e}', fg='red'
             )
+
+
+def _import_users_in_bulk(lines, batch_size, checkpoint_file, workers) -> None:
+    results = bulk_import_service.import_users(
+        lines,
+        batch_size=batch_size,
+        checkpoint_file=checkpoint_file,
+        max_workers=workers,
+    )
+
+    imported_count = 0
+    failed_count = 0
+
+    for result in results:
+        if result.succeeded:
+            imported_count += 1
+            click.secho(
+                f'[line {result.line_number}] '
+                f'Imported user {result.screen_name}.',
+                fg='green',
+            )
+        else:
+            failed_count += 1
+            click.secho(
+                f'[line {result.line_number}] '
+                f'Could not import user: {result.error}',
+                fg='red',
+            )
+
+    click.secho(
+        f'Imported {imported_count} user(s), {failed_count} line(s) failed.',
+        fg='green' if failed_count == 0 else 'yellow',
+    )
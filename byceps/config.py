@@ -23,6 +23,7 @@ class AppMode(Enum):
     admin = object()
     base = object()
     site = object()
+    worker = object()
 
     def is_admin(self) -> bool:
         return self == AppMode.admin
@@ -33,6 +34,9 @@ class AppMode(Enum):
     def is_site(self) -> bool:
         return self == AppMode.site
 
+    def is_worker(self) -> bool:
+        return self == AppMode.worker
+
 
 class ConfigurationError(Exception):
     pass
@@ -15,9 +15,18 @@ from pathlib import Path
 # database connection
 SQLALCHEMY_ECHO = False
 
+# connection pool (per application process)
+DATABASE_POOL_SIZE = 5
+# Connections to open beyond the pool size under load.
+DATABASE_POOL_MAX_OVERFLOW = 10
 # Avoid connection errors after database becomes temporarily
 # unreachable, then becomes reachable again.
-SQLALCHEMY_ENGINE_OPTIONS = {'pool_pre_ping': True}
+DATABASE_POOL_PRE_PING = True
+# Seconds after which connections are replaced (-1: never).
+DATABASE_POOL_RECYCLE = -1
+
+# read replica for statistics, exports etc. (`None`: use primary)
+DATABASE_REPLICA_URI = None
 
 # Disable Flask-SQLAlchemy's tracking of object modifications.
 SQLALCHEMY_TRACK_MODIFICATIONS = False
@@ -27,14 +36,36 @@ JOBS_ASYNC = True
 
 # REST API
 API_ENABLED = True
+# Seconds to keep API tokens cached per process (0: disable caching).
+API_TOKEN_CACHE_TTL = 60
 
 # metrics
 METRICS_ENABLED = False
 
+# Prepare the application served by `serve.py` to be shared by forked
+# worker processes (e.g. with Gunicorn's `--preload` option).
+PRELOAD_ENABLED = False
+
+# Publish events for the push application (requires Redis).
+PUSH_ENABLED = False
+
+# Record events in the database, to be passed on to announcements (and
+# push, if enabled) by the outbox relay (which has to be running then).
+OUTBOX_ENABLED = False
+
 # RQ dashboard (for job queue)
 RQ_DASHBOARD_POLL_INTERVAL = 2500
 RQ_DASHBOARD_WEB_BACKGROUND = 'white'
 
+# password hashing
+# Hashes created with a different method are migrated on the next
+# successful login. To switch to scrypt, set to e.g. 'scrypt:32768:8:1'.
+PASSWORD_HASH_METHOD = 'pbkdf2:sha256:320000'
+# Number of worker processes to offload hashing to (0: hash in-process).
+PASSWORD_HASHING_POOL_SIZE = 0
+PASSWORD_HASHING_MAX_CONCURRENCY = 4
+PASSWORD_HASHING_QUEUE_TIMEOUT = 5.0  # seconds
+
 # login sessions
 PERMANENT_SESSION_LIFETIME = timedelta(14)
 SESSION_COOKIE_SAMESITE = 'Lax'
@@ -4,19 +4,28 @@ byceps.database
 
 Database utilities.
 
+Queries can be sent to a read replica (if one is configured) by
+running them within a `use_read_replica` block.
+
 :Copyright: 2014-2022 Jochen Kupperschmidt
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
 from __future__ import annotations
-from typing import Any, Callable, Iterable, Optional, TypeVar
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterable, Iterator, Optional, TypeVar
 import uuid
 
-from flask_sqlalchemy import Pagination, SQLAlchemy
+from flask import Config, Flask
+from flask_sqlalchemy import Pagination, SignallingSession, SQLAlchemy
+from sqlalchemy import DDL, event, orm
 from sqlalchemy.dialects.postgresql import insert, JSONB, UUID
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Query
 from sqlalchemy.sql import Select
 from sqlalchemy.sql.dml import Insert
+from sqlalchemy.sql.selectable import CompoundSelect
 from sqlalchemy.sql.schema import Table
 
 
@@ -26,7 +35,48 @@ T = TypeVar('T')
 Mapper = Callable[[F], T]
 
 
-db = SQLAlchemy(session_options={'autoflush': False})
+REPLICA_BIND_KEY = 'replica'
+
+
+_use_read_replica: ContextVar[bool] = ContextVar(
+    'use_read_replica', default=False
+)
+
+
+class RoutingSession(SignallingSession):
+    """A session that sends reading queries to the read replica inside
+    of `use_read_replica` blocks.
+
+    Only plain `SELECT` statements (without `FOR UPDATE`) are sent to
+    the replica. Flushes and all other statements (including textual
+    ones) always go to the primary database.
+    """
+
+    def get_bind(self, mapper=None, clause=None):
+        if (
+            _use_read_replica.get()
+            and not self._flushing
+            and _is_read_only_select(clause)
+        ):
+            replica_engine = _find_replica_engine(self.app)
+            if replica_engine is not None:
+                return replica_engine
+
+        return super().get_bind(mapper, clause)
+
+
+def _is_read_only_select(clause: Any) -> bool:
+    return isinstance(clause, (Select, CompoundSelect)) and (
+        clause._for_update_arg is None
+    )
+
+
+class RoutingSQLAlchemy(SQLAlchemy):
+    def create_session(self, options):
+        return orm.sessionmaker(class_=RoutingSession, db=self, **options)
+
+
+db = RoutingSQLAlchemy(session_options={'autoflush': False})
 
 
 db.JSONB = JSONB
@@ -46,6 +96,80 @@ def generate_uuid() -> uuid.UUID:
     return uuid.uuid4()
 
 
+def configure_engines(config: Config) -> None:
+    """Derive engine options, and the read replica bind, from the
+    configuration.
+
+    Options explicitly set via `SQLALCHEMY_ENGINE_OPTIONS` take
+    precedence.
+    """
+    engine_options = dict(config.get('SQLALCHEMY_ENGINE_OPTIONS') or {})
+    engine_options.setdefault('pool_size', config['DATABASE_POOL_SIZE'])
+    engine_options.setdefault(
+        'max_overflow', config['DATABASE_POOL_MAX_OVERFLOW']
+    )
+    engine_options.setdefault(
+        'pool_pre_ping', config['DATABASE_POOL_PRE_PING']
+    )
+    engine_options.setdefault('pool_recycle', config['DATABASE_POOL_RECYCLE'])
+    config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options
+
+    replica_uri = config.get('DATABASE_REPLICA_URI')
+    if replica_uri:
+        binds = dict(config.get('SQLALCHEMY_BINDS') or {})
+        binds[REPLICA_BIND_KEY] = replica_uri
+        config['SQLALCHEMY_BINDS'] = binds
+
+
+def dispose_engines(app: Flask) -> None:
+    """Close the connections of the primary (and, if configured, the
+    read replica) database engine's pools.
+    """
+    db.get_engine(app).dispose()
+
+    replica_engine = _find_replica_engine(app)
+    if replica_engine is not None:
+        replica_engine.dispose()
+
+
+def _find_replica_engine(app: Flask) -> Optional[Engine]:
+    binds = app.config.get('SQLALCHEMY_BINDS') or {}
+    if REPLICA_BIND_KEY not in binds:
+        return None
+
+    return db.get_engine(app, bind=REPLICA_BIND_KEY)
+
+
+@contextmanager
+def use_read_replica() -> Iterator[None]:
+    """Send reading queries made via `db.session` within this block (or
+    decorated function) to the read replica, if one is configured.
+
+    The replica might lag behind the primary database. Use it only for
+    data that does not have to be up to date to the second (like
+    statistics and exports), and not to read what has just been written.
+    """
+    token = _use_read_replica.set(True)
+    try:
+        yield
+    finally:
+        _use_read_replica.reset(token)
+
+
+def create_default_partition(table: Table) -> None:
+    """Create a default partition along with the (partitioned) table.
+
+    Rows that do not belong into any other partition are stored in the
+    default partition, so inserts do not fail if no partition has been
+    created for their key (yet).
+    """
+    event.listen(
+        table,
+        'after_create',
+        DDL('CREATE TABLE %(table)s_default PARTITION OF %(table)s DEFAULT'),
+    )
+
+
 def paginate(
     items_query: Select,
     count_query: Select,
@@ -29,6 +29,17 @@ class TicketCheckedIn(_TicketEvent):
     user_screen_name: Optional[str]
 
 
+@dataclass(frozen=True)
+class TicketSeatOccupied(_TicketEvent):
+    seat_id: SeatID
+    previous_seat_id: Optional[SeatID]
+
+
+@dataclass(frozen=True)
+class TicketSeatReleased(_TicketEvent):
+    seat_id: SeatID
+
+
 @dataclass(frozen=True)
 class TicketsSold(_BaseEvent):
     party_id: PartyID
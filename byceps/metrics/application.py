@@ -9,23 +9,40 @@ Run like this (inside a virtual environment)::
 
     $ DATABASE_URI=your-database-uri-here FLASK_APP=app_metrics flask run --port 8090
 
+Set `REDIS_URL` as well to include metrics that are collected in Redis.
+
+Set `DATABASE_REPLICA_URI` to query a read replica instead of the
+primary database.
+
 Metrics then become available at `http://127.0.0.1/metrics`.
 
 :Copyright: 2014-2022 Jochen Kupperschmidt
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from __future__ import annotations
+from typing import Optional
+
 from flask import Flask
+from redis import StrictRedis
 
-from ..database import db
+from ..database import db, REPLICA_BIND_KEY
 from ..util.framework.blueprint import get_blueprint
 
 
-def create_app(database_uri):
+def create_app(
+    database_uri: str,
+    redis_url: Optional[str] = None,
+    database_replica_uri: Optional[str] = None,
+) -> Flask:
     """Create the actual Flask application."""
     app = Flask(__name__)
 
     app.config['SQLALCHEMY_DATABASE_URI'] = database_uri
+    if database_replica_uri:
+        app.config['SQLALCHEMY_BINDS'] = {
+            REPLICA_BIND_KEY: database_replica_uri
+        }
 
     # Disable Flask-SQLAlchemy's tracking of object modifications.
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
@@ -33,6 +50,9 @@ def create_app(database_uri):
     # Initialize database.
     db.init_app(app)
 
+    if redis_url:
+        app.redis_client = StrictRedis.from_url(redis_url)
+
     blueprint = get_blueprint('monitoring.metrics')
     app.register_blueprint(blueprint, url_prefix='/metrics')
 
@@ -0,0 +1,50 @@
+"""
+byceps.outbox.connections
+~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Connect event signals to recording events in the outbox.
+
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+from typing import Optional
+
+from flask import current_app
+
+from ..announce.connections import SIGNALS as ANNOUNCE_SIGNALS
+from ..events.base import _BaseEvent
+from ..push.connections import SIGNALS as PUSH_SIGNALS
+from ..services.outbox import outbox_service
+from ..signals import ticketing as ticketing_signals
+
+
+# The events sent via these signals are recorded by the services, in
+# the same transaction as the change they are about.
+SIGNALS_RECORDED_BY_SERVICES = frozenset(
+    [
+        ticketing_signals.ticket_checked_in,
+        ticketing_signals.ticket_seat_occupied,
+        ticketing_signals.ticket_seat_released,
+    ]
+)
+
+
+def receive_signal(sender, *, event: Optional[_BaseEvent] = None) -> None:
+    if event is None:
+        return None
+
+    if not current_app.config['OUTBOX_ENABLED']:
+        return None
+
+    outbox_service.append_event(event)
+
+
+SIGNALS = []
+for signal in ANNOUNCE_SIGNALS + PUSH_SIGNALS:
+    if (signal not in SIGNALS) and (signal not in SIGNALS_RECORDED_BY_SERVICES):
+        SIGNALS.append(signal)
+
+for signal in SIGNALS:
+    signal.connect(receive_signal)
@@ -0,0 +1,105 @@
+"""
+byceps.outbox.relay
+~~~~~~~~~~~~~~~~~~~
+
+Pass events recorded in the outbox on to consumers.
+
+Each consumer has a cursor that points to the last event it has taken.
+Events are passed on ordered by the database transaction that has
+recorded them, and the cursor is advanced afterwards. Should the relay
+be interrupted before the cursor has been advanced, events are passed
+on again (i.e. delivery is "at least once").
+
+Events are held back until their transaction and all older ones have
+ended, so that none is skipped because it has been committed late.
+
+Multiple relay processes can run at the same time; a consumer's
+cursor is locked while a batch of events is passed to it.
+
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+import time
+from typing import Callable
+
+from flask import current_app
+
+from ..announce.connections import announce_event
+from ..database import db
+from ..events.base import _BaseEvent
+from ..push.connections import publish_event
+from ..services.outbox import outbox_service
+
+
+Consumer = Callable[[_BaseEvent], None]
+
+
+CONSUMERS: dict[str, Consumer] = {
+    'announce': announce_event,
+    'push': publish_event,
+}
+
+
+def run(
+    consumers: dict[str, Consumer], *, interval: float, batch_size: int
+) -> None:
+    """Pass events on to the consumers until interrupted.
+
+    Wait for the interval (in seconds) whenever no events are pending.
+    """
+    while True:
+        relayed_count = 0
+
+        for consumer_name, consumer in consumers.items():
+            try:
+                relayed_count += relay_events(
+                    consumer_name, consumer, batch_size=batch_size
+                )
+            except Exception:
+                db.session.rollback()
+                current_app.logger.exception(
+                    'Relaying events to consumer "%s" failed.', consumer_name
+                )
+
+        if relayed_count == 0:
+            time.sleep(interval)
+
+
+def relay_events(
+    consumer_name: str, consumer: Consumer, *, batch_size: int
+) -> int:
+    """Pass the next batch of events on to the consumer.
+
+    Return the number of events passed on.
+    """
+    position = outbox_service.lock_cursor(consumer_name)
+    if position is None:
+        # Another relay is passing events to this consumer.
+        db.session.rollback()
+        return 0
+
+    outbox_events = outbox_service.get_events_after(position, batch_size)
+
+    relayed_count = 0
+
+    try:
+        for outbox_event in outbox_events:
+            consumer(outbox_event.event)
+            position = outbox_event.position
+            relayed_count += 1
+    except Exception:
+        # Keep the progress made before the consumer failed.
+        db.session.rollback()
+        if relayed_count > 0:
+            outbox_service.advance_cursor(consumer_name, position)
+        raise
+
+    if relayed_count > 0:
+        outbox_service.advance_cursor(consumer_name, position)
+    else:
+        # Release the lock.
+        db.session.rollback()
+
+    return relayed_count
@@ -0,0 +1,354 @@
+"""
+byceps.push.application
+~~~~~~~~~~~~~~~~~~~~~~~
+
+Push events to browsers via Server-Sent Events.
+
+This is an asyncio-based ASGI application, separate from the Flask
+applications, so that many long-lived connections do not tie up
+request-handling threads. It requires an ASGI server to run.
+
+Clients subscribe to one or more topics::
+
+    GET /events?topic=party:acmecon-2022&topic=board_topic:…
+
+A single Redis subscription per process receives all published
+messages, which are then fanned out to the clients subscribed to their
+topics.
+
+Each client has a bounded queue. Clients that do not keep up are
+disconnected (browsers reconnect automatically) instead of making the
+process buffer an unbounded number of messages for them. The number of
+concurrent connections per process is limited as well.
+
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+import asyncio
+from contextlib import suppress
+from dataclasses import dataclass
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional
+from urllib.parse import parse_qs
+
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+
+from .topics import CHANNEL_PREFIX, is_valid_topic
+
+
+logger = logging.getLogger(__name__)
+
+
+Scope = Dict[str, Any]
+Receive = Callable[[], Awaitable[Dict[str, Any]]]
+Send = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+# Frames that have queued up for a client are sent together, but no
+# more than this many at once.
+MAX_FRAMES_PER_SEND = 64
+
+# Tell browsers how long to wait before reconnecting (in milliseconds).
+RECONNECT_DELAY_FRAME = b'retry: 5000\n\n'
+
+HEARTBEAT_FRAME = b': heartbeat\n\n'
+
+
+@dataclass(frozen=True)
+class PushConfig:
+    max_connections: int = 1000
+    max_topics_per_connection: int = 10
+    queue_size: int = 100
+    heartbeat_interval: float = 15.0  # seconds
+    redis_reconnect_interval: float = 3.0  # seconds
+    allowed_origins: frozenset[str] = frozenset()
+
+
+class Subscriber:
+    """A connected client."""
+
+    def __init__(self, topics: frozenset[str], queue_size: int) -> None:
+        self.topics = topics
+        self.queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=queue_size)
+        self.overflowed = asyncio.Event()
+
+    def offer(self, frame: bytes) -> None:
+        """Queue the frame, or mark the subscriber as overflowed if it
+        does not keep up.
+        """
+        try:
+            self.queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            self.overflowed.set()
+
+    def take_frames(self, first_frame: bytes) -> bytes:
+        """Return the frame and the ones queued after it, joined."""
+        frames = [first_frame]
+        while len(frames) < MAX_FRAMES_PER_SEND:
+            try:
+                frames.append(self.queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+
+        return b''.join(frames)
+
+
+class Hub:
+    """Receive published messages from Redis and fan them out to the
+    subscribers of their topics.
+    """
+
+    def __init__(self, redis_url: str, reconnect_interval: float) -> None:
+        self._redis_url = redis_url
+        self._reconnect_interval = reconnect_interval
+        self._subscribers_by_topic: dict[str, set[Subscriber]] = {}
+        self.subscriber_count = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    def add(self, subscriber: Subscriber) -> None:
+        for topic in subscriber.topics:
+            self._subscribers_by_topic.setdefault(topic, set()).add(subscriber)
+        self.subscriber_count += 1
+
+    def remove(self, subscriber: Subscriber) -> None:
+        for topic in subscriber.topics:
+            subscribers = self._subscribers_by_topic.get(topic)
+            if subscribers is None:
+                continue
+
+            subscribers.discard(subscriber)
+            if not subscribers:
+                del self._subscribers_by_topic[topic]
+        self.subscriber_count -= 1
+
+    def dispatch(self, topic: str, message: bytes) -> None:
+        """Hand the message to the topic's subscribers."""
+        subscribers = self._subscribers_by_topic.get(topic)
+        if not subscribers:
+            return
+
+        # Build the frame only once for all subscribers.
+        frame = b'data: ' + message + b'\n\n'
+        for subscriber in subscribers:
+            subscriber.offer(frame)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._receive()
+            except (OSError, RedisError) as e:
+                logger.warning('Lost subscription to push channels: %s', e)
+
+            await asyncio.sleep(self._reconnect_interval)
+
+    async def _receive(self) -> None:
+        client = aioredis.Redis.from_url(self._redis_url)
+        try:
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            await pubsub.psubscribe(CHANNEL_PREFIX + '*')
+
+            async for message in pubsub.listen():
+                if message['type'] != 'pmessage':
+                    continue
+
+                channel = message['channel'].decode('utf-8')
+                topic = channel[len(CHANNEL_PREFIX) :]
+                self.dispatch(topic, message['data'])
+        finally:
+            await client.close()
+
+
+class PushApp:
+    """ASGI application that streams messages to subscribed clients."""
+
+    def __init__(self, redis_url: str, config: PushConfig) -> None:
+        self.config = config
+        self.hub = Hub(redis_url, config.redis_reconnect_interval)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] == 'lifespan':
+            await self._handle_lifespan(receive, send)
+        elif scope['type'] == 'http':
+            await self._handle_request(scope, receive, send)
+
+    async def _handle_lifespan(self, receive: Receive, send: Send) -> None:
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                self.hub.start()
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await self.hub.stop()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def _handle_request(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if scope['path'] != '/events':
+            await _send_response(send, 404, 'Not Found')
+            return
+
+        if scope['method'] != 'GET':
+            await _send_response(
+                send, 405, 'Method Not Allowed', [(b'allow', b'GET')]
+            )
+            return
+
+        topics = _parse_topics(scope['query_string'])
+        if not topics:
+            await _send_response(send, 400, 'No topic given.')
+            return
+
+        if len(topics) > self.config.max_topics_per_connection:
+            await _send_response(send, 400, 'Too many topics given.')
+            return
+
+        if not all(is_valid_topic(topic) for topic in topics):
+            await _send_response(send, 400, 'Invalid topic given.')
+            return
+
+        if self.hub.subscriber_count >= self.config.max_connections:
+            await _send_response(
+                send, 503, 'Too many connections.', [(b'retry-after', b'10')]
+            )
+            return
+
+        # Start here as well in case the server does not support
+        # lifespan events.
+        self.hub.start()
+
+        subscriber = Subscriber(topics, self.config.queue_size)
+        self.hub.add(subscriber)
+        try:
+            await self._stream(scope, receive, send, subscriber)
+        finally:
+            self.hub.remove(subscriber)
+
+    async def _stream(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        subscriber: Subscriber,
+    ) -> None:
+        headers = [
+            (b'content-type', b'text/event-stream'),
+            (b'cache-control', b'no-cache'),
+            # Prevent proxies (e.g. nginx) from buffering the stream.
+            (b'x-accel-buffering', b'no'),
+        ]
+        origin = _get_header(scope, b'origin')
+        if (origin is not None) and (
+            origin.decode('latin-1') in self.config.allowed_origins
+        ):
+            headers.append((b'access-control-allow-origin', origin))
+            headers.append((b'vary', b'origin'))
+
+        await send(
+            {'type': 'http.response.start', 'status': 200, 'headers': headers}
+        )
+        await _send_body(send, RECONNECT_DELAY_FRAME)
+
+        disconnected = asyncio.create_task(_wait_for_disconnect(receive))
+        overflowed = asyncio.create_task(subscriber.overflowed.wait())
+        try:
+            while True:
+                next_frame = asyncio.create_task(subscriber.queue.get())
+                done, _ = await asyncio.wait(
+                    {next_frame, disconnected, overflowed},
+                    timeout=self.config.heartbeat_interval,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+
+                if disconnected in done:
+                    next_frame.cancel()
+                    return
+
+                # Check the event itself instead of whether the task
+                # waiting for it is done, as under sustained load a
+                # frame is always ready as well.
+                if subscriber.overflowed.is_set():
+                    next_frame.cancel()
+                    # Let the client reconnect and refetch.
+                    break
+
+                if next_frame in done:
+                    body = subscriber.take_frames(next_frame.result())
+                    await _send_body(send, body)
+                    continue
+
+                next_frame.cancel()
+
+                # Keep the connection from being closed by proxies
+                # due to inactivity.
+                await _send_body(send, HEARTBEAT_FRAME)
+        finally:
+            disconnected.cancel()
+            overflowed.cancel()
+
+        await send({'type': 'http.response.body', 'body': b''})
+
+
+def _parse_topics(query_string: bytes) -> frozenset[str]:
+    params = parse_qs(query_string.decode('latin-1'))
+    return frozenset(params.get('topic', []))
+
+
+def _get_header(scope: Scope, name: bytes) -> Optional[bytes]:
+    for header_name, value in scope['headers']:
+        if header_name == name:
+            return value
+
+    return None
+
+
+async def _wait_for_disconnect(receive: Receive) -> None:
+    while True:
+        message = await receive()
+        if message['type'] == 'http.disconnect':
+            return
+
+
+async def _send_body(send: Send, body: bytes) -> None:
+    await send({'type': 'http.response.body', 'body': body, 'more_body': True})
+
+
+async def _send_response(
+    send: Send,
+    status: int,
+    text: str,
+    extra_headers: Optional[list[tuple[bytes, bytes]]] = None,
+) -> None:
+    headers = [(b'content-type', b'text/plain; charset=utf-8')]
+    if extra_headers:
+        headers.extend(extra_headers)
+
+    await send(
+        {'type': 'http.response.start', 'status': status, 'headers': headers}
+    )
+    await send({'type': 'http.response.body', 'body': text.encode('utf-8')})
+
+
+def create_app(redis_url: str, config: Optional[PushConfig] = None) -> PushApp:
+    """Create the push application."""
+    if config is None:
+        config = PushConfig()
+
+    return PushApp(redis_url, config)
@@ -0,0 +1,260 @@
+"""
+byceps.push.connections
+~~~~~~~~~~~~~~~~~~~~~~~
+
+Connect event signals to publishing to push topics.
+
+Messages only contain the name of the event, when it occurred, and the
+IDs of the affected objects, but no contents. Subscriptions are not
+authorized, so clients are expected to (re)fetch whatever they are
+allowed to see.
+
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+import json
+from typing import Any, Callable, Optional
+
+from flask import current_app
+from redis.exceptions import RedisError
+
+from ..announce.events import get_name_for_event
+from ..events.base import _BaseEvent
+from ..events.board import (
+    BoardPostingCreated,
+    BoardPostingHidden,
+    BoardPostingUnhidden,
+    BoardPostingUpdated,
+    BoardTopicHidden,
+    BoardTopicLocked,
+    BoardTopicMoved,
+    BoardTopicPinned,
+    BoardTopicUnhidden,
+    BoardTopicUnlocked,
+    BoardTopicUnpinned,
+    BoardTopicUpdated,
+)
+from ..events.ticketing import (
+    TicketCheckedIn,
+    TicketSeatOccupied,
+    TicketSeatReleased,
+    TicketsSold,
+)
+from ..events.tourney import (
+    TourneyStarted,
+    TourneyPaused,
+    TourneyCanceled,
+    TourneyFinished,
+    TourneyMatchReady,
+    TourneyMatchReset,
+    TourneyMatchScoreSubmitted,
+    TourneyMatchScoreConfirmed,
+    TourneyMatchScoreRandomized,
+    TourneyParticipantReady,
+    TourneyParticipantEliminated,
+    TourneyParticipantWarned,
+    TourneyParticipantDisqualified,
+)
+from ..services.seating import seat_service
+from ..services.ticketing import ticket_service
+from ..signals import board as board_signals
+from ..signals import ticketing as ticketing_signals
+from ..signals import tourney as tourney_signals
+
+from .topics import build_channel, build_topic
+
+
+# Only attributes with these names are included in messages.
+PUBLIC_ATTRIBUTE_NAMES = frozenset(
+    [
+        'board_id',
+        'match_id',
+        'participant1_id',
+        'participant2_id',
+        'participant_id',
+        'party_id',
+        'posting_id',
+        'previous_seat_id',
+        'seat_id',
+        'ticket_id',
+        'topic_id',
+        'tourney_id',
+    ]
+)
+
+
+def _get_board_topic_topics(event: Any) -> list[str]:
+    return [build_topic('board_topic', event.topic_id)]
+
+
+def _get_party_topics(event: Any) -> list[str]:
+    return [build_topic('party', event.party_id)]
+
+
+def _get_ticket_party_topics(event: Any) -> list[str]:
+    db_ticket = ticket_service.find_ticket(event.ticket_id)
+    if db_ticket is None:
+        return []
+
+    return [build_topic('party', db_ticket.party_id)]
+
+
+def _get_seating_area_topics(event: Any) -> list[str]:
+    seat_ids = [event.seat_id, getattr(event, 'previous_seat_id', None)]
+
+    area_ids = set()
+    for seat_id in filter(None, seat_ids):
+        seat = seat_service.find_seat(seat_id)
+        if seat is not None:
+            area_ids.add(seat.area_id)
+
+    return [build_topic('seating_area', area_id) for area_id in area_ids]
+
+
+def _get_tourney_topics(event: Any) -> list[str]:
+    return [build_topic('tourney', event.tourney_id)]
+
+
+def _get_tourney_match_topics(event: Any) -> list[str]:
+    return [
+        build_topic('tourney', event.tourney_id),
+        build_topic('tourney_match', event.match_id),
+    ]
+
+
+EVENT_TYPES_TO_TOPIC_GETTERS: dict[type, Callable[[Any], list[str]]] = {
+    BoardPostingCreated: _get_board_topic_topics,
+    BoardPostingUpdated: _get_board_topic_topics,
+    BoardPostingHidden: _get_board_topic_topics,
+    BoardPostingUnhidden: _get_board_topic_topics,
+    BoardTopicUpdated: _get_board_topic_topics,
+    BoardTopicHidden: _get_board_topic_topics,
+    BoardTopicUnhidden: _get_board_topic_topics,
+    BoardTopicLocked: _get_board_topic_topics,
+    BoardTopicUnlocked: _get_board_topic_topics,
+    BoardTopicPinned: _get_board_topic_topics,
+    BoardTopicUnpinned: _get_board_topic_topics,
+    BoardTopicMoved: _get_board_topic_topics,
+    TicketCheckedIn: _get_ticket_party_topics,
+    TicketSeatOccupied: _get_seating_area_topics,
+    TicketSeatReleased: _get_seating_area_topics,
+    TicketsSold: _get_party_topics,
+    TourneyStarted: _get_tourney_topics,
+    TourneyPaused: _get_tourney_topics,
+    TourneyCanceled: _get_tourney_topics,
+    TourneyFinished: _get_tourney_topics,
+    TourneyMatchReady: _get_tourney_match_topics,
+    TourneyMatchReset: _get_tourney_match_topics,
+    TourneyMatchScoreSubmitted: _get_tourney_match_topics,
+    TourneyMatchScoreConfirmed: _get_tourney_match_topics,
+    TourneyMatchScoreRandomized: _get_tourney_match_topics,
+    TourneyParticipantReady: _get_tourney_match_topics,
+    TourneyParticipantEliminated: _get_tourney_match_topics,
+    TourneyParticipantWarned: _get_tourney_match_topics,
+    TourneyParticipantDisqualified: _get_tourney_match_topics,
+}
+
+
+def receive_signal(sender, *, event: Optional[_BaseEvent] = None) -> None:
+    if event is None:
+        return None
+
+    if not current_app.config['PUSH_ENABLED']:
+        return None
+
+    if current_app.config['OUTBOX_ENABLED']:
+        # The event is recorded in the outbox and published by the
+        # outbox relay.
+        return None
+
+    publish_event(event)
+
+
+def publish_event(event: _BaseEvent) -> None:
+    """Publish the event to the topics of the objects it affects."""
+    get_topics = EVENT_TYPES_TO_TOPIC_GETTERS.get(type(event))
+    if get_topics is None:
+        return None
+
+    topics = get_topics(event)
+    if not topics:
+        return None
+
+    publish(event, topics)
+
+
+def publish(event: _BaseEvent, topics: list[str]) -> None:
+    """Publish the event to the topics' channels.
+
+    Delivery is best effort: Clients that are not connected at that
+    time do not receive the message.
+    """
+    message = serialize_event(event)
+
+    try:
+        pipeline = current_app.redis_client.pipeline(transaction=False)
+        for topic in topics:
+            pipeline.publish(build_channel(topic), message)
+        pipeline.execute()
+    except RedisError as e:
+        current_app.logger.warning('Could not publish push message: %s', e)
+
+
+def serialize_event(event: _BaseEvent) -> str:
+    """Serialize the event to a message.
+
+    The result must not contain line breaks as it is sent as a single
+    Server-Sent Events data line.
+    """
+    data = {
+        name: (str(value) if value is not None else None)
+        for name, value in vars(event).items()
+        if name in PUBLIC_ATTRIBUTE_NAMES
+    }
+
+    return json.dumps(
+        {
+            'event': get_name_for_event(event),
+            'occurred_at': event.occurred_at.isoformat(),
+            'data': data,
+        },
+        separators=(',', ':'),
+        sort_keys=True,
+    )
+
+
+SIGNALS = [
+    board_signals.posting_created,
+    board_signals.posting_updated,
+    board_signals.posting_hidden,
+    board_signals.posting_unhidden,
+    board_signals.topic_updated,
+    board_signals.topic_hidden,
+    board_signals.topic_unhidden,
+    board_signals.topic_locked,
+    board_signals.topic_unlocked,
+    board_signals.topic_pinned,
+    board_signals.topic_unpinned,
+    board_signals.topic_moved,
+    ticketing_signals.ticket_checked_in,
+    ticketing_signals.ticket_seat_occupied,
+    ticketing_signals.ticket_seat_released,
+    ticketing_signals.tickets_sold,
+    tourney_signals.tourney_started,
+    tourney_signals.tourney_paused,
+    tourney_signals.tourney_canceled,
+    tourney_signals.tourney_finished,
+    tourney_signals.match_ready,
+    tourney_signals.match_reset,
+    tourney_signals.match_score_submitted,
+    tourney_signals.match_score_confirmed,
+    tourney_signals.match_score_randomized,
+    tourney_signals.participant_ready,
+    tourney_signals.participant_eliminated,
+    tourney_signals.participant_warned,
+    tourney_signals.participant_disqualified,
+]
+for signal in SIGNALS:
+    signal.connect(receive_signal)
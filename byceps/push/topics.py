@@ -0,0 +1,49 @@
+"""
+byceps.push.topics
+~~~~~~~~~~~~~~~~~~
+
+Topics that clients can subscribe to.
+
+A topic consists of a kind and the ID of an object, e.g.
+``tourney_match:0e3a…``. Each topic corresponds to a Redis pub/sub
+channel.
+
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import re
+
+
+CHANNEL_PREFIX = 'byceps:push:'
+
+TOPIC_KINDS = frozenset(
+    [
+        'board_topic',
+        'party',
+        'seating_area',
+        'tourney',
+        'tourney_match',
+    ]
+)
+
+TOPIC_PATTERN = re.compile(r'([a-z_]+):([0-9A-Za-z_-]{1,64})')
+
+
+def build_topic(kind: str, object_id: object) -> str:
+    """Assemble a topic for the object."""
+    if kind not in TOPIC_KINDS:
+        raise ValueError(f'Unknown topic kind "{kind}"')
+
+    return f'{kind}:{object_id}'
+
+
+def is_valid_topic(topic: str) -> bool:
+    """Return `True` if the topic is well-formed and of a known kind."""
+    match = TOPIC_PATTERN.fullmatch(topic)
+    return (match is not None) and (match.group(1) in TOPIC_KINDS)
+
+
+def build_channel(topic: str) -> str:
+    """Return the name of the Redis channel for the topic."""
+    return CHANNEL_PREFIX + topic
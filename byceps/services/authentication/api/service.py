@@ -11,7 +11,7 @@ from secrets import token_urlsafe
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, select, update
 
 from ....database import db
 from ....typing import UserID
@@ -19,6 +19,7 @@ from ....typing import UserID
 from ...authorization.transfer.models import PermissionID
 
 from .dbmodels import ApiToken as DbApiToken
+from . import token_cache, usage_service
 from .transfer.models import ApiToken
 
 
@@ -54,6 +55,14 @@ def find_api_token_by_token(token: str) -> Optional[ApiToken]:
     return _db_entity_to_api_token(db_api_token)
 
 
+def find_api_token_by_token_cached(token: str) -> Optional[ApiToken]:
+    """Return the API token for that token, or nothing if not found.
+
+    Recently used tokens are returned from a cache.
+    """
+    return token_cache.get_or_load(token, find_api_token_by_token)
+
+
 def get_all_api_tokens() -> list[ApiToken]:
     """Return all API tokens."""
     db_api_tokens = db.session.execute(
@@ -65,6 +74,28 @@ def get_all_api_tokens() -> list[ApiToken]:
     ]
 
 
+def suspend_api_token(api_token_id: UUID) -> None:
+    """Suspend the API token."""
+    _set_suspended(api_token_id, True)
+
+
+def unsuspend_api_token(api_token_id: UUID) -> None:
+    """Unsuspend the API token."""
+    _set_suspended(api_token_id, False)
+
+
+def _set_suspended(api_token_id: UUID, suspended: bool) -> None:
+    db.session.execute(
+        update(DbApiToken)
+        .where(DbApiToken.id == api_token_id)
+        .values(suspended=suspended)
+        .execution_options(synchronize_session='fetch')
+    )
+    db.session.commit()
+
+    token_cache.invalidate(api_token_id)
+
+
 def delete_api_token(api_token_id: UUID) -> None:
     """Delete user's credentials."""
     db.session.execute(
@@ -74,6 +105,9 @@ def delete_api_token(api_token_id: UUID) -> None:
     )
     db.session.commit()
 
+    token_cache.invalidate(api_token_id)
+    usage_service.delete_request_count(api_token_id)
+
 
 def _db_entity_to_api_token(db_api_token: DbApiToken) -> ApiToken:
     return ApiToken(
@@ -0,0 +1,216 @@
+"""
+byceps.services.authentication.api.token_cache
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Keep recently used API tokens (including their permissions) in memory
+to avoid hitting the database on every API request.
+
+Entries are keyed by a hash of the token (so the tokens themselves do
+not serve as dictionary keys) and expire after
+``API_TOKEN_CACHE_TTL`` seconds. Setting that to zero disables the
+cache.
+
+When a token is changed or deleted, its ID is published via Redis so
+that every application process evicts it immediately. Caching is only
+done while the process is subscribed to these notifications; if the
+subscription fails, tokens are looked up in the database again.
+
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+import hashlib
+import os
+from threading import Lock, Thread
+from time import monotonic
+from typing import Callable, Optional
+from uuid import UUID
+
+from flask import current_app
+from redis import StrictRedis
+from redis.exceptions import RedisError
+
+from .transfer.models import ApiToken
+
+
+INVALIDATION_CHANNEL = 'byceps:api_token_invalidations'
+
+
+class TokenCache:
+    """A thread-safe cache of API tokens with a time to live."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._entries: dict[str, tuple[float, ApiToken]] = {}
+        self._eviction_count = 0
+
+    def get_or_load(
+        self,
+        token: str,
+        loader: Callable[[str], Optional[ApiToken]],
+        ttl: float,
+    ) -> Optional[ApiToken]:
+        """Return the cached API token for that token, or load (and
+        cache) it on a miss.
+
+        A loaded token is not cached if an eviction happened while it
+        was being loaded, as it might already be outdated.
+        """
+        api_token = self.get(token)
+        if api_token is not None:
+            return api_token
+
+        with self._lock:
+            eviction_count = self._eviction_count
+
+        api_token = loader(token)
+        if api_token is None:
+            return None
+
+        with self._lock:
+            if self._eviction_count == eviction_count:
+                key = _hash_token(token)
+                self._entries[key] = (monotonic() + ttl, api_token)
+
+        return api_token
+
+    def get(self, token: str) -> Optional[ApiToken]:
+        """Return the cached API token for that token, or `None` if it
+        is not cached or has expired.
+        """
+        key = _hash_token(token)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, api_token = entry
+            if monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+
+            return api_token
+
+    def evict(self, api_token_id: UUID) -> None:
+        """Remove the API token with that ID, if cached."""
+        with self._lock:
+            keys = [
+                key
+                for key, (_, api_token) in self._entries.items()
+                if api_token.id == api_token_id
+            ]
+            for key in keys:
+                del self._entries[key]
+
+            self._eviction_count += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._eviction_count += 1
+
+
+def _hash_token(token: str) -> str:
+    return hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+
+class _ProcessState:
+    """Cache and invalidation listener of the current process.
+
+    Both are re-created after a fork, as the listener thread does not
+    survive it.
+    """
+
+    def __init__(self) -> None:
+        self.lock = Lock()
+        self.pid: Optional[int] = None
+        self.cache = TokenCache()
+        self.listener: Optional[Thread] = None
+        self.next_attempt_at = 0.0
+
+    def get_cache(
+        self, redis_client: StrictRedis, retry_interval: float
+    ) -> Optional[TokenCache]:
+        """Return the cache if invalidations can be received, `None`
+        otherwise.
+        """
+        with self.lock:
+            pid = os.getpid()
+            if self.pid != pid:
+                self.pid = pid
+                self.cache = TokenCache()
+                self.listener = None
+                self.next_attempt_at = 0.0
+
+            if (self.listener is None) or not self.listener.is_alive():
+                # Invalidations might have been missed.
+                self.cache.clear()
+                self.listener = None
+
+                now = monotonic()
+                if now < self.next_attempt_at:
+                    return None
+
+                self.listener = _start_listener(redis_client, self.cache)
+                if self.listener is None:
+                    self.next_attempt_at = now + retry_interval
+                    return None
+
+            return self.cache
+
+
+def _start_listener(
+    redis_client: StrictRedis, cache: TokenCache
+) -> Optional[Thread]:
+    def handle_message(message) -> None:
+        try:
+            api_token_id = UUID(message['data'].decode('ascii'))
+        except (AttributeError, ValueError):
+            return
+
+        cache.evict(api_token_id)
+
+    try:
+        pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(**{INVALIDATION_CHANNEL: handle_message})
+        return pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+    except RedisError as e:
+        current_app.logger.warning(
+            'Could not subscribe to API token invalidations: %s', e
+        )
+        return None
+
+
+_state = _ProcessState()
+
+
+def get_or_load(
+    token: str, loader: Callable[[str], Optional[ApiToken]]
+) -> Optional[ApiToken]:
+    """Return the API token for that token, from the cache if possible,
+    otherwise from the loader.
+    """
+    ttl = current_app.config['API_TOKEN_CACHE_TTL']
+    if ttl <= 0:
+        return loader(token)
+
+    cache = _state.get_cache(current_app.redis_client, ttl)
+    if cache is None:
+        return loader(token)
+
+    return cache.get_or_load(token, loader, ttl)
+
+
+def invalidate(api_token_id: UUID) -> None:
+    """Remove the API token from the caches of all processes."""
+    _state.cache.evict(api_token_id)
+
+    redis_client = current_app.redis_client
+    try:
+        redis_client.publish(INVALIDATION_CHANNEL, str(api_token_id))
+    except RedisError as e:
+        current_app.logger.warning(
+            'Could not publish API token invalidation: %s', e
+        )
@@ -0,0 +1,49 @@
+"""
+byceps.services.authentication.api.usage_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Count API requests per token, to see which integration generates how
+much load.
+
+Counters are kept in Redis so that they are shared between (and
+survive) application processes.
+
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+from uuid import UUID
+
+from flask import current_app
+from redis import StrictRedis
+from redis.exceptions import RedisError
+
+
+REDIS_KEY = 'byceps:api_token_request_counts'
+
+
+def record_request(api_token_id: UUID) -> None:
+    """Increment the number of requests made with that API token."""
+    try:
+        current_app.redis_client.hincrby(REDIS_KEY, str(api_token_id), 1)
+    except RedisError as e:
+        current_app.logger.warning('Could not count API request: %s', e)
+
+
+def get_request_counts(redis_client: StrictRedis) -> dict[UUID, int]:
+    """Return the number of requests made per API token."""
+    counts = redis_client.hgetall(REDIS_KEY)
+
+    return {
+        UUID(api_token_id.decode('ascii')): int(count)
+        for api_token_id, count in counts.items()
+    }
+
+
+def delete_request_count(api_token_id: UUID) -> None:
+    """Remove the request counter for that API token."""
+    try:
+        current_app.redis_client.hdel(REDIS_KEY, str(api_token_id))
+    except RedisError as e:
+        current_app.logger.warning('Could not delete API request count: %s', e)
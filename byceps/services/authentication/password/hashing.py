@@ -0,0 +1,142 @@
+"""
+byceps.services.authentication.password.hashing
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Password hash generation and verification.
+
+Besides the methods supported by Werkzeug, scrypt is supported. Its
+hashes use the format introduced with Werkzeug 2.3
+(``scrypt:<n>:<r>:<p>$<salt>$<hash>``) so they remain valid once
+Werkzeug can handle them natively.
+
+This module does not depend on an application context so that its
+functions can be run in worker processes.
+
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+import hashlib
+import hmac
+import secrets
+
+from werkzeug.security import (
+    check_password_hash as _werkzeug_check_password_hash,
+    DEFAULT_PBKDF2_ITERATIONS,
+    generate_password_hash as _werkzeug_generate_password_hash,
+)
+
+
+SALT_LENGTH = 16
+SALT_CHARS = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789'
+
+SCRYPT_DEFAULT_N = 2 ** 15
+SCRYPT_DEFAULT_R = 8
+SCRYPT_DEFAULT_P = 1
+
+# Parameters (of stored hashes, too) that require more memory than this
+# are rejected so that they cannot exhaust it.
+SCRYPT_MAX_MEMORY = 256 * 1024 * 1024  # bytes
+
+
+def generate_password_hash(password: str, method: str) -> str:
+    """Generate a salted hash value based on the password."""
+    if _is_scrypt_method(method):
+        return _generate_scrypt_hash(password, method)
+
+    return _werkzeug_generate_password_hash(
+        password, method=method, salt_length=SALT_LENGTH
+    )
+
+
+def check_password_hash(password_hash: str, password: str) -> bool:
+    """Hash the password and return `True` if the result matches the
+    given hash, `False` otherwise.
+    """
+    if _is_scrypt_method(password_hash):
+        return _check_scrypt_hash(password_hash, password)
+
+    return _werkzeug_check_password_hash(password_hash, password)
+
+
+def normalize_method(method: str) -> str:
+    """Return the method including all (possibly implicit) parameters,
+    as it appears at the beginning of hashes generated with it.
+    """
+    if _is_scrypt_method(method):
+        n, r, p = _parse_scrypt_parameters(method)
+        return f'scrypt:{n}:{r}:{p}'
+
+    if method.startswith('pbkdf2'):
+        parts = method.split(':')
+        hash_name = parts[1] if len(parts) > 1 else 'sha256'
+        if len(parts) > 2:
+            iterations = int(parts[2])
+        else:
+            iterations = DEFAULT_PBKDF2_ITERATIONS
+        return f'pbkdf2:{hash_name}:{iterations}'
+
+    return method
+
+
+def _is_scrypt_method(method: str) -> bool:
+    return method == 'scrypt' or method.startswith('scrypt:')
+
+
+def _generate_scrypt_hash(password: str, method: str) -> str:
+    n, r, p = _parse_scrypt_parameters(method)
+    salt = ''.join(secrets.choice(SALT_CHARS) for _ in range(SALT_LENGTH))
+    hash_value = _scrypt(password, salt, n, r, p)
+    return f'scrypt:{n}:{r}:{p}${salt}${hash_value}'
+
+
+def _check_scrypt_hash(password_hash: str, password: str) -> bool:
+    try:
+        method, salt, expected_hash_value = password_hash.split('$', 2)
+        n, r, p = _parse_scrypt_parameters(method)
+        actual_hash_value = _scrypt(password, salt, n, r, p)
+    except ValueError:
+        return False
+
+    return hmac.compare_digest(actual_hash_value, expected_hash_value)
+
+
+def _parse_scrypt_parameters(method: str) -> tuple[int, int, int]:
+    """Parse a method string of the form `scrypt[:<n>:<r>:<p>]`."""
+    parts = method.split(':')
+    if parts[0] != 'scrypt':
+        raise ValueError(f'Not an scrypt method: "{method}"')
+
+    args = parts[1:]
+    if not args:
+        return SCRYPT_DEFAULT_N, SCRYPT_DEFAULT_R, SCRYPT_DEFAULT_P
+
+    if len(args) != 3:
+        raise ValueError(f'Invalid scrypt parameters: "{method}"')
+
+    n, r, p = map(int, args)
+
+    # `n` has to be a power of two greater than 1.
+    if (n < 2) or (n & (n - 1)) or (r < 1) or (p < 1):
+        raise ValueError(f'Invalid scrypt parameters: "{method}"')
+
+    if _get_scrypt_memory(n, r, p) > SCRYPT_MAX_MEMORY:
+        raise ValueError(f'scrypt parameters exceed memory limit: "{method}"')
+
+    return n, r, p
+
+
+def _scrypt(password: str, salt: str, n: int, r: int, p: int) -> str:
+    return hashlib.scrypt(
+        password.encode('utf-8'),
+        salt=salt.encode('utf-8'),
+        n=n,
+        r=r,
+        p=p,
+        maxmem=_get_scrypt_memory(n, r, p),
+    ).hex()
+
+
+def _get_scrypt_memory(n: int, r: int, p: int) -> int:
+    return 132 * n * r * p  # ideally 128, but some extra seems needed
@@ -0,0 +1,190 @@
+"""
+byceps.services.authentication.password.hashing_pool
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Run password hashing and verification in a bounded pool of worker
+processes, and record how long these operations take.
+
+Configuration:
+
+``PASSWORD_HASHING_POOL_SIZE``
+    Number of worker processes per application process. If zero (the
+    default), hashing is done in the calling process.
+
+``PASSWORD_HASHING_MAX_CONCURRENCY``
+    Maximum number of hashing operations running at the same time per
+    application process.
+
+``PASSWORD_HASHING_QUEUE_TIMEOUT``
+    Number of seconds to wait for a free slot before giving up with
+    `PasswordHashingOverloaded`.
+
+Timings are accumulated in Redis so that they can be exported as
+metrics independently of the process that did the hashing.
+
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import os
+from threading import BoundedSemaphore, Lock
+from time import perf_counter
+from typing import Any, Callable, Optional, TypeVar
+
+from flask import current_app, has_app_context
+from redis import StrictRedis
+from redis.exceptions import RedisError
+
+
+T = TypeVar('T')
+
+
+OPERATIONS = frozenset(['hash', 'verify'])
+
+REDIS_KEY_PREFIX = 'byceps:password_hashing'
+
+
+class PasswordHashingOverloaded(Exception):
+    """Indicate that no hashing slot became available in time."""
+
+
+class _ProcessState:
+    """Pool and semaphore of the current process.
+
+    Both are created lazily and re-created after a fork so that a pool
+    is never shared between processes.
+    """
+
+    def __init__(self) -> None:
+        self.lock = Lock()
+        self.pid: Optional[int] = None
+        self.executor: Optional[ProcessPoolExecutor] = None
+        self.semaphore: Optional[BoundedSemaphore] = None
+
+    def get(
+        self, pool_size: int, max_concurrency: int
+    ) -> tuple[Optional[ProcessPoolExecutor], BoundedSemaphore]:
+        with self.lock:
+            pid = os.getpid()
+            if self.pid != pid:
+                self.pid = pid
+                self.executor = None
+                self.semaphore = BoundedSemaphore(max_concurrency)
+
+                if pool_size > 0:
+                    self.executor = ProcessPoolExecutor(
+                        max_workers=pool_size,
+                        mp_context=multiprocessing.get_context('spawn'),
+                    )
+
+            return self.executor, self.semaphore
+
+
+_state = _ProcessState()
+
+
+def run(operation: str, func: Callable[..., T], *args: Any) -> T:
+    """Call the function, in a worker process if so configured.
+
+    Raise `PasswordHashingOverloaded` if the maximum number of
+    concurrent hashing operations is reached and no slot becomes
+    available within the configured time.
+
+    Outside of an application context, the function is called directly
+    (e.g. in scripts and tests).
+    """
+    if operation not in OPERATIONS:
+        raise ValueError(f'Unknown operation "{operation}"')
+
+    if not has_app_context():
+        return func(*args)
+
+    config = current_app.config
+    pool_size = config['PASSWORD_HASHING_POOL_SIZE']
+    max_concurrency = config['PASSWORD_HASHING_MAX_CONCURRENCY']
+    queue_timeout = config['PASSWORD_HASHING_QUEUE_TIMEOUT']
+
+    executor, semaphore = _state.get(pool_size, max_concurrency)
+
+    if not semaphore.acquire(timeout=queue_timeout):
+        _record_rejection(operation)
+        raise PasswordHashingOverloaded()
+
+    try:
+        start = perf_counter()
+
+        if executor is not None:
+            result = executor.submit(func, *args).result()
+        else:
+            result = func(*args)
+
+        duration = perf_counter() - start
+    finally:
+        semaphore.release()
+
+    _record_duration(operation, duration)
+
+    return result
+
+
+# -------------------------------------------------------------------- #
+# timings
+
+
+def _record_duration(operation: str, duration: float) -> None:
+    redis_client = _find_redis_client()
+    if redis_client is None:
+        return
+
+    try:
+        pipeline = redis_client.pipeline()
+        pipeline.incr(_build_key('count', operation))
+        pipeline.incrbyfloat(_build_key('duration_sum', operation), duration)
+        pipeline.execute()
+    except RedisError as e:
+        current_app.logger.warning(
+            'Could not record password hashing duration: %s', e
+        )
+
+
+def _record_rejection(operation: str) -> None:
+    redis_client = _find_redis_client()
+    if redis_client is None:
+        return
+
+    try:
+        redis_client.incr(_build_key('rejected_count', operation))
+    except RedisError as e:
+        current_app.logger.warning(
+            'Could not record password hashing rejection: %s', e
+        )
+
+
+def get_timings(redis_client: StrictRedis) -> dict[str, dict[str, float]]:
+    """Return the accumulated count, duration sum (in seconds), and
+    rejection count per operation.
+    """
+    names = ['count', 'duration_sum', 'rejected_count']
+
+    keys = [
+        _build_key(name, operation)
+        for operation in sorted(OPERATIONS)
+        for name in names
+    ]
+    values = iter(redis_client.mget(keys))
+
+    return {
+        operation: {name: float(next(values) or 0) for name in names}
+        for operation in sorted(OPERATIONS)
+    }
+
+
+def _find_redis_client() -> Optional[StrictRedis]:
+    return getattr(current_app, 'redis_client', None)
+
+
+def _build_key(name: str, operation: str) -> str:
+    return f'{REDIS_KEY_PREFIX}:{name}:{operation}'
@@ -9,10 +9,7 @@ byceps.services.authentication.password.service
 from datetime import datetime
 from typing import Optional
 
-from werkzeug.security import (
-    check_password_hash as _check_password_hash,
-    generate_password_hash as _generate_password_hash,
-)
+from flask import current_app, has_app_context
 
 from ....database import db
 from ....typing import UserID
@@ -21,6 +18,7 @@ from ...user import log_service as user_log_service
 
 from ..session import service as session_service
 
+from . import hashing, hashing_pool
 from .dbmodels import Credential as DbCredential
 
 
@@ -28,9 +26,23 @@ PASSWORD_HASH_ITERATIONS = 320000
 PASSWORD_HASH_METHOD = 'pbkdf2:sha256:%d' % PASSWORD_HASH_ITERATIONS
 
 
+def get_password_hash_method() -> str:
+    """Return the configured hash method (algorithm and parameters).
+
+    Outside of an application context, the default method is returned.
+    """
+    if not has_app_context():
+        return PASSWORD_HASH_METHOD
+
+    return current_app.config.get('PASSWORD_HASH_METHOD', PASSWORD_HASH_METHOD)
+
+
 def generate_password_hash(password: str) -> str:
     """Generate a salted hash value based on the password."""
-    return _generate_password_hash(password, method=PASSWORD_HASH_METHOD)
+    method = get_password_hash_method()
+    return hashing_pool.run(
+        'hash', hashing.generate_password_hash, password, method
+    )
 
 
 def create_password_hash(user_id: UserID, password: str) -> None:
@@ -85,8 +97,8 @@ def check_password_hash(password_hash: str, password: str) -> bool:
     """Hash the password and return `True` if the result matches the
     given hash, `False` otherwise.
     """
-    return (password_hash is not None) and _check_password_hash(
-        password_hash, password
+    return (password_hash is not None) and hashing_pool.run(
+        'verify', hashing.check_password_hash, password_hash, password
     )
 
 
@@ -106,7 +118,8 @@ def is_password_hash_current(password_hash: str) -> bool:
     """Return `True` if the password hash was created with the currently
     configured method (algorithm and parameters).
     """
-    return password_hash.startswith(PASSWORD_HASH_METHOD + '$')
+    method = hashing.normalize_method(get_password_hash_method())
+    return password_hash.startswith(method + '$')
 
 
 def _find_credential_for_user(user_id: UserID) -> Optional[DbCredential]:
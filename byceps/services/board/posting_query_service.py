@@ -15,7 +15,7 @@ from ...database import db, paginate, Pagination
 from ...typing import UserID
 from ...util.iterables import index_of
 
-from ..user import service as user_service
+from ..user import loader_service as user_loader_service
 from ..user.transfer.models import User
 
 from .dbmodels.category import Category as DbCategory
@@ -24,6 +24,11 @@ from .dbmodels.topic import Topic as DbTopic
 from .transfer.models import BoardID, PostingID, TopicID
 
 
+# Postings show the creator's avatar at 96 pixels, so request twice
+# that for high-density displays.
+POSTING_AVATAR_SIZE = 192
+
+
 def count_postings_for_board(board_id: BoardID) -> int:
     """Return the number of postings for that board."""
     return db.session \
@@ -84,8 +89,9 @@ def paginate_postings(
 
 
 def _get_users_by_id(user_ids: set[UserID]) -> dict[UserID, User]:
-    users = user_service.get_users(user_ids, include_avatars=True)
-    return user_service.index_users_by_id(users)
+    return user_loader_service.get_loader().get_users(
+        user_ids, avatar_size=POSTING_AVATAR_SIZE
+    )
 
 
 def calculate_posting_page_number(
@@ -7,10 +7,11 @@ byceps.services.brand.settings_service
 """
 
 from __future__ import annotations
-from typing import Optional
+from typing import Mapping, Optional
 
 from ...database import db, upsert
 from ...typing import BrandID
+from ...util.snapshot_cache import SnapshotCache
 
 from .dbmodels.setting import Setting as DbSetting
 from .transfer.models import BrandSetting
@@ -23,6 +24,8 @@ def create_setting(brand_id: BrandID, name: str, value: str) -> BrandSetting:
     db.session.add(setting)
     db.session.commit()
 
+    _snapshots.invalidate(brand_id)
+
     return _db_entity_to_brand_setting(setting)
 
 
@@ -43,6 +46,8 @@ def create_or_update_setting(
 
     upsert(table, identifier, replacement)
 
+    _snapshots.invalidate(brand_id)
+
     return find_setting(brand_id, name)
 
 
@@ -56,6 +61,8 @@ def remove_setting(brand_id: BrandID, name: str) -> None:
         .delete()
     db.session.commit()
 
+    _snapshots.invalidate(brand_id)
+
 
 def find_setting(brand_id: BrandID, name: str) -> Optional[BrandSetting]:
     """Return the setting for that brand and with that name, or `None`
@@ -73,12 +80,15 @@ def find_setting_value(brand_id: BrandID, name: str) -> Optional[str]:
     """Return the value of the setting for that brand and with that
     name, or `None` if not found.
     """
-    setting = find_setting(brand_id, name)
+    return get_setting_values(brand_id).get(name)
 
-    if setting is None:
-        return None
 
-    return setting.value
+def get_setting_values(brand_id: BrandID) -> Mapping[str, str]:
+    """Return the values of all settings for that brand, indexed by name.
+
+    The values are taken from a (read-only) snapshot cached per process.
+    """
+    return _snapshots.get(brand_id)
 
 
 def get_settings(brand_id: BrandID) -> set[BrandSetting]:
@@ -91,6 +101,20 @@ def get_settings(brand_id: BrandID) -> set[BrandSetting]:
     return {_db_entity_to_brand_setting(setting) for setting in settings}
 
 
+def _load_setting_values(brand_id: BrandID) -> dict[str, str]:
+    rows = db.session \
+        .query(DbSetting.name, DbSetting.value) \
+        .filter_by(brand_id=brand_id) \
+        .all()
+
+    return dict(rows)
+
+
+_snapshots: SnapshotCache[BrandID, Mapping[str, str]] = SnapshotCache(
+    'brand_settings', _load_setting_values
+)
+
+
 def _db_entity_to_brand_setting(setting: DbSetting) -> BrandSetting:
     return BrandSetting(
         setting.brand_id,
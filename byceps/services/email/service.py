@@ -13,7 +13,7 @@ from smtplib import SMTP
 
 from flask import current_app
 
-from ...util.jobqueue import enqueue
+from ...util.jobqueue import enqueue, QUEUE_EMAIL
 
 from .transfer.models import Message, NameAndAddress
 
@@ -43,7 +43,14 @@ def enqueue_email(
 ) -> None:
     """Enqueue e-mail to be sent asynchronously."""
     sender_str = sender.format()
-    enqueue(send_email, sender_str, recipients, subject, body)
+    enqueue(
+        send_email,
+        sender_str,
+        recipients,
+        subject,
+        body,
+        queue_name=QUEUE_EMAIL,
+    )
 
 
 def send_email(
@@ -7,9 +7,10 @@ byceps.services.global_setting.service
 """
 
 from __future__ import annotations
-from typing import Optional
+from typing import Mapping, Optional
 
 from ...database import db, upsert
+from ...util.snapshot_cache import SnapshotCache
 
 from .dbmodels import Setting as DbSetting
 from .transfer.models import GlobalSetting
@@ -22,6 +23,8 @@ def create_setting(name: str, value: str) -> GlobalSetting:
     db.session.add(setting)
     db.session.commit()
 
+    _snapshots.invalidate(_SCOPE)
+
     return _db_entity_to_global_setting(setting)
 
 
@@ -35,6 +38,8 @@ def create_or_update_setting(name: str, value: str) -> GlobalSetting:
 
     upsert(table, identifier, replacement)
 
+    _snapshots.invalidate(_SCOPE)
+
     return find_setting(name)
 
 
@@ -50,6 +55,8 @@ def remove_setting(name: str) -> None:
 
     db.session.commit()
 
+    _snapshots.invalidate(_SCOPE)
+
 
 def find_setting(name: str) -> Optional[GlobalSetting]:
     """Return the global setting with that name, or `None` if not found."""
@@ -65,12 +72,15 @@ def find_setting_value(name: str) -> Optional[str]:
     """Return the value of the global setting with that name, or `None`
     if not found.
     """
-    setting = find_setting(name)
+    return get_setting_values().get(name)
 
-    if setting is None:
-        return None
 
-    return setting.value
+def get_setting_values() -> Mapping[str, str]:
+    """Return the values of all global settings, indexed by name.
+
+    The values are taken from a (read-only) snapshot cached per process.
+    """
+    return _snapshots.get(_SCOPE)
 
 
 def get_settings() -> set[GlobalSetting]:
@@ -80,6 +90,23 @@ def get_settings() -> set[GlobalSetting]:
     return {_db_entity_to_global_setting(setting) for setting in settings}
 
 
+# There is only a single scope for global settings.
+_SCOPE = 'global'
+
+
+def _load_setting_values(scope: str) -> dict[str, str]:
+    rows = db.session \
+        .query(DbSetting.name, DbSetting.value) \
+        .all()
+
+    return dict(rows)
+
+
+_snapshots: SnapshotCache[str, Mapping[str, str]] = SnapshotCache(
+    'global_settings', _load_setting_values
+)
+
+
 def _db_entity_to_global_setting(setting: DbSetting) -> GlobalSetting:
     return GlobalSetting(
         setting.name,
@@ -0,0 +1,354 @@
+"""
+byceps.services.log_partitioning.partitioning_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Manage the partitions of the log tables.
+
+The log tables are partitioned by time of occurrence (PostgreSQL range
+partitioning), one partition per month. Entries that do not fall into
+a monthly partition are stored in the table's default partition.
+
+Old partitions can be detached (they are then no longer part of the
+log table, but can still be queried directly) or archived to
+compressed JSON Lines files (one JSON object per entry and line) and
+dropped.
+
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+from datetime import date, datetime
+import gzip
+import json
+import os
+from pathlib import Path
+import re
+from typing import Any, Optional
+from uuid import UUID
+
+from sqlalchemy import text
+
+from ...database import db
+
+from .transfer.models import Partition
+
+
+PARTITIONED_TABLE_NAMES = frozenset(
+    [
+        'shop_order_log_entries',
+        'ticket_log_entries',
+        'user_log_entries',
+    ]
+)
+
+
+_BOUNDS_PATTERN = re.compile(r"FOR VALUES FROM \('([^']+)'\) TO \('([^']+)'\)")
+
+
+def get_partitions(table_name: str) -> list[Partition]:
+    """Return the partitions attached to the table, oldest first, the
+    default partition last.
+    """
+    _ensure_partitioned_table(table_name)
+
+    rows = db.session.execute(
+        text(
+            """
+            SELECT c.relname, pg_get_expr(c.relpartbound, c.oid), c.reltuples
+            FROM pg_inherits AS i
+            JOIN pg_class AS c ON c.oid = i.inhrelid
+            WHERE i.inhparent = CAST(:table_name AS regclass)
+            """
+        ),
+        {'table_name': table_name},
+    ).all()
+
+    partitions = [
+        _to_partition(table_name, name, bounds, row_count)
+        for name, bounds, row_count in rows
+    ]
+
+    partitions.sort(key=lambda p: p.start or datetime.max)
+
+    return partitions
+
+
+def _to_partition(
+    table_name: str, name: str, bounds: str, row_count: float
+) -> Partition:
+    start, end = _parse_bounds(bounds)
+
+    return Partition(
+        table_name=table_name,
+        name=name,
+        start=start,
+        end=end,
+        # Tables that have never been analyzed have a count of -1.
+        estimated_row_count=max(int(row_count), 0),
+    )
+
+
+def _parse_bounds(
+    bounds: str,
+) -> tuple[Optional[datetime], Optional[datetime]]:
+    if bounds == 'DEFAULT':
+        return None, None
+
+    match = _BOUNDS_PATTERN.fullmatch(bounds)
+    if match is None:
+        raise ValueError(f'Unexpected partition bounds: {bounds}')
+
+    start, end = match.groups()
+    return datetime.fromisoformat(start), datetime.fromisoformat(end)
+
+
+def get_detached_partition_names(table_name: str) -> list[str]:
+    """Return the names of the table's partitions that have been
+    detached, but not archived yet.
+    """
+    _ensure_partitioned_table(table_name)
+
+    names = db.session.execute(
+        text(
+            """
+            SELECT c.relname
+            FROM pg_class AS c
+            WHERE c.relkind = 'r'
+              AND NOT c.relispartition
+              AND c.relname LIKE :name_prefix
+              AND pg_table_is_visible(c.oid)
+            """
+        ),
+        {'name_prefix': table_name + r'\_y%'},
+    ).scalars().all()
+
+    return sorted(
+        name for name in names if _is_monthly_partition_name(table_name, name)
+    )
+
+
+def create_partition(table_name: str, month: date) -> bool:
+    """Create the table's partition for the month.
+
+    Entries for that month that have already been stored in the
+    default partition are moved to the new partition.
+
+    Return `False` if the partition already exists.
+    """
+    _ensure_partitioned_table(table_name)
+
+    start = datetime(month.year, month.month, 1)
+    end = _add_months(start, 1)
+    partition_name = get_partition_name(table_name, start)
+    default_partition_name = f'{table_name}_default'
+
+    # Keep entries from being stored in the default partition until the
+    # new partition has been attached. Otherwise entries for the month
+    # stored in the meantime would not be moved, and attaching the
+    # partition would fail. This also serializes concurrent creation of
+    # the partition.
+    db.session.execute(
+        text(f'LOCK TABLE {default_partition_name} IN ACCESS EXCLUSIVE MODE')
+    )
+
+    if _table_exists(partition_name):
+        # Release the lock.
+        db.session.rollback()
+        return False
+
+    range_params = {'start': start, 'end': end}
+
+    # The new partition is populated before it is attached as a
+    # partition can only be attached if the default partition does not
+    # contain any of its entries.
+    db.session.execute(
+        text(
+            f'CREATE TABLE {partition_name} '
+            f'(LIKE {table_name} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'
+        )
+    )
+    db.session.execute(
+        text(
+            f'INSERT INTO {partition_name} '
+            f'SELECT * FROM {default_partition_name} '
+            'WHERE occurred_at >= :start AND occurred_at < :end'
+        ),
+        range_params,
+    )
+    db.session.execute(
+        text(
+            f'DELETE FROM {default_partition_name} '
+            'WHERE occurred_at >= :start AND occurred_at < :end'
+        ),
+        range_params,
+    )
+    db.session.execute(
+        text(
+            f'ALTER TABLE {table_name} ATTACH PARTITION {partition_name} '
+            f"FOR VALUES FROM ('{start.isoformat(' ')}') "
+            f"TO ('{end.isoformat(' ')}')"
+        )
+    )
+    db.session.commit()
+
+    return True
+
+
+def create_upcoming_partitions(
+    table_name: str,
+    month_count: int,
+    *,
+    since: Optional[date] = None,
+    today: Optional[date] = None,
+) -> list[str]:
+    """Create the table's partitions for the current and the following
+    months (and, if given, for the months since `since`), as far as they
+    do not exist yet.
+
+    Return the names of the partitions that have been created.
+    """
+    if today is None:
+        today = date.today()
+
+    current_month = datetime(today.year, today.month, 1)
+    first_month = current_month
+    if since is not None:
+        first_month = min(datetime(since.year, since.month, 1), current_month)
+
+    created_partition_names = []
+    month = first_month
+    last_month = _add_months(current_month, month_count)
+    while month <= last_month:
+        if create_partition(table_name, month):
+            created_partition_names.append(
+                get_partition_name(table_name, month)
+            )
+        month = _add_months(month, 1)
+
+    return created_partition_names
+
+
+def detach_partition(table_name: str, partition_name: str) -> None:
+    """Detach the partition from the table.
+
+    The partition's entries are no longer part of the table afterwards,
+    but the partition can still be queried directly.
+    """
+    _ensure_monthly_partition_name(table_name, partition_name)
+
+    attached_partition_names = {p.name for p in get_partitions(table_name)}
+    if partition_name not in attached_partition_names:
+        raise ValueError(
+            f'"{partition_name}" is not a partition of "{table_name}".'
+        )
+
+    db.session.execute(
+        text(f'ALTER TABLE {table_name} DETACH PARTITION {partition_name}')
+    )
+    db.session.commit()
+
+
+def archive_partition(
+    table_name: str, partition_name: str, directory: Path
+) -> tuple[Path, int]:
+    """Write the partition's entries to a compressed JSON Lines file in
+    the directory, then drop the partition.
+
+    The partition is detached first if it is still attached.
+
+    Return the path of the archive file and the number of entries.
+    """
+    _ensure_monthly_partition_name(table_name, partition_name)
+
+    archive_file = directory / f'{partition_name}.jsonl.gz'
+    if archive_file.exists():
+        raise FileExistsError(f'Archive file "{archive_file}" already exists.')
+
+    attached_partition_names = {p.name for p in get_partitions(table_name)}
+    if partition_name in attached_partition_names:
+        detach_partition(table_name, partition_name)
+    elif partition_name not in get_detached_partition_names(table_name):
+        raise ValueError(
+            f'"{partition_name}" is not a partition of "{table_name}".'
+        )
+
+    # Only move the file into place once it has been written
+    # completely.
+    incomplete_file = archive_file.with_name(archive_file.name + '.part')
+    entry_count = _write_archive_file(partition_name, incomplete_file)
+    incomplete_file.rename(archive_file)
+
+    db.session.execute(text(f'DROP TABLE {partition_name}'))
+    db.session.commit()
+
+    return archive_file, entry_count
+
+
+def _write_archive_file(partition_name: str, path: Path) -> int:
+    result = db.session.execute(
+        text(f'SELECT * FROM {partition_name} ORDER BY occurred_at'),
+        execution_options={'stream_results': True},
+    )
+
+    entry_count = 0
+    with gzip.open(path, 'wt', encoding='utf-8') as f:
+        for row in result.mappings():
+            f.write(json.dumps(dict(row), default=_serialize_value) + '\n')
+            entry_count += 1
+
+    with path.open('rb') as f:
+        os.fsync(f.fileno())
+
+    return entry_count
+
+
+def _serialize_value(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    elif isinstance(value, UUID):
+        return str(value)
+    else:
+        raise TypeError(f'Cannot serialize value of type {type(value)}')
+
+
+def get_partition_name(table_name: str, month: date) -> str:
+    """Return the name of the table's partition for the month."""
+    return f'{table_name}_y{month:%Y}m{month:%m}'
+
+
+def _is_monthly_partition_name(table_name: str, name: str) -> bool:
+    pattern = re.escape(table_name) + r'_y\d{4}m\d{2}'
+    return re.fullmatch(pattern, name) is not None
+
+
+def _ensure_partitioned_table(table_name: str) -> None:
+    # Table and partition names are put into statements, so only
+    # accept known ones.
+    if table_name not in PARTITIONED_TABLE_NAMES:
+        raise ValueError(f'Table "{table_name}" is not partitioned.')
+
+
+def _ensure_monthly_partition_name(
+    table_name: str, partition_name: str
+) -> None:
+    _ensure_partitioned_table(table_name)
+
+    if not _is_monthly_partition_name(table_name, partition_name):
+        raise ValueError(
+            f'"{partition_name}" is not a name of a monthly partition '
+            f'of "{table_name}".'
+        )
+
+
+def _table_exists(table_name: str) -> bool:
+    return db.session.execute(
+        text('SELECT to_regclass(:table_name) IS NOT NULL'),
+        {'table_name': table_name},
+    ).scalar_one()
+
+
+def _add_months(month: datetime, months: int) -> datetime:
+    month_index = month.year * 12 + month.month - 1 + months
+    year, month_offset = divmod(month_index, 12)
+    return datetime(year, month_offset + 1, 1)
@@ -0,0 +1,25 @@
+"""
+byceps.services.log_partitioning.transfer.models
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class Partition:
+    table_name: str
+    name: str
+    start: Optional[datetime]  # `None` for the default partition
+    end: Optional[datetime]  # `None` for the default partition
+    estimated_row_count: int
+
+    @property
+    def is_default(self) -> bool:
+        return self.start is None
@@ -9,6 +9,14 @@ byceps.metrics.service
 from __future__ import annotations
 from typing import Iterator
 
+from flask import current_app
+
+from ...services.authentication.api import (
+    usage_service as api_usage_service,
+)
+from ...services.authentication.password import (
+    hashing_pool as password_hashing_pool,
+)
 from ...services.brand import service as brand_service
 from ...services.board import (
     board_service,
@@ -27,6 +35,7 @@ from ...services.shop.shop.transfer.models import Shop, ShopID
 from ...services.ticketing import ticket_service
 from ...services.user import stats_service as user_stats_service
 from ...typing import BrandID, PartyID
+from ...util import jobqueue
 
 
 def serialize(metrics: Iterator[Metric]) -> Iterator[str]:
@@ -44,8 +53,11 @@ def collect_metrics() -> Iterator[Metric]:
     active_shops = shop_service.get_active_shops()
     active_shop_ids = {shop.id for shop in active_shops}
 
+    yield from _collect_api_metrics()
     yield from _collect_board_metrics(brand_ids)
     yield from _collect_consent_metrics()
+    yield from _collect_job_queue_metrics()
+    yield from _collect_password_hashing_metrics()
     yield from _collect_shop_ordered_article_metrics(active_shop_ids)
     yield from _collect_shop_order_metrics(active_shops)
     yield from _collect_seating_metrics(active_party_ids)
@@ -53,6 +65,24 @@ def collect_metrics() -> Iterator[Metric]:
     yield from _collect_user_metrics()
 
 
+def _collect_api_metrics() -> Iterator[Metric]:
+    """Provide request counts per API token.
+
+    These are only available if a Redis client is configured.
+    """
+    redis_client = getattr(current_app, 'redis_client', None)
+    if redis_client is None:
+        return
+
+    request_counts = api_usage_service.get_request_counts(redis_client)
+    for api_token_id, request_count in request_counts.items():
+        yield Metric(
+            'api_request_count',
+            request_count,
+            labels=[Label('api_token', str(api_token_id))],
+        )
+
+
 def _collect_board_metrics(brand_ids: list[BrandID]) -> Iterator[Metric]:
     for brand_id in brand_ids:
         boards = board_service.get_boards_for_brand(brand_id)
@@ -82,6 +112,62 @@ def _collect_consent_metrics() -> Iterator[Metric]:
         )
 
 
+def _collect_job_queue_metrics() -> Iterator[Metric]:
+    """Provide job counts and waiting times per job queue.
+
+    These are only available if a Redis client is configured.
+    """
+    redis_client = getattr(current_app, 'redis_client', None)
+    if redis_client is None:
+        return
+
+    stats_by_queue_name = jobqueue.get_queue_stats(redis_client)
+    for queue_name, stats in stats_by_queue_name.items():
+        labels = [Label('queue', queue_name)]
+
+        yield Metric('job_queue_length', stats.length, labels=labels)
+        yield Metric(
+            'job_queue_oldest_job_age_seconds',
+            stats.oldest_job_age_seconds,
+            labels=labels,
+        )
+        yield Metric(
+            'job_queue_started_count', stats.started_count, labels=labels
+        )
+        yield Metric(
+            'job_queue_scheduled_count', stats.scheduled_count, labels=labels
+        )
+        yield Metric(
+            'job_queue_failed_count', stats.failed_count, labels=labels
+        )
+
+
+def _collect_password_hashing_metrics() -> Iterator[Metric]:
+    """Provide password hashing counts and durations per operation.
+
+    These are only available if a Redis client is configured.
+    """
+    redis_client = getattr(current_app, 'redis_client', None)
+    if redis_client is None:
+        return
+
+    timings = password_hashing_pool.get_timings(redis_client)
+    for operation, values in timings.items():
+        labels = [Label('operation', operation)]
+
+        yield Metric('password_hashing_count', values['count'], labels=labels)
+        yield Metric(
+            'password_hashing_duration_seconds_sum',
+            values['duration_sum'],
+            labels=labels,
+        )
+        yield Metric(
+            'password_hashing_rejected_count',
+            values['rejected_count'],
+            labels=labels,
+        )
+
+
 def _collect_shop_ordered_article_metrics(
     shop_ids: set[ShopID],
 ) -> Iterator[Metric]:
@@ -33,6 +33,8 @@ class Image(db.Model):
     item = db.relationship(Item, backref='images')
     number = db.Column(db.Integer, nullable=False)
     filename = db.Column(db.UnicodeText, nullable=False)
+    width = db.Column(db.Integer, nullable=True)
+    derivative_widths = db.Column(db.JSONB, nullable=True)
     alt_text = db.Column(db.UnicodeText, nullable=True)
     caption = db.Column(db.UnicodeText, nullable=True)
     attribution = db.Column(db.UnicodeText, nullable=True)
@@ -45,6 +47,7 @@ class Image(db.Model):
         number: int,
         filename: str,
         *,
+        width: Optional[int] = None,
         alt_text: Optional[str] = None,
         caption: Optional[str] = None,
         attribution: Optional[str] = None,
@@ -54,6 +57,7 @@ class Image(db.Model):
         self.item_id = item_id
         self.number = number
         self.filename = filename
+        self.width = width
         self.alt_text = alt_text
         self.caption = caption
         self.attribution = attribution
@@ -6,6 +6,8 @@ byceps.services.news.image_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from __future__ import annotations
+from pathlib import Path
 from typing import BinaryIO, Optional
 
 from flask import current_app
@@ -13,7 +15,9 @@ from flask import current_app
 from ...database import db, generate_uuid
 from ...typing import UserID
 from ...util import upload
+from ...util.image import create_thumbnail
 from ...util.image.models import Dimensions, ImageType
+from ...util.jobqueue import enqueue, QUEUE_BULK
 
 from ..image import service as image_service
 from ..user import service as user_service
@@ -36,6 +40,11 @@ ALLOWED_IMAGE_TYPES = frozenset(
 MAXIMUM_DIMENSIONS = Dimensions(2560, 1440)
 
 
+# Widths (in pixels) of the scaled-down versions of each image. Only
+# those smaller than the original image are rendered.
+DERIVATIVE_WIDTHS = (640, 1280)
+
+
 def create_image(
     creator_id: UserID,
     item_id: ItemID,
@@ -57,9 +66,11 @@ def create_image(
     # Might raise `ImageTypeProhibited`.
     image_type = image_service.determine_image_type(stream, ALLOWED_IMAGE_TYPES)
 
+    width: Optional[int] = None
     if image_type != ImageType.svg:
         image_dimensions = image_service.determine_dimensions(stream)
         _check_image_dimensions(image_dimensions)
+        width = image_dimensions.width
 
     image_id = ImageID(generate_uuid())
     number = _get_next_available_number(item.id)
@@ -71,6 +82,7 @@ def create_image(
         item.id,
         number,
         filename,
+        width=width,
         alt_text=alt_text,
         caption=caption,
         attribution=attribution,
@@ -79,20 +91,69 @@ def create_image(
     db.session.add(db_image)
     db.session.commit()
 
-    path = (
-        current_app.config['PATH_DATA']
-        / 'global'
-        / 'news_channels'
-        / item.channel.id
-        / filename
-    )
+    path = _get_channel_path(item.channel.id) / filename
 
     # Might raise `FileExistsError`.
     upload.store(stream, path, create_parent_path_if_nonexistent=True)
 
+    if image_type != ImageType.svg:
+        enqueue(
+            render_image_derivatives, db_image.id, queue_name=QUEUE_BULK
+        )
+
     return _db_entity_to_image(db_image, item.channel.id)
 
 
+def render_image_derivatives(image_id: ImageID) -> None:
+    """Render scaled-down versions of the image, each in the image's own
+    format as well as in WebP.
+
+    The files are stored next to the original image.
+
+    Meant to be run as a job.
+    """
+    db_image = _find_db_image(image_id)
+    if db_image is None:
+        raise ValueError(f'Unknown news image ID "{image_id}".')
+
+    channel_path = _get_channel_path(db_image.item.channel_id)
+    original_path = channel_path / db_image.filename
+    original_type_name = original_path.suffix[1:]
+
+    widths = [
+        width
+        for width in DERIVATIVE_WIDTHS
+        if (db_image.width is not None) and (width < db_image.width)
+    ]
+
+    for width in widths:
+        # Limit only the width; the height follows from the aspect ratio.
+        dimensions = Dimensions(width, MAXIMUM_DIMENSIONS.height)
+
+        for type_name in {original_type_name, ImageType.webp.name}:
+            stream = create_thumbnail(original_path, type_name, dimensions)
+
+            # Replace what a previous, possibly interrupted run has left.
+            path = channel_path / _get_derivative_filename(
+                db_image.filename, width, type_name
+            )
+            upload.delete(path)
+            upload.store(stream, path)
+
+    db_image.derivative_widths = widths
+    db.session.commit()
+
+
+def _get_channel_path(channel_id: ChannelID) -> Path:
+    data_path = current_app.config['PATH_DATA']
+    return data_path / 'global' / 'news_channels' / channel_id
+
+
+def _get_derivative_filename(filename: str, width: int, type_name: str) -> str:
+    stem = Path(filename).stem
+    return f'{stem}_{width}.{type_name}'
+
+
 def _check_image_dimensions(image_dimensions: Dimensions) -> None:
     """Raise exception if image dimensions exceed defined maximum."""
     too_large = image_dimensions > MAXIMUM_DIMENSIONS
@@ -164,7 +225,11 @@ def _find_db_image(image_id: ImageID) -> Optional[DbImage]:
 
 
 def _db_entity_to_image(db_image: DbImage, channel_id: ChannelID) -> Image:
-    url_path = f'/data/global/news_channels/{channel_id}/{db_image.filename}'
+    url_path_prefix = f'/data/global/news_channels/{channel_id}/'
+    url_path = url_path_prefix + db_image.filename
+
+    srcset = _build_srcset(db_image, url_path_prefix, webp=False)
+    webp_srcset = _build_srcset(db_image, url_path_prefix, webp=True)
 
     return Image(
         id=db_image.id,
@@ -174,7 +239,41 @@ def _db_entity_to_image(db_image: DbImage, channel_id: ChannelID) -> Image:
         number=db_image.number,
         filename=db_image.filename,
         url_path=url_path,
+        srcset=srcset,
+        webp_srcset=webp_srcset,
         alt_text=db_image.alt_text,
         caption=db_image.caption,
         attribution=db_image.attribution,
     )
+
+
+def _build_srcset(
+    db_image: DbImage, url_path_prefix: str, *, webp: bool
+) -> Optional[str]:
+    """Assemble a `srcset` attribute value from the rendered scaled-down
+    versions and the original image.
+
+    Return `None` if no scaled-down versions are available.
+    """
+    if not db_image.derivative_widths or (db_image.width is None):
+        return None
+
+    original_filename = Path(db_image.filename)
+    type_name = 'webp' if webp else original_filename.suffix[1:]
+
+    candidates = [
+        url_path_prefix
+        + _get_derivative_filename(db_image.filename, width, type_name)
+        + f' {width}w'
+        for width in db_image.derivative_widths
+    ]
+
+    if webp and (type_name != original_filename.suffix[1:]):
+        # The original image is not available as WebP.
+        return ', '.join(candidates)
+
+    candidates.append(
+        url_path_prefix + db_image.filename + f' {db_image.width}w'
+    )
+
+    return ', '.join(candidates)
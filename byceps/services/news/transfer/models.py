@@ -50,6 +50,8 @@ class Image:
     number: int
     filename: str
     url_path: str
+    srcset: Optional[str]
+    webp_srcset: Optional[str]
     alt_text: Optional[str]
     caption: Optional[str]
     attribution: Optional[str]
@@ -6,9 +6,10 @@ byceps.services.newsletter.command_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from __future__ import annotations
 from datetime import datetime
 
-from sqlalchemy import delete
+from sqlalchemy import delete, select, update
 from sqlalchemy.dialects.postgresql import insert
 
 from ...database import db
@@ -49,22 +50,40 @@ def delete_list(list_id: ListID) -> None:
 
 def subscribe(user_id: UserID, list_id: ListID, expressed_at: datetime) -> None:
     """Subscribe the user to that list."""
-    _update_subscription_state(
-        user_id, list_id, expressed_at, SubscriptionState.requested
+    subscribe_many({user_id}, list_id, expressed_at)
+
+
+def subscribe_many(
+    user_ids: set[UserID], list_id: ListID, expressed_at: datetime
+) -> None:
+    """Subscribe the users to that list.
+
+    Users that are already subscribed stay subscribed.
+    """
+    if not user_ids:
+        return
+
+    _insert_subscription_updates(
+        user_ids, list_id, expressed_at, SubscriptionState.requested
     )
 
     table = DbSubscription.__table__
     query = (
         insert(table)
         .values(
-            {
-                'user_id': str(user_id),
-                'list_id': str(list_id),
-            }
+            [
+                {
+                    'user_id': str(user_id),
+                    'list_id': str(list_id),
+                }
+                for user_id in user_ids
+            ]
         )
         .on_conflict_do_nothing(constraint=table.primary_key)
     )
-    db.session.execute(query)
+    result = db.session.execute(query)
+
+    _adjust_subscriber_count(list_id, result.rowcount)
 
     db.session.commit()
 
@@ -73,32 +92,85 @@ def unsubscribe(
     user_id: UserID, list_id: ListID, expressed_at: datetime
 ) -> None:
     """Unsubscribe the user from that list."""
-    _update_subscription_state(
-        user_id, list_id, expressed_at, SubscriptionState.declined
+    unsubscribe_many({user_id}, list_id, expressed_at)
+
+
+def unsubscribe_many(
+    user_ids: set[UserID], list_id: ListID, expressed_at: datetime
+) -> None:
+    """Unsubscribe the users from that list."""
+    if not user_ids:
+        return
+
+    _insert_subscription_updates(
+        user_ids, list_id, expressed_at, SubscriptionState.declined
     )
 
-    db.session.execute(
+    result = db.session.execute(
         delete(DbSubscription)
-        .where(DbSubscription.user_id == user_id)
+        .where(DbSubscription.user_id.in_(user_ids))
         .where(DbSubscription.list_id == list_id)
     )
 
+    _adjust_subscriber_count(list_id, -result.rowcount)
+
     db.session.commit()
 
 
-def _update_subscription_state(
-    user_id: UserID,
+def _insert_subscription_updates(
+    user_ids: set[UserID],
     list_id: ListID,
     expressed_at: datetime,
     state: SubscriptionState,
 ) -> None:
-    """Update the user's subscription state for that list."""
+    """Record the users' subscription state for that list."""
     list_ = find_list(list_id)
     if list_ is None:
         raise UnknownListId(list_id)
 
-    subscription_update = DbSubscriptionUpdate(
-        user_id, list_.id, expressed_at, state
+    rows = [
+        {
+            'user_id': user_id,
+            'list_id': list_.id,
+            'expressed_at': expressed_at,
+            'state': state.name,
+        }
+        for user_id in user_ids
+    ]
+
+    db.session.execute(insert(DbSubscriptionUpdate.__table__), rows)
+
+
+def _adjust_subscriber_count(list_id: ListID, delta: int) -> None:
+    """Add the delta to the list's number of subscribers."""
+    if delta == 0:
+        return
+
+    db.session.execute(
+        update(DbList)
+        .where(DbList.id == list_id)
+        .values(subscriber_count=DbList.subscriber_count + delta)
+    )
+
+
+def recount_subscribers(list_id: ListID) -> int:
+    """Count the users subscribed to that list from scratch, and store
+    the result as the list's number of subscribers.
+
+    Return the number of subscribers.
+    """
+    subscriber_count = db.session.execute(
+        select(db.func.count())
+        .select_from(DbSubscription)
+        .filter_by(list_id=list_id)
+    ).scalar_one()
+
+    db.session.execute(
+        update(DbList)
+        .where(DbList.id == list_id)
+        .values(subscriber_count=subscriber_count)
     )
 
-    db.session.add(subscription_update)
+    db.session.commit()
+
+    return subscriber_count
@@ -29,10 +29,12 @@ class List(db.Model):
 
     id = db.Column(db.UnicodeText, primary_key=True)
     title = db.Column(db.UnicodeText, nullable=False)
+    subscriber_count = db.Column(db.Integer, default=0, nullable=False)
 
     def __init__(self, list_id: ListID, title: str) -> None:
         self.id = list_id
         self.title = title
+        self.subscriber_count = 0
 
     def __repr__(self) -> str:
         return ReprBuilder(self) \
@@ -44,11 +44,21 @@ def get_all_lists() -> Sequence[List]:
 
 def count_subscribers_for_list(list_id: ListID) -> int:
     """Return the number of users that are currently subscribed to that list."""
-    return db.session.execute(
-        select(db.func.count())
-        .select_from(DbSubscription)
-        .filter_by(list_id=list_id)
-    ).scalar_one()
+    subscriber_count = db.session.execute(
+        select(DbList.subscriber_count)
+        .filter_by(id=list_id)
+    ).scalar()
+
+    return subscriber_count or 0
+
+
+def get_subscriber_counts() -> dict[ListID, int]:
+    """Return the number of currently subscribed users for each list."""
+    rows = db.session.execute(
+        select(DbList.id, DbList.subscriber_count)
+    ).all()
+
+    return {list_id: subscriber_count for list_id, subscriber_count in rows}
 
 
 def get_subscribers(list_id: ListID) -> Iterable[Subscriber]:
@@ -98,6 +108,50 @@ def get_subscription_updates_for_user(
         .all()
 
 
+def get_subscription_states_for_user(
+    user_id: UserID,
+) -> list[tuple[List, bool]]:
+    """Return all lists, each with whether the user is subscribed to it
+    or not.
+    """
+    rows = db.session.execute(
+        select(DbList.id, DbList.title, DbSubscription.user_id)
+        .outerjoin(
+            DbSubscription,
+            (DbSubscription.list_id == DbList.id)
+            & (DbSubscription.user_id == user_id),
+        )
+        .order_by(DbList.id)
+    ).all()
+
+    return [
+        (List(id=row.id, title=row.title), row.user_id is not None)
+        for row in rows
+    ]
+
+
+def get_subscribed_list_ids_for_users(
+    user_ids: set[UserID],
+) -> dict[UserID, set[ListID]]:
+    """Return the IDs of the lists each of the users is subscribed to."""
+    list_ids_by_user_id: dict[UserID, set[ListID]] = {
+        user_id: set() for user_id in user_ids
+    }
+
+    if not user_ids:
+        return list_ids_by_user_id
+
+    rows = db.session.execute(
+        select(DbSubscription.user_id, DbSubscription.list_id)
+        .filter(DbSubscription.user_id.in_(user_ids))
+    ).all()
+
+    for user_id, list_id in rows:
+        list_ids_by_user_id[user_id].add(list_id)
+
+    return list_ids_by_user_id
+
+
 def is_subscribed(user_id: UserID, list_id: ListID) -> bool:
     """Return if the user is subscribed to the list or not."""
     return db.session.execute(
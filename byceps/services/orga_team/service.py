@@ -20,6 +20,7 @@ from ..party import service as party_service
 from ..party.transfer.models import PartyID
 from ..user.dbmodels.detail import UserDetail as DbUserDetail
 from ..user.dbmodels.user import User as DbUser
+from ..user import loader_service as user_loader_service
 from ..user import service as user_service
 from ..user.transfer.models import User
 
@@ -313,8 +314,7 @@ def _get_public_orga_users_by_id(
     memberships: DbMembership,
 ) -> dict[UserID, User]:
     user_ids = {ms.user_id for ms in memberships}
-    users = user_service.get_users(user_ids, include_avatars=True)
-    return user_service.index_users_by_id(users)
+    return user_loader_service.get_loader().get_users(user_ids)
 
 
 def has_team_memberships(team_id: OrgaTeamID) -> bool:
@@ -0,0 +1,82 @@
+"""
+byceps.services.outbox.dbmodels
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+from datetime import datetime
+from typing import Any
+
+from ...database import db
+from ...util.instances import ReprBuilder
+
+
+class DbOutboxEvent(db.Model):
+    """An event recorded to be passed on to consumers.
+
+    Events are passed on ordered by the ID of the database transaction
+    that has recorded them, then by their own ID.
+    """
+
+    __tablename__ = 'outbox_events'
+    __table_args__ = (
+        db.Index(
+            'ix_outbox_events_transaction_id_id', 'transaction_id', 'id'
+        ),
+    )
+
+    id = db.Column(db.BigInteger, primary_key=True)
+    transaction_id = db.Column(
+        db.BigInteger,
+        server_default=db.text('txid_current()'),
+        nullable=False,
+    )
+    recorded_at = db.Column(db.DateTime, nullable=False)
+    occurred_at = db.Column(db.DateTime, index=True, nullable=False)
+    event_type = db.Column(db.UnicodeText, nullable=False)
+    data = db.Column(db.JSONB, nullable=False)
+
+    def __init__(
+        self,
+        recorded_at: datetime,
+        occurred_at: datetime,
+        event_type: str,
+        data: dict[str, Any],
+    ) -> None:
+        self.recorded_at = recorded_at
+        self.occurred_at = occurred_at
+        self.event_type = event_type
+        self.data = data
+
+    def __repr__(self) -> str:
+        return ReprBuilder(self) \
+            .add_with_lookup('id') \
+            .add_with_lookup('occurred_at') \
+            .add_custom(repr(self.event_type)) \
+            .build()
+
+
+class DbOutboxCursor(db.Model):
+    """The position up to which a consumer has taken events."""
+
+    __tablename__ = 'outbox_cursors'
+
+    consumer_name = db.Column(db.UnicodeText, primary_key=True)
+    last_transaction_id = db.Column(db.BigInteger, nullable=False)
+    last_event_id = db.Column(db.BigInteger, nullable=False)
+    updated_at = db.Column(db.DateTime, nullable=False)
+
+    def __init__(
+        self,
+        consumer_name: str,
+        last_transaction_id: int,
+        last_event_id: int,
+        updated_at: datetime,
+    ) -> None:
+        self.consumer_name = consumer_name
+        self.last_transaction_id = last_transaction_id
+        self.last_event_id = last_event_id
+        self.updated_at = updated_at
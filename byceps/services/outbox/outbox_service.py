@@ -0,0 +1,222 @@
+"""
+byceps.services.outbox.outbox_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Record events in the database so that they can be passed on to
+consumers (like announcements) reliably, and replayed.
+
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+from datetime import datetime
+from typing import Iterable, Iterator, Optional
+
+from flask import current_app
+from sqlalchemy import select, tuple_
+
+from ...database import db, insert_ignore_on_conflict
+from ...events.base import _BaseEvent
+
+from .dbmodels import DbOutboxCursor, DbOutboxEvent
+from .serialization import (
+    deserialize_event,
+    get_event_type_name,
+    serialize_event,
+)
+from .transfer.models import OutboxEvent, OutboxPosition
+
+
+def append_event(event: _BaseEvent, *, commit: bool = True) -> None:
+    """Record the event.
+
+    Pass `commit=False` to record it as part of an ongoing transaction
+    (i.e. together with the change the event is about).
+    """
+    db_event = DbOutboxEvent(
+        datetime.utcnow(),
+        event.occurred_at,
+        get_event_type_name(event),
+        serialize_event(event),
+    )
+    db.session.add(db_event)
+
+    if commit:
+        db.session.commit()
+
+
+def append_events_to_transaction(events: Iterable[_BaseEvent]) -> None:
+    """Record the events as part of the ongoing transaction, if the
+    outbox is enabled.
+
+    Call this before committing the change the events are about so that
+    both are committed (or rolled back) together.
+    """
+    if not current_app.config['OUTBOX_ENABLED']:
+        return None
+
+    for event in events:
+        append_event(event, commit=False)
+
+
+def get_events_after(
+    position: OutboxPosition, limit: int
+) -> list[OutboxEvent]:
+    """Return up to `limit` events after that position, in the order
+    they are passed on in.
+
+    Only events recorded by transactions that have ended are returned.
+    Transactions still in progress might yet commit events that would
+    have to be passed on before later ones, so those are held back.
+    """
+    db_events = db.session.execute(
+        select(DbOutboxEvent)
+        .filter(
+            tuple_(DbOutboxEvent.transaction_id, DbOutboxEvent.id)
+            > tuple_(position.transaction_id, position.event_id)
+        )
+        .filter(DbOutboxEvent.transaction_id < _select_oldest_transaction_id())
+        .order_by(DbOutboxEvent.transaction_id, DbOutboxEvent.id)
+        .limit(limit)
+    ).scalars().all()
+
+    return [_db_entity_to_event(db_event) for db_event in db_events]
+
+
+def iterate_events_occurred_between(
+    start: datetime, end: datetime, *, batch_size: int = 500
+) -> Iterator[OutboxEvent]:
+    """Yield the events that occurred in that time range, in the order
+    they were recorded.
+
+    Events are fetched in batches to limit memory usage.
+    """
+    last_event_id = 0
+
+    while True:
+        db_events = db.session.execute(
+            select(DbOutboxEvent)
+            .filter(DbOutboxEvent.occurred_at >= start)
+            .filter(DbOutboxEvent.occurred_at < end)
+            .filter(DbOutboxEvent.id > last_event_id)
+            .order_by(DbOutboxEvent.id)
+            .limit(batch_size)
+        ).scalars().all()
+
+        if not db_events:
+            return
+
+        for db_event in db_events:
+            yield _db_entity_to_event(db_event)
+
+        last_event_id = db_events[-1].id
+
+
+def get_current_position() -> OutboxPosition:
+    """Return the position before all events that transactions still in
+    progress (or yet to be started) will record.
+
+    Events recorded by transactions that have ended come before it,
+    except for some that have just been recorded while an older
+    transaction is still in progress.
+    """
+    oldest_transaction_id = db.session.execute(
+        select(_select_oldest_transaction_id())
+    ).scalar_one()
+
+    return OutboxPosition(oldest_transaction_id, 0)
+
+
+def _select_oldest_transaction_id():
+    """Select the ID of the oldest transaction still in progress (or,
+    if none is, of the next one to be started).
+    """
+    return db.func.txid_snapshot_xmin(db.func.txid_current_snapshot())
+
+
+def lock_cursor(consumer_name: str) -> Optional[OutboxPosition]:
+    """Lock the consumer's cursor and return the position of the last
+    event it has taken.
+
+    The lock is held until the transaction ends. Return `None` if the
+    cursor is locked by someone else.
+
+    A cursor is created on first use, positioned at the current
+    position, so that a new consumer only receives events recorded from
+    then on. Earlier events can be replayed.
+    """
+    current_position = get_current_position()
+
+    insert_ignore_on_conflict(
+        DbOutboxCursor.__table__,
+        {
+            'consumer_name': consumer_name,
+            'last_transaction_id': current_position.transaction_id,
+            'last_event_id': current_position.event_id,
+            'updated_at': datetime.utcnow(),
+        },
+    )
+
+    row = db.session.execute(
+        select(DbOutboxCursor.last_transaction_id, DbOutboxCursor.last_event_id)
+        .filter_by(consumer_name=consumer_name)
+        .with_for_update(skip_locked=True)
+    ).one_or_none()
+
+    if row is None:
+        return None
+
+    return OutboxPosition(*row)
+
+
+def advance_cursor(consumer_name: str, position: OutboxPosition) -> None:
+    """Record that the consumer has taken the events up to that
+    position.
+
+    The cursor is never moved backwards.
+    """
+    db.session \
+        .query(DbOutboxCursor) \
+        .filter_by(consumer_name=consumer_name) \
+        .filter(
+            tuple_(
+                DbOutboxCursor.last_transaction_id,
+                DbOutboxCursor.last_event_id,
+            )
+            < tuple_(position.transaction_id, position.event_id)
+        ) \
+        .update(
+            {
+                'last_transaction_id': position.transaction_id,
+                'last_event_id': position.event_id,
+                'updated_at': datetime.utcnow(),
+            },
+            synchronize_session=False,
+        )
+    db.session.commit()
+
+
+def get_cursor_positions() -> dict[str, OutboxPosition]:
+    """Return the position of the last event taken, per consumer."""
+    rows = db.session.execute(
+        select(
+            DbOutboxCursor.consumer_name,
+            DbOutboxCursor.last_transaction_id,
+            DbOutboxCursor.last_event_id,
+        )
+    ).all()
+
+    return {
+        consumer_name: OutboxPosition(transaction_id, event_id)
+        for consumer_name, transaction_id, event_id in rows
+    }
+
+
+def _db_entity_to_event(db_event: DbOutboxEvent) -> OutboxEvent:
+    return OutboxEvent(
+        id=db_event.id,
+        transaction_id=db_event.transaction_id,
+        recorded_at=db_event.recorded_at,
+        event=deserialize_event(db_event.event_type, db_event.data),
+    )
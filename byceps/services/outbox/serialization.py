@@ -0,0 +1,143 @@
+"""
+byceps.services.outbox.serialization
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Convert events to JSON-compatible data and back.
+
+Events are stored as JSON (instead of, e.g., pickled) so that they can
+be inspected in the database and read back independently of changes
+to unrelated code.
+
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+import dataclasses
+from datetime import datetime
+from enum import Enum
+from importlib import import_module
+import typing
+from typing import Any, Union
+from uuid import UUID
+
+from ...events.base import _BaseEvent
+
+
+EVENTS_PACKAGE_NAME = 'byceps.events'
+
+
+class UnknownEventType(Exception):
+    pass
+
+
+def get_event_type_name(event: _BaseEvent) -> str:
+    """Return the name of the event's type, relative to the events
+    package (e.g. ``board.BoardPostingCreated``).
+    """
+    event_type = type(event)
+
+    module_name = event_type.__module__
+    prefix = EVENTS_PACKAGE_NAME + '.'
+    if module_name.startswith(prefix):
+        module_name = module_name[len(prefix) :]
+
+    return f'{module_name}.{event_type.__qualname__}'
+
+
+def find_event_type(event_type_name: str) -> type[_BaseEvent]:
+    """Return the event type with that name.
+
+    Only types from the events package are looked up.
+    """
+    module_name, _, class_name = event_type_name.rpartition('.')
+    if not module_name or not module_name.isidentifier():
+        raise UnknownEventType(event_type_name)
+
+    try:
+        module = import_module(f'{EVENTS_PACKAGE_NAME}.{module_name}')
+    except ImportError:
+        raise UnknownEventType(event_type_name)
+
+    event_type = getattr(module, class_name, None)
+    if not (
+        isinstance(event_type, type)
+        and issubclass(event_type, _BaseEvent)
+        and dataclasses.is_dataclass(event_type)
+    ):
+        raise UnknownEventType(event_type_name)
+
+    return event_type
+
+
+def serialize_event(event: _BaseEvent) -> dict[str, Any]:
+    """Convert the event's attributes to JSON-compatible data."""
+    return _encode(event)
+
+
+def deserialize_event(
+    event_type_name: str, data: dict[str, Any]
+) -> _BaseEvent:
+    """Reconstruct an event from its type name and data."""
+    event_type = find_event_type(event_type_name)
+    return _decode(data, event_type)
+
+
+def _encode(value: Any) -> Any:
+    if (value is None) or isinstance(value, (bool, int, float, str)):
+        return value
+    elif isinstance(value, datetime):
+        return value.isoformat()
+    elif isinstance(value, UUID):
+        return str(value)
+    elif isinstance(value, Enum):
+        return value.name
+    elif dataclasses.is_dataclass(value):
+        return {
+            field.name: _encode(getattr(value, field.name))
+            for field in dataclasses.fields(value)
+        }
+    else:
+        raise TypeError(f'Cannot serialize value of type {type(value)}')
+
+
+def _decode(value: Any, type_: Any) -> Any:
+    if value is None:
+        return None
+
+    type_ = _unwrap_type(type_)
+
+    if type_ is datetime:
+        return datetime.fromisoformat(value)
+    elif type_ is UUID:
+        return UUID(value)
+    elif isinstance(type_, type) and issubclass(type_, Enum):
+        return type_[value]
+    elif dataclasses.is_dataclass(type_):
+        type_hints = typing.get_type_hints(type_)
+        return type_(
+            **{
+                field.name: _decode(
+                    value.get(field.name), type_hints[field.name]
+                )
+                for field in dataclasses.fields(type_)
+            }
+        )
+    else:
+        return value
+
+
+def _unwrap_type(type_: Any) -> Any:
+    """Resolve optional and new types to the actual type."""
+    while True:
+        if getattr(type_, '__origin__', None) is Union:
+            non_none_types = [
+                arg for arg in type_.__args__ if arg is not type(None)
+            ]
+            if len(non_none_types) != 1:
+                return type_
+            type_ = non_none_types[0]
+        elif hasattr(type_, '__supertype__'):
+            type_ = type_.__supertype__
+        else:
+            return type_
@@ -0,0 +1,32 @@
+"""
+byceps.services.outbox.transfer.models
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from ....events.base import _BaseEvent
+
+
+@dataclass(frozen=True)
+class OutboxPosition:
+    """A position in the order in which events are passed on."""
+
+    transaction_id: int
+    event_id: int
+
+
+@dataclass(frozen=True)
+class OutboxEvent:
+    id: int
+    transaction_id: int
+    recorded_at: datetime
+    event: _BaseEvent
+
+    @property
+    def position(self) -> OutboxPosition:
+        return OutboxPosition(self.transaction_id, self.id)
@@ -19,7 +19,7 @@ from ..ticketing.dbmodels.ticket import Ticket as DbTicket
 
 from .dbmodels.area import Area as DbArea
 from .dbmodels.seat import Seat as DbSeat
-from .transfer.models import Area, SeatUtilization
+from .transfer.models import Area, AreaID, SeatUtilization
 
 
 def create_area(party_id: PartyID, slug: str, title: str) -> Area:
@@ -48,6 +48,26 @@ def count_areas_for_party(party_id: PartyID) -> int:
         .count()
 
 
+def find_area(area_id: AreaID) -> Optional[Area]:
+    """Return the area with that ID, or `None` if not found."""
+    area = db.session.get(DbArea, area_id)
+
+    if area is None:
+        return None
+
+    return _db_entity_to_area(area)
+
+
+def get_area(area_id: AreaID) -> Area:
+    """Return the area with that ID, or raise an exception."""
+    area = find_area(area_id)
+
+    if area is None:
+        raise ValueError(f'Unknown area ID "{area_id}"')
+
+    return area
+
+
 def find_area_for_party_by_slug(party_id: PartyID, slug: str) -> Optional[Area]:
     """Return the area for that party with that slug, or `None` if not found."""
     area = db.session \
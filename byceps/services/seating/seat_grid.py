@@ -0,0 +1,254 @@
+"""
+byceps.services.seating.seat_grid
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+A spatial index of the seats of an area.
+
+Seats are put into square cells of a uniform grid by their coordinates,
+so that only the cells overlapping a region have to be looked at to
+find the seats in it, and the cells around a point to find the seats
+nearest to it.
+
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+from collections import defaultdict
+import heapq
+from itertools import count
+from math import ceil, hypot, inf, sqrt
+from typing import Any, Iterable, Iterator, Optional, Tuple
+
+from .transfer.models import Seat
+
+
+# The number of seats a cell should contain on average, if the cell size
+# is derived from the seats.
+SEATS_PER_CELL = 4
+
+
+Cell = Tuple[int, int]
+
+
+class SeatGrid:
+    """A spatial index of seats."""
+
+    def __init__(
+        self, seats: Iterable[Seat], *, cell_size: Optional[int] = None
+    ) -> None:
+        seats = list(seats)
+
+        if cell_size is None:
+            cell_size = _get_cell_size(seats)
+        elif cell_size < 1:
+            raise ValueError('The cell size has to be positive.')
+
+        self._cell_size = cell_size
+
+        cells: dict[Cell, list[Seat]] = defaultdict(list)
+        for seat in seats:
+            cells[self._get_cell(seat.coord_x, seat.coord_y)].append(seat)
+        self._cells = dict(cells)
+
+        # The range of cells containing seats.
+        self._extent: Optional[tuple[Cell, Cell]] = None
+        if self._cells:
+            cell_xs = [cell_x for cell_x, _ in self._cells]
+            cell_ys = [cell_y for _, cell_y in self._cells]
+            self._extent = (
+                (min(cell_xs), min(cell_ys)),
+                (max(cell_xs), max(cell_ys)),
+            )
+
+        self._seat_count = len(seats)
+
+    def __len__(self) -> int:
+        return self._seat_count
+
+    def get_seats_in_region(
+        self, min_x: int, min_y: int, max_x: int, max_y: int
+    ) -> list[Seat]:
+        """Return the seats within the rectangle (including its edges),
+        ordered by their coordinates (top to bottom, left to right).
+        """
+        min_cell_x, min_cell_y = self._get_cell(min_x, min_y)
+        max_cell_x, max_cell_y = self._get_cell(max_x, max_y)
+
+        cell_count = max(0, max_cell_x - min_cell_x + 1) * max(
+            0, max_cell_y - min_cell_y + 1
+        )
+        if cell_count <= len(self._cells):
+            cells = (
+                self._cells.get((cell_x, cell_y), [])
+                for cell_x in range(min_cell_x, max_cell_x + 1)
+                for cell_y in range(min_cell_y, max_cell_y + 1)
+            )
+        else:
+            # The region covers more cells than there are non-empty
+            # ones, so check the non-empty ones instead.
+            cells = (
+                cell_seats
+                for (cell_x, cell_y), cell_seats in self._cells.items()
+                if (min_cell_x <= cell_x <= max_cell_x)
+                and (min_cell_y <= cell_y <= max_cell_y)
+            )
+
+        seats = [
+            seat
+            for cell_seats in cells
+            for seat in cell_seats
+            if (min_x <= seat.coord_x <= max_x)
+            and (min_y <= seat.coord_y <= max_y)
+        ]
+
+        seats.sort(key=lambda seat: (seat.coord_y, seat.coord_x))
+        return seats
+
+    def iter_nearest_seats(self, x: int, y: int) -> Iterator[Seat]:
+        """Yield all seats, ordered by their distance to the point
+        (nearest first).
+        """
+        if not self._cells:
+            return
+
+        # Cells are queued by the distance to their nearest point, and
+        # only broken up into their seats once that is the nearest
+        # distance left. Order of equally distant seats: top to bottom,
+        # left to right. Cells come before equally distant seats; the
+        # counter avoids comparing cells and seats.
+        tie_breaker = count()
+        heap: list[tuple[float, bool, int, int, int, Any]] = []
+
+        def pop_nearer_seats(max_distance: float) -> Iterator[Seat]:
+            while heap and (heap[0][0] <= max_distance):
+                _, is_seat, _, _, _, item = heapq.heappop(heap)
+                if is_seat:
+                    yield item
+                    continue
+
+                for seat in self._cells[item]:
+                    distance = hypot(seat.coord_x - x, seat.coord_y - y)
+                    heapq.heappush(
+                        heap,
+                        (
+                            distance,
+                            True,
+                            seat.coord_y,
+                            seat.coord_x,
+                            next(tie_breaker),
+                            seat,
+                        ),
+                    )
+
+        for ring, cells in self._iter_rings(self._get_cell(x, y)):
+            for cell in cells:
+                distance = self._get_distance_to_cell(cell, x, y)
+                heapq.heappush(
+                    heap, (distance, False, 0, 0, next(tie_breaker), cell)
+                )
+
+            # Cells on the following rings are farther away than this.
+            yield from pop_nearer_seats(ring * self._cell_size)
+
+        yield from pop_nearer_seats(inf)
+
+    def _get_distance_to_cell(self, cell: Cell, x: int, y: int) -> float:
+        """Return the distance from the point to the nearest position
+        within the cell.
+        """
+        cell_x, cell_y = cell
+        min_x = cell_x * self._cell_size
+        min_y = cell_y * self._cell_size
+        max_x = min_x + self._cell_size - 1
+        max_y = min_y + self._cell_size - 1
+
+        dx = max(min_x - x, 0, x - max_x)
+        dy = max(min_y - y, 0, y - max_y)
+        return hypot(dx, dy)
+
+    def _iter_rings(
+        self, center_cell: Cell
+    ) -> Iterator[tuple[int, list[Cell]]]:
+        """Yield the non-empty cells grouped by their (Chebyshev)
+        distance from the center cell (the "ring" they are on), nearest
+        first.
+
+        Only the rings overlapping the extent of the non-empty cells are
+        walked, cell by cell, as long as that takes fewer steps than
+        looking at each non-empty cell. The cells on all remaining rings
+        are then looked up among the non-empty ones instead, and yielded
+        at once (as if on the last ring).
+        """
+        assert self._extent is not None
+        (min_x, min_y), (max_x, max_y) = self._extent
+        center_x, center_y = center_cell
+
+        first_ring = max(
+            0,
+            min_x - center_x,
+            center_x - max_x,
+            min_y - center_y,
+            center_y - max_y,
+        )
+        last_ring = max(
+            center_x - min_x,
+            max_x - center_x,
+            center_y - min_y,
+            max_y - center_y,
+        )
+
+        walked_cell_count = 0
+        for ring in range(first_ring, last_ring + 1):
+            # The top and bottom rows include the corners.
+            xs = range(
+                max(center_x - ring, min_x), min(center_x + ring, max_x) + 1
+            )
+            ys = range(
+                max(center_y - ring + 1, min_y),
+                min(center_y + ring - 1, max_y) + 1,
+            )
+            rows = [
+                cell_y
+                for cell_y in {center_y - ring, center_y + ring}
+                if min_y <= cell_y <= max_y
+            ]
+            columns = [
+                cell_x
+                for cell_x in {center_x - ring, center_x + ring}
+                if min_x <= cell_x <= max_x
+            ]
+
+            walked_cell_count += len(rows) * len(xs) + len(columns) * len(ys)
+            if walked_cell_count > len(self._cells):
+                break
+
+            ring_cells = [
+                (cell_x, cell_y) for cell_y in rows for cell_x in xs
+            ] + [(cell_x, cell_y) for cell_x in columns for cell_y in ys]
+            yield ring, [cell for cell in ring_cells if cell in self._cells]
+        else:
+            return
+
+        yield last_ring, [
+            (cell_x, cell_y)
+            for cell_x, cell_y in self._cells
+            if max(abs(cell_x - center_x), abs(cell_y - center_y)) >= ring
+        ]
+
+    def _get_cell(self, x: int, y: int) -> Cell:
+        return x // self._cell_size, y // self._cell_size
+
+
+def _get_cell_size(seats: list[Seat]) -> int:
+    """Derive a cell size from the seats' extent."""
+    if not seats:
+        return 1
+
+    xs = [seat.coord_x for seat in seats]
+    ys = [seat.coord_y for seat in seats]
+    width = max(xs) - min(xs)
+    height = max(ys) - min(ys)
+
+    area_per_cell = (width + 1) * (height + 1) * SEATS_PER_CELL / len(seats)
+    return max(1, int(sqrt(ceil(area_per_cell))))
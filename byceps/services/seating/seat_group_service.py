@@ -6,6 +6,7 @@ byceps.services.seating.seat_group_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from __future__ import annotations
 from typing import Optional, Sequence
 
 from sqlalchemy import select
@@ -213,6 +214,19 @@ def get_all_seat_groups_for_party(party_id: PartyID) -> Sequence[DbSeatGroup]:
         .all()
 
 
+def select_seats_in_groups(seat_ids: set[SeatID]) -> set[SeatID]:
+    """Return the IDs of those seats that are part of a seat group."""
+    if not seat_ids:
+        return set()
+
+    return set(
+        db.session.execute(
+            select(DbSeatGroupAssignment.seat_id)
+            .filter(DbSeatGroupAssignment.seat_id.in_(frozenset(seat_ids)))
+        ).scalars().all()
+    )
+
+
 def is_seat_part_of_a_group(seat_id: SeatID) -> bool:
     """Return whether or not the seat is part of a seat group."""
     return db.session.execute(
@@ -0,0 +1,308 @@
+"""
+byceps.services.seating.seat_import
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Read seat layouts from files, and compare them to existing seats.
+
+Layouts can be provided as CSV (with a header row) or as JSON Lines
+(one object per line). Both are read line by line. The fields are:
+
+- `x`, `y`: the seat's coordinates (required, non-negative integers)
+- `category`: the title of the seat's ticket category (required)
+- `rotation`: in degrees (optional, 0 to 359)
+- `label`: e.g. "A-12" (optional)
+- `type`: (optional)
+
+Imported seats are matched with existing seats by label, or, if they
+have none, by position. This way, seats can be moved by changing their
+coordinates in the layout while keeping their label (and whatever
+tickets occupy them).
+
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+from collections import defaultdict
+import csv
+from dataclasses import dataclass
+import json
+from typing import (
+    Any,
+    Collection,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from ..ticketing.transfer.models import TicketCategoryID
+
+from .transfer.models import MAX_COORDINATE, Seat
+
+
+class SeatImportError(Exception):
+    """Indicate that a seat layout is invalid."""
+
+
+@dataclass(frozen=True)
+class SeatToImport:
+    coord_x: int
+    coord_y: int
+    category_title: str
+    rotation: Optional[int]
+    label: Optional[str]
+    type_: Optional[str]
+
+
+@dataclass(frozen=True)
+class SeatLayoutDiff:
+    added: list[SeatToImport]
+    changed: list[tuple[Seat, SeatToImport]]
+    removed: list[Seat]
+    unchanged_count: int
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+
+SeatKey = Union[str, Tuple[int, int]]
+
+
+def read_seats_from_csv(
+    lines: Iterable[str],
+    *,
+    category_titles: Optional[Collection[str]] = None,
+) -> Iterator[SeatToImport]:
+    """Read seats from CSV lines (including a header row).
+
+    Raise `SeatImportError` on the first invalid seat.
+    """
+    reader = csv.DictReader(lines)
+
+    missing_field_names = {'x', 'y', 'category'}.difference(
+        reader.fieldnames or []
+    )
+    if missing_field_names:
+        raise SeatImportError(
+            'Missing columns: ' + ', '.join(sorted(missing_field_names))
+        )
+
+    records = ((reader.line_num, record) for record in reader)
+    yield from _read_seats(records, category_titles)
+
+
+def read_seats_from_json_lines(
+    lines: Iterable[str],
+    *,
+    category_titles: Optional[Collection[str]] = None,
+) -> Iterator[SeatToImport]:
+    """Read seats from JSON Lines (one object per line, blank lines
+    are ignored).
+
+    Raise `SeatImportError` on the first invalid seat.
+    """
+
+    def parse_lines() -> Iterator[tuple[int, Any]]:
+        for line_number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                raise SeatImportError(f'Line {line_number}: Invalid JSON: {e}')
+
+            yield line_number, record
+
+    yield from _read_seats(parse_lines(), category_titles)
+
+
+def _read_seats(
+    records: Iterable[tuple[int, Any]],
+    category_titles: Optional[Collection[str]],
+) -> Iterator[SeatToImport]:
+    line_numbers_by_key: dict[SeatKey, int] = {}
+    line_numbers_by_position: dict[tuple[int, int], int] = {}
+
+    for line_number, record in records:
+        try:
+            seat = _parse_seat(record, category_titles)
+        except ValueError as e:
+            raise SeatImportError(f'Line {line_number}: {e}')
+
+        # Labels have to be unique, as do positions.
+        for key, line_numbers, conflict in [
+            (get_key(seat), line_numbers_by_key, 'a duplicate of'),
+            (
+                (seat.coord_x, seat.coord_y),
+                line_numbers_by_position,
+                'at the same position as the seat in',
+            ),
+        ]:
+            previous_line_number = line_numbers.get(key)
+            if previous_line_number is not None:
+                raise SeatImportError(
+                    f'Line {line_number}: Seat {describe_seat(seat)} is '
+                    f'{conflict} line {previous_line_number}.'
+                )
+            line_numbers[key] = line_number
+
+        yield seat
+
+
+def _parse_seat(
+    record: Any, category_titles: Optional[Collection[str]]
+) -> SeatToImport:
+    if not isinstance(record, dict):
+        raise ValueError('Seat has to be an object.')
+
+    coord_x = _parse_int(record, 'x', 0, MAX_COORDINATE, required=True)
+    coord_y = _parse_int(record, 'y', 0, MAX_COORDINATE, required=True)
+    rotation = _parse_int(record, 'rotation', 0, 359, required=False)
+
+    category_title = _parse_str(record, 'category')
+    if category_title is None:
+        raise ValueError('Category is required.')
+    if (category_titles is not None) and (
+        category_title not in category_titles
+    ):
+        raise ValueError(f'Unknown category "{category_title}".')
+
+    return SeatToImport(
+        coord_x=coord_x,
+        coord_y=coord_y,
+        category_title=category_title,
+        rotation=rotation,
+        label=_parse_str(record, 'label'),
+        type_=_parse_str(record, 'type'),
+    )
+
+
+def _parse_int(
+    record: dict[str, Any],
+    name: str,
+    min_value: int,
+    max_value: int,
+    *,
+    required: bool,
+) -> Optional[int]:
+    value = record.get(name)
+
+    if isinstance(value, str):
+        value = value.strip() or None
+
+    if value is None:
+        if required:
+            raise ValueError(f'Field "{name}" is required.')
+        return None
+
+    if isinstance(value, (bool, float)):
+        raise ValueError(f'Field "{name}" has to be an integer.')
+
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f'Field "{name}" has to be an integer.')
+
+    if not (min_value <= number <= max_value):
+        raise ValueError(
+            f'Field "{name}" has to be between {min_value} and {max_value}.'
+        )
+
+    return number
+
+
+def _parse_str(record: dict[str, Any], name: str) -> Optional[str]:
+    value = record.get(name)
+
+    if value is None:
+        return None
+
+    if not isinstance(value, str):
+        raise ValueError(f'Field "{name}" has to be a string.')
+
+    return value.strip() or None
+
+
+def diff_layout(
+    existing_seats: Iterable[Seat],
+    seats_to_import: Iterable[SeatToImport],
+    category_ids_by_title: Mapping[str, TicketCategoryID],
+) -> SeatLayoutDiff:
+    """Compare the seats to import to the existing ones.
+
+    Raise `SeatImportError` if a seat's category is unknown.
+    """
+    existing_seats_by_key: dict[SeatKey, list[Seat]] = defaultdict(list)
+    for seat in existing_seats:
+        existing_seats_by_key[get_key(seat)].append(seat)
+
+    added = []
+    changed = []
+    unchanged_count = 0
+
+    for seat_to_import in seats_to_import:
+        if seat_to_import.category_title not in category_ids_by_title:
+            raise SeatImportError(
+                f'Unknown category "{seat_to_import.category_title}".'
+            )
+
+        matching_seats = existing_seats_by_key.get(get_key(seat_to_import))
+        existing_seat = matching_seats.pop(0) if matching_seats else None
+
+        if existing_seat is None:
+            added.append(seat_to_import)
+        elif _has_changed(
+            existing_seat, seat_to_import, category_ids_by_title
+        ):
+            changed.append((existing_seat, seat_to_import))
+        else:
+            unchanged_count += 1
+
+    # Also includes existing seats that share a key with another one.
+    removed = [
+        seat for seats in existing_seats_by_key.values() for seat in seats
+    ]
+
+    return SeatLayoutDiff(
+        added=added,
+        changed=changed,
+        removed=removed,
+        unchanged_count=unchanged_count,
+    )
+
+
+def _has_changed(
+    seat: Seat,
+    seat_to_import: SeatToImport,
+    category_ids_by_title: Mapping[str, TicketCategoryID],
+) -> bool:
+    category_id = category_ids_by_title[seat_to_import.category_title]
+
+    return (
+        (seat.coord_x != seat_to_import.coord_x)
+        or (seat.coord_y != seat_to_import.coord_y)
+        or (seat.category_id != category_id)
+        or (seat.rotation != seat_to_import.rotation)
+        or (seat.type_ != seat_to_import.type_)
+    )
+
+
+def get_key(seat: Union[Seat, SeatToImport]) -> SeatKey:
+    """Return what identifies the seat in a layout."""
+    if seat.label:
+        return seat.label
+
+    return seat.coord_x, seat.coord_y
+
+
+def describe_seat(seat: Union[Seat, SeatToImport]) -> str:
+    """Return how to refer to the seat in messages."""
+    if seat.label:
+        return f'"{seat.label}"'
+
+    return f'at ({seat.coord_x}, {seat.coord_y})'
@@ -0,0 +1,216 @@
+"""
+byceps.services.seating.seat_import_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Import seat layouts into areas.
+
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+from typing import Iterable, Mapping
+
+from sqlalchemy import (
+    cast,
+    column,
+    delete,
+    insert,
+    select,
+    update,
+    values,
+)
+
+from ...database import db
+
+from ..ticketing import category_service as ticket_category_service
+from ..ticketing.dbmodels.ticket import Ticket as DbTicket
+from ..ticketing.transfer.models import TicketCategoryID
+
+from . import area_service, seat_group_service, seat_service
+from .dbmodels.seat import Seat as DbSeat
+from .seat_import import (
+    describe_seat,
+    diff_layout,
+    SeatImportError,
+    SeatLayoutDiff,
+    SeatToImport,
+)
+from .transfer.models import AreaID, Seat
+
+
+def get_category_ids_by_title(area_id: AreaID) -> dict[str, TicketCategoryID]:
+    """Return the IDs of the ticket categories of the area's party,
+    indexed by title.
+    """
+    area = area_service.get_area(area_id)
+
+    categories = ticket_category_service.get_categories_for_party(
+        area.party_id
+    )
+
+    return {category.title: category.id for category in categories}
+
+
+def import_seats(
+    area_id: AreaID,
+    seats_to_import: Iterable[SeatToImport],
+    *,
+    dry_run: bool = False,
+) -> SeatLayoutDiff:
+    """Make the area's seats match the layout.
+
+    Seats are added, changed, and removed as necessary, all in a single
+    transaction. Seats that are occupied or part of a seat group cannot
+    be removed, and their category cannot be changed.
+
+    Return the differences between the existing seats and the layout.
+    Nothing is changed on a dry run.
+    """
+    category_ids_by_title = get_category_ids_by_title(area_id)
+    existing_seats = seat_service.get_seats_for_area(area_id)
+
+    layout_diff = diff_layout(
+        existing_seats, seats_to_import, category_ids_by_title
+    )
+
+    _ensure_no_seats_in_use_are_affected(layout_diff, category_ids_by_title)
+
+    if dry_run or not layout_diff.has_changes:
+        return layout_diff
+
+    _insert_seats(area_id, layout_diff.added, category_ids_by_title)
+    _update_seats(layout_diff.changed, category_ids_by_title)
+    _delete_seats(layout_diff.removed)
+
+    db.session.commit()
+
+    seat_service.invalidate_seat_grid(area_id)
+
+    return layout_diff
+
+
+def _ensure_no_seats_in_use_are_affected(
+    layout_diff: SeatLayoutDiff,
+    category_ids_by_title: Mapping[str, TicketCategoryID],
+) -> None:
+    recategorized_seats = [
+        seat
+        for seat, seat_to_import in layout_diff.changed
+        if seat.category_id
+        != category_ids_by_title[seat_to_import.category_title]
+    ]
+
+    affected_seats_by_id = {
+        seat.id: seat for seat in layout_diff.removed + recategorized_seats
+    }
+    if not affected_seats_by_id:
+        return
+
+    affected_seat_ids = set(affected_seats_by_id.keys())
+
+    occupied_seat_ids = db.session.execute(
+        select(DbTicket.occupied_seat_id)
+        .filter(DbTicket.occupied_seat_id.in_(frozenset(affected_seat_ids)))
+    ).scalars().all()
+
+    grouped_seat_ids = seat_group_service.select_seats_in_groups(
+        affected_seat_ids
+    )
+
+    seats_in_use = [
+        affected_seats_by_id[seat_id]
+        for seat_id in set(occupied_seat_ids).union(grouped_seat_ids)
+    ]
+    if seats_in_use:
+        labels = ', '.join(sorted(describe_seat(seat) for seat in seats_in_use))
+        raise SeatImportError(
+            'Seats that are occupied or part of a seat group cannot be '
+            f'removed or moved to another category: {labels}'
+        )
+
+
+def _insert_seats(
+    area_id: AreaID,
+    seats_to_import: list[SeatToImport],
+    category_ids_by_title: Mapping[str, TicketCategoryID],
+) -> None:
+    if not seats_to_import:
+        return
+
+    rows = [
+        {
+            'area_id': area_id,
+            'category_id': category_ids_by_title[seat.category_title],
+            'coord_x': seat.coord_x,
+            'coord_y': seat.coord_y,
+            'rotation': seat.rotation,
+            'label': seat.label,
+            'type': seat.type_,
+        }
+        for seat in seats_to_import
+    ]
+
+    db.session.execute(insert(DbSeat.__table__), rows)
+
+
+def _update_seats(
+    changes: list[tuple[Seat, SeatToImport]],
+    category_ids_by_title: Mapping[str, TicketCategoryID],
+) -> None:
+    if not changes:
+        return
+
+    table = DbSeat.__table__
+
+    # Update all seats with a single statement, joining a list of the
+    # new values (`UPDATE ... FROM (VALUES ...)`).
+    changed_seats = values(
+        column('id', db.Uuid),
+        column('category_id', db.Uuid),
+        column('coord_x', db.Integer),
+        column('coord_y', db.Integer),
+        column('rotation', db.Integer),
+        column('type', db.UnicodeText),
+        name='changed_seats',
+    ).data(
+        [
+            (
+                seat.id,
+                category_ids_by_title[seat_to_import.category_title],
+                seat_to_import.coord_x,
+                seat_to_import.coord_y,
+                seat_to_import.rotation,
+                seat_to_import.type_,
+            )
+            for seat, seat_to_import in changes
+        ]
+    )
+
+    # The database derives the types of the listed values from the
+    # values themselves (e.g. text for UUIDs, or if all are `NULL`), so
+    # they have to be cast to the columns' types.
+    def get_value(name: str):
+        return cast(changed_seats.c[name], table.c[name].type)
+
+    statement = update(table) \
+        .where(table.c.id == get_value('id')) \
+        .values(
+            category_id=get_value('category_id'),
+            coord_x=get_value('coord_x'),
+            coord_y=get_value('coord_y'),
+            rotation=get_value('rotation'),
+            type=get_value('type'),
+        )
+
+    db.session.execute(statement)
+
+
+def _delete_seats(seats: list[Seat]) -> None:
+    if not seats:
+        return
+
+    table = DbSeat.__table__
+    seat_ids = frozenset(seat.id for seat in seats)
+
+    db.session.execute(delete(table).where(table.c.id.in_(seat_ids)))
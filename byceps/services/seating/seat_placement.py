@@ -0,0 +1,301 @@
+"""
+byceps.services.seating.seat_placement
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Find seats for a number of people who want to sit together.
+
+Seats are grouped into rows by their vertical coordinate. The distances
+between neighboring seats and between neighboring rows are derived from
+the coordinates of all seats of the layout (as the most common gap), so
+layouts of any scale are supported.
+
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+from bisect import bisect_left, bisect_right
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+import heapq
+from math import hypot, sqrt
+from typing import Collection, Iterable, Iterator, Optional, Sequence
+
+from .transfer.models import Seat
+
+
+# Seats farther apart than this (in multiples of the regular distance)
+# are not considered to be next to each other, e.g. because of an aisle
+# in between.
+MAX_NEIGHBOR_DISTANCE = 1.5
+
+
+@dataclass(frozen=True)
+class PlacementPreferences:
+    # Seats have to form a single block without gaps.
+    adjacent: bool = True
+    # All seats have to be in the same row.
+    same_row: bool = False
+
+
+def find_seats(
+    free_seats: Collection[Seat],
+    quantity: int,
+    preferences: PlacementPreferences,
+    *,
+    all_seats: Optional[Collection[Seat]] = None,
+) -> Optional[list[Seat]]:
+    """Select that many of the free seats, as close to each other as
+    possible.
+
+    The seat and row distances are derived from all seats of the layout
+    (occupied ones included) if given, otherwise from the free seats.
+    Free seats separated by occupied ones are only considered to be
+    next to each other if the former are.
+
+    Return the seats ordered by row, and from left to right within each
+    row, or `None` if no selection satisfies the preferences.
+    """
+    if quantity < 1:
+        raise ValueError('At least one seat has to be requested.')
+
+    if len(free_seats) < quantity:
+        return None
+
+    layout_rows = _group_into_rows(
+        all_seats if (all_seats is not None) else free_seats
+    )
+    seat_distance = _get_regular_gap(
+        [seat.coord_x for seat in row] for row in layout_rows.values()
+    )
+    row_distance = _get_regular_gap([sorted(layout_rows)])
+
+    rows = _group_into_rows(free_seats)
+
+    if preferences.same_row:
+        seats = _find_seats_in_row(
+            rows, quantity, seat_distance, preferences.adjacent
+        )
+    else:
+        seats = _find_cluster(
+            free_seats,
+            quantity,
+            seat_distance,
+            row_distance,
+            preferences.adjacent,
+        )
+
+    if seats is None:
+        return None
+
+    return sorted(seats, key=lambda seat: (seat.coord_y, seat.coord_x))
+
+
+def _group_into_rows(seats: Iterable[Seat]) -> dict[int, list[Seat]]:
+    """Group the seats by row, each row sorted from left to right."""
+    rows = defaultdict(list)
+    for seat in seats:
+        rows[seat.coord_y].append(seat)
+
+    for row in rows.values():
+        row.sort(key=lambda seat: seat.coord_x)
+
+    return dict(rows)
+
+
+def _get_regular_gap(sequences: Iterable[Sequence[int]]) -> int:
+    """Return the most common gap between consecutive values of the
+    (sorted) sequences.
+    """
+    gaps = Counter(
+        b - a
+        for values in sequences
+        for a, b in zip(values, values[1:])
+        if b > a
+    )
+
+    if not gaps:
+        return 1
+
+    return gaps.most_common(1)[0][0]
+
+
+def _find_seats_in_row(
+    rows: dict[int, list[Seat]],
+    quantity: int,
+    seat_distance: int,
+    adjacent: bool,
+) -> Optional[list[Seat]]:
+    """Return consecutive free seats of a single row spanning the
+    shortest distance.
+    """
+    max_gap = seat_distance * MAX_NEIGHBOR_DISTANCE
+
+    best_key = None
+    best_seats = None
+
+    for coord_y, row in sorted(rows.items()):
+        # Count the gaps too wide to sit next to each other up to each
+        # seat so that windows containing one are detected in constant
+        # time.
+        gap_counts = [0]
+        for previous_seat, seat in zip(row, row[1:]):
+            is_gap = (seat.coord_x - previous_seat.coord_x) > max_gap
+            gap_counts.append(gap_counts[-1] + int(is_gap))
+
+        for start in range(len(row) - quantity + 1):
+            end = start + quantity - 1
+            if adjacent and (gap_counts[end] != gap_counts[start]):
+                continue
+
+            span = row[end].coord_x - row[start].coord_x
+            key = (span, coord_y, row[start].coord_x)
+            if (best_key is None) or (key < best_key):
+                best_key = key
+                best_seats = row[start : end + 1]
+
+    return best_seats
+
+
+def _find_cluster(
+    seats: Collection[Seat],
+    quantity: int,
+    seat_distance: int,
+    row_distance: int,
+    adjacent: bool,
+) -> Optional[list[Seat]]:
+    """Return the seats closest to each other.
+
+    Each seat, as well as each point halfway between it and its diagonal
+    neighbors, is tried as the center of the group, taking the seats
+    nearest to it. The group whose seats are closest to their own center
+    of mass wins.
+    """
+    seats_by_x = sorted(seats, key=lambda seat: (seat.coord_x, seat.coord_y))
+    xs = [seat.coord_x for seat in seats_by_x]
+
+    def get_distance(seat: Seat, x: float, y: float) -> float:
+        return hypot(
+            (seat.coord_x - x) / seat_distance,
+            (seat.coord_y - y) / row_distance,
+        )
+
+    # In a fully available block, the nearest seats lie within a square
+    # of this many seats around the center.
+    initial_radius = int(sqrt(quantity - 1)) + 2
+
+    best_key = None
+    best_seats = None
+
+    for center_x, center_y in _get_centers(
+        seats_by_x, seat_distance, row_distance
+    ):
+        def by_distance(seat: Seat) -> tuple[float, int, int]:
+            distance = get_distance(seat, center_x, center_y)
+            return distance, seat.coord_y, seat.coord_x
+
+        radius = initial_radius
+        while True:
+            candidates = _get_seats_within(
+                seats_by_x,
+                xs,
+                center_x,
+                center_y,
+                radius * seat_distance,
+                radius * row_distance,
+            )
+            if len(candidates) >= quantity:
+                break
+            # Not enough free seats nearby; look farther.
+            radius *= 2
+
+        group = heapq.nsmallest(quantity, candidates, key=by_distance)
+
+        # The nearest seats are only guaranteed to be the nearest ones
+        # overall if none lies farther away than the searched radius.
+        if get_distance(group[-1], center_x, center_y) > radius:
+            group = heapq.nsmallest(quantity, seats_by_x, key=by_distance)
+
+        if adjacent and not _is_connected(group, seat_distance, row_distance):
+            continue
+
+        mean_x = sum(seat.coord_x for seat in group) / quantity
+        mean_y = sum(seat.coord_y for seat in group) / quantity
+        cost = sum(get_distance(seat, mean_x, mean_y) for seat in group)
+        key = (round(cost, 9), center_y, center_x)
+        if (best_key is None) or (key < best_key):
+            best_key = key
+            best_seats = group
+
+    return best_seats
+
+
+def _get_centers(
+    seats: Iterable[Seat], seat_distance: int, row_distance: int
+) -> Iterator[tuple[float, float]]:
+    """Yield the seats' positions, and the points halfway between each
+    seat and its (possible) diagonal neighbors.
+    """
+    offsets = [
+        (0, 0),
+        (-seat_distance / 2, -row_distance / 2),
+        (seat_distance / 2, -row_distance / 2),
+        (-seat_distance / 2, row_distance / 2),
+        (seat_distance / 2, row_distance / 2),
+    ]
+
+    centers = {
+        (seat.coord_x + dx, seat.coord_y + dy)
+        for seat in seats
+        for dx, dy in offsets
+    }
+
+    return iter(sorted(centers))
+
+
+def _get_seats_within(
+    seats_by_x: list[Seat],
+    xs: list[int],
+    center_x: float,
+    center_y: float,
+    max_dx: float,
+    max_dy: float,
+) -> list[Seat]:
+    """Return the seats within the box around the center."""
+    start = bisect_left(xs, center_x - max_dx)
+    end = bisect_right(xs, center_x + max_dx)
+
+    return [
+        seat
+        for seat in seats_by_x[start:end]
+        if abs(seat.coord_y - center_y) <= max_dy
+    ]
+
+
+def _is_connected(
+    seats: list[Seat], seat_distance: int, row_distance: int
+) -> bool:
+    """Return `True` if each seat can be reached from any other one by
+    moving between neighboring seats (in the same row or in adjacent
+    rows).
+    """
+    max_dx = seat_distance * MAX_NEIGHBOR_DISTANCE
+    max_dy = row_distance * MAX_NEIGHBOR_DISTANCE
+
+    def are_neighbors(a: Seat, b: Seat) -> bool:
+        return (abs(a.coord_x - b.coord_x) <= max_dx) and (
+            abs(a.coord_y - b.coord_y) <= max_dy
+        )
+
+    reached = {0}
+    pending = [0]
+    while pending:
+        index = pending.pop()
+        for other_index, other in enumerate(seats):
+            if (other_index not in reached) and are_neighbors(
+                seats[index], other
+            ):
+                reached.add(other_index)
+                pending.append(other_index)
+
+    return len(reached) == len(seats)
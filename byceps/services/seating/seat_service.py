@@ -7,19 +7,26 @@ byceps.services.seating.seat_service
 """
 
 from __future__ import annotations
-from typing import Iterable, Iterator, Optional, Sequence
+from typing import AbstractSet, Iterable, Iterator, Optional, Sequence
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 
 from ...database import db
 from ...typing import PartyID
+from ...util.snapshot_cache import SnapshotCache
 
 from ..ticketing.dbmodels.category import Category as DbTicketCategory
 from ..ticketing.dbmodels.ticket import Ticket as DbTicket
-from ..ticketing.transfer.models import TicketCategory, TicketCategoryID
+from ..ticketing.transfer.models import (
+    TicketCategory,
+    TicketCategoryID,
+    TicketID,
+)
 
 from .dbmodels.area import Area as DbArea
 from .dbmodels.seat import Seat as DbSeat
+from .dbmodels.seat_group import SeatGroupAssignment as DbSeatGroupAssignment
+from .seat_grid import SeatGrid
 from .transfer.models import AreaID, Seat, SeatID, SeatUtilization
 
 
@@ -45,35 +52,47 @@ def create_seat(
     db.session.add(db_seat)
     db.session.commit()
 
+    invalidate_seat_grid(area_id)
+
     return _db_entity_to_seat(db_seat)
 
 
 def create_seats(area_id: AreaID, seats: Iterator[Seat]) -> None:
     """Create multiple seats in the same area at once."""
-    db_seats = [
-        DbSeat(
-            area_id,
-            seat.category_id,
-            coord_x=seat.coord_x,
-            coord_y=seat.coord_y,
-            rotation=seat.rotation,
-            label=seat.label,
-            type_=seat.type_,
-        )
+    rows = [
+        {
+            'area_id': area_id,
+            'coord_x': seat.coord_x,
+            'coord_y': seat.coord_y,
+            'rotation': seat.rotation,
+            'category_id': seat.category_id,
+            'label': seat.label,
+            'type': seat.type_,
+        }
         for seat in seats
     ]
 
-    db.session.add_all(db_seats)
+    if not rows:
+        return
+
+    # Insert with as few statements as possible instead of one per seat.
+    db.session.execute(insert(DbSeat.__table__), rows)
     db.session.commit()
 
+    invalidate_seat_grid(area_id)
+
 
 def delete_seat(seat_id: SeatID) -> None:
     """Delete a seat."""
+    seat = get_seat(seat_id)
+
     db.session.query(DbSeat) \
         .filter_by(id=seat_id) \
         .delete()
     db.session.commit()
 
+    invalidate_seat_grid(seat.area_id)
+
 
 def count_occupied_seats_by_category(
     party_id: PartyID,
@@ -175,6 +194,46 @@ def find_seats(seat_ids: set[SeatID]) -> set[Seat]:
     return {_db_entity_to_seat(db_seat) for db_seat in db_seats}
 
 
+def get_free_seats(
+    category_id: TicketCategoryID,
+    *,
+    area_id: Optional[AreaID] = None,
+    ignored_ticket_ids: AbstractSet[TicketID] = frozenset(),
+) -> list[Seat]:
+    """Return the seats of that category (and area, if given) that are
+    neither occupied nor part of a seat group.
+
+    Seats occupied by the ignored tickets are considered free.
+    """
+    occupied_seat_ids = select(DbTicket.occupied_seat_id) \
+        .filter(DbTicket.occupied_seat_id != None)
+    if ignored_ticket_ids:
+        occupied_seat_ids = occupied_seat_ids \
+            .filter(DbTicket.id.notin_(frozenset(ignored_ticket_ids)))
+
+    grouped_seat_ids = select(DbSeatGroupAssignment.seat_id)
+
+    query = select(DbSeat) \
+        .filter_by(category_id=category_id) \
+        .filter(DbSeat.id.notin_(occupied_seat_ids)) \
+        .filter(DbSeat.id.notin_(grouped_seat_ids))
+    if area_id is not None:
+        query = query.filter_by(area_id=area_id)
+
+    db_seats = db.session.execute(query).scalars().all()
+
+    return [_db_entity_to_seat(db_seat) for db_seat in db_seats]
+
+
+def get_seats_for_area(area_id: AreaID) -> list[Seat]:
+    """Return the seats of that area."""
+    db_seats = db.session.execute(
+        select(DbSeat).filter_by(area_id=area_id)
+    ).scalars().all()
+
+    return [_db_entity_to_seat(db_seat) for db_seat in db_seats]
+
+
 def get_seats_with_tickets_for_area(
     area_id: AreaID,
 ) -> Sequence[tuple[Seat, Optional[DbTicket]]]:
@@ -195,9 +254,100 @@ def get_seats_with_tickets_for_area(
     ]
 
 
+def get_seats_with_tickets_in_region(
+    area_id: AreaID, min_x: int, min_y: int, max_x: int, max_y: int
+) -> Sequence[tuple[Seat, Optional[DbTicket]]]:
+    """Return the seats within the rectangle and their associated
+    tickets (if available) for that area.
+    """
+    seats = _get_seat_grid(area_id).get_seats_in_region(
+        min_x, min_y, max_x, max_y
+    )
+    if not seats:
+        return []
+
+    db_tickets = db.session.execute(
+        select(DbTicket)
+        .filter(DbTicket.occupied_seat_id.in_({seat.id for seat in seats}))
+    ).scalars().all()
+    db_tickets_by_seat_id = {
+        db_ticket.occupied_seat_id: db_ticket for db_ticket in db_tickets
+    }
+
+    return [(seat, db_tickets_by_seat_id.get(seat.id)) for seat in seats]
+
+
+def find_nearest_free_seats(
+    area_id: AreaID,
+    x: int,
+    y: int,
+    quantity: int,
+    *,
+    category_id: Optional[TicketCategoryID] = None,
+) -> list[Seat]:
+    """Return up to that many seats of that area (and category, if
+    given) which are neither occupied nor part of a seat group, nearest
+    to the point first.
+    """
+    unavailable_seat_ids = _get_unavailable_seat_ids(area_id)
+
+    seats: list[Seat] = []
+
+    for seat in _get_seat_grid(area_id).iter_nearest_seats(x, y):
+        if len(seats) == quantity:
+            break
+
+        if seat.id in unavailable_seat_ids:
+            continue
+
+        if (category_id is not None) and (seat.category_id != category_id):
+            continue
+
+        seats.append(seat)
+
+    return seats
+
+
+def _get_unavailable_seat_ids(area_id: AreaID) -> set[SeatID]:
+    """Return the IDs of the seats in the area that are occupied or part
+    of a seat group.
+    """
+    occupied_seat_ids = select(DbTicket.occupied_seat_id) \
+        .join(DbSeat, DbSeat.id == DbTicket.occupied_seat_id) \
+        .filter(DbSeat.area_id == area_id)
+
+    grouped_seat_ids = select(DbSeatGroupAssignment.seat_id) \
+        .join(DbSeat, DbSeat.id == DbSeatGroupAssignment.seat_id) \
+        .filter(DbSeat.area_id == area_id)
+
+    return set(
+        db.session.execute(
+            occupied_seat_ids.union(grouped_seat_ids)
+        ).scalars().all()
+    )
+
+
+def _get_seat_grid(area_id: AreaID) -> SeatGrid:
+    return _seat_grids.get(area_id)
+
+
+def _load_seat_grid(area_id: AreaID) -> SeatGrid:
+    return SeatGrid(get_seats_for_area(area_id))
+
+
+def invalidate_seat_grid(area_id: AreaID) -> None:
+    """Make all processes reload the area's seat positions.
+
+    Has to be called after seats of the area have been created, moved,
+    or deleted.
+    """
+    _seat_grids.invalidate(area_id)
+
+
 def _db_entity_to_seat(db_seat: DbSeat) -> Seat:
     return Seat(
         id=db_seat.id,
+        area_id=db_seat.area_id,
         coord_x=db_seat.coord_x,
         coord_y=db_seat.coord_y,
         rotation=db_seat.rotation,
@@ -205,3 +355,10 @@ def _db_entity_to_seat(db_seat: DbSeat) -> Seat:
         label=db_seat.label,
         type_=db_seat.type_,
     )
+
+
+# The seats' positions rarely change, so they are indexed in memory (per
+# area). Whether they are occupied is always looked up.
+_seat_grids: SnapshotCache[AreaID, SeatGrid] = SnapshotCache(
+    'seating_area_seat_grid', _load_seat_grid
+)
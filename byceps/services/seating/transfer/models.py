@@ -15,6 +15,10 @@ from ....typing import PartyID
 from ...ticketing.transfer.models import TicketCategoryID
 
 
+# Seat coordinates are stored as (signed) 32-bit integers.
+MAX_COORDINATE = 2**31 - 1
+
+
 AreaID = NewType('AreaID', UUID)
 
 
@@ -35,6 +39,7 @@ SeatID = NewType('SeatID', UUID)
 @dataclass(frozen=True)
 class Seat:
     id: SeatID
+    area_id: AreaID
     coord_x: int
     coord_y: int
     rotation: Optional[int]
@@ -8,7 +8,7 @@ byceps.services.shop.order.dbmodels.log
 
 from datetime import datetime
 
-from .....database import db, generate_uuid
+from .....database import create_default_partition, db, generate_uuid
 from .....util.instances import ReprBuilder
 
 from ..transfer.log import OrderLogEntryData
@@ -19,9 +19,10 @@ class OrderLogEntry(db.Model):
     """A log entry regarding an order."""
 
     __tablename__ = 'shop_order_log_entries'
+    __table_args__ = {'postgresql_partition_by': 'RANGE (occurred_at)'}
 
     id = db.Column(db.Uuid, default=generate_uuid, primary_key=True)
-    occurred_at = db.Column(db.DateTime, nullable=False)
+    occurred_at = db.Column(db.DateTime, primary_key=True)
     event_type = db.Column(db.UnicodeText, index=True, nullable=False)
     order_id = db.Column(db.Uuid, db.ForeignKey('shop_orders.id'), index=True, nullable=False)
     data = db.Column(db.JSONB)
@@ -44,3 +45,6 @@ class OrderLogEntry(db.Model):
             .add_with_lookup('order_id') \
             .add_with_lookup('data') \
             .build()
+
+
+create_default_partition(OrderLogEntry.__table__)
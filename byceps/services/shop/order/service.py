@@ -668,6 +668,32 @@ def get_orders(order_ids: frozenset[OrderID]) -> list[Order]:
     return [_order_to_transfer_object(db_order) for db_order in db_orders]
 
 
+# Columns required to build an order transfer object for a list. Others
+# (like the payment state update metadata) are left unloaded.
+_ORDER_LIST_COLUMNS = (
+    DbOrder.id,
+    DbOrder.created_at,
+    DbOrder.shop_id,
+    DbOrder.storefront_id,
+    DbOrder.order_number,
+    DbOrder.placed_by_id,
+    DbOrder.company,
+    DbOrder.first_name,
+    DbOrder.last_name,
+    DbOrder.country,
+    DbOrder.zip_code,
+    DbOrder.city,
+    DbOrder.street,
+    DbOrder.total_amount,
+    DbOrder.invoice_created_at,
+    DbOrder.payment_method,
+    DbOrder._payment_state,
+    DbOrder.cancelation_reason,
+    DbOrder.processing_required,
+    DbOrder.processed_at,
+)
+
+
 def get_orders_for_shop_paginated(
     shop_id: ShopID,
     page: int,
@@ -682,50 +708,46 @@ def get_orders_for_shop_paginated(
 
     If a payment state is specified, only orders in that state are
     returned.
-    """
-    items_query = select(DbOrder) \
-        .options(db.joinedload(DbOrder.line_items)) \
-        .filter_by(shop_id=shop_id) \
-        .order_by(DbOrder.created_at.desc())
 
-    count_query = select(db.func.count(DbOrder.id)) \
-        .filter_by(shop_id=shop_id) \
+    Only the columns needed for a list are loaded. Line items of all
+    orders on the page are loaded with a single, separate query instead
+    of being joined to the orders.
+    """
+    filters = [DbOrder.shop_id == shop_id]
 
     if search_term:
         ilike_pattern = f'%{search_term}%'
-        items_query = items_query \
-            .filter(DbOrder.order_number.ilike(ilike_pattern))
-        count_query = count_query \
-            .filter(DbOrder.order_number.ilike(ilike_pattern))
+        filters.append(DbOrder.order_number.ilike(ilike_pattern))
 
     if only_payment_state is not None:
-        items_query = items_query.filter_by(_payment_state=only_payment_state.name)
-        count_query = count_query.filter_by(_payment_state=only_payment_state.name)
+        filters.append(DbOrder._payment_state == only_payment_state.name)
 
         if (only_payment_state == PaymentState.open) and (only_overdue is not None):
             now = datetime.utcnow()
 
             if only_overdue:
-                items_query = items_query \
-                    .filter(DbOrder.created_at + OVERDUE_THRESHOLD < now)
-                count_query = items_query \
-                    .filter(DbOrder.created_at + OVERDUE_THRESHOLD < now)
+                filters.append(DbOrder.created_at + OVERDUE_THRESHOLD < now)
             else:
-                items_query = items_query \
-                    .filter(DbOrder.created_at + OVERDUE_THRESHOLD >= now)
-                count_query = items_query \
-                    .filter(DbOrder.created_at + OVERDUE_THRESHOLD >= now)
+                filters.append(DbOrder.created_at + OVERDUE_THRESHOLD >= now)
 
     if only_processed is not None:
-        items_query = items_query.filter(DbOrder.processing_required == True)
-        count_query = count_query.filter(DbOrder.processing_required == True)
+        filters.append(DbOrder.processing_required == True)
 
         if only_processed:
-            items_query = items_query.filter(DbOrder.processed_at != None)
-            count_query = count_query.filter(DbOrder.processed_at != None)
+            filters.append(DbOrder.processed_at != None)
         else:
-            items_query = items_query.filter(DbOrder.processed_at == None)
-            count_query = count_query.filter(DbOrder.processed_at == None)
+            filters.append(DbOrder.processed_at == None)
+
+    items_query = select(DbOrder) \
+        .options(
+            db.load_only(*_ORDER_LIST_COLUMNS),
+            db.selectinload(DbOrder.line_items),
+        ) \
+        .filter(*filters) \
+        .order_by(DbOrder.created_at.desc())
+
+    count_query = select(db.func.count(DbOrder.id)) \
+        .filter(*filters)
 
     return paginate(
         items_query,
@@ -733,7 +755,6 @@ def get_orders_for_shop_paginated(
         page,
         per_page,
         scalar_result=True,
-        unique_result=True,
         item_mapper=_order_to_transfer_object,
     )
 
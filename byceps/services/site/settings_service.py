@@ -7,10 +7,11 @@ byceps.services.site.settings_service
 """
 
 from __future__ import annotations
-from typing import Optional
+from typing import Mapping, Optional
 
 from ...database import db, upsert
 from ...typing import PartyID
+from ...util.snapshot_cache import SnapshotCache
 
 from .dbmodels.setting import Setting as DbSetting
 from .transfer.models import SiteID, SiteSetting
@@ -23,6 +24,8 @@ def create_setting(site_id: SiteID, name: str, value: str) -> SiteSetting:
     db.session.add(setting)
     db.session.commit()
 
+    _snapshots.invalidate(site_id)
+
     return _db_entity_to_site_setting(setting)
 
 
@@ -43,6 +46,8 @@ def create_or_update_setting(
 
     upsert(table, identifier, replacement)
 
+    _snapshots.invalidate(site_id)
+
     return find_setting(site_id, name)
 
 
@@ -56,6 +61,8 @@ def remove_setting(site_id: SiteID, name: str) -> None:
         .delete()
     db.session.commit()
 
+    _snapshots.invalidate(site_id)
+
 
 def find_setting(site_id: SiteID, name: str) -> Optional[SiteSetting]:
     """Return the setting for that site and with that name, or `None`
@@ -73,12 +80,15 @@ def find_setting_value(site_id: SiteID, name: str) -> Optional[str]:
     """Return the value of the setting for that site and with that
     name, or `None` if not found.
     """
-    setting = find_setting(site_id, name)
+    return get_setting_values(site_id).get(name)
 
-    if setting is None:
-        return None
 
-    return setting.value
+def get_setting_values(site_id: SiteID) -> Mapping[str, str]:
+    """Return the values of all settings for that site, indexed by name.
+
+    The values are taken from a (read-only) snapshot cached per process.
+    """
+    return _snapshots.get(site_id)
 
 
 def get_settings(site_id: SiteID) -> set[SiteSetting]:
@@ -91,6 +101,20 @@ def get_settings(site_id: SiteID) -> set[SiteSetting]:
     return {_db_entity_to_site_setting(setting) for setting in settings}
 
 
+def _load_setting_values(site_id: SiteID) -> dict[str, str]:
+    rows = db.session \
+        .query(DbSetting.name, DbSetting.value) \
+        .filter_by(site_id=site_id) \
+        .all()
+
+    return dict(rows)
+
+
+_snapshots: SnapshotCache[SiteID, Mapping[str, str]] = SnapshotCache(
+    'site_settings', _load_setting_values
+)
+
+
 def _db_entity_to_site_setting(setting: DbSetting) -> SiteSetting:
     return SiteSetting(
         setting.site_id,
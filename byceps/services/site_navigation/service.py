@@ -7,18 +7,21 @@ byceps.services.site_navigation.service
 """
 
 from __future__ import annotations
-from typing import Iterable, Optional
+from collections import defaultdict
+from typing import Iterable, Mapping, Optional
 
 from sqlalchemy import select
 
 from ...database import db
 from ...services.site.transfer.models import SiteID
+from ...util.snapshot_cache import SnapshotCache
 
 from .dbmodels import Item as DbItem, Menu as DbMenu
 from .transfer.models import (
     Item,
     ItemID,
     ItemTargetType,
+    ItemTreeNode,
     Menu,
     MenuAggregate,
     MenuID,
@@ -37,6 +40,8 @@ def create_menu(
     db.session.add(db_menu)
     db.session.commit()
 
+    _invalidate_menu_trees(db_menu)
+
     return _db_entity_to_menu(db_menu)
 
 
@@ -65,6 +70,34 @@ def create_item(
     db_menu.items.append(db_item)
     db.session.commit()
 
+    _invalidate_menu_trees(db_menu)
+
+    return _db_entity_to_item(db_item)
+
+
+def update_item(
+    item_id: ItemID,
+    target_type: ItemTargetType,
+    target: str,
+    label: str,
+    current_page_id: str,
+    hidden: bool,
+) -> Item:
+    """Update a menu item."""
+    db_item = db.session.get(DbItem, item_id)
+    if db_item is None:
+        raise ValueError('Unknown item ID')
+
+    db_item.target_type = target_type
+    db_item.target = target
+    db_item.label = label
+    db_item.current_page_id = current_page_id
+    db_item.hidden = hidden
+
+    db.session.commit()
+
+    _invalidate_menu_trees(db_item.menu)
+
     return _db_entity_to_item(db_item)
 
 
@@ -149,6 +182,88 @@ def get_items_for_menu(
     return [_db_entity_to_item(db_item) for db_item in db_items]
 
 
+def get_item_tree_for_menu(
+    site_id: SiteID, name: str, language_code: str
+) -> list[ItemTreeNode]:
+    """Return the visible items of a menu as a tree, ordered by
+    position on each level.
+
+    Items below hidden items are not included.
+
+    An empty list is returned if the menu does not exist, is hidden, or
+    contains no visible items.
+
+    The trees of all menus of the site in that language are cached per
+    process.
+    """
+    scope = _build_menu_trees_scope(site_id, language_code)
+    trees_by_menu_name = _menu_trees.get(scope)
+    return trees_by_menu_name.get(name, [])
+
+
+def _load_menu_trees(scope: str) -> dict[str, list[ItemTreeNode]]:
+    """Load the item trees of all visible menus of a site in a language,
+    indexed by menu name.
+    """
+    site_id, language_code = scope.rsplit(':', 1)
+
+    rows = db.session.execute(
+        select(DbMenu.name, DbItem)
+        .join(DbItem.menu)
+        .filter(DbMenu.site_id == site_id)
+        .filter(DbMenu.language_code == language_code)
+        .filter(DbMenu.hidden == False)
+        .filter(DbItem.hidden == False)
+        .order_by(DbItem.position)
+    ).all()
+
+    items_by_menu_name: dict[str, list[Item]] = defaultdict(list)
+    for menu_name, db_item in rows:
+        items_by_menu_name[menu_name].append(_db_entity_to_item(db_item))
+
+    return {
+        menu_name: _build_item_tree(items)
+        for menu_name, items in items_by_menu_name.items()
+    }
+
+
+def _build_item_tree(items: list[Item]) -> list[ItemTreeNode]:
+    """Arrange the (visible, ordered) items as a tree.
+
+    Items whose parent is not among the items (i.e. hidden) are left
+    out.
+    """
+    items_by_parent_id: dict[Optional[ItemID], list[Item]] = defaultdict(
+        list
+    )
+    for item in items:
+        items_by_parent_id[item.parent_item_id].append(item)
+
+    def build_nodes(parent_item_id: Optional[ItemID]) -> list[ItemTreeNode]:
+        return [
+            ItemTreeNode(item=item, children=build_nodes(item.id))
+            for item in items_by_parent_id.get(parent_item_id, [])
+        ]
+
+    return build_nodes(None)
+
+
+def _build_menu_trees_scope(site_id: SiteID, language_code: str) -> str:
+    return f'{site_id}:{language_code}'
+
+
+def _invalidate_menu_trees(db_menu: DbMenu) -> None:
+    scope = _build_menu_trees_scope(db_menu.site_id, db_menu.language_code)
+    _menu_trees.invalidate(scope)
+
+
+_menu_trees: SnapshotCache[
+    str, Mapping[str, list[ItemTreeNode]]
+] = SnapshotCache(
+    'site_navigation', _load_menu_trees
+)
+
+
 def _db_entity_to_menu(db_menu: DbMenu) -> Menu:
     return Menu(
         id=db_menu.id,
@@ -163,6 +278,7 @@ def _db_entity_to_item(db_item: DbItem) -> Item:
     return Item(
         id=db_item.id,
         menu_id=db_item.menu_id,
+        parent_item_id=db_item.parent_item_id,
         position=db_item.position,
         target_type=db_item.target_type,
         target=db_item.target,
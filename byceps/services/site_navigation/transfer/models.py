@@ -9,7 +9,7 @@ byceps.services.site_navigation.transfer.models
 from __future__ import annotations
 from dataclasses import dataclass
 from enum import Enum
-from typing import NewType
+from typing import NewType, Optional
 from uuid import UUID
 
 from ...site.transfer.models import SiteID
@@ -37,6 +37,7 @@ class Menu:
 class Item:
     id: ItemID
     menu_id: MenuID
+    parent_item_id: Optional[ItemID]
     position: int
     target_type: ItemTargetType
     target: str
@@ -45,6 +46,12 @@ class Item:
     hidden: bool
 
 
+@dataclass(frozen=True)
+class ItemTreeNode:
+    item: Item
+    children: list[ItemTreeNode]
+
+
 @dataclass(frozen=True)
 class ItemForRendering:
     target: str
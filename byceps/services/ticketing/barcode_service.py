@@ -6,10 +6,14 @@ Render Code 128 (set B) barcodes as SVG images.
 
 This implementation only supports code set B.
 
+Rendered images are memoized as ticket codes do not change.
+
 :Copyright: 2014-2022 Jochen Kupperschmidt
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from functools import lru_cache
+
 from jinja2 import Template
 
 
@@ -143,6 +147,10 @@ SVG_TEMPLATE = Template(
 )
 
 
+RENDER_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=RENDER_CACHE_SIZE)
 def render_svg(text, *, thickness=3):
     values = list(_generate_values(text))
     bar_widths = list(_generate_bars(values, thickness))
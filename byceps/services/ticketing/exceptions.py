@@ -56,6 +56,10 @@ class SeatChangeDeniedForGroupSeat(Exception):
     """
 
 
+class SeatAlreadyOccupied(Exception):
+    """Indicate that the seat is already occupied by another ticket."""
+
+
 class TicketCategoryMismatch(Exception):
     """Indicate that the provided ticket category does not match the one
     of the target item.
@@ -0,0 +1,194 @@
+"""
+byceps.services.ticketing.related_ticket_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Tickets related to a user (i.e. owned, managed, or used by them),
+prepared for display.
+
+Tickets are selected together with their category and seat in a single
+query, and the users related to them are fetched in another one.
+
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+from collections import defaultdict
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.engine import Row
+from sqlalchemy.sql import ColumnElement, Select
+
+from ...database import db
+from ...typing import PartyID, UserID
+
+from ..party import service as party_service
+from ..party.transfer.models import Party
+from ..seating.dbmodels.area import Area as DbArea
+from ..seating.dbmodels.seat import Seat as DbSeat
+from ..user import service as user_service
+from ..user.transfer.models import User
+
+from .dbmodels.category import Category as DbCategory
+from .dbmodels.ticket import Ticket as DbTicket
+from .transfer.models import (
+    RelatedTicket,
+    RelatedTicketSeat,
+    RelatedTicketSeatArea,
+    TicketCategory,
+)
+
+
+def get_tickets_related_to_user_for_party(
+    user_id: UserID, party_id: PartyID
+) -> list[RelatedTicket]:
+    """Return the tickets for that party the user owns, manages, or
+    uses, in order of creation.
+    """
+    query = _build_query() \
+        .filter(DbTicket.party_id == party_id) \
+        .filter(_is_related_to_user(user_id))
+
+    return _get_tickets(query)
+
+
+def get_tickets_related_to_user_by_party(
+    user_id: UserID,
+) -> list[tuple[Party, list[RelatedTicket]]]:
+    """Return the tickets the user owns, manages, or uses, grouped by
+    party (most recent party first), in order of creation.
+    """
+    query = _build_query().filter(_is_related_to_user(user_id))
+
+    tickets = _get_tickets(query)
+
+    tickets_by_party_id: dict[PartyID, list[RelatedTicket]] = defaultdict(
+        list
+    )
+    for ticket in tickets:
+        tickets_by_party_id[ticket.party_id].append(ticket)
+
+    parties = party_service.get_parties(set(tickets_by_party_id.keys()))
+    parties.sort(key=lambda party: party.starts_at, reverse=True)
+
+    return [(party, tickets_by_party_id[party.id]) for party in parties]
+
+
+def get_tickets_for_seat_manager(
+    user_id: UserID, party_id: PartyID
+) -> list[RelatedTicket]:
+    """Return the tickets for that party whose respective seats the user
+    is entitled to manage, in order of creation.
+
+    Revoked tickets are excluded.
+    """
+    query = _build_query() \
+        .filter(DbTicket.party_id == party_id) \
+        .filter(DbTicket.revoked == False) \
+        .filter(
+            (
+                (DbTicket.seat_managed_by_id == None) &
+                (DbTicket.owned_by_id == user_id)
+            ) |
+            (DbTicket.seat_managed_by_id == user_id)
+        )
+
+    return _get_tickets(query)
+
+
+def _is_related_to_user(user_id: UserID) -> ColumnElement:
+    return (
+        (DbTicket.owned_by_id == user_id) |
+        (DbTicket.seat_managed_by_id == user_id) |
+        (DbTicket.user_managed_by_id == user_id) |
+        (DbTicket.used_by_id == user_id)
+    )
+
+
+def _build_query() -> Select:
+    query = select(
+        DbTicket.id,
+        DbTicket.created_at,
+        DbTicket.party_id,
+        DbTicket.code,
+        DbTicket.bundle_id,
+        DbTicket.order_number,
+        DbTicket.owned_by_id,
+        DbTicket.seat_managed_by_id,
+        DbTicket.user_managed_by_id,
+        DbTicket.used_by_id,
+        DbTicket.revoked,
+        DbTicket.user_checked_in,
+        DbCategory.id.label('category_id'),
+        DbCategory.title.label('category_title'),
+        DbSeat.id.label('seat_id'),
+        DbSeat.label.label('seat_label'),
+        DbArea.slug.label('area_slug'),
+        DbArea.title.label('area_title'),
+    )
+
+    return query \
+        .join(DbCategory, DbCategory.id == DbTicket.category_id) \
+        .outerjoin(DbSeat, DbSeat.id == DbTicket.occupied_seat_id) \
+        .outerjoin(DbArea, DbArea.id == DbSeat.area_id) \
+        .order_by(DbTicket.created_at)
+
+
+def _get_tickets(query: Select) -> list[RelatedTicket]:
+    rows = db.session.execute(query).all()
+
+    user_ids = {
+        user_id
+        for row in rows
+        for user_id in (
+            row.owned_by_id,
+            row.seat_managed_by_id,
+            row.user_managed_by_id,
+            row.used_by_id,
+        )
+        if user_id is not None
+    }
+    users = user_service.get_users(user_ids, include_avatars=True)
+    users_by_id = {user.id: user for user in users}
+
+    return [_row_to_ticket(row, users_by_id) for row in rows]
+
+
+def _row_to_ticket(row: Row, users_by_id: dict[UserID, User]) -> RelatedTicket:
+    def get_user(user_id: Optional[UserID]) -> Optional[User]:
+        return users_by_id[user_id] if (user_id is not None) else None
+
+    occupied_seat: Optional[RelatedTicketSeat]
+    if row.seat_id is not None:
+        occupied_seat = RelatedTicketSeat(
+            id=row.seat_id,
+            label=row.seat_label,
+            area=RelatedTicketSeatArea(
+                slug=row.area_slug,
+                title=row.area_title,
+            ),
+        )
+    else:
+        occupied_seat = None
+
+    return RelatedTicket(
+        id=row.id,
+        created_at=row.created_at,
+        party_id=row.party_id,
+        code=row.code,
+        category=TicketCategory(
+            id=row.category_id,
+            party_id=row.party_id,
+            title=row.category_title,
+        ),
+        bundle_id=row.bundle_id,
+        order_number=row.order_number,
+        owned_by=users_by_id[row.owned_by_id],
+        seat_managed_by=get_user(row.seat_managed_by_id),
+        user_managed_by=get_user(row.user_managed_by_id),
+        used_by=get_user(row.used_by_id),
+        occupied_seat=occupied_seat,
+        revoked=row.revoked,
+        user_checked_in=row.user_checked_in,
+    )
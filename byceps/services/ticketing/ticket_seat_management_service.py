@@ -6,16 +6,29 @@ byceps.services.ticketing.ticket_seat_management_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from __future__ import annotations
+from collections import defaultdict
+from typing import Iterable, Optional
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+
 from ...database import db
+from ...events.ticketing import TicketSeatOccupied, TicketSeatReleased
 from ...typing import UserID
 
+from ..outbox import outbox_service
 # Load `Seat.assignment` backref.
 from ..seating.dbmodels.seat_group import SeatGroup as DbSeatGroup
 from ..seating import seat_service, seat_group_service
-from ..seating.transfer.models import Seat, SeatID
+from ..seating import seat_placement
+from ..seating.seat_placement import PlacementPreferences
+from ..seating.transfer.models import AreaID, Seat, SeatID
+from ..user import service as user_service
 
 from . import log_service
 from .exceptions import (
+    SeatAlreadyOccupied,
     SeatChangeDeniedForBundledTicket,
     SeatChangeDeniedForGroupSeat,
     TicketCategoryMismatch,
@@ -23,7 +36,7 @@ from .exceptions import (
 )
 from .dbmodels.ticket import Ticket as DbTicket
 from . import ticket_service
-from .transfer.models import TicketID
+from .transfer.models import TicketCategoryID, TicketID
 
 
 def appoint_seat_manager(
@@ -67,7 +80,7 @@ def withdraw_seat_manager(ticket_id: TicketID, initiator_id: UserID) -> None:
 
 def occupy_seat(
     ticket_id: TicketID, seat_id: SeatID, initiator_id: UserID
-) -> None:
+) -> TicketSeatOccupied:
     """Occupy the seat with this ticket."""
     db_ticket = _get_ticket(ticket_id)
 
@@ -98,10 +111,219 @@ def occupy_seat(
     )
     db.session.add(db_log_entry)
 
+    event = TicketSeatOccupied(
+        occurred_at=db_log_entry.occurred_at,
+        initiator_id=initiator_id,
+        initiator_screen_name=user_service.find_screen_name(initiator_id),
+        ticket_id=db_ticket.id,
+        seat_id=seat.id,
+        previous_seat_id=previous_seat_id,
+    )
+
+    outbox_service.append_events_to_transaction([event])
+
     db.session.commit()
 
+    return event
+
+
+def find_seats_for_tickets(
+    ticket_ids: set[TicketID],
+    preferences: PlacementPreferences,
+    *,
+    area_id: Optional[AreaID] = None,
+) -> Optional[dict[TicketID, SeatID]]:
+    """Find free seats for the tickets, close to each other as per the
+    preferences.
+
+    Tickets of different categories are placed separately, each on seats
+    of their category. The tickets of a category are placed within a
+    single area, trying areas with more free seats first. Seats
+    currently occupied by the tickets are considered free.
+
+    Return the seat for each ticket, or `None` if not enough suitable
+    seats are free.
+    """
+    db_tickets = ticket_service.find_tickets(ticket_ids)
+    if len(db_tickets) != len(ticket_ids):
+        raise ValueError('Unknown ticket ID(s)')
+
+    db_tickets_by_category_id: dict[
+        TicketCategoryID, list[DbTicket]
+    ] = defaultdict(list)
+    for db_ticket in db_tickets:
+        db_tickets_by_category_id[db_ticket.category_id].append(db_ticket)
+
+    seat_ids_by_ticket_id: dict[TicketID, SeatID] = {}
+
+    for category_id, category_db_tickets in db_tickets_by_category_id.items():
+        free_seats = seat_service.get_free_seats(
+            category_id, area_id=area_id, ignored_ticket_ids=ticket_ids
+        )
+
+        seats = _find_seats_in_single_area(
+            free_seats, len(category_db_tickets), preferences
+        )
+        if seats is None:
+            return None
+
+        category_db_tickets.sort(key=lambda t: t.created_at)
+        for db_ticket, seat in zip(category_db_tickets, seats):
+            seat_ids_by_ticket_id[db_ticket.id] = seat.id
+
+    return seat_ids_by_ticket_id
+
+
+def _find_seats_in_single_area(
+    free_seats: list[Seat], quantity: int, preferences: PlacementPreferences
+) -> Optional[list[Seat]]:
+    free_seats_by_area_id: dict[AreaID, list[Seat]] = defaultdict(list)
+    for seat in free_seats:
+        free_seats_by_area_id[seat.area_id].append(seat)
+
+    for area_id, area_free_seats in sorted(
+        free_seats_by_area_id.items(),
+        key=lambda item: (-len(item[1]), str(item[0])),
+    ):
+        # Coordinates are only comparable within an area. Occupied seats
+        # are part of the layout, too.
+        area_seats = seat_service.get_seats_for_area(area_id)
+
+        seats = seat_placement.find_seats(
+            area_free_seats, quantity, preferences, all_seats=area_seats
+        )
+        if seats is not None:
+            return seats
+
+    return None
+
+
+def occupy_seats(
+    seat_ids_by_ticket_id: dict[TicketID, SeatID], initiator_id: UserID
+) -> list[TicketSeatOccupied]:
+    """Occupy the seats with the respective tickets, all at once.
 
-def release_seat(ticket_id: TicketID, initiator_id: UserID) -> None:
+    Either all seats are occupied, or none is. Raise `SeatAlreadyOccupied`
+    if any seat is occupied by another ticket (including if that happens
+    concurrently).
+    """
+    ticket_ids = set(seat_ids_by_ticket_id.keys())
+    seat_ids = set(seat_ids_by_ticket_id.values())
+
+    if len(seat_ids) != len(ticket_ids):
+        raise ValueError('Each seat can only be occupied by a single ticket.')
+
+    # Lock the tickets (in a consistent order, to avoid deadlocks).
+    db_tickets = db.session.execute(
+        select(DbTicket)
+        .filter(DbTicket.id.in_(frozenset(ticket_ids)))
+        .order_by(DbTicket.id)
+        .with_for_update()
+    ).scalars().all()
+
+    if len(db_tickets) != len(ticket_ids):
+        raise ValueError('Unknown ticket ID(s)')
+
+    seats_by_id = {seat.id: seat for seat in seat_service.find_seats(seat_ids)}
+    if len(seats_by_id) != len(seat_ids):
+        raise ValueError('Unknown seat ID(s)')
+
+    for db_ticket in db_tickets:
+        if db_ticket.revoked:
+            raise TicketIsRevoked(f'Ticket {db_ticket.id} has been revoked.')
+
+        _deny_seat_management_if_ticket_belongs_to_bundle(db_ticket)
+
+        seat = seats_by_id[seat_ids_by_ticket_id[db_ticket.id]]
+        if seat.category_id != db_ticket.category_id:
+            raise TicketCategoryMismatch(
+                'Ticket and seat belong to different categories.'
+            )
+
+    group_seat_ids = seat_group_service.select_seats_in_groups(seat_ids)
+    if group_seat_ids:
+        labels = _get_seat_labels(seats_by_id, group_seat_ids)
+        raise SeatChangeDeniedForGroupSeat(
+            f'Seats {labels} belong to a group and, thus, cannot be '
+            'occupied by single tickets.'
+        )
+
+    occupied_seat_ids = db.session.execute(
+        select(DbTicket.occupied_seat_id)
+        .filter(DbTicket.occupied_seat_id.in_(frozenset(seat_ids)))
+        .filter(DbTicket.id.notin_(frozenset(ticket_ids)))
+    ).scalars().all()
+    if occupied_seat_ids:
+        labels = _get_seat_labels(seats_by_id, occupied_seat_ids)
+        raise SeatAlreadyOccupied(f'Seats {labels} are already occupied.')
+
+    previous_seat_ids_by_ticket_id = {
+        db_ticket.id: db_ticket.occupied_seat_id for db_ticket in db_tickets
+    }
+
+    # Release the previously occupied seats first so that the tickets
+    # can swap seats among each other without conflicting.
+    for db_ticket in db_tickets:
+        db_ticket.occupied_seat_id = None
+    db.session.flush()
+
+    initiator_screen_name = user_service.find_screen_name(initiator_id)
+
+    events = []
+    for db_ticket in db_tickets:
+        seat_id = seat_ids_by_ticket_id[db_ticket.id]
+        previous_seat_id = previous_seat_ids_by_ticket_id[db_ticket.id]
+
+        db_ticket.occupied_seat_id = seat_id
+
+        log_entry_data = {
+            'seat_id': str(seat_id),
+            'initiator_id': str(initiator_id),
+        }
+        if previous_seat_id is not None:
+            log_entry_data['previous_seat_id'] = str(previous_seat_id)
+
+        db_log_entry = log_service.build_entry(
+            'seat-occupied', db_ticket.id, log_entry_data
+        )
+        db.session.add(db_log_entry)
+
+        events.append(
+            TicketSeatOccupied(
+                occurred_at=db_log_entry.occurred_at,
+                initiator_id=initiator_id,
+                initiator_screen_name=initiator_screen_name,
+                ticket_id=db_ticket.id,
+                seat_id=seat_id,
+                previous_seat_id=previous_seat_id,
+            )
+        )
+
+    outbox_service.append_events_to_transaction(events)
+
+    try:
+        db.session.commit()
+    except IntegrityError:
+        # Another ticket has occupied one of the seats in the meantime.
+        db.session.rollback()
+        raise SeatAlreadyOccupied(
+            'Some of the seats have been occupied in the meantime.'
+        )
+
+    return events
+
+
+def _get_seat_labels(
+    seats_by_id: dict[SeatID, Seat], seat_ids: Iterable[SeatID]
+) -> str:
+    return ', '.join(
+        sorted(f"'{seats_by_id[seat_id].label}'" for seat_id in seat_ids)
+    )
+
+
+def release_seat(
+    ticket_id: TicketID, initiator_id: UserID
+) -> TicketSeatReleased:
     """Release the seat occupied by this ticket."""
     db_ticket = _get_ticket(ticket_id)
 
@@ -125,8 +347,20 @@ def release_seat(ticket_id: TicketID, initiator_id: UserID) -> None:
     )
     db.session.add(db_log_entry)
 
+    event = TicketSeatReleased(
+        occurred_at=db_log_entry.occurred_at,
+        initiator_id=initiator_id,
+        initiator_screen_name=user_service.find_screen_name(initiator_id),
+        ticket_id=db_ticket.id,
+        seat_id=seat.id,
+    )
+
+    outbox_service.append_events_to_transaction([event])
+
     db.session.commit()
 
+    return event
+
 
 def _get_ticket(ticket_id: TicketID) -> DbTicket:
     """Return the ticket with that ID.
@@ -10,6 +10,7 @@ from ...database import db
 from ...events.ticketing import TicketCheckedIn
 from ...typing import PartyID, UserID
 
+from ..outbox import outbox_service
 from ..user import service as user_service
 from ..user.transfer.models import User
 
@@ -50,9 +51,7 @@ def check_in_user(
     )
     db.session.add(db_log_entry)
 
-    db.session.commit()
-
-    return TicketCheckedIn(
+    event = TicketCheckedIn(
         occurred_at=db_log_entry.occurred_at,
         initiator_id=initiator.id,
         initiator_screen_name=initiator.screen_name,
@@ -63,6 +62,12 @@ def check_in_user(
         user_screen_name=user.screen_name,
     )
 
+    outbox_service.append_events_to_transaction([event])
+
+    db.session.commit()
+
+    return event
+
 
 def _get_ticket_for_checkin(party_id: PartyID, ticket_id: TicketID) -> DbTicket:
     db_ticket = ticket_service.get_ticket(ticket_id)
@@ -6,11 +6,16 @@ byceps.services.ticketing.transfer.models
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from __future__ import annotations
 from dataclasses import dataclass
+from datetime import datetime
 from typing import NewType, Optional
 from uuid import UUID
 
-from ....typing import PartyID
+from ....typing import PartyID, UserID
+
+from ...shop.order.transfer.number import OrderNumber
+from ...user.transfer.models import User
 
 
 TicketCategoryID = NewType('TicketCategoryID', UUID)
@@ -36,3 +41,63 @@ TicketBundleID = NewType('TicketBundleID', UUID)
 class TicketSaleStats:
     tickets_max: Optional[int]
     tickets_sold: int
+
+
+@dataclass(frozen=True)
+class RelatedTicketSeatArea:
+    slug: str
+    title: str
+
+
+@dataclass(frozen=True)
+class RelatedTicketSeat:
+    id: UUID
+    label: Optional[str]
+    area: RelatedTicketSeatArea
+
+
+@dataclass(frozen=True)
+class RelatedTicket:
+    """A ticket as shown to a user that owns, manages, or uses it."""
+
+    id: TicketID
+    created_at: datetime
+    party_id: PartyID
+    code: TicketCode
+    category: TicketCategory
+    bundle_id: Optional[TicketBundleID]
+    order_number: Optional[OrderNumber]
+    owned_by: User
+    seat_managed_by: Optional[User]
+    user_managed_by: Optional[User]
+    used_by: Optional[User]
+    occupied_seat: Optional[RelatedTicketSeat]
+    revoked: bool
+    user_checked_in: bool
+
+    @property
+    def owned_by_id(self) -> UserID:
+        return self.owned_by.id
+
+    @property
+    def used_by_id(self) -> Optional[UserID]:
+        return self.used_by.id if (self.used_by is not None) else None
+
+    @property
+    def belongs_to_bundle(self) -> bool:
+        return self.bundle_id is not None
+
+    def is_owned_by(self, user_id: UserID) -> bool:
+        return self.owned_by.id == user_id
+
+    def get_seat_manager(self) -> User:
+        return self.seat_managed_by or self.owned_by
+
+    def get_user_manager(self) -> User:
+        return self.user_managed_by or self.owned_by
+
+    def is_seat_managed_by(self, user_id: UserID) -> bool:
+        return self.get_seat_manager().id == user_id
+
+    def is_user_managed_by(self, user_id: UserID) -> bool:
+        return self.get_user_manager().id == user_id
@@ -0,0 +1,127 @@
+"""
+byceps.services.tourney.bracket.dbmodels
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import datetime
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    hybrid_property = property
+else:
+    from sqlalchemy.ext.hybrid import hybrid_property
+
+from ....database import db
+from ....util.instances import ReprBuilder
+
+from ..transfer.models import (
+    BracketSide,
+    BracketType,
+    MatchID,
+    ParticipantID,
+    TourneyID,
+)
+
+
+class Bracket(db.Model):
+    """An elimination bracket of a tourney."""
+
+    __tablename__ = 'tourney_brackets'
+
+    tourney_id = db.Column(db.Uuid, db.ForeignKey('tourneys.id'), primary_key=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    _type = db.Column('type', db.UnicodeText, nullable=False)
+
+    def __init__(self, tourney_id: TourneyID, type_: BracketType) -> None:
+        self.tourney_id = tourney_id
+        self.type = type_
+
+    @hybrid_property
+    def type(self) -> BracketType:
+        return BracketType[self._type]
+
+    @type.setter
+    def type(self, type_: BracketType) -> None:
+        assert type_ is not None
+        self._type = type_.name
+
+    def __repr__(self) -> str:
+        return ReprBuilder(self) \
+            .add_with_lookup('tourney_id') \
+            .add('type', self.type.name) \
+            .build()
+
+
+class BracketMatch(db.Model):
+    """A match in a bracket.
+
+    The matches of a bracket are numbered (by position), and each one
+    refers to the positions of the matches its winner and loser advance
+    to.
+    """
+
+    __tablename__ = 'tourney_bracket_matches'
+
+    tourney_id = db.Column(db.Uuid, db.ForeignKey('tourney_brackets.tourney_id'), primary_key=True)
+    position = db.Column(db.Integer, primary_key=True)
+    match_id = db.Column(db.Uuid, db.ForeignKey('tourney_matches.id'), unique=True, nullable=False)
+    _side = db.Column('side', db.UnicodeText, nullable=False)
+    round = db.Column(db.Integer, nullable=False)
+    participant1_id = db.Column(db.Uuid, db.ForeignKey('tourney_participants.id'), nullable=True)
+    participant2_id = db.Column(db.Uuid, db.ForeignKey('tourney_participants.id'), nullable=True)
+    winner_id = db.Column(db.Uuid, db.ForeignKey('tourney_participants.id'), nullable=True)
+    confirmed_at = db.Column(db.DateTime, nullable=True)
+    next_position = db.Column(db.Integer, nullable=True)
+    next_slot = db.Column(db.Integer, nullable=True)
+    loser_next_position = db.Column(db.Integer, nullable=True)
+    loser_next_slot = db.Column(db.Integer, nullable=True)
+    walkover = db.Column(db.Boolean, nullable=False)
+
+    def __init__(
+        self,
+        tourney_id: TourneyID,
+        position: int,
+        match_id: MatchID,
+        side: BracketSide,
+        round: int,
+        next_position: Optional[int],
+        next_slot: Optional[int],
+        loser_next_position: Optional[int],
+        loser_next_slot: Optional[int],
+        walkover: bool,
+        *,
+        participant1_id: Optional[ParticipantID] = None,
+        participant2_id: Optional[ParticipantID] = None,
+    ) -> None:
+        self.tourney_id = tourney_id
+        self.position = position
+        self.match_id = match_id
+        self.side = side
+        self.round = round
+        self.next_position = next_position
+        self.next_slot = next_slot
+        self.loser_next_position = loser_next_position
+        self.loser_next_slot = loser_next_slot
+        self.walkover = walkover
+        self.participant1_id = participant1_id
+        self.participant2_id = participant2_id
+
+    @hybrid_property
+    def side(self) -> BracketSide:
+        return BracketSide[self._side]
+
+    @side.setter
+    def side(self, side: BracketSide) -> None:
+        assert side is not None
+        self._side = side.name
+
+    def __repr__(self) -> str:
+        return ReprBuilder(self) \
+            .add_with_lookup('tourney_id') \
+            .add_with_lookup('position') \
+            .add('side', self.side.name) \
+            .add_with_lookup('round') \
+            .build()
@@ -0,0 +1,425 @@
+"""
+byceps.services.tourney.bracket.service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Create elimination brackets for tourneys, and let participants advance
+through them as match results are confirmed.
+
+A serialized snapshot of each bracket is cached so that clients can
+poll it cheaply.
+
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+from datetime import datetime
+import json
+import random
+from typing import Any, Callable, Optional, Sequence, Union
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+
+from ....database import db
+from ....events.tourney import (
+    TourneyMatchReady,
+    TourneyMatchScoreConfirmed,
+    TourneyParticipantEliminated,
+)
+from ....util.snapshot_cache import SnapshotCache
+
+from .. import participant_service, tourney_service
+from ..dbmodels.match import Match as DbMatch
+from ..transfer.models import (
+    BracketType,
+    MatchID,
+    Participant,
+    ParticipantID,
+    Tourney,
+    TourneyID,
+)
+
+from .dbmodels import Bracket as DbBracket, BracketMatch as DbBracketMatch
+from .tree import build_tree
+
+
+BracketEvent = Union[
+    TourneyMatchReady, TourneyMatchScoreConfirmed, TourneyParticipantEliminated
+]
+
+NodeGetter = Callable[[int], DbBracketMatch]
+
+
+class BracketExists(Exception):
+    """The tourney already has a bracket."""
+
+
+def create_bracket(
+    tourney_id: TourneyID,
+    bracket_type: BracketType,
+    *,
+    seeding: Optional[Sequence[ParticipantID]] = None,
+) -> None:
+    """Create a bracket for the tourney's participants.
+
+    Participants are seeded in the given order (top seed first), or
+    randomly if no seeding is given.
+
+    Raise `BracketExists` if the tourney already has a bracket (which
+    might have just been created concurrently).
+    """
+    tourney = tourney_service.get_tourney(tourney_id)
+
+    if db.session.get(DbBracket, tourney.id) is not None:
+        raise BracketExists(f'Tourney "{tourney.id}" already has a bracket.')
+
+    participants = participant_service.get_participants_for_tourney(tourney.id)
+    participant_ids = _seed({p.id for p in participants}, seeding)
+
+    nodes = build_tree(bracket_type, len(participant_ids))
+
+    db_bracket = DbBracket(tourney.id, bracket_type)
+    db.session.add(db_bracket)
+
+    db_matches = [DbMatch() for _ in nodes]
+    db.session.add_all(db_matches)
+
+    try:
+        db.session.flush()  # Generate match IDs.
+    except IntegrityError as exc:
+        db.session.rollback()
+        raise BracketExists(
+            f'Tourney "{tourney.id}" already has a bracket.'
+        ) from exc
+
+    db_nodes = []
+    for node, db_match in zip(nodes, db_matches):
+        participant1_id, participant2_id = [
+            participant_ids[seed] if (seed is not None) else None
+            for seed in node.seeds
+        ]
+
+        db_node = DbBracketMatch(
+            tourney.id,
+            node.position,
+            db_match.id,
+            node.side,
+            node.round,
+            node.next_position,
+            node.next_slot,
+            node.loser_next_position,
+            node.loser_next_slot,
+            node.walkover,
+            participant1_id=participant1_id,
+            participant2_id=participant2_id,
+        )
+        db_nodes.append(db_node)
+
+    db.session.add_all(db_nodes)
+
+    # Participants without an opponent advance right away.
+    for db_node in db_nodes:
+        participant_id = db_node.participant1_id or db_node.participant2_id
+        if (
+            db_node.walkover
+            and (db_node.winner_id is None)
+            and (participant_id is not None)
+        ):
+            _advance_winner(db_nodes.__getitem__, db_node, participant_id)
+
+    db.session.commit()
+
+    _snapshots.invalidate(tourney.id)
+
+
+def _seed(
+    participant_ids: set[ParticipantID],
+    seeding: Optional[Sequence[ParticipantID]],
+) -> list[ParticipantID]:
+    if seeding is None:
+        return random.sample(sorted(participant_ids), len(participant_ids))
+
+    if (len(seeding) != len(participant_ids)) or (
+        set(seeding) != participant_ids
+    ):
+        raise ValueError(
+            'The seeding has to contain each participant exactly once.'
+        )
+
+    return list(seeding)
+
+
+def confirm_match_result(
+    match_id: MatchID, winner_id: ParticipantID
+) -> list[BracketEvent]:
+    """Record the winner of the match, and let the winner (and, in a
+    double elimination bracket, the loser) advance to their next
+    matches.
+
+    All changes are made in a single transaction, with the affected
+    matches locked.
+
+    Return events for the confirmation, for matches that have become
+    ready, and for the elimination of the loser (if that is the case).
+    """
+    db_node = db.session.execute(
+        select(DbBracketMatch)
+        .filter_by(match_id=match_id)
+        .with_for_update()
+    ).scalar_one_or_none()
+
+    if db_node is None:
+        raise ValueError(f'Match "{match_id}" is not part of a bracket.')
+
+    if db_node.winner_id is not None:
+        raise ValueError(f'Match "{match_id}" has already been decided.')
+
+    participant1_id = db_node.participant1_id
+    participant2_id = db_node.participant2_id
+    if (participant1_id is None) or (participant2_id is None):
+        raise ValueError(f'Match "{match_id}" is not ready.')
+
+    if winner_id == participant1_id:
+        loser_id = participant2_id
+    elif winner_id == participant2_id:
+        loser_id = participant1_id
+    else:
+        raise ValueError(
+            f'Participant "{winner_id}" does not take part in match '
+            f'"{match_id}".'
+        )
+
+    tourney_id = db_node.tourney_id
+    confirmed_at = datetime.utcnow()
+
+    def get_node(position: int) -> DbBracketMatch:
+        return db.session.get(
+            DbBracketMatch, (tourney_id, position), with_for_update=True
+        )
+
+    db_node.confirmed_at = confirmed_at
+    reached_nodes = [_advance_winner(get_node, db_node, winner_id)]
+
+    loser_eliminated = db_node.loser_next_position is None
+    if not loser_eliminated:
+        reached_nodes.append(
+            _place_participant(
+                get_node,
+                db_node.loser_next_position,
+                db_node.loser_next_slot,
+                loser_id,
+            )
+        )
+
+    # Collect before committing expires the entities. Both participants
+    # might have reached the same match.
+    ready_matches = {
+        node.match_id: (node.participant1_id, node.participant2_id)
+        for node in reached_nodes
+        if (node is not None)
+        and (node.participant1_id is not None)
+        and (node.participant2_id is not None)
+    }
+
+    db.session.commit()
+
+    _snapshots.invalidate(tourney_id)
+
+    tourney = tourney_service.get_tourney(tourney_id)
+    participants_by_id = _get_participants_by_id(tourney_id)
+
+    events: list[BracketEvent] = [
+        _build_match_event(
+            TourneyMatchScoreConfirmed,
+            confirmed_at,
+            tourney,
+            match_id,
+            participants_by_id.get(participant1_id),
+            participants_by_id.get(participant2_id),
+        )
+    ]
+
+    events.extend(
+        _build_match_event(
+            TourneyMatchReady,
+            confirmed_at,
+            tourney,
+            ready_match_id,
+            participants_by_id.get(ready_participant1_id),
+            participants_by_id.get(ready_participant2_id),
+        )
+        for ready_match_id, (
+            ready_participant1_id,
+            ready_participant2_id,
+        ) in ready_matches.items()
+    )
+
+    if loser_eliminated:
+        loser = participants_by_id[loser_id]
+        events.append(
+            TourneyParticipantEliminated(
+                occurred_at=confirmed_at,
+                initiator_id=None,
+                initiator_screen_name=None,
+                tourney_id=str(tourney.id),
+                tourney_title=tourney.title,
+                match_id=str(match_id),
+                participant_id=str(loser.id),
+                participant_name=loser.title,
+            )
+        )
+
+    return events
+
+
+def _build_match_event(
+    event_class: type[BracketEvent],
+    occurred_at: datetime,
+    tourney: Tourney,
+    match_id: MatchID,
+    participant1: Optional[Participant],
+    participant2: Optional[Participant],
+) -> BracketEvent:
+    return event_class(
+        occurred_at=occurred_at,
+        initiator_id=None,
+        initiator_screen_name=None,
+        tourney_id=str(tourney.id),
+        tourney_title=tourney.title,
+        match_id=str(match_id),
+        participant1_id=_get_id_str(participant1),
+        participant1_name=_get_title(participant1),
+        participant2_id=_get_id_str(participant2),
+        participant2_name=_get_title(participant2),
+    )
+
+
+def _advance_winner(
+    get_node: NodeGetter, db_node: DbBracketMatch, winner_id: ParticipantID
+) -> Optional[DbBracketMatch]:
+    """Record the winner, and place them in their next match.
+
+    Return the match the winner ends up in (if any).
+    """
+    db_node.winner_id = winner_id
+
+    if db_node.next_position is None:
+        return None
+
+    return _place_participant(
+        get_node, db_node.next_position, db_node.next_slot, winner_id
+    )
+
+
+def _place_participant(
+    get_node: NodeGetter,
+    position: int,
+    slot: int,
+    participant_id: ParticipantID,
+) -> Optional[DbBracketMatch]:
+    """Put the participant into one of the match's slots.
+
+    If the match is a walkover, the participant advances further right
+    away.
+
+    Return the match the participant ends up in (if any).
+    """
+    db_node = get_node(position)
+
+    if slot == 1:
+        db_node.participant1_id = participant_id
+    else:
+        db_node.participant2_id = participant_id
+
+    if db_node.walkover:
+        return _advance_winner(get_node, db_node, participant_id)
+
+    return db_node
+
+
+def get_bracket_json(tourney_id: TourneyID) -> Optional[str]:
+    """Return the tourney's bracket serialized as JSON, or `None` if the
+    tourney has no bracket.
+    """
+    return _snapshots.get(tourney_id)
+
+
+def _load_snapshot(tourney_id: TourneyID) -> Optional[str]:
+    db_bracket = db.session.get(DbBracket, tourney_id)
+    if db_bracket is None:
+        return None
+
+    db_nodes = db.session.execute(
+        select(DbBracketMatch)
+        .filter_by(tourney_id=tourney_id)
+        .order_by(DbBracketMatch.position)
+    ).scalars().all()
+
+    participants_by_id = _get_participants_by_id(tourney_id)
+
+    def participant_to_json(
+        participant_id: Optional[ParticipantID],
+    ) -> Optional[dict[str, Any]]:
+        participant = participants_by_id.get(participant_id)
+        if participant is None:
+            return None
+
+        return {
+            'id': str(participant.id),
+            'title': participant.title,
+            'logo_url': participant.logo_url,
+        }
+
+    data = {
+        'tourney_id': str(tourney_id),
+        'type': db_bracket.type.name,
+        'matches': [
+            {
+                'position': db_node.position,
+                'match_id': str(db_node.match_id),
+                'side': db_node.side.name,
+                'round': db_node.round,
+                'participants': [
+                    participant_to_json(db_node.participant1_id),
+                    participant_to_json(db_node.participant2_id),
+                ],
+                'winner_id': _get_id_str(
+                    participants_by_id.get(db_node.winner_id)
+                ),
+                'walkover': db_node.walkover,
+                'confirmed_at': (
+                    db_node.confirmed_at.isoformat()
+                    if (db_node.confirmed_at is not None)
+                    else None
+                ),
+                'next_position': db_node.next_position,
+                'next_slot': db_node.next_slot,
+                'loser_next_position': db_node.loser_next_position,
+                'loser_next_slot': db_node.loser_next_slot,
+            }
+            for db_node in db_nodes
+        ],
+    }
+
+    return json.dumps(data, separators=(',', ':'))
+
+
+def _get_participants_by_id(
+    tourney_id: TourneyID,
+) -> dict[ParticipantID, Participant]:
+    participants = participant_service.get_participants_for_tourney(tourney_id)
+    return {participant.id: participant for participant in participants}
+
+
+def _get_id_str(participant: Optional[Participant]) -> Optional[str]:
+    return str(participant.id) if (participant is not None) else None
+
+
+def _get_title(participant: Optional[Participant]) -> Optional[str]:
+    return participant.title if (participant is not None) else None
+
+
+_snapshots: SnapshotCache[TourneyID, Optional[str]] = SnapshotCache(
+    'tourney_bracket', _load_snapshot
+)
@@ -0,0 +1,221 @@
+"""
+byceps.services.tourney.bracket.tree
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Build the match trees of elimination brackets.
+
+A tree is returned as a list of nodes (one per match), in the order the
+matches are played. Each node refers to the matches its winner and its
+loser advance to by their positions in that list, so the next match can
+be looked up directly.
+
+Participants are referred to by their seed (0 being the top seed). If
+the number of participants is not a power of two, the top seeds get
+byes. Matches that can never have two participants (as at least one of
+them would have to come from a bye) are marked as walkovers: their
+single participant advances without playing.
+
+Double elimination brackets end with a single grand final between the
+winners of the winners' and the losers' bracket.
+
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+from itertools import chain
+from typing import Optional
+
+from ..transfer.models import BracketSide, BracketType
+
+
+@dataclass(frozen=True)
+class BracketNode:
+    position: int
+    side: BracketSide
+    round: int
+    seeds: tuple[Optional[int], Optional[int]]
+    next_position: Optional[int]
+    next_slot: Optional[int]  # 1 or 2
+    loser_next_position: Optional[int]
+    loser_next_slot: Optional[int]  # 1 or 2
+    walkover: bool
+
+
+@dataclass
+class _Node:
+    side: BracketSide
+    round: int
+    seeds: list[Optional[int]] = field(default_factory=lambda: [None, None])
+    next: Optional[tuple[int, int]] = None
+    loser_next: Optional[tuple[int, int]] = None
+
+
+def build_tree(
+    bracket_type: BracketType, participant_count: int
+) -> list[BracketNode]:
+    """Build the match tree of a bracket for that many participants."""
+    if participant_count < 2:
+        raise ValueError('A bracket requires at least two participants.')
+
+    nodes: list[_Node] = []
+    winners_rounds = _add_winners_bracket(nodes, participant_count)
+
+    if bracket_type == BracketType.double_elimination:
+        _add_losers_bracket_and_grand_final(nodes, winners_rounds)
+
+    return _finalize(nodes)
+
+
+def _add_winners_bracket(
+    nodes: list[_Node], participant_count: int
+) -> list[list[int]]:
+    size = _get_bracket_size(participant_count)
+    seed_order = get_seed_order(size)
+
+    rounds = []
+    for round_number in range(1, size.bit_length()):
+        match_count = size >> round_number
+        rounds.append(
+            _add_round(nodes, BracketSide.winners, round_number, match_count)
+        )
+
+    for i, position in enumerate(rounds[0]):
+        nodes[position].seeds = [
+            seed if seed < participant_count else None
+            for seed in seed_order[i * 2 : i * 2 + 2]
+        ]
+
+    for round_positions, next_round_positions in zip(rounds, rounds[1:]):
+        _link_pairwise(nodes, round_positions, next_round_positions)
+
+    return rounds
+
+
+def _add_losers_bracket_and_grand_final(
+    nodes: list[_Node], winners_rounds: list[list[int]]
+) -> None:
+    losers_rounds: list[list[int]] = []
+
+    if len(winners_rounds) > 1:
+        # The losers of the first winners' round play each other.
+        first_round = _add_round(
+            nodes, BracketSide.losers, 1, len(winners_rounds[0]) // 2
+        )
+        for i, position in enumerate(winners_rounds[0]):
+            nodes[position].loser_next = (first_round[i // 2], i % 2)
+        losers_rounds.append(first_round)
+
+        # Then, alternately, the remaining participants play the losers
+        # of the next winners' round, and each other.
+        for winners_round in winners_rounds[1:]:
+            previous_round = losers_rounds[-1]
+            round_number = len(losers_rounds) + 1
+
+            round_positions = _add_round(
+                nodes, BracketSide.losers, round_number, len(previous_round)
+            )
+            for i, position in enumerate(previous_round):
+                nodes[position].next = (round_positions[i], 0)
+            # Cross over to make rematches less likely.
+            for i, position in enumerate(reversed(winners_round)):
+                nodes[position].loser_next = (round_positions[i], 1)
+            losers_rounds.append(round_positions)
+
+            if len(round_positions) > 1:
+                next_round_positions = _add_round(
+                    nodes,
+                    BracketSide.losers,
+                    round_number + 1,
+                    len(round_positions) // 2,
+                )
+                _link_pairwise(nodes, round_positions, next_round_positions)
+                losers_rounds.append(next_round_positions)
+
+    grand_final_position = _add_round(nodes, BracketSide.grand_final, 1, 1)[0]
+
+    winners_final_position = winners_rounds[-1][0]
+    nodes[winners_final_position].next = (grand_final_position, 0)
+
+    if losers_rounds:
+        losers_final_position = losers_rounds[-1][0]
+        nodes[losers_final_position].next = (grand_final_position, 1)
+    else:
+        # With only two participants, there is no losers' bracket.
+        nodes[winners_final_position].loser_next = (grand_final_position, 1)
+
+
+def _add_round(
+    nodes: list[_Node], side: BracketSide, round_number: int, match_count: int
+) -> list[int]:
+    first_position = len(nodes)
+    nodes.extend(_Node(side, round_number) for _ in range(match_count))
+    return list(range(first_position, len(nodes)))
+
+
+def _link_pairwise(
+    nodes: list[_Node],
+    round_positions: list[int],
+    next_round_positions: list[int],
+) -> None:
+    """Let the winners of two consecutive matches play each other in
+    the next round.
+    """
+    for i, position in enumerate(round_positions):
+        nodes[position].next = (next_round_positions[i // 2], i % 2)
+
+
+def _finalize(nodes: list[_Node]) -> list[BracketNode]:
+    # Determine which slots will ever be taken by a participant. Nodes
+    # only advance participants to nodes at later positions, so a single
+    # pass suffices.
+    occupied = [
+        [seed is not None for seed in node.seeds] for node in nodes
+    ]
+    for position, node in enumerate(nodes):
+        participant_count = sum(occupied[position])
+        if (node.next is not None) and (participant_count > 0):
+            next_position, next_slot_index = node.next
+            occupied[next_position][next_slot_index] = True
+        if (node.loser_next is not None) and (participant_count == 2):
+            loser_next_position, loser_next_slot_index = node.loser_next
+            occupied[loser_next_position][loser_next_slot_index] = True
+
+    return [
+        BracketNode(
+            position=position,
+            side=node.side,
+            round=node.round,
+            seeds=(node.seeds[0], node.seeds[1]),
+            next_position=node.next[0] if node.next else None,
+            next_slot=node.next[1] + 1 if node.next else None,
+            loser_next_position=(
+                node.loser_next[0] if node.loser_next else None
+            ),
+            loser_next_slot=(
+                node.loser_next[1] + 1 if node.loser_next else None
+            ),
+            walkover=not all(occupied[position]),
+        )
+        for position, node in enumerate(nodes)
+    ]
+
+
+def _get_bracket_size(participant_count: int) -> int:
+    """Return the smallest power of two that is at least the number of
+    participants.
+    """
+    return 1 << (participant_count - 1).bit_length()
+
+
+def get_seed_order(size: int) -> list[int]:
+    """Return the seeds in the order they are placed in the first round
+    so that top seeds meet as late as possible (e.g. 0, 3, 1, 2 for a
+    bracket of size 4).
+    """
+    order = [0]
+    while len(order) < size:
+        last_seed = len(order) * 2 - 1
+        order = list(chain.from_iterable((s, last_seed - s) for s in order))
+    return order
@@ -12,7 +12,7 @@ from typing import Optional, Sequence
 
 from ...database import db
 from ...services.text_markup import service as text_markup_service
-from ...services.user import service as user_service
+from ...services.user import loader_service as user_loader_service
 from ...services.user.transfer.models import User
 from ...typing import UserID
 
@@ -27,24 +27,13 @@ def find_comment(comment_id: MatchCommentID) -> Optional[MatchComment]:
     if comment is None:
         return None
 
-    # creator
-    creator = _get_user(comment.created_by_id)
-
-    # last editor
-    last_editor = None
-    if comment.last_edited_by_id:
-        last_editor = _get_user(comment.last_edited_by_id)
-
-    # moderator
-    moderator = None
-    if comment.hidden_by_id:
-        moderator = _get_user(comment.hidden_by_id)
+    users_by_id = _get_users_by_id([comment])
 
     return _db_entity_to_comment(
         comment,
-        creator,
-        last_editor=last_editor,
-        moderator=moderator,
+        users_by_id[comment.created_by_id],
+        last_editor=users_by_id.get(comment.last_edited_by_id),
+        moderator=users_by_id.get(comment.hidden_by_id),
     )
 
 
@@ -78,29 +67,13 @@ def get_comments(
         .order_by(DbMatchComment.created_at) \
         .all()
 
-    # creators
-    creator_ids = {comment.created_by_id for comment in db_comments}
-    creators_by_id = _get_users_by_id(creator_ids)
-
-    # last editors
-    last_editor_ids = {
-        comment.last_edited_by_id
-        for comment in db_comments
-        if comment.last_edited_by_id
-    }
-    last_editors_by_id = _get_users_by_id(last_editor_ids)
-
-    # moderators
-    moderator_ids = {
-        comment.hidden_by_id for comment in db_comments if comment.hidden_by_id
-    }
-    moderators_by_id = _get_users_by_id(moderator_ids)
+    users_by_id = _get_users_by_id(db_comments)
 
     comments = []
     for db_comment in db_comments:
-        creator = creators_by_id[db_comment.created_by_id]
-        last_editor = last_editors_by_id.get(db_comment.last_edited_by_id)
-        moderator = moderators_by_id.get(db_comment.hidden_by_id)
+        creator = users_by_id[db_comment.created_by_id]
+        last_editor = users_by_id.get(db_comment.last_edited_by_id)
+        moderator = users_by_id.get(db_comment.hidden_by_id)
 
         comment = _db_entity_to_comment(
             db_comment,
@@ -113,9 +86,21 @@ def get_comments(
     return comments
 
 
-def _get_users_by_id(user_ids: set[UserID]) -> dict[UserID, User]:
-    users = user_service.get_users(user_ids, include_avatars=True)
-    return user_service.index_users_by_id(users)
+def _get_users_by_id(
+    db_comments: Sequence[DbMatchComment],
+) -> dict[UserID, User]:
+    """Load creators, last editors, and moderators of the comments in
+    one go.
+    """
+    user_ids = set()
+    for comment in db_comments:
+        user_ids.add(comment.created_by_id)
+        if comment.last_edited_by_id:
+            user_ids.add(comment.last_edited_by_id)
+        if comment.hidden_by_id:
+            user_ids.add(comment.hidden_by_id)
+
+    return user_loader_service.get_loader().get_users(user_ids)
 
 
 def create_comment(
@@ -180,10 +165,6 @@ def _get_db_comment(comment_id: MatchCommentID) -> DbMatchComment:
     return comment
 
 
-def _get_user(user_id: UserID) -> User:
-    return user_service.get_user(user_id, include_avatar=True)
-
-
 def _db_entity_to_comment(
     comment: DbMatchComment,
     creator: User,
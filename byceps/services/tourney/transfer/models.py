@@ -9,6 +9,7 @@ byceps.services.tourney.transfer.models
 from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
+from enum import Enum
 from typing import NewType, Optional
 from uuid import UUID
 
@@ -104,3 +105,11 @@ class MatchComment:
     hidden: bool
     hidden_at: Optional[datetime]
     hidden_by: Optional[User]
+
+
+BracketType = Enum(
+    'BracketType', ['single_elimination', 'double_elimination']
+)
+
+
+BracketSide = Enum('BracketSide', ['winners', 'losers', 'grand_final'])
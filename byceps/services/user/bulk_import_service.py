@@ -0,0 +1,394 @@
+"""
+byceps.services.user.bulk_import_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Import large numbers of user accounts in batches.
+
+Lines are validated and passwords are hashed in a process pool. Users,
+their details, credentials, and log entries are then inserted with
+multi-row statements, one transaction per batch.
+
+After each committed batch, the number of the last processed line is
+written to an (optional) checkpoint file. An interrupted import can be
+resumed by running it again with the same checkpoint file.
+
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from functools import partial
+from itertools import islice
+import multiprocessing
+import os
+from pathlib import Path
+import secrets
+from typing import Iterable, Iterator, Optional
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+
+from ...database import db, generate_uuid
+
+from ..authentication.password import (
+    hashing as password_hashing,
+    service as password_service,
+)
+from ..authentication.password.dbmodels import Credential as DbCredential
+
+from .creation_service import normalize_email_address, normalize_screen_name
+from .dbmodels.detail import UserDetail as DbUserDetail
+from .dbmodels.log import UserLogEntry as DbUserLogEntry
+from .dbmodels.user import hash_email_address, User as DbUser
+from .import_service import parse_user_json, UserToImport
+
+
+DEFAULT_BATCH_SIZE = 500
+
+
+@dataclass(frozen=True)
+class ImportLineResult:
+    line_number: int
+    screen_name: Optional[str]
+    error: Optional[str]
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+@dataclass(frozen=True)
+class _ValidatedLine:
+    line_number: int
+    user_to_import: Optional[UserToImport]
+    screen_name: Optional[str]
+    email_address: Optional[str]
+    error: Optional[str]
+
+
+def import_users(
+    lines: Iterable[str],
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    checkpoint_file: Optional[Path] = None,
+    max_workers: Optional[int] = None,
+) -> Iterator[ImportLineResult]:
+    """Import users from JSON lines, in batches of `batch_size` lines.
+
+    Yield a result for each processed line.
+
+    Lines already covered by the checkpoint file are skipped.
+
+    If a batch cannot be committed, the transaction is rolled back and
+    the exception is re-raised. The checkpoint then still points to the
+    end of the last committed batch.
+    """
+    if batch_size < 1:
+        raise ValueError('The batch size must be positive.')
+
+    last_processed_line_number = _read_checkpoint(checkpoint_file)
+
+    numbered_lines = (
+        (line_number, line)
+        for line_number, line in enumerate(lines, start=1)
+        if line_number > last_processed_line_number
+    )
+
+    # Use fresh interpreters instead of forking so that the database
+    # connections held by this process are not shared with the workers.
+    mp_context = multiprocessing.get_context('spawn')
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=mp_context
+    ) as executor:
+        while True:
+            batch = list(islice(numbered_lines, batch_size))
+            if not batch:
+                break
+
+            yield from _import_batch(executor, batch)
+
+            last_line_number = batch[-1][0]
+            _write_checkpoint(checkpoint_file, last_line_number)
+
+
+def _import_batch(
+    executor: Executor, batch: list[tuple[int, str]]
+) -> list[ImportLineResult]:
+    validated_lines = list(executor.map(_validate_line, batch, chunksize=32))
+
+    validated_lines = _reject_duplicates(validated_lines)
+
+    valid_lines = [vl for vl in validated_lines if vl.error is None]
+
+    # The password is random and not known to anyone. Users are
+    # expected to set a new one via the password reset feature.
+    passwords = [secrets.token_urlsafe(24) for _ in valid_lines]
+    generate_password_hash = partial(
+        password_hashing.generate_password_hash,
+        method=password_service.get_password_hash_method(),
+    )
+    password_hashes = list(
+        executor.map(generate_password_hash, passwords, chunksize=8)
+    )
+
+    try:
+        _insert_users(valid_lines, password_hashes)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+    return [
+        ImportLineResult(
+            line_number=vl.line_number,
+            screen_name=vl.screen_name,
+            error=vl.error,
+        )
+        for vl in validated_lines
+    ]
+
+
+def _validate_line(numbered_line: tuple[int, str]) -> _ValidatedLine:
+    """Parse and validate a single line.
+
+    This is run in a worker process and must not access the database.
+    """
+    line_number, line = numbered_line
+
+    try:
+        user_to_import = parse_user_json(line)
+
+        screen_name = normalize_screen_name(user_to_import.screen_name)
+
+        email_address: Optional[str]
+        if user_to_import.email_address is not None:
+            email_address = normalize_email_address(
+                user_to_import.email_address
+            )
+        else:
+            email_address = None
+    except Exception as e:
+        return _ValidatedLine(
+            line_number=line_number,
+            user_to_import=None,
+            screen_name=None,
+            email_address=None,
+            error=str(e),
+        )
+
+    return _ValidatedLine(
+        line_number=line_number,
+        user_to_import=user_to_import,
+        screen_name=screen_name,
+        email_address=email_address,
+        error=None,
+    )
+
+
+def _reject_duplicates(
+    validated_lines: list[_ValidatedLine],
+) -> list[_ValidatedLine]:
+    """Mark lines with screen names or email addresses that are already
+    in use, either by existing users or by a previous line of the batch.
+
+    Screen names are compared case-insensitively.
+    """
+    valid_lines = [vl for vl in validated_lines if vl.error is None]
+
+    taken_screen_names = _find_taken_screen_names(
+        {vl.screen_name.lower() for vl in valid_lines}
+    )
+    taken_email_addresses = _find_taken_email_addresses(
+        {vl.email_address for vl in valid_lines if vl.email_address}
+    )
+
+    results = []
+
+    for vl in validated_lines:
+        if vl.error is not None:
+            results.append(vl)
+            continue
+
+        error = None
+
+        screen_name_lower = vl.screen_name.lower()
+        if screen_name_lower in taken_screen_names:
+            error = f"Screen name '{vl.screen_name}' is already in use."
+        elif vl.email_address in taken_email_addresses:
+            error = f"Email address '{vl.email_address}' is already in use."
+
+        if error is not None:
+            results.append(
+                _ValidatedLine(
+                    line_number=vl.line_number,
+                    user_to_import=None,
+                    screen_name=vl.screen_name,
+                    email_address=vl.email_address,
+                    error=error,
+                )
+            )
+            continue
+
+        taken_screen_names.add(screen_name_lower)
+        if vl.email_address is not None:
+            taken_email_addresses.add(vl.email_address)
+
+        results.append(vl)
+
+    return results
+
+
+def _find_taken_screen_names(screen_names_lower: set[str]) -> set[str]:
+    """Return those of the (lowercased) screen names that are in use."""
+    if not screen_names_lower:
+        return set()
+
+    lower_screen_name = db.func.lower(DbUser.screen_name)
+
+    rows = db.session.execute(
+        select(lower_screen_name)
+        .filter(lower_screen_name.in_(screen_names_lower))
+    ).scalars().all()
+
+    return set(rows)
+
+
+def _find_taken_email_addresses(email_addresses: set[str]) -> set[str]:
+    """Return those of the (normalized) email addresses that are in use."""
+    if not email_addresses:
+        return set()
+
+    lower_email_address = db.func.lower(DbUser.email_address)
+
+    rows = db.session.execute(
+        select(lower_email_address)
+        .filter(lower_email_address.in_(email_addresses))
+    ).scalars().all()
+
+    return set(rows)
+
+
+def _insert_users(
+    valid_lines: list[_ValidatedLine], password_hashes: list[str]
+) -> None:
+    """Insert users and related records with one statement per table.
+
+    Does not commit.
+    """
+    if not valid_lines:
+        return
+
+    now = datetime.utcnow()
+
+    user_rows = []
+    detail_rows = []
+    credential_rows = []
+    log_entry_rows = []
+
+    for vl, password_hash in zip(valid_lines, password_hashes):
+        user_id = generate_uuid()
+        uti = vl.user_to_import
+
+        user_rows.append(
+            {
+                'id': user_id,
+                'created_at': now,
+                'screen_name': vl.screen_name,
+                'email_address': vl.email_address,
+                'email_address_md5_hash': _hash_email_address(
+                    vl.email_address, 'md5'
+                ),
+                'email_address_sha256_hash': _hash_email_address(
+                    vl.email_address, 'sha256'
+                ),
+                'email_address_verified': False,
+                'initialized': False,
+                'suspended': False,
+                'deleted': False,
+                'locale': None,
+                'legacy_id': uti.legacy_id,
+            }
+        )
+
+        detail_rows.append(
+            {
+                'user_id': user_id,
+                'first_name': uti.first_name,
+                'last_name': uti.last_name,
+                'date_of_birth': uti.date_of_birth,
+                'country': uti.country,
+                'zip_code': uti.zip_code,
+                'city': uti.city,
+                'street': uti.street,
+                'phone_number': uti.phone_number,
+                'internal_comment': uti.internal_comment,
+                'extras': None,
+            }
+        )
+
+        credential_rows.append(
+            {
+                'user_id': user_id,
+                'password_hash': password_hash,
+                'updated_at': now,
+            }
+        )
+
+        log_entry_rows.append(
+            {
+                'id': generate_uuid(),
+                'occurred_at': now,
+                'event_type': 'user-created',
+                'user_id': user_id,
+                'data': {},
+            }
+        )
+
+    for table, rows in [
+        (DbUser.__table__, user_rows),
+        (DbUserDetail.__table__, detail_rows),
+        (DbCredential.__table__, credential_rows),
+        (DbUserLogEntry.__table__, log_entry_rows),
+    ]:
+        db.session.execute(insert(table).values(rows))
+
+
+def _hash_email_address(
+    email_address: Optional[str], hash_name: str
+) -> Optional[str]:
+    if email_address is None:
+        return None
+
+    return hash_email_address(email_address, hash_name)
+
+
+# -------------------------------------------------------------------- #
+# checkpoint
+
+
+def _read_checkpoint(checkpoint_file: Optional[Path]) -> int:
+    """Return the number of the last line processed by a previous run,
+    or zero if there was none.
+    """
+    if checkpoint_file is None or not checkpoint_file.exists():
+        return 0
+
+    value = checkpoint_file.read_text().strip()
+    if not value:
+        return 0
+
+    return int(value)
+
+
+def _write_checkpoint(checkpoint_file: Optional[Path], line_number: int) -> None:
+    """Atomically record the number of the last processed line."""
+    if checkpoint_file is None:
+        return
+
+    tmp_file = checkpoint_file.with_name(checkpoint_file.name + '.tmp')
+    tmp_file.write_text(f'{line_number}\n')
+    os.replace(tmp_file, checkpoint_file)
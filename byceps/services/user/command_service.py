@@ -202,7 +202,7 @@ def change_email_address(
 
     old_email_address = user.email_address
 
-    user.email_address = new_email_address
+    user.set_email_address(new_email_address)
     user.email_address_verified = verified
 
     log_entry_data = {
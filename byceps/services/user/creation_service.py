@@ -61,13 +61,13 @@ def create_user(
 
     normalized_screen_name: Optional[str]
     if screen_name is not None:
-        normalized_screen_name = _normalize_screen_name(screen_name)
+        normalized_screen_name = normalize_screen_name(screen_name)
     else:
         normalized_screen_name = None
 
     normalized_email_address: Optional[str]
     if email_address is not None:
-        normalized_email_address = _normalize_email_address(email_address)
+        normalized_email_address = normalize_email_address(email_address)
     else:
         normalized_email_address = None
 
@@ -135,14 +135,14 @@ def request_email_address_confirmation(
     """Send an e-mail to the user to request confirmation of the e-mail
     address.
     """
-    normalized_email_address = _normalize_email_address(email_address)
+    normalized_email_address = normalize_email_address(email_address)
 
     email_address_service.send_email_address_confirmation_email_for_site(
         user, normalized_email_address, site_id
     )
 
 
-def _normalize_screen_name(screen_name: str) -> str:
+def normalize_screen_name(screen_name: str) -> str:
     """Normalize the screen name, or raise an exception if invalid."""
     normalized = screen_name.strip()
 
@@ -152,7 +152,7 @@ def _normalize_screen_name(screen_name: str) -> str:
     return normalized
 
 
-def _normalize_email_address(email_address: str) -> str:
+def normalize_email_address(email_address: str) -> str:
     """Normalize the e-mail address, or raise an exception if invalid."""
     normalized = email_address.strip().lower()
 
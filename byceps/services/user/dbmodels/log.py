@@ -8,7 +8,7 @@ byceps.services.user.dbmodels.log
 
 from datetime import datetime
 
-from ....database import db, generate_uuid
+from ....database import create_default_partition, db, generate_uuid
 from ....typing import UserID
 from ....util.instances import ReprBuilder
 
@@ -19,9 +19,15 @@ class UserLogEntry(db.Model):
     """A log entry regarding a user."""
 
     __tablename__ = 'user_log_entries'
+    __table_args__ = (
+        db.Index(
+            'ix_user_log_entries_user_id_occurred_at', 'user_id', 'occurred_at'
+        ),
+        {'postgresql_partition_by': 'RANGE (occurred_at)'},
+    )
 
     id = db.Column(db.Uuid, default=generate_uuid, primary_key=True)
-    occurred_at = db.Column(db.DateTime, nullable=False)
+    occurred_at = db.Column(db.DateTime, primary_key=True)
     event_type = db.Column(db.UnicodeText, index=True, nullable=False)
     user_id = db.Column(db.Uuid, db.ForeignKey('users.id'), index=True, nullable=False)
     data = db.Column(db.JSONB)
@@ -44,3 +50,6 @@ class UserLogEntry(db.Model):
             .add_with_lookup('user_id') \
             .add_with_lookup('data') \
             .build()
+
+
+create_default_partition(UserLogEntry.__table__)
@@ -7,6 +7,7 @@ byceps.services.user.dbmodels.user
 """
 
 from datetime import datetime
+import hashlib
 from typing import Optional
 
 from sqlalchemy.ext.associationproxy import association_proxy
@@ -26,6 +27,8 @@ class User(db.Model):
     created_at = db.Column(db.DateTime, nullable=False)
     screen_name = db.Column(db.UnicodeText, unique=True, nullable=True)
     email_address = db.Column(db.UnicodeText, unique=True, nullable=True)
+    email_address_md5_hash = db.Column(db.UnicodeText, index=True, nullable=True)
+    email_address_sha256_hash = db.Column(db.UnicodeText, index=True, nullable=True)
     email_address_verified = db.Column(db.Boolean, default=False, nullable=False)
     initialized = db.Column(db.Boolean, default=False, nullable=False)
     suspended = db.Column(db.Boolean, default=False, nullable=False)
@@ -48,14 +51,35 @@ class User(db.Model):
     ) -> None:
         self.created_at = created_at
         self.screen_name = screen_name
-        self.email_address = email_address
+        self.set_email_address(email_address)
         self.locale = locale
         self.legacy_id = legacy_id
 
+    def set_email_address(self, email_address: Optional[str]) -> None:
+        """Set the email address and update its hashes accordingly."""
+        self.email_address = email_address
+
+        if email_address is not None:
+            self.email_address_md5_hash = hash_email_address(
+                email_address, 'md5'
+            )
+            self.email_address_sha256_hash = hash_email_address(
+                email_address, 'sha256'
+            )
+        else:
+            self.email_address_md5_hash = None
+            self.email_address_sha256_hash = None
+
     @property
     def avatar_url(self) -> Optional[str]:
+        return self.get_avatar_url()
+
+    def get_avatar_url(self, size: Optional[int] = None) -> Optional[str]:
+        """Return the avatar's URL, pointing to a scaled-down version of
+        the image if a size (in pixels) is given and one is available.
+        """
         avatar = self.avatar
-        return avatar.url if (avatar is not None) else None
+        return avatar.get_url(size) if (avatar is not None) else None
 
     def __eq__(self, other) -> bool:
         return (other is not None) and (self.id == other.id)
@@ -73,3 +97,11 @@ class User(db.Model):
             .add_with_lookup('id') \
             .add_with_lookup('screen_name') \
             .build()
+
+
+def hash_email_address(email_address: str, hash_name: str) -> str:
+    """Return the hex digest of the email address, normalized the way
+    Gravatar does it.
+    """
+    normalized = email_address.strip().lower()
+    return hashlib.new(hash_name, normalized.encode('utf-8')).hexdigest()
@@ -60,7 +60,7 @@ def delete_account(
 def _anonymize_account(user: DbUser) -> None:
     """Remove user details from the account."""
     user.screen_name = None
-    user.email_address = None
+    user.set_email_address(None)
     user.legacy_id = None
 
     # Remove details.
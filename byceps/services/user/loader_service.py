@@ -0,0 +1,152 @@
+"""
+byceps.services.user.loader_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+A request-scoped cache of users, their badges, and their orga status.
+
+Each call loads whatever has not been loaded during the request yet
+with a single query per kind of data, and keeps the results for the
+rest of the request. This avoids loading the same users repeatedly
+(e.g. for different parts of a page), but it does not combine separate
+calls into one query, so callers should request all users they need
+at once.
+
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+from typing import Iterable, Optional, Tuple
+
+from flask import g, has_request_context
+
+from ...typing import PartyID, UserID
+
+from ..user_avatar.dbmodels import Avatar as DbAvatar
+from ..user_badge import awarding_service as badge_awarding_service
+from ..user_badge.transfer.models import Badge
+
+from .dbmodels.user import User as DbUser
+from . import service as user_service
+from .transfer.models import User
+
+
+UserRow = Tuple[UserID, str, bool, bool, Optional[str], Optional[DbAvatar]]
+
+
+class UserLoader:
+    """Load users (with avatars), badges, and orga status, and
+    remember them.
+    """
+
+    def __init__(self) -> None:
+        # Unknown user IDs are mapped to `None` to avoid looking them up
+        # again.
+        self._user_rows: dict[UserID, Optional[UserRow]] = {}
+        self._badges_by_featured_only: dict[
+            bool, dict[UserID, set[Badge]]
+        ] = {}
+        self._orga_flags_by_party_id: dict[PartyID, dict[UserID, bool]] = {}
+
+    def get_users(
+        self,
+        user_ids: Iterable[UserID],
+        *,
+        avatar_size: Optional[int] = None,
+    ) -> dict[UserID, User]:
+        """Return the users with those IDs, indexed by ID.
+
+        Their respective avatars' URLs are included. If an avatar size
+        (in pixels) is given, the URLs point to appropriately
+        scaled-down versions of the avatar images, if available.
+        """
+        user_ids = set(user_ids)
+
+        self._load_users(user_ids - self._user_rows.keys())
+
+        users_by_id = {}
+        for user_id in user_ids:
+            row = self._user_rows.get(user_id)
+            if row is not None:
+                users_by_id[user_id] = user_service.user_row_to_dto(
+                    row, avatar_size=avatar_size
+                )
+
+        return users_by_id
+
+    def _load_users(self, user_ids: set[UserID]) -> None:
+        if not user_ids:
+            return
+
+        rows = user_service.get_user_query(True) \
+            .filter(DbUser.id.in_(frozenset(user_ids))) \
+            .all()
+
+        for user_id in user_ids:
+            self._user_rows[user_id] = None
+
+        for row in rows:
+            self._user_rows[row[0]] = row
+
+    def get_badges(
+        self, user_ids: Iterable[UserID], *, featured_only: bool = False
+    ) -> dict[UserID, set[Badge]]:
+        """Return the badges awarded to the users, indexed by user ID.
+
+        Users without badges are mapped to an empty set.
+        """
+        user_ids = set(user_ids)
+
+        badges_by_user_id = self._badges_by_featured_only.setdefault(
+            featured_only, {}
+        )
+
+        missing_user_ids = user_ids - badges_by_user_id.keys()
+        if missing_user_ids:
+            loaded = badge_awarding_service.get_badges_awarded_to_users(
+                missing_user_ids, featured_only=featured_only
+            )
+            for user_id in missing_user_ids:
+                badges_by_user_id[user_id] = loaded.get(user_id, set())
+
+        return {user_id: badges_by_user_id[user_id] for user_id in user_ids}
+
+    def get_orga_ids(
+        self, user_ids: Iterable[UserID], party_id: PartyID
+    ) -> set[UserID]:
+        """Return the IDs of those users that are organizers of that
+        party.
+        """
+        user_ids = set(user_ids)
+
+        orga_flags = self._orga_flags_by_party_id.setdefault(party_id, {})
+
+        missing_user_ids = user_ids - orga_flags.keys()
+        if missing_user_ids:
+            # Imported here as the orga team service uses this module.
+            from ..orga_team import service as orga_team_service
+
+            orga_ids = orga_team_service.select_orgas_for_party(
+                missing_user_ids, party_id
+            )
+            for user_id in missing_user_ids:
+                orga_flags[user_id] = user_id in orga_ids
+
+        return {user_id for user_id in user_ids if orga_flags[user_id]}
+
+
+def get_loader() -> UserLoader:
+    """Return the loader for the current request.
+
+    Outside of a request, a new loader is returned on each call so that
+    long-running processes do not serve outdated users.
+    """
+    if not has_request_context():
+        return UserLoader()
+
+    loader = g.get('user_loader')
+    if loader is None:
+        loader = UserLoader()
+        g.user_loader = loader
+
+    return loader
@@ -58,7 +58,7 @@ def find_active_user(
     - the account is currently suspended.
     - the account is marked as deleted.
     """
-    query = _get_user_query(include_avatar)
+    query = get_user_query(include_avatar)
 
     row = query \
         .filter(DbUser.initialized == True) \
@@ -70,7 +70,7 @@ def find_active_user(
     if row is None:
         return None
 
-    return _user_row_to_dto(row)
+    return user_row_to_dto(row)
 
 
 def find_user(
@@ -82,14 +82,14 @@ def find_user(
 
     Include avatar URL if requested.
     """
-    row = _get_user_query(include_avatar) \
+    row = get_user_query(include_avatar) \
         .filter(DbUser.id == user_id) \
         .one_or_none()
 
     if row is None:
         return None
 
-    return _user_row_to_dto(row)
+    return user_row_to_dto(row)
 
 
 def get_user(user_id: UserID, *, include_avatar: bool = False) -> User:
@@ -109,26 +109,32 @@ def get_users(
     user_ids: set[UserID],
     *,
     include_avatars: bool = False,
+    avatar_size: Optional[int] = None,
 ) -> set[User]:
     """Return the users with those IDs.
 
-    Their respective avatars' URLs are included, if requested.
+    Their respective avatars' URLs are included, if requested. If an
+    avatar size (in pixels) is given, the URLs point to appropriately
+    scaled-down versions of the avatar images, if available.
     """
     if not user_ids:
         return set()
 
-    query = _get_user_query(include_avatars)
+    query = get_user_query(include_avatars)
 
     rows = query \
         .filter(DbUser.id.in_(frozenset(user_ids))) \
         .all()
 
-    return {_user_row_to_dto(row) for row in rows}
+    return {user_row_to_dto(row, avatar_size=avatar_size) for row in rows}
 
 
-def _get_user_query(
+def get_user_query(
     include_avatar: bool,
 ) -> Query:
+    """Return a query for user rows, to be turned into users by
+    `user_row_to_dto`.
+    """
     query = db.session \
         .query(
             DbUser.id,
@@ -147,11 +153,16 @@ def _get_user_query(
     return query
 
 
-def _user_row_to_dto(
-    row: tuple[UserID, str, bool, bool, Optional[str], Optional[DbAvatar]]
+def user_row_to_dto(
+    row: tuple[UserID, str, bool, bool, Optional[str], Optional[DbAvatar]],
+    *,
+    avatar_size: Optional[int] = None,
 ) -> User:
+    """Assemble a user from a row returned by a query from
+    `get_user_query`.
+    """
     user_id, screen_name, suspended, deleted, locale, avatar = row
-    avatar_url = avatar.url if (avatar is not None) else None
+    avatar_url = avatar.get_url(avatar_size) if (avatar is not None) else None
 
     return User(
         id=user_id,
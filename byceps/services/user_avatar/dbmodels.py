@@ -6,9 +6,10 @@ byceps.services.user_avatar.dbmodels
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from __future__ import annotations
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 
 from flask import current_app
 if TYPE_CHECKING:
@@ -28,6 +29,11 @@ _ABSOLUTE_URL_PATH_PREFIX = '/data/global/users/avatars/'
 
 FALLBACK_AVATAR_URL_PATH = '/static/avatar_fallback.svg'
 
+# Edge lengths (in pixels) of the scaled-down versions of each avatar
+# image. Chosen to cover the commonly rendered sizes on high-density
+# displays as well.
+DERIVATIVE_SIZES = (48, 96, 192)
+
 
 class Avatar(db.Model):
     """An avatar image uploaded by a user."""
@@ -38,10 +44,12 @@ class Avatar(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     creator_id = db.Column(db.Uuid, db.ForeignKey('users.id'), nullable=False)
     _image_type = db.Column('image_type', db.UnicodeText, nullable=False)
+    derivatives_rendered = db.Column(db.Boolean, default=False, nullable=False)
 
     def __init__(self, creator_id: UserID, image_type: ImageType) -> None:
         self.creator_id = creator_id
         self.image_type = image_type
+        self.derivatives_rendered = False
 
     @hybrid_property
     def image_type(self) -> ImageType:
@@ -59,13 +67,46 @@ class Avatar(db.Model):
 
     @property
     def path(self) -> Path:
-        path = current_app.config['PATH_DATA'] / 'global' / 'users' / 'avatars'
-        return path / self.filename
+        return _get_avatars_path() / self.filename
 
     @property
     def url(self) -> str:
         return _ABSOLUTE_URL_PATH_PREFIX + str(self.filename)
 
+    def get_derivative_filename(self, size: int, image_type: ImageType) -> Path:
+        return Path(f'{self.id}_{size}.{image_type.name}')
+
+    def get_derivative_path(self, size: int, image_type: ImageType) -> Path:
+        return _get_avatars_path() / self.get_derivative_filename(
+            size, image_type
+        )
+
+    def get_url(
+        self,
+        size: Optional[int] = None,
+        *,
+        image_type: Optional[ImageType] = None,
+    ) -> str:
+        """Return the URL of the smallest version of the image that is
+        at least `size` pixels wide and high.
+
+        Fall back to the original image if no size is given, the
+        scaled-down versions have not been rendered (yet), or none of
+        them is large enough.
+        """
+        if (size is None) or not self.derivatives_rendered:
+            return self.url
+
+        derivative_size = _select_derivative_size(size)
+        if derivative_size is None:
+            return self.url
+
+        if image_type is None:
+            image_type = self.image_type
+
+        filename = self.get_derivative_filename(derivative_size, image_type)
+        return _ABSOLUTE_URL_PATH_PREFIX + str(filename)
+
     def __repr__(self) -> str:
         return ReprBuilder(self) \
             .add_with_lookup('id') \
@@ -73,6 +114,19 @@ class Avatar(db.Model):
             .build()
 
 
+def _get_avatars_path() -> Path:
+    return current_app.config['PATH_DATA'] / 'global' / 'users' / 'avatars'
+
+
+def _select_derivative_size(size: int) -> Optional[int]:
+    """Return the smallest derivative size not below the given size."""
+    for derivative_size in DERIVATIVE_SIZES:
+        if derivative_size >= size:
+            return derivative_size
+
+    return None
+
+
 class AvatarSelection(db.Model):
     """The selection of an avatar image to be used for a user."""
 
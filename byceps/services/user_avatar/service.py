@@ -15,6 +15,7 @@ from ...database import db
 from ...typing import UserID
 from ...util.image import create_thumbnail
 from ...util.image.models import Dimensions, ImageType
+from ...util.jobqueue import enqueue, QUEUE_BULK
 from ...util import upload
 
 from ..image import service as image_service
@@ -22,7 +23,11 @@ from ..image.service import ImageTypeProhibited  # Provide to view functions.
 from ..user.dbmodels.user import User as DbUser
 from ..user import service as user_service
 
-from .dbmodels import Avatar as DbAvatar, AvatarSelection as DbAvatarSelection
+from .dbmodels import (
+    Avatar as DbAvatar,
+    AvatarSelection as DbAvatarSelection,
+    DERIVATIVE_SIZES,
+)
 from .transfer.models import AvatarID, AvatarUpdate
 
 
@@ -62,9 +67,40 @@ def update_avatar_image(
     user.avatar = avatar
     db.session.commit()
 
+    enqueue(render_avatar_derivatives, avatar.id, queue_name=QUEUE_BULK)
+
     return avatar.id
 
 
+def render_avatar_derivatives(avatar_id: AvatarID) -> None:
+    """Render scaled-down versions of the avatar image, each in the
+    image's own format as well as in WebP.
+
+    The files are stored next to the original image.
+
+    Meant to be run as a job.
+    """
+    avatar = get_db_avatar(avatar_id)
+
+    image_types = {avatar.image_type, ImageType.webp}
+
+    for size in DERIVATIVE_SIZES:
+        dimensions = Dimensions(size, size)
+
+        for image_type in image_types:
+            stream = create_thumbnail(
+                avatar.path, image_type.name, dimensions, force_square=True
+            )
+
+            # Replace what a previous, possibly interrupted run has left.
+            path = avatar.get_derivative_path(size, image_type)
+            upload.delete(path)
+            upload.store(stream, path)
+
+    avatar.derivatives_rendered = True
+    db.session.commit()
+
+
 def remove_avatar_image(user_id: UserID) -> None:
     """Remove the user's avatar image.
 
@@ -80,6 +116,19 @@ def remove_avatar_image(user_id: UserID) -> None:
     db.session.commit()
 
 
+def get_avatar_url_paths(avatar_ids: set[AvatarID]) -> dict[AvatarID, str]:
+    """Return the URL paths of those avatars' images."""
+    if not avatar_ids:
+        return {}
+
+    db_avatars = db.session.execute(
+        select(DbAvatar)
+        .filter(DbAvatar.id.in_(avatar_ids))
+    ).scalars().all()
+
+    return {db_avatar.id: db_avatar.url for db_avatar in db_avatars}
+
+
 def get_db_avatar(avatar_id: AvatarID) -> DbAvatar:
     """Return the avatar with that ID, or raise exception if not found."""
     return db.session.execute(
@@ -98,16 +147,26 @@ def get_avatars_uploaded_by_user(user_id: UserID) -> list[AvatarUpdate]:
     return [AvatarUpdate(avatar.created_at, avatar.url) for avatar in avatars]
 
 
-def get_avatar_url_for_user(user_id: UserID) -> Optional[str]:
-    """Return the URL of the user's current avatar, or `None` if not set."""
-    avatar_urls_by_user_id = get_avatar_urls_for_users({user_id})
+def get_avatar_url_for_user(
+    user_id: UserID, *, size: Optional[int] = None
+) -> Optional[str]:
+    """Return the URL of the user's current avatar, or `None` if not set.
+
+    If a size (in pixels) is given, the URL of an appropriately
+    scaled-down version is returned, if available.
+    """
+    avatar_urls_by_user_id = get_avatar_urls_for_users({user_id}, size=size)
     return avatar_urls_by_user_id.get(user_id)
 
 
 def get_avatar_urls_for_users(
-    user_ids: set[UserID],
+    user_ids: set[UserID], *, size: Optional[int] = None
 ) -> dict[UserID, Optional[str]]:
-    """Return the URLs of those users' current avatars."""
+    """Return the URLs of those users' current avatars.
+
+    If a size (in pixels) is given, the URLs of appropriately
+    scaled-down versions are returned, if available.
+    """
     if not user_ids:
         return {}
 
@@ -120,7 +179,8 @@ def get_avatar_urls_for_users(
         .all()
 
     urls_by_user_id = {
-        user_id: avatar.url for user_id, avatar in user_ids_and_avatars
+        user_id: avatar.get_url(size)
+        for user_id, avatar in user_ids_and_avatars
     }
 
     # Include all user IDs in result.
@@ -128,14 +188,33 @@ def get_avatar_urls_for_users(
 
 
 def get_avatar_url_for_md5_email_address_hash(md5_hash: str) -> Optional[str]:
-    """Return the URL of the current avatar of the user with that hashed
-    email address, or `None` if not set.
+    """Return the URL of the current avatar of the user with that
+    MD5-hashed email address, or `None` if not set.
+    """
+    return _get_avatar_url_for_email_address_hash(
+        DbUser.email_address_md5_hash, md5_hash
+    )
+
+
+def get_avatar_url_for_sha256_email_address_hash(
+    sha256_hash: str,
+) -> Optional[str]:
+    """Return the URL of the current avatar of the user with that
+    SHA-256-hashed email address, or `None` if not set.
     """
+    return _get_avatar_url_for_email_address_hash(
+        DbUser.email_address_sha256_hash, sha256_hash
+    )
+
+
+def _get_avatar_url_for_email_address_hash(
+    hash_column, email_address_hash: str
+) -> Optional[str]:
     avatar = db.session \
         .query(DbAvatar) \
         .join(DbAvatarSelection) \
         .join(DbUser) \
-        .filter(db.func.md5(DbUser.email_address) == md5_hash) \
+        .filter(hash_column == email_address_hash.lower()) \
         .one_or_none()
 
     if avatar is None:
@@ -7,9 +7,12 @@ byceps.services.user_badge.awarding_service
 """
 
 from __future__ import annotations
-from collections import defaultdict
 from datetime import datetime
 from typing import Optional
+from uuid import UUID
+
+from flask import current_app
+from redis.exceptions import RedisError
 
 from ...database import db
 from ...events.user_badge import UserBadgeAwarded
@@ -59,6 +62,8 @@ def award_badge_to_user(
 
     db.session.commit()
 
+    _add_to_cached_awarded_badge_ids(user_id, badge_id)
+
     awarding_dto = _db_entity_to_badge_awarding(awarding)
 
     event = UserBadgeAwarded(
@@ -157,22 +162,23 @@ def get_badges_awarded_to_users(
     if not user_ids:
         return {}
 
-    awardings = db.session \
-        .query(DbBadgeAwarding) \
-        .filter(DbBadgeAwarding.user_id.in_(user_ids)) \
-        .all()
+    badge_ids_by_user_id = _get_awarded_badge_ids(user_ids)
 
-    badge_ids = {awarding.badge_id for awarding in awardings}
-    badges = get_badges(badge_ids, featured_only=featured_only)
+    all_badge_ids = set().union(*badge_ids_by_user_id.values())
+    badges = get_badges(all_badge_ids, featured_only=featured_only)
     badges_by_id = {badge.id: badge for badge in badges}
 
-    badges_by_user_id: dict[UserID, set[Badge]] = defaultdict(set)
-    for awarding in awardings:
-        badge = badges_by_id.get(awarding.badge_id)
-        if badge:
-            badges_by_user_id[awarding.user_id].add(badge)
+    badges_by_user_id = {}
+    for user_id, badge_ids in badge_ids_by_user_id.items():
+        user_badges = {
+            badges_by_id[badge_id]
+            for badge_id in badge_ids
+            if badge_id in badges_by_id
+        }
+        if user_badges:
+            badges_by_user_id[user_id] = user_badges
 
-    return dict(badges_by_user_id)
+    return badges_by_user_id
 
 
 def _db_entity_to_badge_awarding(entity: DbBadgeAwarding) -> BadgeAwarding:
@@ -182,3 +188,111 @@ def _db_entity_to_badge_awarding(entity: DbBadgeAwarding) -> BadgeAwarding:
         user_id=entity.user_id,
         awarded_at=entity.awarded_at,
     )
+
+
+# -------------------------------------------------------------------- #
+# awarded badge IDs cache
+
+# The IDs of the badges awarded to a user are cached as a Redis set per
+# user. A marker member distinguishes a complete set (possibly without
+# any badge IDs) from one that has only been added to by an awarding
+# after it expired.
+AWARDED_BADGE_IDS_KEY_PREFIX = 'byceps:user_badge:awarded_badge_ids'
+AWARDED_BADGE_IDS_COMPLETE_MARKER = '-'
+AWARDED_BADGE_IDS_TTL = 60 * 60  # seconds
+
+
+def _get_awarded_badge_ids(
+    user_ids: set[UserID],
+) -> dict[UserID, set[BadgeID]]:
+    """Return the IDs of the badges awarded to each user.
+
+    Cached sets are taken from Redis. The others are loaded from the
+    database with a single query, then cached.
+    """
+    user_ids = list(user_ids)
+    redis_client = current_app.redis_client
+
+    try:
+        pipeline = redis_client.pipeline(transaction=False)
+        for user_id in user_ids:
+            pipeline.smembers(_build_awarded_badge_ids_key(user_id))
+        cached_sets = pipeline.execute()
+    except RedisError as e:
+        current_app.logger.warning(
+            'Could not fetch cached awarded badge IDs: %s', e
+        )
+        return _load_awarded_badge_ids(set(user_ids))
+
+    badge_ids_by_user_id = {}
+    missing_user_ids = set()
+
+    marker = AWARDED_BADGE_IDS_COMPLETE_MARKER.encode('ascii')
+    for user_id, members in zip(user_ids, cached_sets):
+        if marker in members:
+            members.discard(marker)
+            badge_ids_by_user_id[user_id] = {
+                BadgeID(UUID(member.decode('ascii'))) for member in members
+            }
+        else:
+            missing_user_ids.add(user_id)
+
+    if missing_user_ids:
+        loaded = _load_awarded_badge_ids(missing_user_ids)
+        _cache_awarded_badge_ids(loaded)
+        badge_ids_by_user_id.update(loaded)
+
+    return badge_ids_by_user_id
+
+
+def _load_awarded_badge_ids(
+    user_ids: set[UserID],
+) -> dict[UserID, set[BadgeID]]:
+    rows = db.session \
+        .query(DbBadgeAwarding.user_id, DbBadgeAwarding.badge_id) \
+        .filter(DbBadgeAwarding.user_id.in_(user_ids)) \
+        .distinct() \
+        .all()
+
+    badge_ids_by_user_id: dict[UserID, set[BadgeID]] = {
+        user_id: set() for user_id in user_ids
+    }
+    for user_id, badge_id in rows:
+        badge_ids_by_user_id[user_id].add(badge_id)
+
+    return badge_ids_by_user_id
+
+
+def _cache_awarded_badge_ids(
+    badge_ids_by_user_id: dict[UserID, set[BadgeID]]
+) -> None:
+    try:
+        pipeline = current_app.redis_client.pipeline()
+        for user_id, badge_ids in badge_ids_by_user_id.items():
+            key = _build_awarded_badge_ids_key(user_id)
+            members = [str(badge_id) for badge_id in badge_ids]
+            pipeline.delete(key)
+            pipeline.sadd(key, AWARDED_BADGE_IDS_COMPLETE_MARKER, *members)
+            pipeline.expire(key, AWARDED_BADGE_IDS_TTL)
+        pipeline.execute()
+    except RedisError as e:
+        current_app.logger.warning(
+            'Could not cache awarded badge IDs: %s', e
+        )
+
+
+def _add_to_cached_awarded_badge_ids(
+    user_id: UserID, badge_id: BadgeID
+) -> None:
+    key = _build_awarded_badge_ids_key(user_id)
+
+    try:
+        current_app.redis_client.sadd(key, str(badge_id))
+    except RedisError as e:
+        current_app.logger.warning(
+            'Could not update cached awarded badge IDs: %s', e
+        )
+
+
+def _build_awarded_badge_ids_key(user_id: UserID) -> str:
+    return f'{AWARDED_BADGE_IDS_KEY_PREFIX}:{user_id}'
@@ -7,10 +7,11 @@ byceps.services.user_badge.badge_service
 """
 
 from __future__ import annotations
-from typing import Optional
+from typing import Mapping, Optional
 
 from ...database import db
 from ...typing import BrandID
+from ...util.snapshot_cache import SnapshotCache
 
 from .dbmodels.badge import Badge as DbBadge
 from .transfer.models import Badge, BadgeID
@@ -38,6 +39,8 @@ def create_badge(
     db.session.add(badge)
     db.session.commit()
 
+    _catalog.invalidate(_SCOPE)
+
     return _db_entity_to_badge(badge)
 
 
@@ -64,6 +67,8 @@ def update_badge(
 
     db.session.commit()
 
+    _catalog.invalidate(_SCOPE)
+
     return _db_entity_to_badge(badge)
 
 
@@ -75,6 +80,8 @@ def delete_badge(badge_id: BadgeID) -> None:
 
     db.session.commit()
 
+    _catalog.invalidate(_SCOPE)
+
 
 def find_badge(badge_id: BadgeID) -> Optional[Badge]:
     """Return the badge with that id, or `None` if not found."""
@@ -115,20 +122,24 @@ def get_badges(
     """Return the badges with those IDs.
 
     If `featured_only` is `True`, only return featured badges.
+
+    Badges are taken from the badge catalog cache.
     """
     if not badge_ids:
         return set()
 
-    query = db.session \
-        .query(DbBadge) \
-        .filter(DbBadge.id.in_(badge_ids))
+    badges_by_id = _catalog.get(_SCOPE)
 
-    if featured_only:
-        query = query.filter_by(featured=True)
+    badges = {
+        badges_by_id[badge_id]
+        for badge_id in badge_ids
+        if badge_id in badges_by_id
+    }
 
-    badges = query.all()
+    if featured_only:
+        badges = {badge for badge in badges if badge.featured}
 
-    return {_db_entity_to_badge(badge) for badge in badges}
+    return badges
 
 
 def get_all_badges() -> set[Badge]:
@@ -138,6 +149,22 @@ def get_all_badges() -> set[Badge]:
     return {_db_entity_to_badge(badge) for badge in badges}
 
 
+# There are only few badges, and they rarely change, but they are looked
+# up on many pages (e.g. for each posting creator on board pages). Thus
+# all of them are kept in memory, in a single scope.
+_SCOPE = 'all'
+
+
+def _load_catalog(scope: str) -> dict[BadgeID, Badge]:
+    badges = get_all_badges()
+    return {badge.id: badge for badge in badges}
+
+
+_catalog: SnapshotCache[str, Mapping[BadgeID, Badge]] = SnapshotCache(
+    'user_badge_catalog', _load_catalog
+)
+
+
 def _db_entity_to_badge(entity: DbBadge) -> Badge:
     image_url_path = f'/data/global/users/badges/{entity.image_filename}'
 
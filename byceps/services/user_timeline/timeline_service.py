@@ -0,0 +1,343 @@
+"""
+byceps.services.user_timeline.timeline_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+A user's history, merged from the user log and related records of
+other services (avatar uploads, consents, newsletter subscription
+updates, orders).
+
+The sources are combined in a single query (``UNION ALL``), newest
+entries first, and fetched one page at a time. Pages are addressed by
+a cursor pointing after the last entry of the previous page (keyset
+pagination), so fetching older pages does not get slower.
+
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+import binascii
+from dataclasses import dataclass
+from datetime import datetime
+import json
+from typing import Any, Optional
+from uuid import UUID
+
+from sqlalchemy import cast, literal, select, tuple_, type_coerce, union_all
+from sqlalchemy.sql import ColumnElement, Select
+
+from ...database import db
+from ...typing import UserID
+
+from ..consent.dbmodels.consent import Consent as DbConsent
+from ..consent.dbmodels.subject import Subject as DbConsentSubject
+from ..newsletter.dbmodels import (
+    List as DbNewsletterList,
+    SubscriptionUpdate as DbNewsletterSubscriptionUpdate,
+)
+from ..shop.order.dbmodels.log import OrderLogEntry as DbOrderLogEntry
+from ..shop.order.dbmodels.order import Order as DbOrder
+from ..site import service as site_service
+from ..site.transfer.models import Site, SiteID
+from ..user.dbmodels.log import UserLogEntry as DbUserLogEntry
+from ..user import service as user_service
+from ..user.transfer.models import User
+from ..user_avatar.dbmodels import Avatar as DbAvatar
+from ..user_avatar import service as avatar_service
+from ..user_avatar.transfer.models import AvatarID
+from ..user_badge import badge_service
+from ..user_badge.transfer.models import Badge, BadgeID
+
+from .transfer.models import TimelineEntry, TimelinePage
+
+
+SOURCE_AVATAR = 'avatar'
+SOURCE_CONSENT = 'consent'
+SOURCE_NEWSLETTER = 'newsletter'
+SOURCE_ORDER_LOG = 'order_log'
+SOURCE_USER_LOG = 'user_log'
+
+
+ORDER_EVENT_TYPES = frozenset(
+    [
+        'order-canceled-after-paid',
+        'order-canceled-before-paid',
+        'order-paid',
+        'order-placed',
+    ]
+)
+
+
+@dataclass(frozen=True)
+class _Cursor:
+    occurred_at: datetime
+    source: str
+    entry_id: str
+
+    def serialize(self) -> str:
+        value = json.dumps(
+            [self.occurred_at.isoformat(), self.source, self.entry_id]
+        )
+        return urlsafe_b64encode(value.encode('utf-8')).decode('ascii')
+
+    @classmethod
+    def parse(cls, value: str) -> _Cursor:
+        try:
+            occurred_at_str, source, entry_id = json.loads(
+                urlsafe_b64decode(value.encode('ascii'))
+            )
+            occurred_at = datetime.fromisoformat(occurred_at_str)
+        except (binascii.Error, TypeError, UnicodeError, ValueError):
+            raise ValueError(f'Invalid timeline cursor "{value}"')
+
+        return cls(occurred_at, str(source), str(entry_id))
+
+
+def get_page(
+    user_id: UserID,
+    *,
+    cursor: Optional[str] = None,
+    limit: int = 50,
+    exclude_event_types: frozenset[str] = frozenset(),
+) -> TimelinePage:
+    """Return a page of the user's timeline, newest entries first.
+
+    Without a cursor, the first page is returned. Raise `ValueError` if
+    the cursor is invalid.
+    """
+    parsed_cursor = _Cursor.parse(cursor) if (cursor is not None) else None
+
+    rows = _fetch_rows(user_id, parsed_cursor, limit + 1, exclude_event_types)
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    next_cursor = None
+    if has_more:
+        last_row = rows[-1]
+        next_cursor = _Cursor(
+            last_row.occurred_at, last_row.source, last_row.entry_id
+        ).serialize()
+
+    entries = _to_entries(rows)
+
+    return TimelinePage(entries=entries, next_cursor=next_cursor)
+
+
+def _fetch_rows(
+    user_id: UserID,
+    cursor: Optional[_Cursor],
+    limit: int,
+    exclude_event_types: frozenset[str],
+) -> list[Any]:
+    timeline = union_all(
+        _select_user_log_entries(user_id),
+        _select_avatar_updates(user_id),
+        _select_consents(user_id),
+        _select_newsletter_subscription_updates(user_id),
+        _select_order_log_entries(user_id),
+    ).subquery()
+
+    query = select(timeline)
+
+    if cursor is not None:
+        query = query.filter(
+            tuple_(
+                timeline.c.occurred_at, timeline.c.source, timeline.c.entry_id
+            )
+            < tuple_(cursor.occurred_at, cursor.source, cursor.entry_id)
+        )
+
+    if exclude_event_types:
+        query = query.filter(
+            timeline.c.event_type.notin_(exclude_event_types)
+        )
+
+    return db.session.execute(
+        query
+        .order_by(
+            timeline.c.occurred_at.desc(),
+            timeline.c.source.desc(),
+            timeline.c.entry_id.desc(),
+        )
+        .limit(limit)
+    ).all()
+
+
+def _select_user_log_entries(user_id: UserID) -> Select:
+    return select(
+        DbUserLogEntry.occurred_at.label('occurred_at'),
+        _text(SOURCE_USER_LOG).label('source'),
+        cast(DbUserLogEntry.id, db.UnicodeText).label('entry_id'),
+        DbUserLogEntry.event_type.label('event_type'),
+        DbUserLogEntry.data.label('data'),
+    ) \
+        .filter(DbUserLogEntry.user_id == user_id)
+
+
+def _select_avatar_updates(user_id: UserID) -> Select:
+    return select(
+        DbAvatar.created_at.label('occurred_at'),
+        _text(SOURCE_AVATAR).label('source'),
+        cast(DbAvatar.id, db.UnicodeText).label('entry_id'),
+        _text('user-avatar-updated').label('event_type'),
+        _build_json(
+            initiator_id=cast(DbAvatar.creator_id, db.UnicodeText),
+            avatar_id=cast(DbAvatar.id, db.UnicodeText),
+        ).label('data'),
+    ) \
+        .filter(DbAvatar.creator_id == user_id)
+
+
+def _select_consents(user_id: UserID) -> Select:
+    return select(
+        DbConsent.expressed_at.label('occurred_at'),
+        _text(SOURCE_CONSENT).label('source'),
+        cast(DbConsent.subject_id, db.UnicodeText).label('entry_id'),
+        _text('consent-expressed').label('event_type'),
+        _build_json(
+            initiator_id=cast(DbConsent.user_id, db.UnicodeText),
+            subject_title=DbConsentSubject.title,
+        ).label('data'),
+    ) \
+        .join(DbConsentSubject, DbConsentSubject.id == DbConsent.subject_id) \
+        .filter(DbConsent.user_id == user_id)
+
+
+def _select_newsletter_subscription_updates(user_id: UserID) -> Select:
+    update = DbNewsletterSubscriptionUpdate
+    state_column = update.__table__.c.state
+
+    return select(
+        update.expressed_at.label('occurred_at'),
+        _text(SOURCE_NEWSLETTER).label('source'),
+        update.list_id.label('entry_id'),
+        db.func.concat(_text('newsletter-'), state_column).label(
+            'event_type'
+        ),
+        _build_json(
+            initiator_id=cast(update.user_id, db.UnicodeText),
+            list_=_build_json(
+                id=DbNewsletterList.id,
+                title=DbNewsletterList.title,
+            ),
+        ).label('data'),
+    ) \
+        .join(DbNewsletterList, DbNewsletterList.id == update.list_id) \
+        .filter(update.user_id == user_id)
+
+
+def _select_order_log_entries(user_id: UserID) -> Select:
+    initiator_id = DbOrderLogEntry.data['initiator_id'].astext
+
+    return select(
+        DbOrderLogEntry.occurred_at.label('occurred_at'),
+        _text(SOURCE_ORDER_LOG).label('source'),
+        cast(DbOrderLogEntry.id, db.UnicodeText).label('entry_id'),
+        DbOrderLogEntry.event_type.label('event_type'),
+        _build_json(
+            initiator_id=initiator_id,
+            order_id=cast(DbOrder.id, db.UnicodeText),
+            order_number=DbOrder.order_number,
+        ).label('data'),
+    ) \
+        .join(DbOrder, DbOrder.id == DbOrderLogEntry.order_id) \
+        .filter(DbOrderLogEntry.event_type.in_(ORDER_EVENT_TYPES)) \
+        .filter(initiator_id == str(user_id))
+
+
+def _text(value: str) -> ColumnElement:
+    return cast(literal(value), db.UnicodeText)
+
+
+def _build_json(**values: ColumnElement) -> ColumnElement:
+    args: list[Any] = []
+    for key, value in values.items():
+        args.extend([_text(key), value])
+
+    return type_coerce(db.func.jsonb_build_object(*args), db.JSONB)
+
+
+def _to_entries(rows: list[Any]) -> list[TimelineEntry]:
+    """Resolve referenced objects in batches, and assemble entries."""
+    datas = [dict(row.data or {}) for row in rows]
+
+    users_by_id = _get_users_by_id(datas)
+    badges_by_id = _get_badges_by_id(rows, datas)
+    sites_by_id = _get_sites_by_id(rows, datas)
+    _add_avatar_url_paths(datas)
+
+    return [
+        TimelineEntry(
+            occurred_at=row.occurred_at,
+            event_type=row.event_type,
+            data=data,
+            initiator=users_by_id.get(data.get('initiator_id')),
+            badge=badges_by_id.get(_find_badge_id(row, data)),
+            site=sites_by_id.get(_find_site_id(row, data)),
+        )
+        for row, data in zip(rows, datas)
+    ]
+
+
+def _get_users_by_id(datas: list[dict[str, Any]]) -> dict[str, User]:
+    user_ids = {
+        UserID(UUID(data['initiator_id']))
+        for data in datas
+        if data.get('initiator_id')
+    }
+    users = user_service.get_users(user_ids, include_avatars=True)
+    return {str(user.id): user for user in users}
+
+
+def _get_badges_by_id(
+    rows: list[Any], datas: list[dict[str, Any]]
+) -> dict[str, Badge]:
+    badge_ids = {
+        BadgeID(UUID(badge_id))
+        for badge_id in map(_find_badge_id, rows, datas)
+        if badge_id
+    }
+    badges = badge_service.get_badges(badge_ids)
+    return {str(badge.id): badge for badge in badges}
+
+
+def _find_badge_id(row: Any, data: dict[str, Any]) -> Optional[str]:
+    if row.event_type != 'user-badge-awarded':
+        return None
+
+    return data.get('badge_id')
+
+
+def _get_sites_by_id(
+    rows: list[Any], datas: list[dict[str, Any]]
+) -> dict[str, Site]:
+    site_ids = {
+        SiteID(site_id)
+        for site_id in map(_find_site_id, rows, datas)
+        if site_id
+    }
+    sites = site_service.get_sites(site_ids)
+    return {site.id: site for site in sites}
+
+
+def _find_site_id(row: Any, data: dict[str, Any]) -> Optional[str]:
+    if row.event_type not in {'user-created', 'user-logged-in'}:
+        return None
+
+    return data.get('site_id')
+
+
+def _add_avatar_url_paths(datas: list[dict[str, Any]]) -> None:
+    avatar_ids = {
+        AvatarID(UUID(data['avatar_id']))
+        for data in datas
+        if 'avatar_id' in data
+    }
+    url_paths_by_avatar_id = avatar_service.get_avatar_url_paths(avatar_ids)
+
+    for data in datas:
+        avatar_id = data.get('avatar_id')
+        if avatar_id is not None:
+            data['url_path'] = url_paths_by_avatar_id.get(UUID(avatar_id))
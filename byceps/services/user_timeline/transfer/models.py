@@ -0,0 +1,33 @@
+"""
+byceps.services.user_timeline.transfer.models
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Optional
+
+from ...site.transfer.models import Site
+from ...user.transfer.models import User
+from ...user_badge.transfer.models import Badge
+
+
+@dataclass(frozen=True)
+class TimelineEntry:
+    occurred_at: datetime
+    event_type: str
+    data: dict[str, Any]
+    initiator: Optional[User]
+    badge: Optional[Badge]
+    site: Optional[Site]
+
+
+@dataclass(frozen=True)
+class TimelinePage:
+    entries: list[TimelineEntry]
+    # To be passed to fetch the next (i.e. older) page, if any.
+    next_cursor: Optional[str]
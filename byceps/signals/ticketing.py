@@ -13,4 +13,6 @@ ticketing_signals = Namespace()
 
 
 ticket_checked_in = ticketing_signals.signal('ticket-checked-in')
+ticket_seat_occupied = ticketing_signals.signal('ticket-seat-occupied')
+ticket_seat_released = ticketing_signals.signal('ticket-seat-released')
 tickets_sold = ticketing_signals.signal('tickets-sold')
@@ -6,10 +6,13 @@ byceps.util.image
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from __future__ import annotations
 from io import BytesIO
-from typing import BinaryIO, Union
+from typing import BinaryIO, TYPE_CHECKING, Union
 
-from PIL import Image, ImageFile
+# Pillow is imported on first use to keep application startup fast.
+if TYPE_CHECKING:
+    from PIL import ImageFile
 
 from .models import Dimensions
 
@@ -19,6 +22,8 @@ FilenameOrStream = Union[str, BinaryIO]
 
 def read_dimensions(filename_or_stream: FilenameOrStream) -> Dimensions:
     """Return the dimensions of the image."""
+    from PIL import Image
+
     image = Image.open(filename_or_stream)
     return Dimensions(*image.size)
 
@@ -31,6 +36,8 @@ def create_thumbnail(
     force_square: bool = False,
 ) -> BinaryIO:
     """Create a thumbnail from the given image and return the result stream."""
+    from PIL import Image
+
     output_stream = BytesIO()
 
     image = Image.open(filename_or_stream)
@@ -4,6 +4,15 @@ byceps.util.jobqueue
 
 An asynchronously processed job queue based on Redis_ and RQ_.
 
+Jobs are put into named queues so that slow jobs (e.g. calls to
+external webhooks) do not hold up urgent ones (e.g. order
+confirmation emails). Workers process the queues in the order of
+`QUEUE_NAMES`, i.e. by priority.
+
+Repeated triggers for the same logical work can be deduplicated (see
+`enqueue_unique`) or combined into a single job (see
+`enqueue_coalesced`).
+
 .. _Redis: https://redis.io/
 .. _RQ:    https://python-rq.org/
 
@@ -11,12 +20,49 @@ An asynchronously processed job queue based on Redis_ and RQ_.
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from __future__ import annotations
 from contextlib import contextmanager
-from datetime import datetime, timezone
-from typing import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+import pickle
+from typing import Any, Callable, Optional
 
 from flask import current_app
+from redis import StrictRedis
+from redis.exceptions import RedisError
 from rq import Connection, Queue
+from rq.job import Job
+
+
+QUEUE_CRITICAL = 'critical'
+QUEUE_EMAIL = 'email'
+QUEUE_DEFAULT = 'default'
+QUEUE_ANNOUNCE = 'announce'
+QUEUE_BULK = 'bulk'
+
+# Ordered by priority, highest first.
+QUEUE_NAMES = (
+    QUEUE_CRITICAL,
+    QUEUE_EMAIL,
+    QUEUE_DEFAULT,
+    QUEUE_ANNOUNCE,
+    QUEUE_BULK,
+)
+
+REDIS_KEY_PREFIX = 'byceps:jobqueue'
+
+# Collected items are kept at most this long after their window has
+# ended (e.g. if no worker is running).
+COALESCED_ITEMS_TTL_MARGIN = timedelta(days=1)
+
+
+@dataclass(frozen=True)
+class QueueStats:
+    length: int
+    oldest_job_age_seconds: float
+    started_count: int
+    scheduled_count: int
+    failed_count: int
 
 
 @contextmanager
@@ -25,19 +71,30 @@ def connection():
         yield
 
 
-def get_queue(app):
+def get_queue(app, name: str = QUEUE_DEFAULT) -> Queue:
+    if name not in QUEUE_NAMES:
+        raise ValueError(f'Unknown job queue "{name}"')
+
     is_async = app.config['JOBS_ASYNC']
-    return Queue(is_async=is_async)
+    return Queue(name, is_async=is_async)
 
 
-def enqueue(func: Callable, *args, **kwargs):
+def enqueue(
+    func: Callable, *args, queue_name: str = QUEUE_DEFAULT, **kwargs
+):
     """Add the function call to the queue as a job."""
     with connection():
-        queue = get_queue(current_app)
+        queue = get_queue(current_app, queue_name)
         queue.enqueue(func, *args, **kwargs)
 
 
-def enqueue_at(dt: datetime, func: Callable, *args, **kwargs):
+def enqueue_at(
+    dt: datetime,
+    func: Callable,
+    *args,
+    queue_name: str = QUEUE_DEFAULT,
+    **kwargs,
+):
     """Add the function call to the queue as a job to be executed at the
     specific time.
     """
@@ -47,5 +104,206 @@ def enqueue_at(dt: datetime, func: Callable, *args, **kwargs):
         dt = dt.replace(tzinfo=timezone.utc)
 
     with connection():
-        queue = get_queue(current_app)
+        queue = get_queue(current_app, queue_name)
         queue.enqueue_at(dt, func, *args, **kwargs)
+
+
+def enqueue_unique(
+    dedupe_key: str,
+    window: timedelta,
+    func: Callable,
+    *args,
+    queue_name: str = QUEUE_DEFAULT,
+    **kwargs,
+) -> bool:
+    """Add the function call to the queue as a job unless a job with
+    the same key has already been added within the time window.
+
+    Return `True` if the job has been added, `False` if it has been
+    dropped.
+
+    If Redis is unavailable for deduplication, the job is added.
+    """
+    key = f'{REDIS_KEY_PREFIX}:unique:{dedupe_key}'
+
+    try:
+        is_first = current_app.redis_client.set(
+            key, 1, nx=True, px=_to_milliseconds(window)
+        )
+    except RedisError as e:
+        current_app.logger.warning(
+            'Could not deduplicate job "%s": %s', dedupe_key, e
+        )
+        is_first = True
+
+    if not is_first:
+        return False
+
+    enqueue(func, *args, queue_name=queue_name, **kwargs)
+    return True
+
+
+def enqueue_coalesced(
+    dedupe_key: str,
+    window: timedelta,
+    func: Callable,
+    item: Any,
+    *args,
+    queue_name: str = QUEUE_DEFAULT,
+    **kwargs,
+) -> None:
+    """Add the function call with the item to the queue as a job, unless
+    a job for the same key has been added within the time window.
+
+    In that case, collect the item instead, and call the function once
+    with all items collected until the window ends, as a single job. A
+    new window starts with that job.
+
+    The function is called as ``func(items, *args, **kwargs)``. Only
+    items passed along with equal further arguments are combined.
+
+    Items and further arguments have to be picklable.
+
+    If Redis is unavailable for collecting, the function is called with
+    just that item.
+    """
+    items_key, window_key, pending_key = _build_coalescing_keys(dedupe_key)
+
+    redis_client = current_app.redis_client
+    try:
+        is_first = redis_client.set(
+            window_key, 1, nx=True, px=_to_milliseconds(window)
+        )
+
+        if not is_first:
+            with redis_client.pipeline() as pipe:
+                ttl = _to_milliseconds(window + COALESCED_ITEMS_TTL_MARGIN)
+                pipe.rpush(items_key, pickle.dumps((item, args, kwargs)))
+                pipe.pexpire(items_key, ttl)
+                pipe.set(pending_key, 1, nx=True, px=ttl)
+                pipe.pttl(window_key)
+                _, _, is_first_pending, remaining_ms = pipe.execute()
+    except RedisError as e:
+        current_app.logger.warning(
+            'Could not coalesce job "%s": %s', dedupe_key, e
+        )
+        is_first = True
+
+    if is_first:
+        # Nothing has been added recently, so don't wait.
+        enqueue(func, [item], *args, queue_name=queue_name, **kwargs)
+        return
+
+    if not is_first_pending:
+        # A job for the items collected in this window has already
+        # been added.
+        return
+
+    # The window might have ended already (`PTTL` then returns a
+    # negative value).
+    delay = timedelta(milliseconds=max(remaining_ms, 0))
+
+    with connection():
+        queue = get_queue(current_app, queue_name)
+        if queue.is_async:
+            queue.enqueue_in(
+                delay, _call_with_coalesced_items, dedupe_key, window, func
+            )
+        else:
+            # Scheduled jobs are not executed synchronously.
+            queue.enqueue(_call_with_coalesced_items, dedupe_key, window, func)
+
+
+def _call_with_coalesced_items(
+    dedupe_key: str, window: timedelta, func: Callable
+) -> None:
+    items_key, window_key, pending_key = _build_coalescing_keys(dedupe_key)
+
+    # Take the items collected so far at once. Items added after this
+    # are collected for another job.
+    with current_app.redis_client.pipeline() as pipe:
+        pipe.lrange(items_key, 0, -1)
+        pipe.delete(items_key)
+        pipe.delete(pending_key)
+        serialized_entries, _, _ = pipe.execute()
+
+    if not serialized_entries:
+        return
+
+    # Start a new window so that a burst that continues is collected
+    # again instead of being passed on item by item.
+    current_app.redis_client.set(window_key, 1, px=_to_milliseconds(window))
+
+    entries = [pickle.loads(serialized) for serialized in serialized_entries]
+
+    for args, kwargs, items in _group_items_by_arguments(entries):
+        func(items, *args, **kwargs)
+
+
+def _group_items_by_arguments(
+    entries: list[tuple[Any, tuple[Any, ...], dict[str, Any]]]
+) -> list[tuple[tuple[Any, ...], dict[str, Any], list[Any]]]:
+    """Group items by the further arguments they have been passed along
+    with, keeping their order.
+    """
+    groups: list[tuple[tuple[Any, ...], dict[str, Any], list[Any]]] = []
+
+    for item, args, kwargs in entries:
+        for group_args, group_kwargs, group_items in groups:
+            if (group_args == args) and (group_kwargs == kwargs):
+                group_items.append(item)
+                break
+        else:
+            groups.append((args, kwargs, [item]))
+
+    return groups
+
+
+def _build_coalescing_keys(dedupe_key: str) -> tuple[str, str, str]:
+    key_prefix = f'{REDIS_KEY_PREFIX}:coalesced:{dedupe_key}'
+    return (
+        f'{key_prefix}:items',
+        f'{key_prefix}:window',
+        f'{key_prefix}:pending',
+    )
+
+
+def _to_milliseconds(delta: timedelta) -> int:
+    return max(int(delta.total_seconds() * 1000), 1)
+
+
+def get_queue_stats(redis_client: StrictRedis) -> dict[str, QueueStats]:
+    """Return the number of jobs per state, and how long the oldest
+    waiting job has been waiting, per queue.
+    """
+    now = datetime.utcnow()
+
+    stats = {}
+    for name in QUEUE_NAMES:
+        queue = Queue(name, connection=redis_client)
+
+        oldest_job_enqueued_at = _find_oldest_job_enqueued_at(queue)
+        if oldest_job_enqueued_at is not None:
+            age = (now - oldest_job_enqueued_at).total_seconds()
+            oldest_job_age_seconds = max(age, 0.0)
+        else:
+            oldest_job_age_seconds = 0.0
+
+        stats[name] = QueueStats(
+            length=queue.count,
+            oldest_job_age_seconds=oldest_job_age_seconds,
+            started_count=queue.started_job_registry.count,
+            scheduled_count=queue.scheduled_job_registry.count,
+            failed_count=queue.failed_job_registry.count,
+        )
+
+    return stats
+
+
+def _find_oldest_job_enqueued_at(queue: Queue) -> Optional[datetime]:
+    job_ids = queue.get_job_ids(offset=0, length=1)
+    if not job_ids:
+        return None
+
+    job = Job.fetch(job_ids[0], connection=queue.connection)
+    return job.enqueued_at
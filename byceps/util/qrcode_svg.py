@@ -0,0 +1,32 @@
+"""
+byceps.util.qrcode_svg
+~~~~~~~~~~~~~~~~~~~~~~
+
+Render QR codes as SVG images.
+
+Rendered images are memoized as the encoded data (e.g. URLs of
+resources) usually does not change.
+
+The QR code library is imported on first use to keep application
+startup fast.
+
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from functools import lru_cache
+
+
+RENDER_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=RENDER_CACHE_SIZE)
+def render_svg(data: str, *, box_size: int = 10, border: int = 0) -> str:
+    """Generate QR code as SVG."""
+    import qrcode
+    from qrcode.image.svg import SvgPathImage
+
+    image = qrcode.make(
+        data, border=border, box_size=box_size, image_factory=SvgPathImage
+    )
+    return image.to_string().decode('utf-8')
@@ -0,0 +1,102 @@
+"""
+byceps.util.snapshot_cache
+~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Cache immutable snapshots of rarely changing data (like settings) per
+process.
+
+Each scope (e.g. a site) has a version number in Redis. Changing the
+underlying data must be followed by a call to `invalidate`, which
+increments the version. A process that finds that the version differs
+from the one its snapshot was loaded for loads a new snapshot.
+
+If Redis is unavailable, snapshots are loaded on every access.
+
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+from threading import Lock
+from types import MappingProxyType
+from typing import Callable, Generic, Hashable, Mapping, Optional, TypeVar
+
+from flask import current_app
+from redis.exceptions import RedisError
+
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+
+REDIS_KEY_PREFIX = 'byceps:snapshot_version'
+
+
+class SnapshotCache(Generic[K, V]):
+    """A per-process cache of values, one per scope.
+
+    The loaded values are shared, so they must not be modified. Loaded
+    mappings are copied to read-only ones; other values (e.g. a single
+    object) are cached as they are.
+    """
+
+    def __init__(self, name: str, load: Callable[[K], V]) -> None:
+        self._name = name
+        self._load = load
+        self._lock = Lock()
+        self._snapshots: dict[K, tuple[int, V]] = {}
+
+    def get(self, scope: K) -> V:
+        """Return the snapshot for that scope."""
+        version = self._fetch_version(scope)
+        if version is None:
+            return self._load_snapshot(scope)
+
+        with self._lock:
+            entry = self._snapshots.get(scope)
+            if (entry is not None) and (entry[0] == version):
+                return entry[1]
+
+        # Remember the version fetched *before* loading. Should the data
+        # be changed in the meantime, the snapshot will be reloaded on
+        # the next access.
+        snapshot = self._load_snapshot(scope)
+
+        with self._lock:
+            self._snapshots[scope] = (version, snapshot)
+
+        return snapshot
+
+    def _load_snapshot(self, scope: K) -> V:
+        value = self._load(scope)
+
+        if isinstance(value, Mapping):
+            return MappingProxyType(dict(value))  # type: ignore
+
+        return value
+
+    def invalidate(self, scope: K) -> None:
+        """Make all processes reload the snapshot for that scope."""
+        with self._lock:
+            self._snapshots.pop(scope, None)
+
+        try:
+            current_app.redis_client.incr(self._build_key(scope))
+        except RedisError as e:
+            current_app.logger.warning(
+                'Could not invalidate %s snapshot: %s', self._name, e
+            )
+
+    def _fetch_version(self, scope: K) -> Optional[int]:
+        try:
+            value = current_app.redis_client.get(self._build_key(scope))
+        except RedisError as e:
+            current_app.logger.warning(
+                'Could not fetch %s snapshot version: %s', self._name, e
+            )
+            return None
+
+        return int(value or 0)
+
+    def _build_key(self, scope: K) -> str:
+        return f'{REDIS_KEY_PREFIX}:{self._name}:{scope}'
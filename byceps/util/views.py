@@ -15,6 +15,7 @@ from flask import (
     g,
     jsonify,
     redirect,
+    request,
     Response,
     stream_with_context,
     url_for,
@@ -60,6 +61,20 @@ def create_empty_json_response(status):
     return Response('{}', status=status, mimetype='application/json')
 
 
+def create_cacheable_svg_response(svg: str, *, max_age: int) -> Response:
+    """Create a response for an SVG image that may be cached by the
+    client (but not by shared caches) for `max_age` seconds.
+
+    Include an ETag and answer conditional requests with `304 Not
+    Modified` if the client already has the current image.
+    """
+    response = Response(svg, mimetype='image/svg+xml')
+    response.add_etag()
+    response.cache_control.private = True
+    response.cache_control.max_age = max_age
+    return response.make_conditional(request)
+
+
 def jsonified(f):
     """Send the data returned by the decorated function as JSON."""
 
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+"""Pass events recorded in the outbox on to consumers (e.g.
+announcements).
+
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+
+import click
+
+from byceps.application import create_app
+from byceps.outbox.relay import CONSUMERS, run
+
+
+@click.command()
+@click.option(
+    '-c',
+    '--consumer',
+    'consumer_names',
+    type=click.Choice(sorted(CONSUMERS)),
+    multiple=True,
+    help='consumer to pass events on to (default: all enabled)',
+)
+@click.option(
+    '--interval',
+    type=click.FloatRange(min=0.1),
+    default=1.0,
+    show_default=True,
+    help='seconds to wait if no events are pending',
+)
+@click.option(
+    '--batch-size',
+    type=click.IntRange(min=1),
+    default=100,
+    show_default=True,
+    help='maximum number of events to pass on at once per consumer',
+)
+def execute(
+    consumer_names: tuple[str, ...], interval: float, batch_size: int
+) -> None:
+    app = create_app(config_overrides={'APP_MODE': 'worker'})
+
+    if not consumer_names:
+        consumer_names = tuple(
+            name
+            for name in sorted(CONSUMERS)
+            if (name != 'push') or app.config['PUSH_ENABLED']
+        )
+
+    consumers = {name: CONSUMERS[name] for name in consumer_names}
+
+    with app.app_context():
+        run(consumers, interval=interval, batch_size=batch_size)
+
+
+if __name__ == '__main__':
+    execute()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+
+"""Assign seats next to each other to the tickets managed by a user.
+
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import click
+
+from byceps.services.seating import area_service, seat_service
+from byceps.services.seating.seat_placement import PlacementPreferences
+from byceps.services.ticketing.exceptions import SeatAlreadyOccupied
+from byceps.services.ticketing import (
+    ticket_seat_management_service,
+    ticket_service,
+)
+from byceps.signals import ticketing as ticketing_signals
+
+from _util import call_with_app_context
+from _validators import validate_party, validate_user_id
+
+
+@click.command()
+@click.argument('party', callback=validate_party)
+@click.argument('seat_manager', callback=validate_user_id)
+@click.argument('initiator', callback=validate_user_id)
+@click.option('--area', 'area_slug', help='only use seats in this area')
+@click.option(
+    '--same-row', is_flag=True, help='place everybody in the same row'
+)
+@click.option('--scattered', is_flag=True, help='allow gaps between seats')
+@click.option(
+    '--dry-run', is_flag=True, help='only show the seats, do not occupy them'
+)
+def execute(
+    party, seat_manager, initiator, area_slug, same_row, scattered, dry_run
+) -> None:
+    area_id = None
+    if area_slug is not None:
+        area = area_service.find_area_for_party_by_slug(party.id, area_slug)
+        if area is None:
+            raise click.BadParameter(f'Unknown area slug "{area_slug}".')
+        area_id = area.id
+
+    # Bundled tickets occupy seat groups instead.
+    tickets = [
+        ticket
+        for ticket in ticket_service.find_tickets_for_seat_manager(
+            seat_manager.id, party.id
+        )
+        if not ticket.belongs_to_bundle
+    ]
+    if not tickets:
+        click.secho('No tickets to assign seats to.', fg='yellow')
+        return
+
+    preferences = PlacementPreferences(
+        adjacent=not scattered, same_row=same_row
+    )
+
+    ticket_ids = {ticket.id for ticket in tickets}
+    seat_ids_by_ticket_id = (
+        ticket_seat_management_service.find_seats_for_tickets(
+            ticket_ids, preferences, area_id=area_id
+        )
+    )
+    if seat_ids_by_ticket_id is None:
+        click.secho('Not enough suitable seats are available.', fg='red')
+        return
+
+    seats = seat_service.find_seats(set(seat_ids_by_ticket_id.values()))
+    seats_by_id = {seat.id: seat for seat in seats}
+    for ticket in sorted(tickets, key=lambda t: t.created_at):
+        seat = seats_by_id[seat_ids_by_ticket_id[ticket.id]]
+        click.echo(f'{ticket.code} -> {seat.label}')
+
+    if dry_run:
+        return
+
+    try:
+        events = ticket_seat_management_service.occupy_seats(
+            seat_ids_by_ticket_id, initiator.id
+        )
+    except SeatAlreadyOccupied as e:
+        click.secho(f'{e} Please try again.', fg='red')
+        return
+
+    for event in events:
+        ticketing_signals.ticket_seat_occupied.send(None, event=event)
+
+    click.secho('Done.', fg='green')
+
+
+if __name__ == '__main__':
+    call_with_app_context(execute)
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+
+"""Compare cold (uncached) and warm (cached) rendering of barcodes and
+QR codes.
+
+Unlike the other scripts, this one does not need an application
+context and thus no configuration.
+
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+from secrets import token_hex
+from time import perf_counter
+from typing import Callable
+
+import click
+
+from byceps.services.ticketing import barcode_service
+from byceps.util import qrcode_svg
+
+
+@click.command()
+@click.option('-n', '--number', type=int, default=1000, show_default=True)
+def execute(number: int) -> None:
+    ticket_codes = [token_hex(3).upper()[:5] for _ in range(number)]
+    urls = [f'https://www.acmecon.test/{token_hex(8)}' for _ in range(number)]
+
+    benchmark('barcode', barcode_service.render_svg, ticket_codes)
+    benchmark('QR code', qrcode_svg.render_svg, urls)
+
+
+def benchmark(label: str, cached_func: Callable, values: list[str]) -> None:
+    cached_func.cache_clear()
+
+    cold = _measure(cached_func, values)
+    warm = _measure(cached_func, values)
+
+    click.secho(f'{label} ({len(values):d} values):', bold=True)
+    click.secho(f'  cold: {_format_per_call(cold, values)}')
+    click.secho(f'  warm: {_format_per_call(warm, values)}')
+    click.secho(f'  speedup: {cold / warm:.0f}x', fg='green')
+
+
+def _measure(func: Callable, values: list[str]) -> float:
+    start = perf_counter()
+    for value in values:
+        func(value)
+    return perf_counter() - start
+
+
+def _format_per_call(duration: float, values: list[str]) -> str:
+    per_call_us = duration / len(values) * 1_000_000
+    return f'{duration:.3f} s total, {per_call_us:.1f} µs per call'
+
+
+if __name__ == '__main__':
+    execute()
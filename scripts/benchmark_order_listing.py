@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+
+"""Measure how long it takes to fetch a page of the admin order list
+for a shop, and check the result against a latency budget.
+
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from statistics import median
+from time import perf_counter
+
+import click
+
+from byceps.blueprints.admin.shop.order import service as order_admin_service
+from byceps.database import db
+from byceps.services.shop.order import service as order_service
+from byceps.services.shop.shop import service as shop_service
+from byceps.services.shop.shop.transfer.models import Shop, ShopID
+
+from _util import call_with_app_context
+
+
+def validate_shop(ctx, param, shop_id_value: str) -> Shop:
+    shop = shop_service.find_shop(ShopID(shop_id_value))
+
+    if not shop:
+        raise click.BadParameter(f'Unknown shop ID "{shop_id_value}".')
+
+    return shop
+
+
+@click.command()
+@click.argument('shop', callback=validate_shop)
+@click.option('--per-page', type=int, default=500, show_default=True)
+@click.option('-n', '--runs', type=int, default=10, show_default=True)
+@click.option(
+    '--budget',
+    type=float,
+    default=250.0,
+    show_default=True,
+    help='maximum acceptable median duration, in milliseconds',
+)
+def execute(shop: Shop, per_page: int, runs: int, budget: float) -> None:
+    durations = [_measure(shop, per_page) for _ in range(runs)]
+
+    median_ms = median(durations) * 1000
+    max_ms = max(durations) * 1000
+
+    click.secho(f'{runs:d} runs, {per_page:d} orders per page:', bold=True)
+    click.secho(f'  median: {median_ms:.1f} ms')
+    click.secho(f'  max: {max_ms:.1f} ms')
+
+    if median_ms > budget:
+        click.secho(f'Over budget of {budget:.1f} ms.', fg='red')
+        raise click.exceptions.Exit(1)
+
+    click.secho(f'Within budget of {budget:.1f} ms.', fg='green')
+
+
+def _measure(shop: Shop, per_page: int) -> float:
+    # Start without any entities cached in the session.
+    db.session.expunge_all()
+
+    start = perf_counter()
+
+    orders = order_service.get_orders_for_shop_paginated(
+        shop.id, 1, per_page
+    )
+    list(order_admin_service.extend_order_tuples_with_orderer(orders.items))
+
+    return perf_counter() - start
+
+
+if __name__ == '__main__':
+    call_with_app_context(execute)
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+
+"""Import a seat layout (CSV or JSON Lines) into a seating area.
+
+Seats are added, changed, and removed so that the area matches the
+layout. Use `--dry-run` to only show the differences.
+
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from pathlib import Path
+
+import click
+
+from byceps.services.seating import area_service, seat_import_service
+from byceps.services.seating.seat_import import (
+    describe_seat,
+    read_seats_from_csv,
+    read_seats_from_json_lines,
+    SeatImportError,
+)
+
+from _util import call_with_app_context
+from _validators import validate_party
+
+
+READERS_BY_FORMAT = {
+    'csv': read_seats_from_csv,
+    'jsonl': read_seats_from_json_lines,
+}
+
+
+@click.command()
+@click.argument('party', callback=validate_party)
+@click.argument('area_slug')
+@click.argument(
+    'layout_file', type=click.Path(exists=True, dir_okay=False, path_type=Path)
+)
+@click.option(
+    '--format',
+    'format_',
+    type=click.Choice(list(READERS_BY_FORMAT)),
+    help='layout file format (default: derived from file name extension)',
+)
+@click.option('--dry-run', is_flag=True, help='only show the differences')
+def execute(party, area_slug, layout_file, format_, dry_run) -> None:
+    area = area_service.find_area_for_party_by_slug(party.id, area_slug)
+    if area is None:
+        raise click.BadParameter(f'Unknown area slug "{area_slug}".')
+
+    if format_ is None:
+        format_ = layout_file.suffix.lstrip('.').lower()
+        if format_ not in READERS_BY_FORMAT:
+            raise click.BadParameter(
+                f'Cannot derive format from file name "{layout_file.name}".'
+            )
+    read_seats = READERS_BY_FORMAT[format_]
+
+    category_ids_by_title = seat_import_service.get_category_ids_by_title(
+        area.id
+    )
+
+    with layout_file.open(newline='', encoding='utf-8') as f:
+        seats = read_seats(f, category_titles=category_ids_by_title.keys())
+
+        try:
+            layout_diff = seat_import_service.import_seats(
+                area.id, seats, dry_run=dry_run
+            )
+        except SeatImportError as e:
+            raise click.ClickException(str(e))
+
+    for seat in layout_diff.added:
+        click.secho(f'+ {describe_seat(seat)}', fg='green')
+    for _, seat in layout_diff.changed:
+        click.secho(f'~ {describe_seat(seat)}', fg='yellow')
+    for seat in layout_diff.removed:
+        click.secho(f'- {describe_seat(seat)}', fg='red')
+
+    click.echo(
+        f'{len(layout_diff.added):d} added, '
+        f'{len(layout_diff.changed):d} changed, '
+        f'{len(layout_diff.removed):d} removed, '
+        f'{layout_diff.unchanged_count:d} unchanged'
+    )
+
+    if dry_run:
+        click.secho('Dry run, nothing has been changed.', fg='yellow')
+    else:
+        click.secho('Done.', fg='green')
+
+
+if __name__ == '__main__':
+    call_with_app_context(execute)
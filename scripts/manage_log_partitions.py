@@ -0,0 +1,178 @@
+#!/usr/bin/env python
+
+"""Manage the monthly partitions of the log tables.
+
+Create partitions for upcoming months in advance (e.g. via cron), and
+archive old ones to compressed JSON Lines files.
+
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+from datetime import date, datetime
+from pathlib import Path
+from typing import Optional
+
+import click
+
+from byceps.services.log_partitioning import partitioning_service
+from byceps.services.log_partitioning.partitioning_service import (
+    PARTITIONED_TABLE_NAMES,
+)
+
+from _util import call_with_app_context
+
+
+TABLE_NAME_CHOICE = click.Choice(sorted(PARTITIONED_TABLE_NAMES))
+
+
+@click.group()
+def cli() -> None:
+    pass
+
+
+@cli.command('list')
+@click.option('--table', 'table_name', type=TABLE_NAME_CHOICE)
+def list_partitions(table_name: Optional[str]) -> None:
+    """List attached and detached partitions."""
+    for table_name in _get_table_names(table_name):
+        click.secho(table_name, bold=True)
+
+        for partition in partitioning_service.get_partitions(table_name):
+            if partition.is_default:
+                range_str = 'default'
+            else:
+                range_str = (
+                    f'{partition.start:%Y-%m-%d} – {partition.end:%Y-%m-%d}'
+                )
+            click.echo(
+                f'  {partition.name:<40} {range_str:<25} '
+                f'~{partition.estimated_row_count:d} entries'
+            )
+
+        for name in partitioning_service.get_detached_partition_names(
+            table_name
+        ):
+            click.echo(f'  {name:<40} detached')
+
+
+@cli.command('create')
+@click.option('--table', 'table_name', type=TABLE_NAME_CHOICE)
+@click.option(
+    '--months-ahead',
+    'month_count',
+    type=click.IntRange(min=0),
+    default=3,
+    show_default=True,
+    help='number of months after the current one to create partitions for',
+)
+@click.option(
+    '--since',
+    type=click.DateTime(formats=['%Y-%m']),
+    help='also create partitions for past months since this one (YYYY-MM)',
+)
+def create_partitions(
+    table_name: Optional[str], month_count: int, since: Optional[datetime]
+) -> None:
+    """Create partitions for the current and upcoming months.
+
+    Entries already stored in a table's default partition are moved to
+    the new partitions.
+    """
+    for table_name in _get_table_names(table_name):
+        created_partition_names = (
+            partitioning_service.create_upcoming_partitions(
+                table_name, month_count, since=since
+            )
+        )
+
+        for name in created_partition_names:
+            click.echo(f'Created partition {name}.')
+
+    click.secho('Done.', fg='green')
+
+
+@cli.command('detach')
+@click.argument('table_name', type=TABLE_NAME_CHOICE)
+@click.argument('partition_name')
+def detach_partition(table_name: str, partition_name: str) -> None:
+    """Detach a partition from its table."""
+    try:
+        partitioning_service.detach_partition(table_name, partition_name)
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+
+    click.secho(f'Detached partition {partition_name}.', fg='green')
+
+
+@cli.command('archive')
+@click.option('--table', 'table_name', type=TABLE_NAME_CHOICE)
+@click.option(
+    '--before',
+    type=click.DateTime(formats=['%Y-%m']),
+    required=True,
+    help='archive partitions for months before this one (YYYY-MM)',
+)
+@click.option(
+    '--directory',
+    type=click.Path(
+        exists=True, file_okay=False, writable=True, path_type=Path
+    ),
+    required=True,
+    help='directory to write the archive files to',
+)
+def archive_partitions(
+    table_name: Optional[str], before: datetime, directory: Path
+) -> None:
+    """Archive old partitions to files, and drop them."""
+    today = date.today()
+    if before.date() > date(today.year, today.month, 1):
+        raise click.BadParameter(
+            'The current month cannot be archived.', param_hint='--before'
+        )
+
+    for table_name in _get_table_names(table_name):
+        for partition_name in _get_partition_names_before(table_name, before):
+            archive_file, entry_count = partitioning_service.archive_partition(
+                table_name, partition_name, directory
+            )
+            click.echo(
+                f'Archived {entry_count:d} entries of partition '
+                f'{partition_name} to {archive_file}.'
+            )
+
+    click.secho('Done.', fg='green')
+
+
+def _get_table_names(table_name: Optional[str]) -> list[str]:
+    if table_name is not None:
+        return [table_name]
+
+    return sorted(PARTITIONED_TABLE_NAMES)
+
+
+def _get_partition_names_before(table_name: str, before: datetime) -> list[str]:
+    attached_partition_names = [
+        partition.name
+        for partition in partitioning_service.get_partitions(table_name)
+        if (partition.end is not None) and (partition.end <= before)
+    ]
+
+    before_partition_name = partitioning_service.get_partition_name(
+        table_name, before
+    )
+    detached_partition_names = [
+        name
+        for name in partitioning_service.get_detached_partition_names(
+            table_name
+        )
+        # Names sort chronologically.
+        if name < before_partition_name
+    ]
+
+    return attached_partition_names + detached_partition_names
+
+
+if __name__ == '__main__':
+    call_with_app_context(cli)
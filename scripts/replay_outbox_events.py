@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+
+"""Pass events recorded in the outbox that occurred in a time range on
+to a consumer again, e.g. to announce them via a newly added webhook.
+
+Consumer cursors are not changed.
+
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+from datetime import datetime
+from functools import partial
+from uuid import UUID
+
+import click
+
+from byceps.announce.connections import announce_event
+from byceps.outbox.relay import CONSUMERS
+from byceps.services.outbox import outbox_service
+from byceps.services.outbox.serialization import get_event_type_name
+from byceps.services.webhooks.transfer.models import WebhookID
+
+from _util import call_with_app_context
+
+
+@click.command()
+@click.argument('start', type=click.DateTime())
+@click.argument('end', type=click.DateTime())
+@click.option(
+    '-c',
+    '--consumer',
+    'consumer_name',
+    type=click.Choice(sorted(CONSUMERS)),
+    default='announce',
+    show_default=True,
+)
+@click.option(
+    '--webhook',
+    'webhook_ids',
+    type=click.UUID,
+    multiple=True,
+    help='only announce via this webhook (announce consumer only)',
+)
+@click.option(
+    '--dry-run', is_flag=True, help='list events, but do not pass them on'
+)
+def execute(
+    start: datetime,
+    end: datetime,
+    consumer_name: str,
+    webhook_ids: tuple[UUID, ...],
+    dry_run: bool,
+) -> None:
+    consumer = CONSUMERS[consumer_name]
+    if webhook_ids:
+        if consumer_name != 'announce':
+            raise click.BadParameter(
+                'Webhooks can only be selected for the announce consumer.'
+            )
+
+        consumer = partial(
+            announce_event,
+            webhook_ids={WebhookID(webhook_id) for webhook_id in webhook_ids},
+        )
+
+    replayed_count = 0
+    for outbox_event in outbox_service.iterate_events_occurred_between(
+        start, end
+    ):
+        event = outbox_event.event
+        click.echo(
+            f'{outbox_event.id}\t{event.occurred_at:%Y-%m-%d %H:%M:%S}\t'
+            f'{get_event_type_name(event)}'
+        )
+
+        if not dry_run:
+            consumer(event)
+
+        replayed_count += 1
+
+    action = 'Found' if dry_run else 'Replayed'
+    click.secho(f'{action} {replayed_count} events.', fg='green')
+
+
+if __name__ == '__main__':
+    call_with_app_context(execute)
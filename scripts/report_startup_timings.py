@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+
+"""Report how long it takes to create the application, per startup
+phase, and how many modules are imported in each phase.
+
+The app mode (and site ID) can be given to compare modes without
+changing the configuration.
+
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+import sys
+from time import perf_counter
+from typing import Any, Optional
+
+import click
+
+
+APP_MODES = ['admin', 'base', 'site', 'worker']
+
+
+@click.command()
+@click.option('--app-mode', type=click.Choice(APP_MODES))
+@click.option('--site-id')
+@click.option(
+    '--preload', is_flag=True, help='also measure preloading of modules'
+)
+def execute(
+    app_mode: Optional[str], site_id: Optional[str], preload: bool
+) -> None:
+    module_count_before = len(sys.modules)
+    start = perf_counter()
+
+    # Import here to include the cost of importing the application
+    # module itself.
+    from byceps import application
+
+    import_duration = perf_counter() - start
+    import_module_count = len(sys.modules) - module_count_before
+
+    config_overrides: dict[str, Any] = {}
+    if app_mode is not None:
+        config_overrides['APP_MODE'] = app_mode
+    if site_id is not None:
+        config_overrides['SITE_ID'] = site_id
+
+    app = application.create_app(config_overrides=config_overrides)
+
+    rows = [('import', import_duration, import_module_count)]
+    rows.extend(
+        (phase.name, phase.duration_seconds, phase.imported_module_count)
+        for phase in app.startup_phases
+    )
+
+    if preload:
+        module_count_before = len(sys.modules)
+        start = perf_counter()
+        application.preload(app)
+        rows.append(
+            (
+                'preload',
+                perf_counter() - start,
+                len(sys.modules) - module_count_before,
+            )
+        )
+
+    total_duration = sum(duration for _, duration, _ in rows)
+    total_module_count = sum(module_count for _, _, module_count in rows)
+
+    app_mode_name = app.config.get('APP_MODE') or 'base'
+    click.secho(f'app mode: {app_mode_name}', bold=True)
+    for name, duration, module_count in rows:
+        click.echo(_format_row(name, duration, module_count))
+    click.secho(
+        _format_row('total', total_duration, total_module_count), bold=True
+    )
+
+
+def _format_row(name: str, duration: float, module_count: int) -> str:
+    duration_ms = duration * 1000
+    return f'  {name:<16} {duration_ms:>9.1f} ms {module_count:>6d} modules'
+
+
+if __name__ == '__main__':
+    execute()
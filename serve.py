@@ -2,11 +2,18 @@
 Create and initialize the application using a configuration specified by
 an environment variable.
 
+If ``PRELOAD_ENABLED`` is set, the application is prepared to be
+shared by forked worker processes, e.g. when run with Gunicorn's
+``--preload`` option.
+
 :Copyright: 2014-2022 Jochen Kupperschmidt
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from byceps.application import create_app
+from byceps.application import create_app, preload
 
 
 app = create_app()
+
+if app.config['PRELOAD_ENABLED']:
+    preload(app)
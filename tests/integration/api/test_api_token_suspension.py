@@ -0,0 +1,27 @@
+"""
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.services.authentication.api import service as api_service
+
+
+# Any endpoint that requires an API token will do.
+URL = '/api/v1/tourney/match_comments/7ddde2e7-b9de-4a0f-bd5c-e7cb8c28ef8f'
+
+
+def test_suspension_takes_effect_immediately(api_client, admin_user):
+    api_token = api_service.create_api_token(admin_user.id, set())
+    headers = [('Authorization', f'Bearer {api_token.token}')]
+
+    # Authenticated, but comment does not exist.
+    assert api_client.get(URL, headers=headers).status_code == 404
+
+    api_service.suspend_api_token(api_token.id)
+    assert api_client.get(URL, headers=headers).status_code == 401
+
+    api_service.unsuspend_api_token(api_token.id)
+    assert api_client.get(URL, headers=headers).status_code == 404
+
+    api_service.delete_api_token(api_token.id)
+    assert api_client.get(URL, headers=headers).status_code == 401
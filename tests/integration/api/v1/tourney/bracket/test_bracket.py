@@ -0,0 +1,208 @@
+"""
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import datetime
+
+import pytest
+
+from byceps.services.tourney import (
+    category_service,
+    participant_service,
+    tourney_service,
+)
+
+from tests.helpers import generate_token
+
+
+def test_create_and_view_bracket(
+    api_client, api_client_authz_header, tourney, participants
+):
+    response = request_bracket_creation(
+        api_client,
+        api_client_authz_header,
+        tourney.id,
+        seeding=[str(p.id) for p in participants],
+    )
+
+    assert response.status_code == 201
+    assert response.location.endswith(
+        f'/api/v1/tourney/tourneys/{tourney.id}/bracket'
+    )
+
+    response = request_bracket(api_client, api_client_authz_header, tourney.id)
+
+    assert response.status_code == 200
+    assert response.content_type == 'application/json'
+    assert response.json['tourney_id'] == str(tourney.id)
+    assert response.json['type'] == 'single_elimination'
+    assert len(response.json['matches']) == 3
+
+    # The bracket has not changed since.
+    etag = response.headers['ETag']
+    response = request_bracket(
+        api_client, api_client_authz_header, tourney.id, etag=etag
+    )
+
+    assert response.status_code == 304
+
+
+def test_view_nonexistent_bracket(api_client, api_client_authz_header, tourney):
+    response = request_bracket(api_client, api_client_authz_header, tourney.id)
+
+    assert response.status_code == 404
+
+
+def test_create_bracket_for_nonexistent_tourney(
+    api_client, api_client_authz_header
+):
+    unknown_tourney_id = '00000000-0000-0000-0000-000000000000'
+
+    response = request_bracket_creation(
+        api_client, api_client_authz_header, unknown_tourney_id
+    )
+
+    assert response.status_code == 404
+
+
+def test_create_bracket_of_unknown_type(
+    api_client, api_client_authz_header, tourney, participants
+):
+    response = request_bracket_creation(
+        api_client,
+        api_client_authz_header,
+        tourney.id,
+        bracket_type='round_robin',
+    )
+
+    assert response.status_code == 400
+
+
+def test_create_bracket_twice(
+    api_client, api_client_authz_header, tourney, participants
+):
+    response = request_bracket_creation(
+        api_client, api_client_authz_header, tourney.id
+    )
+    assert response.status_code == 201
+
+    response = request_bracket_creation(
+        api_client, api_client_authz_header, tourney.id
+    )
+    assert response.status_code == 409
+
+
+def test_confirm_match_result(
+    api_client, api_client_authz_header, tourney, participants
+):
+    p1 = participants[0]
+
+    request_bracket_creation(
+        api_client,
+        api_client_authz_header,
+        tourney.id,
+        seeding=[str(p.id) for p in participants],
+    )
+    match = get_matches(api_client, api_client_authz_header, tourney.id)[0]
+
+    response = request_result_confirmation(
+        api_client, api_client_authz_header, match['match_id'], str(p1.id)
+    )
+
+    assert response.status_code == 204
+
+    match = get_matches(api_client, api_client_authz_header, tourney.id)[0]
+    assert match['winner_id'] == str(p1.id)
+
+    # The match has been decided already.
+    response = request_result_confirmation(
+        api_client, api_client_authz_header, match['match_id'], str(p1.id)
+    )
+
+    assert response.status_code == 400
+
+
+def test_confirm_match_result_without_winner(
+    api_client, api_client_authz_header, tourney, participants
+):
+    request_bracket_creation(api_client, api_client_authz_header, tourney.id)
+    match = get_matches(api_client, api_client_authz_header, tourney.id)[0]
+
+    url = f'/api/v1/tourney/matches/{match["match_id"]}/result'
+    response = api_client.post(
+        url, headers=[api_client_authz_header], json={}
+    )
+
+    assert response.status_code == 400
+
+
+# helpers
+
+
+@pytest.fixture(scope='module')
+def tourney_category(api_app, party):
+    return category_service.create_category(party.id, 'Racing')
+
+
+@pytest.fixture
+def tourney(tourney_category):
+    return tourney_service.create_tourney(
+        tourney_category.party_id,
+        generate_token(),
+        tourney_category.id,
+        8,
+        datetime(2022, 8, 20, 18, 0, 0),
+    )
+
+
+@pytest.fixture
+def participants(tourney):
+    return [
+        participant_service.create_participant(tourney.id, f'Team {i}', 5)
+        for i in range(1, 5)
+    ]
+
+
+def request_bracket(api_client, api_client_authz_header, tourney_id, etag=None):
+    url = f'/api/v1/tourney/tourneys/{tourney_id}/bracket'
+
+    headers = [api_client_authz_header]
+    if etag is not None:
+        headers.append(('If-None-Match', etag))
+
+    return api_client.get(url, headers=headers)
+
+
+def request_bracket_creation(
+    api_client,
+    api_client_authz_header,
+    tourney_id,
+    *,
+    bracket_type='single_elimination',
+    seeding=None,
+):
+    url = f'/api/v1/tourney/tourneys/{tourney_id}/bracket'
+
+    headers = [api_client_authz_header]
+    json_data = {'type': bracket_type}
+    if seeding is not None:
+        json_data['seeding'] = seeding
+
+    return api_client.post(url, headers=headers, json=json_data)
+
+
+def request_result_confirmation(
+    api_client, api_client_authz_header, match_id, winner_id
+):
+    url = f'/api/v1/tourney/matches/{match_id}/result'
+
+    headers = [api_client_authz_header]
+    json_data = {'winner_id': winner_id}
+
+    return api_client.post(url, headers=headers, json=json_data)
+
+
+def get_matches(api_client, api_client_authz_header, tourney_id):
+    response = request_bracket(api_client, api_client_authz_header, tourney_id)
+    return response.json['matches']
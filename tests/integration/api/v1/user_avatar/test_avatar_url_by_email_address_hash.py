@@ -22,6 +22,37 @@ def test_existent_user_with_avatar(api_client):
 
     assert response.status_code == 302
     assert_redirect(response, f'/data/global/users/avatars/{avatar_id}.jpeg')
+    assert response.headers['Cache-Control'] == 'public, max-age=300'
+
+
+def test_existent_user_with_avatar_by_sha256_hash(api_client):
+    email_address = 'user3@users.test'
+    user_id = create_initialized_user('UserWithAvatar3', email_address)
+    avatar_id = set_avatar(user_id)
+    email_address_hash = hashlib.sha256(
+        email_address.encode('utf-8')
+    ).hexdigest()
+
+    response = send_request(api_client, email_address_hash)
+
+    assert_redirect(response, f'/data/global/users/avatars/{avatar_id}.jpeg')
+
+
+def test_hash_is_updated_on_email_address_change(api_client, admin_user):
+    old_email_address = 'user4@users.test'
+    new_email_address = 'user4-new@users.test'
+    user_id = create_initialized_user('UserWithAvatar4', old_email_address)
+    avatar_id = set_avatar(user_id)
+
+    user_command_service.change_email_address(
+        user_id, new_email_address, True, admin_user.id
+    )
+
+    response = send_request(api_client, hash_email_address(old_email_address))
+    assert_redirect(response, '/static/avatar_fallback.svg')
+
+    response = send_request(api_client, hash_email_address(new_email_address))
+    assert_redirect(response, f'/data/global/users/avatars/{avatar_id}.jpeg')
 
 
 def test_existent_user_without_avatar(api_client):
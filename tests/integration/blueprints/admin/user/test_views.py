@@ -96,3 +96,15 @@ def test_view_events(user_admin_client, user):
     url = f'/admin/users/{user.id}/events'
     response = user_admin_client.get(url)
     assert response.status_code == 200
+
+
+def test_view_events_without_logins(user_admin_client, user):
+    url = f'/admin/users/{user.id}/events?include_logins=no'
+    response = user_admin_client.get(url)
+    assert response.status_code == 200
+
+
+def test_view_events_with_invalid_cursor(user_admin_client, user):
+    url = f'/admin/users/{user.id}/events?cursor=invalid'
+    response = user_admin_client.get(url)
+    assert response.status_code == 400
@@ -0,0 +1,126 @@
+"""
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from byceps.services.seating import area_service, seat_service
+from byceps.services.ticketing import (
+    ticket_creation_service,
+    ticket_seat_management_service,
+    ticket_service,
+)
+
+from tests.helpers import generate_token, http_client, log_in_user
+
+
+@patch('byceps.signals.ticketing.ticket_seat_occupied.send')
+def test_assign_seats(
+    ticket_seat_occupied_send_mock, site_app, area, seats, tickets, manager
+):
+    # Every other seat is occupied.
+    response = send_request(site_app, area.slug, manager.id, same_row='on')
+
+    assert response.status_code == 302
+
+    occupied_seat_ids = {
+        ticket_service.get_ticket(ticket.id).occupied_seat_id
+        for ticket in tickets
+    }
+    assert occupied_seat_ids == {seats[0].id, seats[1].id}
+
+    assert ticket_seat_occupied_send_mock.call_count == len(tickets)
+
+
+def test_assign_seats_without_suitable_seats(
+    site_app, area, seats, occupied_seats, tickets, manager
+):
+    # Only seats separated by occupied ones are free.
+    response = send_request(site_app, area.slug, manager.id, same_row='on')
+
+    assert response.status_code == 302
+
+    assert all(
+        ticket_service.get_ticket(ticket.id).occupied_seat_id is None
+        for ticket in tickets
+    )
+
+
+def test_assign_seats_when_not_logged_in(site_app, area):
+    response = send_request(site_app, area.slug)
+
+    assert response.status_code == 302
+
+
+# helpers
+
+
+@pytest.fixture(scope='module')
+def manager(make_admin):
+    manager = make_admin({'seating.administrate'})
+    log_in_user(manager.id)
+    return manager
+
+
+@pytest.fixture(scope='module')
+def category(make_ticket_category, party):
+    return make_ticket_category(party.id, 'Standard')
+
+
+@pytest.fixture(scope='module')
+def area(party):
+    area = area_service.create_area(party.id, generate_token(), 'Lounge')
+    yield area
+    area_service.delete_area(area.id)
+
+
+@pytest.fixture
+def seats(area, category):
+    seats = [
+        seat_service.create_seat(area.id, x, 0, category.id)
+        for x in range(0, 200, 40)
+    ]
+    yield seats
+    for seat in seats:
+        seat_service.delete_seat(seat.id)
+
+
+@pytest.fixture
+def occupied_seats(seats, category, make_user):
+    owner = make_user()
+    tickets = []
+    for seat in seats[1::2]:
+        ticket = ticket_creation_service.create_ticket(
+            category.party_id, category.id, owner.id
+        )
+        ticket_seat_management_service.occupy_seat(
+            ticket.id, seat.id, owner.id
+        )
+        tickets.append(ticket)
+
+    yield
+
+    for ticket in tickets:
+        ticket_service.delete_ticket(ticket.id)
+
+
+@pytest.fixture
+def tickets(category, manager):
+    tickets = [
+        ticket_creation_service.create_ticket(
+            category.party_id, category.id, manager.id
+        )
+        for _ in range(2)
+    ]
+    yield tickets
+    for ticket in tickets:
+        ticket_service.delete_ticket(ticket.id)
+
+
+def send_request(app, slug, user_id=None, **form_data):
+    url = f'/seating/areas/{slug}/assign_seats'
+    with http_client(app, user_id=user_id) as client:
+        return client.post(url, data=form_data)
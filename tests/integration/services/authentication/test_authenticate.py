@@ -6,6 +6,9 @@
 from pytest import raises
 
 from byceps.services.authentication.exceptions import AuthenticationFailed
+from byceps.services.authentication.password import (
+    service as password_service,
+)
 from byceps.services.authentication import service as authn_service
 
 
@@ -65,5 +68,26 @@ def test_active_user_with_email_address_and_correct_password_is_accepted(
     assert authenticated_user is not None
 
 
+def test_outdated_password_hash_is_migrated_on_login(admin_app, make_user):
+    user = create_user(make_user)
+
+    credential = password_service._get_credential_for_user(user.id)
+    assert credential.password_hash.startswith('pbkdf2:sha256:320000$')
+
+    admin_app.config['PASSWORD_HASH_METHOD'] = 'scrypt:1024:8:1'
+    try:
+        authn_service.authenticate(user.screen_name, CORRECT_PASSWORD)
+
+        credential = password_service._get_credential_for_user(user.id)
+        assert credential.password_hash.startswith('scrypt:1024:8:1$')
+
+        # The migrated hash must be accepted on the next login.
+        authn_service.authenticate(user.screen_name, CORRECT_PASSWORD)
+    finally:
+        admin_app.config['PASSWORD_HASH_METHOD'] = (
+            password_service.PASSWORD_HASH_METHOD
+        )
+
+
 def create_user(make_user, **kwargs):
     return make_user(password=CORRECT_PASSWORD, **kwargs)
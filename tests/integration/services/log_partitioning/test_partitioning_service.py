@@ -0,0 +1,104 @@
+"""
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import date, datetime
+import gzip
+import json
+
+import pytest
+
+from byceps.services.log_partitioning import partitioning_service
+from byceps.services.user import log_service as user_log_service
+
+
+TABLE_NAME = 'user_log_entries'
+PARTITION_NAME = 'user_log_entries_y2019m08'
+
+
+def test_create_and_archive_partition(admin_app, make_user, tmp_path):
+    user = make_user()
+    user_log_service.create_entry(
+        'user-logged-in', user.id, {}, occurred_at=datetime(2019, 8, 15, 12)
+    )
+
+    # The entry is stored in the default partition for now.
+    assert _get_login_count(user.id) == 1
+
+    assert partitioning_service.create_partition(TABLE_NAME, date(2019, 8, 1))
+    assert not partitioning_service.create_partition(
+        TABLE_NAME, date(2019, 8, 1)
+    )
+
+    partitions = partitioning_service.get_partitions(TABLE_NAME)
+    partition = _find_partition(partitions, PARTITION_NAME)
+    assert partition.start == datetime(2019, 8, 1)
+    assert partition.end == datetime(2019, 9, 1)
+    assert partitions[-1].is_default
+
+    # The entry has been moved to the new partition.
+    assert _get_login_count(user.id) == 1
+
+    archive_file, entry_count = partitioning_service.archive_partition(
+        TABLE_NAME, PARTITION_NAME, tmp_path
+    )
+
+    assert archive_file == tmp_path / 'user_log_entries_y2019m08.jsonl.gz'
+    assert entry_count == 1
+
+    with gzip.open(archive_file, 'rt', encoding='utf-8') as f:
+        archived_entries = [json.loads(line) for line in f]
+
+    assert len(archived_entries) == 1
+    archived_entry = archived_entries[0]
+    assert archived_entry['occurred_at'] == '2019-08-15T12:00:00'
+    assert archived_entry['event_type'] == 'user-logged-in'
+    assert archived_entry['user_id'] == str(user.id)
+    assert archived_entry['data'] == {}
+
+    assert _get_login_count(user.id) == 0
+    assert PARTITION_NAME not in {
+        p.name for p in partitioning_service.get_partitions(TABLE_NAME)
+    }
+    assert partitioning_service.get_detached_partition_names(TABLE_NAME) == []
+
+
+def test_create_upcoming_partitions(admin_app):
+    partition_names = partitioning_service.create_upcoming_partitions(
+        'ticket_log_entries', 2, today=date(2031, 11, 20)
+    )
+
+    assert partition_names == [
+        'ticket_log_entries_y2031m11',
+        'ticket_log_entries_y2031m12',
+        'ticket_log_entries_y2032m01',
+    ]
+
+
+def test_detach_unknown_partition(admin_app):
+    with pytest.raises(ValueError):
+        partitioning_service.detach_partition(
+            TABLE_NAME, 'user_log_entries_y1999m01'
+        )
+
+
+def test_reject_unknown_table(admin_app):
+    with pytest.raises(ValueError):
+        partitioning_service.get_partitions('users')
+
+
+def _find_partition(partitions, name):
+    for partition in partitions:
+        if partition.name == name:
+            return partition
+
+    raise LookupError(name)
+
+
+def _get_login_count(user_id):
+    return len(
+        user_log_service.get_entries_of_type_for_user(
+            user_id, 'user-logged-in'
+        )
+    )
@@ -0,0 +1,74 @@
+"""
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import datetime
+
+import pytest
+
+from byceps.services.newsletter import command_service, service
+
+
+def test_subscribe_and_unsubscribe_many(list1, list2, make_user):
+    user1 = make_user()
+    user2 = make_user()
+    user3 = make_user()
+
+    assert service.count_subscribers_for_list(list1.id) == 0
+
+    command_service.subscribe(user1.id, list1.id, datetime.utcnow())
+    command_service.subscribe_many(
+        {user1.id, user2.id, user3.id}, list1.id, datetime.utcnow()
+    )
+    command_service.subscribe(user2.id, list2.id, datetime.utcnow())
+
+    assert service.count_subscribers_for_list(list1.id) == 3
+    assert service.count_subscribers_for_list(list2.id) == 1
+
+    assert service.get_subscribed_list_ids_for_users(
+        {user1.id, user2.id, user3.id}
+    ) == {
+        user1.id: {list1.id},
+        user2.id: {list1.id, list2.id},
+        user3.id: {list1.id},
+    }
+
+    states = dict(service.get_subscription_states_for_user(user2.id))
+    assert states[list1]
+    assert states[list2]
+
+    command_service.unsubscribe_many(
+        {user2.id, user3.id}, list1.id, datetime.utcnow()
+    )
+
+    assert service.count_subscribers_for_list(list1.id) == 1
+    states = dict(service.get_subscription_states_for_user(user2.id))
+    assert not states[list1]
+    assert states[list2]
+    assert not service.is_subscribed(user3.id, list1.id)
+
+    counts = service.get_subscriber_counts()
+    assert counts[list1.id] == 1
+    assert counts[list2.id] == 1
+
+    assert command_service.recount_subscribers(list1.id) == 1
+
+
+def test_subscribe_to_unknown_list(make_user):
+    user = make_user()
+
+    with pytest.raises(command_service.UnknownListId):
+        command_service.subscribe_many(
+            {user.id}, 'no-such-list', datetime.utcnow()
+        )
+
+
+@pytest.fixture(scope='module')
+def list1(admin_app):
+    return command_service.create_list('newsletter-alpha', 'Alpha')
+
+
+@pytest.fixture(scope='module')
+def list2(admin_app):
+    return command_service.create_list('newsletter-beta', 'Beta')
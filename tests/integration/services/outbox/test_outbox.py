@@ -0,0 +1,178 @@
+"""
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import datetime
+
+import pytest
+
+from byceps.database import db
+from byceps.events.auth import UserLoggedIn
+from byceps.outbox import relay
+from byceps.services.outbox.dbmodels import DbOutboxEvent
+from byceps.services.outbox import outbox_service
+from byceps.services.outbox.serialization import (
+    get_event_type_name,
+    serialize_event,
+)
+
+
+def test_append_and_get_events(admin_app, user):
+    position = outbox_service.get_current_position()
+    event1 = _build_event(user)
+    event2 = _build_event(user)
+
+    outbox_service.append_event(event1)
+    outbox_service.append_event(event2)
+
+    outbox_events = outbox_service.get_events_after(position, 10)
+    assert [outbox_event.event for outbox_event in outbox_events] == [
+        event1,
+        event2,
+    ]
+    assert outbox_events[0].id < outbox_events[1].id
+
+
+def test_iterate_events_occurred_between(admin_app, user):
+    event1 = _build_event(user, datetime(2022, 3, 1, 12, 0, 0))
+    event2 = _build_event(user, datetime(2022, 3, 1, 13, 0, 0))
+    event3 = _build_event(user, datetime(2022, 3, 1, 14, 0, 0))
+    for event in [event1, event2, event3]:
+        outbox_service.append_event(event)
+
+    outbox_events = outbox_service.iterate_events_occurred_between(
+        datetime(2022, 3, 1, 12, 30, 0),
+        datetime(2022, 3, 1, 14, 0, 0),
+        batch_size=1,
+    )
+
+    assert [outbox_event.event for outbox_event in outbox_events] == [event2]
+
+
+def test_append_events_to_transaction(admin_app, user, monkeypatch):
+    monkeypatch.setitem(admin_app.config, 'OUTBOX_ENABLED', True)
+    position = outbox_service.get_current_position()
+
+    # Events are discarded if the transaction is rolled back ...
+    outbox_service.append_events_to_transaction([_build_event(user)])
+    db.session.rollback()
+    assert outbox_service.get_events_after(position, 10) == []
+
+    # ... and recorded once it is committed.
+    event = _build_event(user)
+    outbox_service.append_events_to_transaction([event])
+    db.session.commit()
+    outbox_events = outbox_service.get_events_after(position, 10)
+    assert [outbox_event.event for outbox_event in outbox_events] == [event]
+
+
+def test_append_events_to_transaction_if_disabled(admin_app, user):
+    position = outbox_service.get_current_position()
+
+    outbox_service.append_events_to_transaction([_build_event(user)])
+    db.session.commit()
+
+    assert outbox_service.get_events_after(position, 10) == []
+
+
+def test_relay_events_to_new_consumer(admin_app, user):
+    consumer_name = 'test-new-consumer'
+    consumed_events = []
+
+    outbox_service.append_event(_build_event(user))
+
+    # Events recorded before the cursor is created are not passed on.
+    assert relay.relay_events(
+        consumer_name, consumed_events.append, batch_size=10
+    ) == 0
+
+    event1 = _build_event(user)
+    event2 = _build_event(user)
+    outbox_service.append_event(event1)
+    outbox_service.append_event(event2)
+
+    assert relay.relay_events(
+        consumer_name, consumed_events.append, batch_size=10
+    ) == 2
+    assert consumed_events == [event1, event2]
+
+    assert relay.relay_events(
+        consumer_name, consumed_events.append, batch_size=10
+    ) == 0
+
+
+def test_relay_keeps_progress_if_consumer_fails(admin_app, user):
+    consumer_name = 'test-failing-consumer'
+    relay.relay_events(consumer_name, lambda event: None, batch_size=10)
+
+    event1 = _build_event(user)
+    event2 = _build_event(user)
+    outbox_service.append_event(event1)
+    outbox_service.append_event(event2)
+
+    consumed_events = []
+
+    def fail_on_second_event(event):
+        if consumed_events:
+            raise Exception('Consumer failed.')
+        consumed_events.append(event)
+
+    with pytest.raises(Exception):
+        relay.relay_events(consumer_name, fail_on_second_event, batch_size=10)
+
+    assert consumed_events == [event1]
+
+    # The failed event is passed on again.
+    relay.relay_events(consumer_name, consumed_events.append, batch_size=10)
+    assert consumed_events == [event1, event2]
+
+
+def test_relay_holds_back_events_of_pending_transactions(admin_app, user):
+    consumer_name = 'test-pending-transactions'
+    relay.relay_events(consumer_name, lambda event: None, batch_size=10)
+
+    event1 = _build_event(user)
+    event2 = _build_event(user)
+    consumed_events = []
+
+    with db.engine.connect() as connection:
+        transaction = connection.begin()
+
+        # Record an event in a transaction that is committed late.
+        connection.execute(
+            DbOutboxEvent.__table__.insert().values(
+                recorded_at=datetime.utcnow(),
+                occurred_at=event1.occurred_at,
+                event_type=get_event_type_name(event1),
+                data=serialize_event(event1),
+            )
+        )
+
+        outbox_service.append_event(event2)
+
+        # Events recorded after the pending transaction has started
+        # are held back, too.
+        assert relay.relay_events(
+            consumer_name, consumed_events.append, batch_size=10
+        ) == 0
+        assert consumed_events == []
+
+        transaction.commit()
+
+    assert relay.relay_events(
+        consumer_name, consumed_events.append, batch_size=10
+    ) == 2
+    assert consumed_events == [event1, event2]
+
+
+def _build_event(user, occurred_at=None):
+    if occurred_at is None:
+        occurred_at = datetime.utcnow()
+
+    return UserLoggedIn(
+        occurred_at=occurred_at,
+        initiator_id=user.id,
+        initiator_screen_name=user.screen_name,
+        site_id=None,
+    )
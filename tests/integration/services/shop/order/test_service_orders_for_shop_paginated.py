@@ -0,0 +1,99 @@
+"""
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from byceps.services.shop.cart.models import Cart
+from byceps.services.shop.order import service as order_service
+from byceps.services.shop.order.transfer.order import (
+    Order,
+    Orderer,
+    PaymentState,
+)
+from byceps.services.shop.shop.transfer.models import Shop
+from byceps.services.shop.storefront.transfer.models import Storefront
+
+
+@pytest.fixture
+def shop(make_brand, make_shop) -> Shop:
+    brand = make_brand()
+
+    return make_shop(brand.id)
+
+
+@pytest.fixture
+def storefront(
+    shop: Shop, make_order_number_sequence, make_storefront
+) -> Storefront:
+    order_number_sequence = make_order_number_sequence(
+        shop.id, prefix='LF-04-B'
+    )
+
+    return make_storefront(shop.id, order_number_sequence.id)
+
+
+@pytest.fixture
+def orderer(make_user, make_orderer) -> Orderer:
+    user = make_user()
+    return make_orderer(user.id)
+
+
+def test_get_orders_for_shop_paginated(
+    admin_app, shop: Shop, storefront: Storefront, orderer: Orderer
+):
+    order1 = place_order(storefront, orderer)
+    order2 = place_order(storefront, orderer)
+    order3 = place_order(storefront, orderer)
+
+    page1 = order_service.get_orders_for_shop_paginated(shop.id, 1, 2)
+    assert page1.total == 3
+    assert page1.items == [order3, order2]
+
+    page2 = order_service.get_orders_for_shop_paginated(shop.id, 2, 2)
+    assert page2.total == 3
+    assert page2.items == [order1]
+
+
+@pytest.mark.parametrize(
+    'only_overdue, expected_total',
+    [
+        (False, 2),
+        (True, 0),
+    ],
+)
+def test_get_orders_for_shop_paginated_count_with_overdue_filter(
+    admin_app,
+    shop: Shop,
+    storefront: Storefront,
+    orderer: Orderer,
+    only_overdue: bool,
+    expected_total: int,
+):
+    place_order(storefront, orderer)
+    place_order(storefront, orderer)
+
+    # Request the second page to force the count query to be run.
+    orders = order_service.get_orders_for_shop_paginated(
+        shop.id,
+        2,
+        1,
+        only_payment_state=PaymentState.open,
+        only_overdue=only_overdue,
+    )
+
+    assert orders.total == expected_total
+
+
+# helpers
+
+
+def place_order(storefront: Storefront, orderer: Orderer) -> Order:
+    cart = Cart()
+
+    order, _ = order_service.place_order(storefront.id, orderer, cart)
+
+    return order
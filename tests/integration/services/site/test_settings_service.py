@@ -112,6 +112,20 @@ def test_find_value(site):
     assert value_after_create == value
 
 
+def test_find_value_reflects_changes(site):
+    site_id = SITE_ID
+    name = 'name7'
+
+    settings_service.create_setting(site_id, name, 'value7a')
+    assert settings_service.find_setting_value(site_id, name) == 'value7a'
+
+    settings_service.create_or_update_setting(site_id, name, 'value7b')
+    assert settings_service.find_setting_value(site_id, name) == 'value7b'
+
+    settings_service.remove_setting(site_id, name)
+    assert settings_service.find_setting_value(site_id, name) is None
+
+
 def test_get_settings(site):
     site_id = SITE_ID
 
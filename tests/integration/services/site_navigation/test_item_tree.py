@@ -0,0 +1,62 @@
+"""
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.services.site_navigation import service as navigation_service
+from byceps.services.site_navigation.transfer.models import ItemTargetType
+
+
+def test_get_item_tree_for_menu(admin_app, site):
+    menu = navigation_service.create_menu(site.id, 'main', 'en')
+
+    tree = navigation_service.get_item_tree_for_menu(site.id, 'main', 'en')
+    assert tree == []
+
+    news = create_item(menu.id, 'News')
+    board = create_item(menu.id, 'Board')
+    create_item(menu.id, 'Secret', hidden=True)
+    archive = create_item(menu.id, 'Archive', parent_item_id=news.id)
+
+    tree = navigation_service.get_item_tree_for_menu(site.id, 'main', 'en')
+
+    assert [node.item.label for node in tree] == ['News', 'Board']
+    assert [child.item.id for child in tree[0].children] == [archive.id]
+    assert tree[1].children == []
+
+    navigation_service.update_item(
+        board.id,
+        board.target_type,
+        board.target,
+        'Forum',
+        board.current_page_id,
+        False,
+    )
+
+    tree = navigation_service.get_item_tree_for_menu(site.id, 'main', 'en')
+
+    assert [node.item.label for node in tree] == ['News', 'Forum']
+
+
+def test_get_item_tree_for_hidden_menu(admin_app, site):
+    menu = navigation_service.create_menu(site.id, 'hidden', 'en', hidden=True)
+    create_item(menu.id, 'News')
+
+    assert (
+        navigation_service.get_item_tree_for_menu(site.id, 'hidden', 'en')
+        == []
+    )
+
+
+# helpers
+
+
+def create_item(menu_id, label, **kwargs):
+    return navigation_service.create_item(
+        menu_id,
+        ItemTargetType.url,
+        f'https://www.acmecon.test/{label.lower()}',
+        label,
+        label.lower(),
+        **kwargs,
+    )
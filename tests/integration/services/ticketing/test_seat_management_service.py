@@ -5,7 +5,11 @@
 
 import pytest
 from pytest import raises
+from sqlalchemy import select
+from sqlalchemy.exc import OperationalError
 
+from byceps.database import db
+from byceps.services.outbox import outbox_service
 from byceps.services.seating import area_service, seat_service
 from byceps.services.ticketing import (
     log_service,
@@ -14,10 +18,13 @@ from byceps.services.ticketing import (
     ticket_seat_management_service,
     ticket_service,
 )
+from byceps.services.ticketing.dbmodels.ticket import Ticket as DbTicket
 from byceps.services.ticketing.exceptions import (
+    SeatAlreadyOccupied,
     SeatChangeDeniedForBundledTicket,
     TicketCategoryMismatch,
 )
+from byceps.services.user import service as user_service
 
 # Import models to ensure the corresponding tables are created so
 # `Seat.assignment` is available.
@@ -61,6 +68,15 @@ def ticket(admin_app, category, ticket_owner):
     ticket_service.delete_ticket(ticket.id)
 
 
+@pytest.fixture
+def another_ticket(admin_app, category, ticket_owner):
+    ticket = ticket_creation_service.create_ticket(
+        category.party_id, category.id, ticket_owner.id
+    )
+    yield ticket
+    ticket_service.delete_ticket(ticket.id)
+
+
 @pytest.fixture
 def ticket_bundle(category, ticket_owner):
     ticket_quantity = 1
@@ -202,6 +218,172 @@ def test_occupy_seat_with_wrong_category(
         )
 
 
+def test_occupy_seats(
+    admin_app, seat1, seat2, ticket, another_ticket, ticketing_admin
+):
+    events = ticket_seat_management_service.occupy_seats(
+        {ticket.id: seat1.id, another_ticket.id: seat2.id},
+        ticketing_admin.id,
+    )
+
+    assert ticket.occupied_seat_id == seat1.id
+    assert another_ticket.occupied_seat_id == seat2.id
+
+    assert {
+        (event.ticket_id, event.seat_id, event.previous_seat_id)
+        for event in events
+    } == {
+        (ticket.id, seat1.id, None),
+        (another_ticket.id, seat2.id, None),
+    }
+    assert all(event.initiator_id == ticketing_admin.id for event in events)
+
+    log_entries = log_service.get_entries_for_ticket(ticket.id)
+    assert len(log_entries) == 1
+    assert_log_entry(
+        log_entries[0],
+        'seat-occupied',
+        {'seat_id': str(seat1.id), 'initiator_id': str(ticketing_admin.id)},
+    )
+
+    # Let the tickets swap seats.
+
+    events = ticket_seat_management_service.occupy_seats(
+        {ticket.id: seat2.id, another_ticket.id: seat1.id},
+        ticketing_admin.id,
+    )
+
+    assert ticket.occupied_seat_id == seat2.id
+    assert another_ticket.occupied_seat_id == seat1.id
+
+    assert {
+        (event.ticket_id, event.seat_id, event.previous_seat_id)
+        for event in events
+    } == {
+        (ticket.id, seat2.id, seat1.id),
+        (another_ticket.id, seat1.id, seat2.id),
+    }
+
+
+def test_occupy_seats_records_events_in_outbox(
+    admin_app,
+    seat1,
+    seat2,
+    ticket,
+    another_ticket,
+    ticketing_admin,
+    monkeypatch,
+):
+    monkeypatch.setitem(admin_app.config, 'OUTBOX_ENABLED', True)
+    position = outbox_service.get_current_position()
+
+    events = ticket_seat_management_service.occupy_seats(
+        {ticket.id: seat1.id, another_ticket.id: seat2.id},
+        ticketing_admin.id,
+    )
+
+    outbox_events = outbox_service.get_events_after(position, 10)
+    assert [outbox_event.event for outbox_event in outbox_events] == events
+
+
+def test_occupy_seats_with_seat_occupied_by_another_ticket(
+    admin_app, seat1, seat2, ticket, another_ticket, ticketing_admin
+):
+    ticket_seat_management_service.occupy_seat(
+        another_ticket.id, seat2.id, ticketing_admin.id
+    )
+
+    with raises(SeatAlreadyOccupied):
+        ticket_seat_management_service.occupy_seats(
+            {ticket.id: seat2.id}, ticketing_admin.id
+        )
+
+    db.session.rollback()
+
+    assert ticket.occupied_seat_id is None
+    assert another_ticket.occupied_seat_id == seat2.id
+    assert log_service.get_entries_for_ticket(ticket.id) == []
+
+
+def test_occupy_seats_with_wrong_category_changes_nothing(
+    admin_app,
+    seat1,
+    seat_of_another_category,
+    ticket,
+    another_ticket,
+    ticketing_admin,
+):
+    with raises(TicketCategoryMismatch):
+        ticket_seat_management_service.occupy_seats(
+            {
+                ticket.id: seat1.id,
+                another_ticket.id: seat_of_another_category.id,
+            },
+            ticketing_admin.id,
+        )
+
+    db.session.rollback()
+
+    assert ticket.occupied_seat_id is None
+    assert another_ticket.occupied_seat_id is None
+
+
+def test_occupy_seats_locks_tickets(
+    admin_app, seat1, ticket, ticketing_admin, monkeypatch
+):
+    lock_attempts = []
+
+    def find_screen_name(user_id):
+        # Called while the seats are being occupied, after the tickets
+        # have been locked.
+        with db.engine.connect() as connection:
+            with raises(OperationalError):
+                connection.execute(
+                    select(DbTicket.id)
+                    .filter_by(id=ticket.id)
+                    .with_for_update(nowait=True)
+                )
+        lock_attempts.append(user_id)
+        return None
+
+    monkeypatch.setattr(user_service, 'find_screen_name', find_screen_name)
+
+    ticket_seat_management_service.occupy_seats(
+        {ticket.id: seat1.id}, ticketing_admin.id
+    )
+
+    assert lock_attempts == [ticketing_admin.id]
+    assert ticket.occupied_seat_id == seat1.id
+
+
+def test_occupy_seats_occupied_concurrently(
+    admin_app, seat1, ticket, another_ticket, ticketing_admin, monkeypatch
+):
+    def find_screen_name(user_id):
+        # Let another ticket occupy the seat in the meantime.
+        with db.engine.begin() as connection:
+            connection.execute(
+                DbTicket.__table__.update()
+                .where(DbTicket.__table__.c.id == another_ticket.id)
+                .values(occupied_seat_id=seat1.id)
+            )
+        return None
+
+    monkeypatch.setattr(user_service, 'find_screen_name', find_screen_name)
+
+    with raises(SeatAlreadyOccupied):
+        ticket_seat_management_service.occupy_seats(
+            {ticket.id: seat1.id}, ticketing_admin.id
+        )
+
+    assert ticket.occupied_seat_id is None
+    assert log_service.get_entries_for_ticket(ticket.id) == []
+
+    # Release the seat again.
+    another_ticket.occupied_seat_id = None
+    db.session.commit()
+
+
 # helpers
 
 
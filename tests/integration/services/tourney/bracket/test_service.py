@@ -0,0 +1,186 @@
+"""
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import json
+from uuid import UUID
+
+import pytest
+from pytest import raises
+
+from byceps.database import db
+from byceps.events.tourney import (
+    TourneyMatchReady,
+    TourneyMatchScoreConfirmed,
+    TourneyParticipantEliminated,
+)
+from byceps.services.tourney.bracket.dbmodels import Bracket as DbBracket
+from byceps.services.tourney.bracket import service as bracket_service
+from byceps.services.tourney.transfer.models import BracketType
+
+
+def test_get_bracket_json_without_bracket(tourney):
+    assert bracket_service.get_bracket_json(tourney.id) is None
+
+
+def test_create_bracket(tourney, participants):
+    p1, p2, p3, p4 = participants
+
+    bracket_service.create_bracket(
+        tourney.id,
+        BracketType.single_elimination,
+        seeding=[p.id for p in participants],
+    )
+
+    bracket = get_bracket(tourney.id)
+    assert bracket['type'] == 'single_elimination'
+    assert [
+        get_participant_ids(match) for match in bracket['matches']
+    ] == [
+        [str(p1.id), str(p4.id)],
+        [str(p2.id), str(p3.id)],
+        [None, None],
+    ]
+
+
+def test_create_bracket_with_incomplete_seeding(tourney, participants):
+    with raises(ValueError):
+        bracket_service.create_bracket(
+            tourney.id,
+            BracketType.single_elimination,
+            seeding=[p.id for p in participants[:3]],
+        )
+
+    assert bracket_service.get_bracket_json(tourney.id) is None
+
+
+def test_create_bracket_twice(tourney, participants):
+    bracket_service.create_bracket(tourney.id, BracketType.single_elimination)
+
+    with raises(bracket_service.BracketExists):
+        bracket_service.create_bracket(
+            tourney.id, BracketType.double_elimination
+        )
+
+    assert get_bracket(tourney.id)['type'] == 'single_elimination'
+
+
+def test_create_bracket_concurrently(tourney, participants, monkeypatch):
+    bracket_service.create_bracket(tourney.id, BracketType.single_elimination)
+
+    # Miss the existing bracket as if it was created after the check.
+    session_get = db.session.get
+
+    def get(entity, *args, **kwargs):
+        if entity is DbBracket:
+            return None
+        return session_get(entity, *args, **kwargs)
+
+    monkeypatch.setattr(db.session, 'get', get)
+
+    with raises(bracket_service.BracketExists):
+        bracket_service.create_bracket(
+            tourney.id, BracketType.double_elimination
+        )
+
+    monkeypatch.undo()
+
+    assert get_bracket(tourney.id)['type'] == 'single_elimination'
+
+
+def test_confirm_match_results(tourney, participants):
+    p1, p2, p3, p4 = participants
+
+    bracket_service.create_bracket(
+        tourney.id,
+        BracketType.single_elimination,
+        seeding=[p.id for p in participants],
+    )
+    semifinal1_id, semifinal2_id, final_id = get_match_ids(tourney.id)
+
+    events = bracket_service.confirm_match_result(semifinal1_id, p4.id)
+
+    assert [type(event) for event in events] == [
+        TourneyMatchScoreConfirmed,
+        TourneyParticipantEliminated,
+    ]
+    assert events[0].match_id == str(semifinal1_id)
+    assert events[1].participant_id == str(p1.id)
+
+    events = bracket_service.confirm_match_result(semifinal2_id, p2.id)
+
+    assert [type(event) for event in events] == [
+        TourneyMatchScoreConfirmed,
+        TourneyMatchReady,
+        TourneyParticipantEliminated,
+    ]
+    assert events[1].match_id == str(final_id)
+    assert events[1].participant1_id == str(p4.id)
+    assert events[1].participant2_id == str(p2.id)
+    assert events[2].participant_id == str(p3.id)
+
+    matches = get_bracket(tourney.id)['matches']
+    assert [match['winner_id'] for match in matches] == [
+        str(p4.id),
+        str(p2.id),
+        None,
+    ]
+    assert get_participant_ids(matches[2]) == [str(p4.id), str(p2.id)]
+    assert matches[0]['confirmed_at'] is not None
+
+
+def test_confirm_match_result_twice(tourney, participants):
+    p1 = participants[0]
+
+    bracket_service.create_bracket(
+        tourney.id,
+        BracketType.single_elimination,
+        seeding=[p.id for p in participants],
+    )
+    match_id = get_match_ids(tourney.id)[0]
+
+    bracket_service.confirm_match_result(match_id, p1.id)
+
+    with raises(ValueError):
+        bracket_service.confirm_match_result(match_id, p1.id)
+
+
+@pytest.mark.parametrize('match_index, winner_index', [(0, 1), (2, 0)])
+def test_confirm_match_result_with_invalid_winner(
+    tourney, participants, match_index, winner_index
+):
+    bracket_service.create_bracket(
+        tourney.id,
+        BracketType.single_elimination,
+        seeding=[p.id for p in participants],
+    )
+    match_id = get_match_ids(tourney.id)[match_index]
+
+    # The participant is not part of the match, or the match is not
+    # ready yet.
+    with raises(ValueError):
+        bracket_service.confirm_match_result(
+            match_id, participants[winner_index].id
+        )
+
+
+# helpers
+
+
+def get_bracket(tourney_id):
+    return json.loads(bracket_service.get_bracket_json(tourney_id))
+
+
+def get_match_ids(tourney_id):
+    return [
+        UUID(match['match_id'])
+        for match in get_bracket(tourney_id)['matches']
+    ]
+
+
+def get_participant_ids(match):
+    return [
+        (participant['id'] if (participant is not None) else None)
+        for participant in match['participants']
+    ]
@@ -0,0 +1,40 @@
+"""
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import datetime
+
+import pytest
+
+from byceps.services.tourney import (
+    category_service,
+    participant_service,
+    tourney_service,
+)
+
+from tests.helpers import generate_token
+
+
+@pytest.fixture(scope='package')
+def tourney_category(admin_app, party):
+    return category_service.create_category(party.id, 'Shooter')
+
+
+@pytest.fixture
+def tourney(tourney_category):
+    return tourney_service.create_tourney(
+        tourney_category.party_id,
+        generate_token(),
+        tourney_category.id,
+        8,
+        datetime(2022, 8, 20, 18, 0, 0),
+    )
+
+
+@pytest.fixture
+def participants(tourney):
+    return [
+        participant_service.create_participant(tourney.id, f'Team {i}', 5)
+        for i in range(1, 5)
+    ]
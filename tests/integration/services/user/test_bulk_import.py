@@ -0,0 +1,107 @@
+"""
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import json
+
+from byceps.services.authentication.password import (
+    service as password_service,
+)
+from byceps.services.user import (
+    bulk_import_service,
+    log_service,
+    service as user_service,
+)
+
+from tests.helpers import generate_token
+
+
+def test_bulk_import(admin_app, make_user, tmp_path):
+    existing_user = make_user()
+
+    suffix = generate_token()
+    screen_name1 = f'Imported1-{suffix}'
+    screen_name2 = f'Imported2-{suffix}'
+
+    lines = [
+        _to_json_line(screen_name1, f'one-{suffix}@users.test'),
+        'not JSON',
+        _to_json_line(existing_user.screen_name.upper(), None),
+        _to_json_line(screen_name2, f'TWO-{suffix}@users.test'),
+        _to_json_line(screen_name2.lower(), None),
+    ]
+
+    checkpoint_file = tmp_path / 'checkpoint'
+
+    results = list(
+        bulk_import_service.import_users(
+            lines, batch_size=2, checkpoint_file=checkpoint_file, max_workers=2
+        )
+    )
+
+    assert [result.line_number for result in results] == [1, 2, 3, 4, 5]
+    assert [result.succeeded for result in results] == [
+        True,
+        False,
+        False,
+        True,
+        False,
+    ]
+    assert 'already in use' in results[2].error
+    assert 'already in use' in results[4].error
+
+    assert checkpoint_file.read_text() == '5\n'
+
+    user1 = user_service.find_user_by_screen_name(screen_name1)
+    assert user1 is not None
+    assert user_service.get_email_address(user1.id) == f'one-{suffix}@users.test'
+    assert user_service.get_detail(user1.id).first_name == 'Jane'
+
+    user2 = user_service.find_user_by_screen_name(screen_name2)
+    assert user2 is not None
+    assert user_service.get_email_address(user2.id) == f'two-{suffix}@users.test'
+
+    for user in [user1, user2]:
+        credential = password_service._find_credential_for_user(user.id)
+        assert password_service.is_password_hash_current(
+            credential.password_hash
+        )
+
+        log_entries = log_service.get_entries_for_user(user.id)
+        assert [entry.event_type for entry in log_entries] == ['user-created']
+
+
+def test_bulk_import_resumes_from_checkpoint(admin_app, tmp_path):
+    suffix = generate_token()
+    screen_name1 = f'Skipped-{suffix}'
+    screen_name2 = f'Resumed-{suffix}'
+
+    lines = [
+        _to_json_line(screen_name1, None),
+        _to_json_line(screen_name2, None),
+    ]
+
+    checkpoint_file = tmp_path / 'checkpoint'
+    checkpoint_file.write_text('1\n')
+
+    results = list(
+        bulk_import_service.import_users(
+            lines, checkpoint_file=checkpoint_file, max_workers=1
+        )
+    )
+
+    assert [result.line_number for result in results] == [2]
+    assert user_service.find_user_by_screen_name(screen_name1) is None
+    assert user_service.find_user_by_screen_name(screen_name2) is not None
+    assert checkpoint_file.read_text() == '2\n'
+
+
+def _to_json_line(screen_name, email_address) -> str:
+    return json.dumps(
+        {
+            'screen_name': screen_name,
+            'email_address': email_address,
+            'first_name': 'Jane',
+        }
+    )
@@ -0,0 +1,68 @@
+"""
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from uuid import UUID
+
+from byceps.services.user import loader_service
+from byceps.services.user import service as user_service
+from byceps.services.user.loader_service import UserLoader
+
+
+def test_get_users(admin_app, make_user):
+    user1 = make_user()
+    user2 = make_user()
+    unknown_user_id = UUID('00000000-0000-0000-0000-000000000002')
+
+    loader = UserLoader()
+
+    actual = loader.get_users({user1.id, user2.id, unknown_user_id})
+
+    assert actual.keys() == {user1.id, user2.id}
+    assert actual[user1.id].screen_name == user1.screen_name
+    assert actual[user2.id].screen_name == user2.screen_name
+
+
+def test_users_are_loaded_only_once(
+    admin_app, make_user, monkeypatch
+):
+    user1 = make_user()
+    user2 = make_user()
+    user3 = make_user()
+
+    query_count = 0
+    original_get_user_query = user_service.get_user_query
+
+    def get_user_query(include_avatar):
+        nonlocal query_count
+        query_count += 1
+        return original_get_user_query(include_avatar)
+
+    monkeypatch.setattr(user_service, 'get_user_query', get_user_query)
+
+    loader = UserLoader()
+
+    loader.get_users({user1.id, user2.id})
+    assert query_count == 1
+
+    # Both users have already been loaded.
+    actual = loader.get_users({user2.id, user1.id})
+    assert actual.keys() == {user1.id, user2.id}
+    assert query_count == 1
+
+    # Only the third user needs to be loaded.
+    actual = loader.get_users({user1.id, user3.id})
+    assert actual.keys() == {user1.id, user3.id}
+    assert query_count == 2
+
+
+def test_get_loader_is_request_scoped(admin_app):
+    with admin_app.test_request_context():
+        assert loader_service.get_loader() is loader_service.get_loader()
+
+    with admin_app.test_request_context():
+        loader = loader_service.get_loader()
+
+    with admin_app.test_request_context():
+        assert loader_service.get_loader() is not loader
@@ -7,6 +7,7 @@ from pathlib import Path
 
 import pytest
 
+from byceps.services.user_avatar.dbmodels import DERIVATIVE_SIZES
 from byceps.services.user_avatar import service as user_avatar_service
 from byceps.util.image.models import ImageType
 
@@ -29,3 +30,22 @@ def test_path(data_path, site_app, user, image_extension, image_type):
     expected = data_path / 'global' / 'users' / 'avatars' / expected_filename
 
     assert avatar.path == expected
+
+
+def test_derivatives(data_path, site_app, user):
+    with Path('tests/fixtures/images/image.png').open('rb') as f:
+        avatar_id = user_avatar_service.update_avatar_image(
+            user.id, f, {ImageType.png}
+        )
+
+    # Jobs are run synchronously in tests.
+    avatar = user_avatar_service.get_db_avatar(avatar_id)
+    assert avatar.derivatives_rendered
+
+    for size in DERIVATIVE_SIZES:
+        for image_type in [ImageType.png, ImageType.webp]:
+            assert avatar.get_derivative_path(size, image_type).exists()
+
+    assert user_avatar_service.get_avatar_url_for_user(
+        user.id, size=48
+    ) == f'/data/global/users/avatars/{avatar.id}_48.png'
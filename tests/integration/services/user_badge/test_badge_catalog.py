@@ -0,0 +1,32 @@
+"""
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.services.user_badge import badge_service
+
+
+def test_catalog_reflects_changes(site_app):
+    badge = badge_service.create_badge('first-blood', 'First Blood', 'fb.svg')
+
+    assert badge_service.get_badges({badge.id}) == {badge}
+    assert badge_service.get_badges({badge.id}, featured_only=True) == set()
+
+    updated_badge = badge_service.update_badge(
+        badge.id,
+        badge.slug,
+        'First Blood!',
+        badge.description,
+        badge.image_filename,
+        badge.brand_id,
+        True,
+    )
+
+    assert badge_service.get_badges({badge.id}) == {updated_badge}
+    assert badge_service.get_badges({badge.id}, featured_only=True) == {
+        updated_badge
+    }
+
+    badge_service.delete_badge(badge.id)
+
+    assert badge_service.get_badges({badge.id}) == set()
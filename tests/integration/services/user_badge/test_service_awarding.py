@@ -180,5 +180,31 @@ def test_get_awardings_of_badge(
     }
 
 
+def test_get_badges_awarded_to_users(site_app, make_user, badge1, badge2):
+    user_a = make_user()
+    user_b = make_user()
+    user_c = make_user()
+
+    awarding_service.award_badge_to_user(badge1.id, user_a.id)
+
+    # Fill the cache.
+    actual = awarding_service.get_badges_awarded_to_users(
+        {user_a.id, user_b.id, user_c.id}
+    )
+    assert actual == {user_a.id: {badge1}}
+
+    # Awarding must be reflected, even though the sets are cached.
+    awarding_service.award_badge_to_user(badge2.id, user_a.id)
+    awarding_service.award_badge_to_user(badge2.id, user_b.id)
+
+    actual = awarding_service.get_badges_awarded_to_users(
+        {user_a.id, user_b.id, user_c.id}
+    )
+    assert actual == {
+        user_a.id: {badge1, badge2},
+        user_b.id: {badge2},
+    }
+
+
 def _create_badge(slug, label):
     return badge_service.create_badge(slug, label, f'{slug}.svg')
@@ -0,0 +1,110 @@
+"""
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import datetime
+
+import pytest
+
+from byceps.services.consent import consent_service, subject_service
+from byceps.services.user import log_service as user_log_service
+from byceps.services.user_timeline import timeline_service
+
+
+@pytest.fixture(scope='module')
+def timeline_user(make_user):
+    return make_user()
+
+
+@pytest.fixture(scope='module')
+def log_entries(admin_app, timeline_user, admin_user):
+    user_id = timeline_user.id
+    initiator_id = str(admin_user.id)
+
+    for day, event_type in [
+        (1, 'user-details-updated'),
+        (2, 'user-logged-in'),
+        (4, 'user-suspended'),
+        (5, 'user-logged-in'),
+    ]:
+        user_log_service.create_entry(
+            event_type,
+            user_id,
+            {'initiator_id': initiator_id},
+            occurred_at=datetime(2022, 4, day, 12, 0, 0),
+        )
+
+    subject = subject_service.create_subject(
+        'timeline-terms', 'Timeline Terms', 'Terms', None
+    )
+    consent_service.consent_to_subject(
+        user_id, subject.id, datetime(2022, 4, 3, 12, 0, 0)
+    )
+
+
+# The entry for the creation of the account (logged when the user was
+# created for the tests) is the most recent one.
+EXPECTED_EVENT_TYPES = [
+    'user-created',
+    'user-logged-in',
+    'user-suspended',
+    'consent-expressed',
+    'user-logged-in',
+    'user-details-updated',
+]
+
+
+def test_entries_are_merged_newest_first(log_entries, timeline_user):
+    page = timeline_service.get_page(timeline_user.id)
+
+    assert _get_event_types(page) == EXPECTED_EVENT_TYPES
+    assert page.next_cursor is None
+
+    consent_entry = page.entries[3]
+    assert consent_entry.data['subject_title'] == 'Timeline Terms'
+    assert consent_entry.initiator.id == timeline_user.id
+
+
+def test_initiators_are_resolved(log_entries, timeline_user, admin_user):
+    page = timeline_service.get_page(timeline_user.id)
+
+    assert page.entries[0].initiator is None
+    assert page.entries[1].initiator.id == admin_user.id
+
+
+def test_pages_follow_each_other(log_entries, timeline_user):
+    event_types = []
+    cursor = None
+
+    for _ in range(3):
+        page = timeline_service.get_page(
+            timeline_user.id, cursor=cursor, limit=2
+        )
+        event_types.extend(_get_event_types(page))
+        cursor = page.next_cursor
+
+    assert event_types == EXPECTED_EVENT_TYPES
+    assert cursor is None
+
+
+def test_exclude_event_types(log_entries, timeline_user):
+    page = timeline_service.get_page(
+        timeline_user.id, exclude_event_types=frozenset(['user-logged-in'])
+    )
+
+    assert _get_event_types(page) == [
+        'user-created',
+        'user-suspended',
+        'consent-expressed',
+        'user-details-updated',
+    ]
+
+
+def test_invalid_cursor(admin_app, timeline_user):
+    with pytest.raises(ValueError):
+        timeline_service.get_page(timeline_user.id, cursor='invalid')
+
+
+def _get_event_types(page):
+    return [entry.event_type for entry in page.entries]
@@ -0,0 +1,35 @@
+"""
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.application import create_app
+
+from tests.helpers import CONFIG_FILENAME_TESTING
+
+
+def test_startup_phases_of_admin_app(admin_app):
+    phase_names = [phase.name for phase in admin_app.startup_phases]
+
+    assert phase_names == [
+        'configuration',
+        'extensions',
+        'permissions',
+        'blueprints',
+        'templating',
+        'admin',
+        'announcements',
+    ]
+
+
+def test_worker_app_registers_no_blueprints(admin_app):
+    app = create_app(
+        config_filename=CONFIG_FILENAME_TESTING,
+        config_overrides={'APP_MODE': 'worker'},
+    )
+
+    phase_names = {phase.name for phase in app.startup_phases}
+    assert 'blueprints' not in phase_names
+    assert 'permissions' not in phase_names
+
+    assert app.blueprints == {}
@@ -0,0 +1,101 @@
+"""
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import timedelta
+from secrets import token_hex
+
+import pytest
+
+from byceps.util.jobqueue import (
+    connection,
+    enqueue,
+    enqueue_coalesced,
+    enqueue_unique,
+    get_queue,
+    QUEUE_BULK,
+    QUEUE_EMAIL,
+)
+
+
+calls = []
+
+
+def record_call(value) -> None:
+    calls.append(value)
+
+
+def record_call_with_label(value, label: str) -> None:
+    calls.append((value, label))
+
+
+def test_get_queue_by_name(admin_app):
+    with connection():
+        queue = get_queue(admin_app, QUEUE_EMAIL)
+
+    assert queue.name == QUEUE_EMAIL
+
+
+def test_get_queue_with_unknown_name(admin_app):
+    with connection():
+        with pytest.raises(ValueError):
+            get_queue(admin_app, 'urgent-ish')
+
+
+def test_enqueue_on_named_queue(admin_app):
+    calls.clear()
+
+    # Jobs are executed right away as `JOBS_ASYNC` is disabled in tests.
+    enqueue(record_call, 'resize', queue_name=QUEUE_BULK)
+
+    assert calls == ['resize']
+
+
+def test_enqueue_unique_drops_duplicates_within_window(admin_app):
+    calls.clear()
+    dedupe_key = f'test:{token_hex(4)}'
+    window = timedelta(minutes=1)
+
+    assert enqueue_unique(dedupe_key, window, record_call, 'first')
+    assert not enqueue_unique(dedupe_key, window, record_call, 'second')
+
+    assert calls == ['first']
+
+
+def test_enqueue_unique_with_different_keys(admin_app):
+    calls.clear()
+    window = timedelta(minutes=1)
+
+    assert enqueue_unique(f'test:{token_hex(4)}', window, record_call, 'a')
+    assert enqueue_unique(f'test:{token_hex(4)}', window, record_call, 'b')
+
+    assert calls == ['a', 'b']
+
+
+def test_enqueue_coalesced(admin_app):
+    calls.clear()
+    dedupe_key = f'test:{token_hex(4)}'
+    window = timedelta(minutes=1)
+
+    # The first item is passed on right away. Further items within the
+    # window are collected, but the job to pass them on is executed
+    # right away (instead of at the end of the window) as `JOBS_ASYNC`
+    # is disabled in tests, so each one gets the items collected up to
+    # then.
+    enqueue_coalesced(dedupe_key, window, record_call, 'item1')
+    enqueue_coalesced(dedupe_key, window, record_call, 'item2')
+    enqueue_coalesced(dedupe_key, window, record_call, 'item3')
+
+    assert calls == [['item1'], ['item2'], ['item3']]
+
+
+def test_enqueue_coalesced_keeps_arguments_per_item(admin_app):
+    calls.clear()
+    dedupe_key = f'test:{token_hex(4)}'
+    window = timedelta(minutes=1)
+
+    enqueue_coalesced(dedupe_key, window, record_call_with_label, 'a', 'x')
+    enqueue_coalesced(dedupe_key, window, record_call_with_label, 'b', 'y')
+
+    assert calls == [(['a'], 'x'), (['b'], 'y')]
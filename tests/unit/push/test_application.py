@@ -0,0 +1,227 @@
+"""
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import asyncio
+
+from byceps.push.application import create_app, PushConfig, Subscriber
+
+
+TOPIC = 'party:acmecon-2022'
+
+
+def test_subscriber_overflows_when_queue_is_full():
+    async def run():
+        subscriber = Subscriber(frozenset([TOPIC]), queue_size=2)
+
+        subscriber.offer(b'1')
+        subscriber.offer(b'2')
+        assert not subscriber.overflowed.is_set()
+
+        subscriber.offer(b'3')
+        assert subscriber.overflowed.is_set()
+
+        assert subscriber.take_frames(await subscriber.queue.get()) == b'12'
+
+    asyncio.run(run())
+
+
+def test_dispatch_only_to_subscribers_of_topic():
+    async def run():
+        app = _create_app()
+        subscriber1 = Subscriber(frozenset([TOPIC]), queue_size=10)
+        subscriber2 = Subscriber(frozenset(['party:other']), queue_size=10)
+        app.hub.add(subscriber1)
+        app.hub.add(subscriber2)
+
+        app.hub.dispatch(TOPIC, b'{"event":"tickets-sold"}')
+
+        assert subscriber1.queue.get_nowait() == (
+            b'data: {"event":"tickets-sold"}\n\n'
+        )
+        assert subscriber2.queue.empty()
+
+        app.hub.remove(subscriber1)
+        app.hub.remove(subscriber2)
+        assert app.hub.subscriber_count == 0
+
+    asyncio.run(run())
+
+
+def test_unknown_path():
+    status, _ = asyncio.run(_request(_create_app(), '/nope', b''))
+    assert status == 404
+
+
+def test_request_without_topic():
+    status, _ = asyncio.run(_request(_create_app(), '/events', b''))
+    assert status == 400
+
+
+def test_request_with_invalid_topic():
+    status, _ = asyncio.run(
+        _request(_create_app(), '/events', b'topic=user:admin')
+    )
+    assert status == 400
+
+
+def test_request_with_too_many_topics():
+    app = _create_app(max_topics_per_connection=1)
+    query_string = b'topic=party:one&topic=party:two'
+
+    status, _ = asyncio.run(_request(app, '/events', query_string))
+
+    assert status == 400
+
+
+def test_request_beyond_connection_limit():
+    app = _create_app(max_connections=0)
+
+    query_string = b'topic=' + TOPIC.encode()
+
+    status, _ = asyncio.run(_request(app, '/events', query_string))
+
+    assert status == 503
+
+
+def test_stream_messages_until_disconnect():
+    async def run():
+        app = _create_app()
+        disconnect = asyncio.Event()
+        sent = []
+
+        async def receive():
+            await disconnect.wait()
+            return {'type': 'http.disconnect'}
+
+        async def send(message):
+            sent.append(message)
+
+        scope = _build_scope('/events', b'topic=' + TOPIC.encode())
+        request = asyncio.create_task(app(scope, receive, send))
+
+        await _wait_until(lambda: app.hub.subscriber_count == 1)
+        app.hub.dispatch(TOPIC, b'{"event":"ticket-checked-in"}')
+        app.hub.dispatch('party:other', b'{"event":"tickets-sold"}')
+        await _wait_until(lambda: len(sent) == 3)
+
+        disconnect.set()
+        await request
+
+        assert app.hub.subscriber_count == 0
+        return sent
+
+    sent = asyncio.run(run())
+
+    assert sent[0]['status'] == 200
+    assert (b'content-type', b'text/event-stream') in sent[0]['headers']
+    assert sent[1]['body'] == b'retry: 5000\n\n'
+    assert sent[2]['body'] == b'data: {"event":"ticket-checked-in"}\n\n'
+
+
+def test_disconnect_slow_client():
+    async def run():
+        app = _create_app(queue_size=1)
+        sent = []
+
+        async def receive():
+            await asyncio.Event().wait()  # never disconnect
+
+        async def send(message):
+            sent.append(message)
+            # Be slow to receive the first message.
+            if message.get('body', b'').startswith(b'data:'):
+                await asyncio.sleep(0.1)
+
+        scope = _build_scope('/events', b'topic=' + TOPIC.encode())
+        request = asyncio.create_task(app(scope, receive, send))
+
+        await _wait_until(lambda: app.hub.subscriber_count == 1)
+        for _ in range(3):
+            app.hub.dispatch(TOPIC, b'{}')
+            await asyncio.sleep(0)
+
+        await asyncio.wait_for(request, timeout=1)
+        return sent
+
+    sent = asyncio.run(run())
+
+    last_message = sent[-1]
+    assert last_message['body'] == b''
+    assert not last_message.get('more_body', False)
+
+
+def test_disconnect_slow_client_under_sustained_load():
+    async def run():
+        app = _create_app(queue_size=2)
+        sent = []
+
+        async def receive():
+            await asyncio.Event().wait()  # never disconnect
+
+        async def send(message):
+            sent.append(message)
+            await asyncio.sleep(0.001)
+
+        scope = _build_scope('/events', b'topic=' + TOPIC.encode())
+        request = asyncio.create_task(app(scope, receive, send))
+
+        await _wait_until(lambda: app.hub.subscriber_count == 1)
+
+        # Keep frames coming faster than the client takes them.
+        while not request.done():
+            for _ in range(5):
+                app.hub.dispatch(TOPIC, b'{}')
+            await asyncio.sleep(0)
+
+        await asyncio.wait_for(request, timeout=1)
+        return sent
+
+    sent = asyncio.run(asyncio.wait_for(run(), timeout=5))
+
+    last_message = sent[-1]
+    assert last_message['body'] == b''
+    assert not last_message.get('more_body', False)
+
+
+# helpers
+
+
+def _create_app(**config_kwargs):
+    app = create_app('redis://127.0.0.1:6379/0', PushConfig(**config_kwargs))
+    # Do not subscribe to Redis.
+    app.hub.start = lambda: None
+    return app
+
+
+def _build_scope(path, query_string):
+    return {
+        'type': 'http',
+        'method': 'GET',
+        'path': path,
+        'query_string': query_string,
+        'headers': [],
+    }
+
+
+async def _request(app, path, query_string):
+    sent = []
+
+    async def receive():
+        return {'type': 'http.disconnect'}
+
+    async def send(message):
+        sent.append(message)
+
+    await app(_build_scope(path, query_string), receive, send)
+
+    return sent[0]['status'], sent[1]['body']
+
+
+async def _wait_until(predicate):
+    for _ in range(100):
+        if predicate():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError('Condition not met in time.')
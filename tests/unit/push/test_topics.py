@@ -0,0 +1,40 @@
+"""
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import pytest
+
+from byceps.push.topics import build_channel, build_topic, is_valid_topic
+
+
+@pytest.mark.parametrize(
+    'topic, expected',
+    [
+        ('party:acmecon-2022', True),
+        ('board_topic:5b9f4c0b-8d0b-4c8e-9d4c-1f3f5b0c9a2e', True),
+        ('tourney_match:abc123', True),
+        ('party:', False),
+        ('party', False),
+        ('unknown:abc', False),
+        ('party:acme con', False),
+        ('party:acmecon\n', False),
+        ('party:acmecon\ndata: injected', False),
+        ('party:' + 'x' * 65, False),
+    ],
+)
+def test_is_valid_topic(topic, expected):
+    assert is_valid_topic(topic) == expected
+
+
+def test_build_topic():
+    assert build_topic('seating_area', 'hall-a') == 'seating_area:hall-a'
+
+
+def test_build_topic_with_unknown_kind():
+    with pytest.raises(ValueError):
+        build_topic('user', 'abc')
+
+
+def test_build_channel():
+    assert build_channel('party:acme') == 'byceps:push:party:acme'
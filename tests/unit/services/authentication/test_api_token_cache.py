@@ -0,0 +1,75 @@
+"""
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import datetime
+from unittest.mock import Mock
+from uuid import UUID
+
+from byceps.services.authentication.api.token_cache import TokenCache
+from byceps.services.authentication.api.transfer.models import ApiToken
+
+
+API_TOKEN = ApiToken(
+    id=UUID('1ffb6b59-58d9-4a78-bca4-1d66f67b1d4c'),
+    created_at=datetime(2022, 8, 1, 12, 0, 0),
+    creator_id=UUID('b3ec1a3c-4e2b-4cb0-8b83-a8b7b1ef8b23'),
+    token='dummy-token',
+    permissions=frozenset(['tourney.view']),
+    description=None,
+    suspended=False,
+)
+
+
+def test_get_or_load_caches_token():
+    cache = TokenCache()
+    loader = Mock(return_value=API_TOKEN)
+
+    assert cache.get_or_load('dummy-token', loader, 60) == API_TOKEN
+    assert cache.get_or_load('dummy-token', loader, 60) == API_TOKEN
+
+    loader.assert_called_once_with('dummy-token')
+
+
+def test_get_or_load_does_not_cache_unknown_token():
+    cache = TokenCache()
+    loader = Mock(return_value=None)
+
+    assert cache.get_or_load('unknown-token', loader, 60) is None
+    assert cache.get_or_load('unknown-token', loader, 60) is None
+
+    assert loader.call_count == 2
+
+
+def test_expired_token_is_reloaded():
+    cache = TokenCache()
+    loader = Mock(return_value=API_TOKEN)
+
+    cache.get_or_load('dummy-token', loader, 0)
+    cache.get_or_load('dummy-token', loader, 0)
+
+    assert loader.call_count == 2
+
+
+def test_evict():
+    cache = TokenCache()
+    loader = Mock(return_value=API_TOKEN)
+
+    cache.get_or_load('dummy-token', loader, 60)
+    cache.evict(API_TOKEN.id)
+
+    assert cache.get('dummy-token') is None
+
+
+def test_token_evicted_while_loading_is_not_cached():
+    cache = TokenCache()
+
+    def load_and_get_evicted(token):
+        cache.evict(API_TOKEN.id)
+        return API_TOKEN
+
+    api_token = cache.get_or_load('dummy-token', load_and_get_evicted, 60)
+
+    assert api_token == API_TOKEN
+    assert cache.get('dummy-token') is None
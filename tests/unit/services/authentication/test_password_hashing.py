@@ -0,0 +1,77 @@
+"""
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import pytest
+
+from byceps.services.authentication.password import hashing, hashing_pool
+
+
+@pytest.mark.parametrize(
+    'method, expected',
+    [
+        ('pbkdf2:sha256:320000', 'pbkdf2:sha256:320000'),
+        ('pbkdf2:sha256', 'pbkdf2:sha256:260000'),
+        ('scrypt', 'scrypt:32768:8:1'),
+        ('scrypt:16384:8:2', 'scrypt:16384:8:2'),
+    ],
+)
+def test_normalize_method(method, expected):
+    assert hashing.normalize_method(method) == expected
+
+
+@pytest.mark.parametrize(
+    'method',
+    [
+        'pbkdf2:sha256:1000',
+        'scrypt:1024:8:1',
+    ],
+)
+def test_generate_and_check_password_hash(method):
+    password_hash = hashing.generate_password_hash('hunter2', method)
+
+    assert password_hash.startswith(hashing.normalize_method(method) + '$')
+    assert hashing.check_password_hash(password_hash, 'hunter2')
+    assert not hashing.check_password_hash(password_hash, 'hunter3')
+
+
+def test_check_scrypt_hash_in_werkzeug_format():
+    password_hash = (
+        'scrypt:1024:8:1$pV7v6aVKm0OXbXRE$'
+        '8dc9662c67fa744745fc38eed6b2c1ca8afd93fcad523ef1f83195a7a7034e30'
+        'bb7c92e03d3b7f3ee9422fe44d3a17b39bdccbd61b8359327156e2d99250a6b7'
+    )
+
+    assert hashing.check_password_hash(password_hash, 'hunter2')
+    assert not hashing.check_password_hash(password_hash, 'hunter3')
+
+
+@pytest.mark.parametrize(
+    'password_hash',
+    [
+        'scrypt:1024:8$nope',
+        'scrypt:1000:8:1$pV7v6aVKm0OXbXRE$00',  # n not a power of two
+        'scrypt:1024:0:1$pV7v6aVKm0OXbXRE$00',
+        'scrypt:1024:8:0$pV7v6aVKm0OXbXRE$00',
+        'scrypt:1073741824:8:1$pV7v6aVKm0OXbXRE$00',  # too much memory
+        'scrypt:1024:8:1073741824$pV7v6aVKm0OXbXRE$00',  # too much memory
+    ],
+)
+def test_check_malformed_scrypt_hash(password_hash):
+    assert not hashing.check_password_hash(password_hash, 'hunter2')
+
+
+def test_generate_password_hash_with_excessive_scrypt_parameters():
+    with pytest.raises(ValueError):
+        hashing.generate_password_hash('hunter2', 'scrypt:1073741824:8:1')
+
+
+def test_run_outside_of_app_context():
+    password_hash = hashing_pool.run(
+        'hash', hashing.generate_password_hash, 'hunter2', 'pbkdf2:sha256:1000'
+    )
+
+    assert hashing_pool.run(
+        'verify', hashing.check_password_hash, password_hash, 'hunter2'
+    )
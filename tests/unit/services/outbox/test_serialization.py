@@ -0,0 +1,105 @@
+"""
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import datetime
+from uuid import UUID
+
+import pytest
+
+from byceps.events.board import BoardPostingCreated
+from byceps.events.snippet import SnippetUpdated
+from byceps.events.tourney import TourneyMatchReady
+from byceps.services.outbox.serialization import (
+    deserialize_event,
+    get_event_type_name,
+    serialize_event,
+    UnknownEventType,
+)
+from byceps.services.snippet.transfer.models import Scope, SnippetType
+
+
+OCCURRED_AT = datetime(2022, 8, 20, 17, 55, 13, 123456)
+USER_ID = UUID('d3e4d5a8-6f3a-4b5e-9a0e-c2b0a3f0e7a1')
+
+
+def test_round_trip_with_new_types_and_optional_values():
+    event = BoardPostingCreated(
+        occurred_at=OCCURRED_AT,
+        initiator_id=USER_ID,
+        initiator_screen_name='Poster',
+        board_id='acme-2022-board',
+        posting_id=UUID('6b3b7b2e-7f5c-4c1e-a4a6-8f8a1c0b9d11'),
+        posting_creator_id=USER_ID,
+        posting_creator_screen_name='Poster',
+        topic_id=UUID('0b0e4b8e-2d5d-4b6f-8f4e-7c1e0a9b3c22'),
+        topic_title='Seating plan',
+        topic_muted=False,
+        url=None,
+    )
+
+    actual = _round_trip(event)
+
+    assert actual == event
+    assert isinstance(actual.posting_id, UUID)
+
+
+def test_round_trip_with_nested_dataclass_and_enum():
+    event = SnippetUpdated(
+        occurred_at=OCCURRED_AT,
+        initiator_id=USER_ID,
+        initiator_screen_name='Editor',
+        snippet_id=UUID('f1d1f3c4-5c4d-4f5e-8a8b-3e0f1a2b3c44'),
+        scope=Scope.for_site('acme-2022-website'),
+        snippet_name='info',
+        snippet_type=SnippetType.fragment,
+        snippet_version_id=UUID('a1b2c3d4-e5f6-4a7b-8c9d-0e1f2a3b4c55'),
+    )
+
+    assert _round_trip(event) == event
+
+
+def test_round_trip_without_initiator():
+    event = TourneyMatchReady(
+        occurred_at=OCCURRED_AT,
+        initiator_id=None,
+        initiator_screen_name=None,
+        tourney_id='tourney-1',
+        tourney_title='Tourney 1',
+        match_id='match-1',
+        participant1_id='participant-1',
+        participant1_name='Team One',
+        participant2_id=None,
+        participant2_name=None,
+    )
+
+    assert _round_trip(event) == event
+
+
+def test_get_event_type_name():
+    event = TourneyMatchReady(
+        OCCURRED_AT, None, None, 't', 'T', 'm', None, None, None, None
+    )
+
+    assert get_event_type_name(event) == 'tourney.TourneyMatchReady'
+
+
+@pytest.mark.parametrize(
+    'event_type_name',
+    [
+        'tourney.Unknown',
+        'unknown.TourneyMatchReady',
+        'base.dataclass',
+        '..application.create_app',
+        'TourneyMatchReady',
+    ],
+)
+def test_deserialize_unknown_event_type(event_type_name):
+    with pytest.raises(UnknownEventType):
+        deserialize_event(event_type_name, {})
+
+
+def _round_trip(event):
+    data = serialize_event(event)
+    return deserialize_event(get_event_type_name(event), data)
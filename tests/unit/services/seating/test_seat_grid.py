@@ -0,0 +1,144 @@
+"""
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from math import hypot
+import random
+from uuid import uuid4
+
+import pytest
+
+from byceps.services.seating.seat_grid import SeatGrid
+from byceps.services.seating.transfer.models import AreaID, Seat, SeatID
+from byceps.services.ticketing.transfer.models import TicketCategoryID
+
+
+AREA_ID = AreaID(uuid4())
+CATEGORY_ID = TicketCategoryID(uuid4())
+
+
+@pytest.fixture(scope='module')
+def seats():
+    generator = random.Random(42)
+    return [
+        create_seat(generator.randrange(2000), generator.randrange(1500))
+        for _ in range(2000)
+    ]
+
+
+@pytest.mark.parametrize('cell_size', [None, 1, 37, 5000])
+def test_get_seats_in_region(seats, cell_size):
+    grid = SeatGrid(seats, cell_size=cell_size)
+
+    actual = grid.get_seats_in_region(400, 300, 799, 599)
+
+    expected = sorted(
+        (
+            seat
+            for seat in seats
+            if (400 <= seat.coord_x <= 799) and (300 <= seat.coord_y <= 599)
+        ),
+        key=lambda seat: (seat.coord_y, seat.coord_x),
+    )
+    assert actual == expected
+
+
+def test_get_seats_in_region_includes_edges():
+    seat1 = create_seat(10, 10)
+    seat2 = create_seat(20, 20)
+    seat3 = create_seat(21, 20)
+    grid = SeatGrid([seat1, seat2, seat3], cell_size=5)
+
+    assert grid.get_seats_in_region(10, 10, 20, 20) == [seat1, seat2]
+
+
+def test_get_seats_in_region_outside_of_seats(seats):
+    grid = SeatGrid(seats)
+
+    assert grid.get_seats_in_region(-500, -500, -1, -1) == []
+
+
+@pytest.mark.parametrize('cell_size', [None, 1, 37, 5000])
+def test_iter_nearest_seats(seats, cell_size):
+    grid = SeatGrid(seats, cell_size=cell_size)
+
+    actual = list(grid.iter_nearest_seats(1000, 700))
+
+    def get_distance(seat: Seat) -> float:
+        return hypot(seat.coord_x - 1000, seat.coord_y - 700)
+
+    assert len(actual) == len(seats)
+    assert set(actual) == set(seats)
+    distances = [get_distance(seat) for seat in actual]
+    assert distances == sorted(distances)
+
+
+def test_iter_nearest_seats_from_outside(seats):
+    grid = SeatGrid(seats)
+
+    actual = next(grid.iter_nearest_seats(-1000, -1000))
+
+    expected = min(
+        seats, key=lambda seat: hypot(seat.coord_x + 1000, seat.coord_y + 1000)
+    )
+    assert actual == expected
+
+
+def test_iter_nearest_seats_from_far_away(seats):
+    grid = SeatGrid(seats, cell_size=1)
+
+    actual = list(grid.iter_nearest_seats(10**9, -(10**9)))
+
+    assert len(actual) == len(seats)
+    assert actual[0] == min(
+        seats,
+        key=lambda seat: hypot(seat.coord_x - 10**9, seat.coord_y + 10**9),
+    )
+
+
+@pytest.mark.parametrize('cell_size', [None, 1, 37])
+@pytest.mark.parametrize('x, y', [(0, 0), (1999, 750), (-300, 5000)])
+def test_iter_nearest_seats_matches_sorting(seats, cell_size, x, y):
+    grid = SeatGrid(seats, cell_size=cell_size)
+
+    actual = list(grid.iter_nearest_seats(x, y))
+
+    expected = sorted(
+        seats,
+        key=lambda seat: (
+            hypot(seat.coord_x - x, seat.coord_y - y),
+            seat.coord_y,
+            seat.coord_x,
+        ),
+    )
+    assert actual == expected
+
+
+def test_empty_grid():
+    grid = SeatGrid([])
+
+    assert len(grid) == 0
+    assert grid.get_seats_in_region(0, 0, 100, 100) == []
+    assert list(grid.iter_nearest_seats(0, 0)) == []
+
+
+def test_cell_size_must_be_positive():
+    with pytest.raises(ValueError):
+        SeatGrid([], cell_size=0)
+
+
+# helpers
+
+
+def create_seat(coord_x: int, coord_y: int) -> Seat:
+    return Seat(
+        id=SeatID(uuid4()),
+        area_id=AREA_ID,
+        coord_x=coord_x,
+        coord_y=coord_y,
+        rotation=None,
+        category_id=CATEGORY_ID,
+        label=None,
+        type_=None,
+    )
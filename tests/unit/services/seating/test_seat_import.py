@@ -0,0 +1,193 @@
+"""
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from typing import Optional
+from uuid import uuid4
+
+import pytest
+
+from byceps.services.seating.seat_import import (
+    diff_layout,
+    read_seats_from_csv,
+    read_seats_from_json_lines,
+    SeatImportError,
+    SeatToImport,
+)
+from byceps.services.seating.transfer.models import AreaID, Seat, SeatID
+from byceps.services.ticketing.transfer.models import TicketCategoryID
+
+
+AREA_ID = AreaID(uuid4())
+CATEGORY_ID_STANDARD = TicketCategoryID(uuid4())
+CATEGORY_ID_PREMIUM = TicketCategoryID(uuid4())
+
+CATEGORY_IDS_BY_TITLE = {
+    'Standard': CATEGORY_ID_STANDARD,
+    'Premium': CATEGORY_ID_PREMIUM,
+}
+
+
+def test_read_seats_from_csv():
+    lines = [
+        'x,y,category,rotation,label,type\n',
+        '10,20,Standard,90,A-1,\n',
+        ' 30 ,20,Premium,, A-2 ,wide\n',
+    ]
+
+    actual = list(read_seats_from_csv(lines))
+
+    assert actual == [
+        SeatToImport(10, 20, 'Standard', 90, 'A-1', None),
+        SeatToImport(30, 20, 'Premium', None, 'A-2', 'wide'),
+    ]
+
+
+def test_read_seats_from_csv_requires_columns():
+    lines = ['x,category\n', '10,Standard\n']
+
+    with pytest.raises(SeatImportError, match='Missing columns: y'):
+        list(read_seats_from_csv(lines))
+
+
+def test_read_seats_from_json_lines():
+    lines = [
+        '{"x": 10, "y": 20, "category": "Standard", "label": "A-1"}\n',
+        '\n',
+        '{"x": 30, "y": 20, "category": "Premium", "rotation": 180}\n',
+    ]
+
+    actual = list(read_seats_from_json_lines(lines))
+
+    assert actual == [
+        SeatToImport(10, 20, 'Standard', None, 'A-1', None),
+        SeatToImport(30, 20, 'Premium', 180, None, None),
+    ]
+
+
+@pytest.mark.parametrize(
+    'line, expected_message',
+    [
+        ('{"x": 10, "y": 20}', 'Line 2: Category is required.'),
+        ('{"x": -1, "y": 20, "category": "Standard"}', 'Line 2: Field "x"'),
+        ('{"x": 1.5, "y": 20, "category": "Standard"}', 'Line 2: Field "x"'),
+        ('{"x": 10, "category": "Standard"}', 'Line 2: Field "y"'),
+        (
+            '{"x": 10, "y": 20, "category": "Standard", "rotation": 360}',
+            'Line 2: Field "rotation"',
+        ),
+        ('{"x": 10, "y": 20, "category": "VIP"}', 'Line 2: Unknown category'),
+        ('[10, 20]', 'Line 2: Seat has to be an object.'),
+        ('{"x": 10,', 'Line 2: Invalid JSON'),
+    ],
+)
+def test_read_invalid_seat(line, expected_message):
+    lines = ['{"x": 0, "y": 0, "category": "Standard"}\n', line]
+
+    with pytest.raises(SeatImportError) as excinfo:
+        list(
+            read_seats_from_json_lines(
+                lines, category_titles=CATEGORY_IDS_BY_TITLE.keys()
+            )
+        )
+
+    assert str(excinfo.value).startswith(expected_message)
+
+
+def test_read_duplicate_label():
+    lines = [
+        'x,y,category,label\n',
+        '10,20,Standard,A-1\n',
+        '30,20,Standard,A-1\n',
+    ]
+
+    with pytest.raises(SeatImportError) as excinfo:
+        list(read_seats_from_csv(lines))
+
+    assert str(excinfo.value) == 'Line 3: Seat "A-1" is a duplicate of line 2.'
+
+
+def test_read_duplicate_position():
+    lines = [
+        'x,y,category,label\n',
+        '10,20,Standard,A-1\n',
+        '10,20,Standard,A-2\n',
+    ]
+
+    with pytest.raises(SeatImportError) as excinfo:
+        list(read_seats_from_csv(lines))
+
+    assert str(excinfo.value) == (
+        'Line 3: Seat "A-2" is at the same position as the seat in line 2.'
+    )
+
+
+def test_diff_layout():
+    unchanged_seat = create_seat(10, 20, CATEGORY_ID_STANDARD, 'A-1')
+    moved_seat = create_seat(30, 20, CATEGORY_ID_STANDARD, 'A-2')
+    recategorized_seat = create_seat(50, 20, CATEGORY_ID_STANDARD, None)
+    removed_seat = create_seat(70, 20, CATEGORY_ID_STANDARD, 'A-4')
+
+    existing_seats = [
+        unchanged_seat,
+        moved_seat,
+        recategorized_seat,
+        removed_seat,
+    ]
+
+    seats_to_import = [
+        SeatToImport(10, 20, 'Standard', None, 'A-1', None),
+        SeatToImport(35, 20, 'Standard', None, 'A-2', None),
+        SeatToImport(50, 20, 'Premium', None, None, None),
+        SeatToImport(90, 20, 'Premium', None, 'A-5', None),
+    ]
+
+    actual = diff_layout(existing_seats, seats_to_import, CATEGORY_IDS_BY_TITLE)
+
+    assert actual.added == [seats_to_import[3]]
+    assert actual.changed == [
+        (moved_seat, seats_to_import[1]),
+        (recategorized_seat, seats_to_import[2]),
+    ]
+    assert actual.removed == [removed_seat]
+    assert actual.unchanged_count == 1
+    assert actual.has_changes
+
+
+def test_diff_layout_without_changes():
+    existing_seats = [create_seat(10, 20, CATEGORY_ID_STANDARD, 'A-1')]
+    seats_to_import = [SeatToImport(10, 20, 'Standard', None, 'A-1', None)]
+
+    actual = diff_layout(existing_seats, seats_to_import, CATEGORY_IDS_BY_TITLE)
+
+    assert not actual.has_changes
+    assert actual.unchanged_count == 1
+
+
+def test_diff_layout_with_unknown_category():
+    seats_to_import = [SeatToImport(10, 20, 'VIP', None, 'A-1', None)]
+
+    with pytest.raises(SeatImportError):
+        diff_layout([], seats_to_import, CATEGORY_IDS_BY_TITLE)
+
+
+# helpers
+
+
+def create_seat(
+    coord_x: int,
+    coord_y: int,
+    category_id: TicketCategoryID,
+    label: Optional[str],
+) -> Seat:
+    return Seat(
+        id=SeatID(uuid4()),
+        area_id=AREA_ID,
+        coord_x=coord_x,
+        coord_y=coord_y,
+        rotation=None,
+        category_id=category_id,
+        label=label,
+        type_=None,
+    )
@@ -0,0 +1,170 @@
+"""
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+from uuid import uuid4
+
+import pytest
+
+from byceps.services.seating.seat_placement import (
+    find_seats,
+    PlacementPreferences,
+)
+from byceps.services.seating.transfer.models import AreaID, Seat, SeatID
+from byceps.services.ticketing.transfer.models import TicketCategoryID
+
+
+AREA_ID = AreaID(uuid4())
+CATEGORY_ID = TicketCategoryID(uuid4())
+
+# Seats are 40 units apart, rows 60 units.
+SEAT_DISTANCE = 40
+ROW_DISTANCE = 60
+
+
+def test_block_in_single_row():
+    # Row 0 has a gap at column 2; row 1 is free.
+    seats = create_seats(
+        {
+            0: [0, 1, 3, 4, 5],
+            1: [0, 1, 2, 3, 4, 5],
+        }
+    )
+
+    actual = find_seats(seats, 4, PlacementPreferences(same_row=True))
+
+    assert get_positions(actual) == [(0, 1), (1, 1), (2, 1), (3, 1)]
+
+
+def test_same_row_requires_enough_adjacent_seats():
+    seats = create_seats({0: [0, 1, 3, 4]})
+
+    assert find_seats(seats, 3, PlacementPreferences(same_row=True)) is None
+
+
+def test_same_row_with_gaps_allowed():
+    seats = create_seats({0: [0, 1, 3, 7]})
+
+    preferences = PlacementPreferences(adjacent=False, same_row=True)
+    actual = find_seats(seats, 3, preferences)
+
+    assert get_positions(actual) == [(0, 0), (1, 0), (3, 0)]
+
+
+def test_cluster_spans_multiple_rows():
+    seats = create_seats(
+        {
+            0: [0, 1, 2, 3, 4, 5, 6, 7],
+            1: [0, 1, 2, 3, 4, 5, 6, 7],
+        }
+    )
+
+    actual = find_seats(seats, 4, PlacementPreferences())
+
+    # A square block is more compact than four seats in a row.
+    columns_by_row = {}
+    for column, row in get_positions(actual):
+        columns_by_row.setdefault(row, []).append(column)
+    assert len(columns_by_row) == 2
+    assert all(
+        columns == list(range(columns[0], columns[0] + 2))
+        for columns in columns_by_row.values()
+    )
+
+
+def test_cluster_is_connected():
+    # Two free seats at the left, three far off at the right.
+    seats = create_seats({0: [0, 1, 10, 11, 12]})
+
+    actual = find_seats(seats, 3, PlacementPreferences())
+
+    assert get_positions(actual) == [(10, 0), (11, 0), (12, 0)]
+
+
+def test_cluster_not_available():
+    seats = create_seats({0: [0, 1, 10, 11]})
+
+    assert find_seats(seats, 3, PlacementPreferences()) is None
+
+
+def test_scattered_seats_are_close_to_each_other():
+    seats = create_seats({0: [0, 2, 4, 20, 30]})
+
+    actual = find_seats(seats, 3, PlacementPreferences(adjacent=False))
+
+    assert get_positions(actual) == [(0, 0), (2, 0), (4, 0)]
+
+
+def test_large_group_in_partially_occupied_area():
+    rows = {
+        row: [column for column in range(20) if (column + row) % 7 != 0]
+        for row in range(10)
+    }
+    # Leave a free block of 6 x 5 seats.
+    for row in range(3, 8):
+        rows[row] = sorted(set(rows[row]) | set(range(10, 16)))
+    seats = create_seats(rows)
+
+    actual = find_seats(seats, 30, PlacementPreferences())
+
+    assert actual is not None
+    assert len(actual) == 30
+    assert len(set(actual)) == 30
+
+
+def test_occupied_seats_separate_free_ones():
+    # Every other seat is occupied.
+    all_seats = create_seats({0: list(range(9))})
+    free_seats = [seat for seat in all_seats if seat.coord_x % 80 == 0]
+
+    same_row = PlacementPreferences(same_row=True)
+    assert find_seats(free_seats, 3, same_row, all_seats=all_seats) is None
+    assert find_seats(
+        free_seats, 3, PlacementPreferences(), all_seats=all_seats
+    ) is None
+
+    # Without the layout, the free seats appear to be next to each other.
+    actual = find_seats(free_seats, 3, same_row)
+    assert get_positions(actual) == [(0, 0), (2, 0), (4, 0)]
+
+
+def test_not_enough_seats():
+    seats = create_seats({0: [0, 1]})
+
+    assert find_seats(seats, 3, PlacementPreferences()) is None
+
+
+def test_quantity_must_be_positive():
+    seats = create_seats({0: [0, 1]})
+
+    with pytest.raises(ValueError):
+        find_seats(seats, 0, PlacementPreferences())
+
+
+# helpers
+
+
+def create_seats(columns_by_row: dict[int, list[int]]) -> list[Seat]:
+    return [
+        Seat(
+            id=SeatID(uuid4()),
+            area_id=AREA_ID,
+            coord_x=column * SEAT_DISTANCE,
+            coord_y=row * ROW_DISTANCE,
+            rotation=None,
+            category_id=CATEGORY_ID,
+            label=f'{row}-{column}',
+            type_=None,
+        )
+        for row, columns in columns_by_row.items()
+        for column in columns
+    ]
+
+
+def get_positions(seats: list[Seat]) -> list[tuple[int, int]]:
+    return [
+        (seat.coord_x // SEAT_DISTANCE, seat.coord_y // ROW_DISTANCE)
+        for seat in seats
+    ]
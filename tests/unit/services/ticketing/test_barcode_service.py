@@ -0,0 +1,21 @@
+"""
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.services.ticketing import barcode_service
+
+
+def test_render_svg_is_memoized():
+    barcode_service.render_svg.cache_clear()
+
+    svg1 = barcode_service.render_svg('ABC12')
+    svg2 = barcode_service.render_svg('ABC12')
+    svg3 = barcode_service.render_svg('ABC12', thickness=2)
+
+    assert svg2 is svg1
+    assert svg3 != svg1
+
+    cache_info = barcode_service.render_svg.cache_info()
+    assert cache_info.hits == 1
+    assert cache_info.misses == 2
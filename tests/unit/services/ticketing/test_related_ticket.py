@@ -0,0 +1,138 @@
+"""
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+import pytest
+
+from byceps.services.ticketing.transfer.models import (
+    RelatedTicket,
+    TicketBundleID,
+    TicketCategory,
+    TicketCategoryID,
+    TicketCode,
+    TicketID,
+)
+from byceps.services.user.transfer.models import User
+from byceps.typing import PartyID, UserID
+
+
+ANY_BUNDLE_ID = TicketBundleID(UUID('4138fcfb-cc18-45c0-aede-d49a8e279885'))
+
+
+def create_user(user_id: str) -> User:
+    return User(
+        id=UserID(UUID(user_id)),
+        screen_name=None,
+        suspended=False,
+        deleted=False,
+        locale=None,
+        avatar_url=None,
+    )
+
+
+user1 = create_user('388925a8-1f67-4506-9dde-63a9880139a6')
+user2 = create_user('cd9685fe-b503-41ce-a6e5-5a4762c29cbc')
+
+
+@pytest.mark.parametrize(
+    'bundle_id, expected',
+    [
+        (ANY_BUNDLE_ID, True ),
+        (None,          False),
+    ],
+)
+def test_belongs_to_bundle(bundle_id, expected):
+    ticket = create_ticket(user1, bundle_id=bundle_id)
+
+    assert ticket.belongs_to_bundle == expected
+
+
+@pytest.mark.parametrize(
+    'seat_managed_by, expected_seat_manager',
+    [
+        (None,  user1),
+        (user1, user1),
+        (user2, user2),
+    ],
+)
+def test_get_seat_manager(seat_managed_by, expected_seat_manager):
+    ticket = create_ticket(user1, seat_managed_by=seat_managed_by)
+
+    assert ticket.get_seat_manager() == expected_seat_manager
+    assert ticket.is_seat_managed_by(expected_seat_manager.id)
+
+
+@pytest.mark.parametrize(
+    'user_managed_by, expected_user_manager',
+    [
+        (None,  user1),
+        (user1, user1),
+        (user2, user2),
+    ],
+)
+def test_get_user_manager(user_managed_by, expected_user_manager):
+    ticket = create_ticket(user1, user_managed_by=user_managed_by)
+
+    assert ticket.get_user_manager() == expected_user_manager
+    assert ticket.is_user_managed_by(expected_user_manager.id)
+
+
+def test_management_rights_waived_by_owner():
+    ticket = create_ticket(user1, seat_managed_by=user2, user_managed_by=user2)
+
+    assert ticket.is_owned_by(user1.id)
+    assert not ticket.is_seat_managed_by(user1.id)
+    assert not ticket.is_user_managed_by(user1.id)
+
+
+@pytest.mark.parametrize(
+    'used_by, expected',
+    [
+        (None,  None    ),
+        (user2, user2.id),
+    ],
+)
+def test_used_by_id(used_by, expected):
+    ticket = create_ticket(user1, used_by=used_by)
+
+    assert ticket.used_by_id == expected
+
+
+# helpers
+
+
+def create_ticket(
+    owned_by: User,
+    *,
+    bundle_id: Optional[TicketBundleID] = None,
+    seat_managed_by: Optional[User] = None,
+    user_managed_by: Optional[User] = None,
+    used_by: Optional[User] = None,
+) -> RelatedTicket:
+    party_id = PartyID('acme-2022')
+
+    return RelatedTicket(
+        id=TicketID(UUID('6b6b5a52-8cb6-4e22-b1e7-f8dc46b4a9c8')),
+        created_at=datetime(2022, 3, 18, 12, 0, 0),
+        party_id=party_id,
+        code=TicketCode('ABCDE'),
+        category=TicketCategory(
+            id=TicketCategoryID(UUID('5b6f0c6d-9d55-4b3e-a5ef-1d6b1c1d0a4e')),
+            party_id=party_id,
+            title='Standard',
+        ),
+        bundle_id=bundle_id,
+        order_number=None,
+        owned_by=owned_by,
+        seat_managed_by=seat_managed_by,
+        user_managed_by=user_managed_by,
+        used_by=used_by,
+        occupied_seat=None,
+        revoked=False,
+        user_checked_in=False,
+    )
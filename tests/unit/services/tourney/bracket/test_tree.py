@@ -0,0 +1,123 @@
+"""
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import pytest
+
+from byceps.services.tourney.bracket.tree import build_tree, get_seed_order
+from byceps.services.tourney.transfer.models import BracketSide, BracketType
+
+
+@pytest.mark.parametrize(
+    'size, expected',
+    [
+        (2, [0, 1]),
+        (4, [0, 3, 1, 2]),
+        (8, [0, 7, 3, 4, 1, 6, 2, 5]),
+    ],
+)
+def test_get_seed_order(size, expected):
+    assert get_seed_order(size) == expected
+
+
+def test_single_elimination_with_power_of_two_participants():
+    nodes = build_tree(BracketType.single_elimination, 4)
+
+    assert [(n.side, n.round) for n in nodes] == [
+        (BracketSide.winners, 1),
+        (BracketSide.winners, 1),
+        (BracketSide.winners, 2),
+    ]
+    assert [n.seeds for n in nodes] == [(0, 3), (1, 2), (None, None)]
+    assert [(n.next_position, n.next_slot) for n in nodes] == [
+        (2, 1),
+        (2, 2),
+        (None, None),
+    ]
+    assert not any(n.loser_next_position is not None for n in nodes)
+    assert not any(n.walkover for n in nodes)
+
+
+def test_single_elimination_with_byes():
+    nodes = build_tree(BracketType.single_elimination, 5)
+
+    assert len(nodes) == 7
+    assert [n.seeds for n in nodes[:4]] == [
+        (0, None),
+        (3, 4),
+        (1, None),
+        (2, None),
+    ]
+    assert [n.walkover for n in nodes] == [
+        True,
+        False,
+        True,
+        True,
+        False,
+        False,
+        False,
+    ]
+
+
+def test_double_elimination_with_two_participants():
+    nodes = build_tree(BracketType.double_elimination, 2)
+
+    winners_final, grand_final = nodes
+    assert grand_final.side == BracketSide.grand_final
+    assert (winners_final.next_position, winners_final.next_slot) == (1, 1)
+    assert (
+        winners_final.loser_next_position,
+        winners_final.loser_next_slot,
+    ) == (1, 2)
+
+
+def test_double_elimination_with_eight_participants():
+    nodes = build_tree(BracketType.double_elimination, 8)
+
+    assert [(n.side, n.round) for n in nodes] == [
+        (BracketSide.winners, 1),
+        (BracketSide.winners, 1),
+        (BracketSide.winners, 1),
+        (BracketSide.winners, 1),
+        (BracketSide.winners, 2),
+        (BracketSide.winners, 2),
+        (BracketSide.winners, 3),
+        (BracketSide.losers, 1),
+        (BracketSide.losers, 1),
+        (BracketSide.losers, 2),
+        (BracketSide.losers, 2),
+        (BracketSide.losers, 3),
+        (BracketSide.losers, 4),
+        (BracketSide.grand_final, 1),
+    ]
+
+    # Losers of the first round play each other.
+    assert [
+        (n.loser_next_position, n.loser_next_slot) for n in nodes[:4]
+    ] == [(7, 1), (7, 2), (8, 1), (8, 2)]
+
+    # Losers of later rounds meet the survivors of the losers' bracket.
+    assert [
+        (n.loser_next_position, n.loser_next_slot) for n in nodes[4:7]
+    ] == [(10, 2), (9, 2), (12, 2)]
+
+    # The winners of both brackets meet in the grand final.
+    assert (nodes[6].next_position, nodes[6].next_slot) == (13, 1)
+    assert (nodes[12].next_position, nodes[12].next_slot) == (13, 2)
+
+    assert not any(n.walkover for n in nodes)
+
+
+def test_double_elimination_with_byes():
+    nodes = build_tree(BracketType.double_elimination, 5)
+
+    # First-round matches with byes have no losers, so the
+    # losers' bracket matches they would feed are walkovers.
+    losers_first_round = [n for n in nodes if n.side == BracketSide.losers][:2]
+    assert [n.walkover for n in losers_first_round] == [True, True]
+
+
+def test_too_few_participants():
+    with pytest.raises(ValueError):
+        build_tree(BracketType.single_elimination, 1)
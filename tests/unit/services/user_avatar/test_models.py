@@ -46,6 +46,33 @@ def test_hybrid_image_type_setter(image_type, expected):
     assert avatar._image_type == expected
 
 
+@pytest.mark.parametrize(
+    'derivatives_rendered, size, image_type, expected_suffix',
+    [
+        (False, None, None          , '.jpeg'    ),
+        (False, 48  , None          , '.jpeg'    ),
+        (True , None, None          , '.jpeg'    ),
+        (True , 16  , None          , '_48.jpeg' ),
+        (True , 48  , None          , '_48.jpeg' ),
+        (True , 49  , None          , '_96.jpeg' ),
+        (True , 192 , None          , '_192.jpeg'),
+        (True , 193 , None          , '.jpeg'    ),
+        (True , 96  , ImageType.webp, '_96.webp' ),
+    ],
+)
+def test_get_url(derivatives_rendered, size, image_type, expected_suffix):
+    avatar = create_avatar()
+    avatar.id = UUID('00000000-0000-0000-0001-000000000001')
+    avatar.derivatives_rendered = derivatives_rendered
+
+    actual = avatar.get_url(size, image_type=image_type)
+
+    assert actual == (
+        '/data/global/users/avatars/'
+        f'00000000-0000-0000-0001-000000000001{expected_suffix}'
+    )
+
+
 # helpers
 
 
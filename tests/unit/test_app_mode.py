@@ -10,15 +10,25 @@ def test_is_admin():
     assert AppMode.admin.is_admin()
     assert not AppMode.admin.is_base()
     assert not AppMode.admin.is_site()
+    assert not AppMode.admin.is_worker()
 
 
 def test_is_base():
     assert not AppMode.base.is_admin()
     assert AppMode.base.is_base()
     assert not AppMode.base.is_site()
+    assert not AppMode.base.is_worker()
 
 
 def test_is_site():
     assert not AppMode.site.is_admin()
     assert not AppMode.site.is_base()
     assert AppMode.site.is_site()
+    assert not AppMode.site.is_worker()
+
+
+def test_is_worker():
+    assert not AppMode.worker.is_admin()
+    assert not AppMode.worker.is_base()
+    assert not AppMode.worker.is_site()
+    assert AppMode.worker.is_worker()
@@ -0,0 +1,25 @@
+"""
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.util.jobqueue import _group_items_by_arguments
+
+
+def test_group_items_by_arguments():
+    entries = [
+        ('item1', ('webhook1',), {}),
+        ('item2', ('webhook2',), {}),
+        ('item3', ('webhook1',), {}),
+        ('item4', ('webhook1',), {'urgent': True}),
+    ]
+
+    assert _group_items_by_arguments(entries) == [
+        (('webhook1',), {}, ['item1', 'item3']),
+        (('webhook2',), {}, ['item2']),
+        (('webhook1',), {'urgent': True}, ['item4']),
+    ]
+
+
+def test_group_items_by_arguments_without_entries():
+    assert _group_items_by_arguments([]) == []
@@ -0,0 +1,89 @@
+"""
+:Copyright: 2014-2022 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from unittest.mock import Mock
+
+from flask import Flask
+import pytest
+
+from byceps.util.snapshot_cache import SnapshotCache
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        value = self.values.get(key)
+        return str(value).encode('ascii') if value is not None else None
+
+    def incr(self, key):
+        self.values[key] = self.values.get(key, 0) + 1
+
+
+@pytest.fixture
+def app():
+    app = Flask('test')
+    app.redis_client = FakeRedis()
+    with app.app_context():
+        yield app
+
+
+def test_snapshot_is_loaded_once(app):
+    load = Mock(return_value={'name': 'value'})
+    cache = SnapshotCache('test', load)
+
+    assert cache.get('scope1') == {'name': 'value'}
+    assert cache.get('scope1') == {'name': 'value'}
+
+    load.assert_called_once_with('scope1')
+
+
+def test_snapshot_is_read_only(app):
+    cache = SnapshotCache('test', lambda scope: {'name': 'value'})
+
+    snapshot = cache.get('scope1')
+
+    with pytest.raises(TypeError):
+        snapshot['name'] = 'other value'
+
+
+def test_single_value_snapshot(app):
+    value = object()
+    load = Mock(return_value=value)
+    cache = SnapshotCache('test', load)
+
+    assert cache.get('scope1') is value
+    assert cache.get('scope1') is value
+
+    load.assert_called_once_with('scope1')
+
+
+def test_invalidate_reloads_only_that_scope(app):
+    load = Mock(side_effect=lambda scope: {'scope': scope})
+    cache = SnapshotCache('test', load)
+
+    cache.get('scope1')
+    cache.get('scope2')
+    assert load.call_count == 2
+
+    cache.invalidate('scope1')
+
+    cache.get('scope1')
+    cache.get('scope2')
+    assert load.call_count == 3
+
+
+def test_changed_version_reloads_snapshot(app):
+    load = Mock(return_value={})
+    cache = SnapshotCache('test', load)
+
+    cache.get('scope1')
+
+    # Simulate invalidation by another process.
+    app.redis_client.incr('byceps:snapshot_version:test:scope1')
+
+    cache.get('scope1')
+    assert load.call_count == 2
@@ -1,22 +1,108 @@
 #!/usr/bin/env python
-"""Run a worker for the job queue.
+"""Run workers for the job queue.
+
+Each worker processes the given queues in the given order, i.e. a job
+from a queue is only started if all queues listed before it are
+empty.
 
 :Copyright: 2014-2022 Jochen Kupperschmidt
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from __future__ import annotations
+import multiprocessing
+import signal
+
+import click
+from flask import Flask
 from rq import Worker
 
-from byceps.application import create_app
-from byceps.util.jobqueue import connection, get_queue
+from byceps.application import create_app, preload
+from byceps.util.jobqueue import connection, get_queue, QUEUE_NAMES
 
 
-if __name__ == '__main__':
-    app = create_app()
+@click.command()
+@click.option(
+    '-q',
+    '--queues',
+    'queue_names_str',
+    default=','.join(QUEUE_NAMES),
+    show_default=True,
+    help='comma-separated names of queues to process, by priority',
+)
+@click.option(
+    '-w',
+    '--workers',
+    'worker_count',
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help='number of worker processes',
+)
+def execute(queue_names_str: str, worker_count: int) -> None:
+    queue_names = _parse_queue_names(queue_names_str)
+
+    app = create_app(config_overrides={'APP_MODE': 'worker'})
+
+    if worker_count == 1:
+        run_worker(app, queue_names)
+        return
+
+    # Create the application before forking so that the worker
+    # processes share its memory.
+    preload(app)
+
+    context = multiprocessing.get_context('fork')
+    processes = [
+        context.Process(target=run_worker, args=(app, queue_names))
+        for _ in range(worker_count)
+    ]
+
+    for process in processes:
+        process.start()
+
+    def terminate_workers(signum, frame) -> None:
+        # Let the workers finish their current jobs (RQ's warm
+        # shutdown).
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+
+    signal.signal(signal.SIGTERM, terminate_workers)
+    # Ctrl+C in a terminal interrupts the workers directly as they are in
+    # the same process group. Forwarding it would make them abort their
+    # current jobs (RQ's cold shutdown on a second signal).
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
 
+    for process in processes:
+        process.join()
+
+
+def _parse_queue_names(value: str) -> list[str]:
+    queue_names = [name.strip() for name in value.split(',') if name.strip()]
+
+    if not queue_names:
+        raise click.BadParameter('No queue names given.')
+
+    unknown_queue_names = set(queue_names).difference(QUEUE_NAMES)
+    if unknown_queue_names:
+        raise click.BadParameter(
+            'Unknown queue names: ' + ', '.join(sorted(unknown_queue_names))
+        )
+
+    return queue_names
+
+
+def run_worker(app: Flask, queue_names: list[str]) -> None:
     with app.app_context():
         with connection():
-            queues = [get_queue(app)]
+            queues = [get_queue(app, name) for name in queue_names]
 
+            # RQ makes sure that only one scheduler is active per queue,
+            # even if multiple workers are started with it.
             worker = Worker(queues)
             worker.work(with_scheduler=True)
+
+
+if __name__ == '__main__':
+    execute()